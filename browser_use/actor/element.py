@@ -6,12 +6,13 @@ from typing import TYPE_CHECKING, Literal, Union
 from cdp_use.client import logger
 from typing_extensions import TypedDict
 
+from browser_use.browser.element_geometry import bounding_client_rects, measure_element_rects
+
 if TYPE_CHECKING:
 	from cdp_use.cdp.dom.commands import (
 		DescribeNodeParameters,
 		FocusParameters,
 		GetAttributesParameters,
-		GetBoxModelParameters,
 		PushNodesByBackendIdsToFrontendParameters,
 		RequestChildNodesParameters,
 		ResolveNodeParameters,
@@ -117,78 +118,25 @@ class Element:
 			except Exception:
 				pass
 
-			# Method 2: Fall back to DOM.getBoxModel
-			if not quads:
-				try:
-					box_model = await self._client.send.DOM.getBoxModel(
-						params={'backendNodeId': self._backend_node_id}, session_id=self._session_id
-					)
-					if 'model' in box_model and 'content' in box_model['model']:
-						content_quad = box_model['model']['content']
-						if len(content_quad) >= 8:
-							# Convert box model format to quad format
-							quads = [
-								[
-									content_quad[0],
-									content_quad[1],  # x1, y1
-									content_quad[2],
-									content_quad[3],  # x2, y2
-									content_quad[4],
-									content_quad[5],  # x3, y3
-									content_quad[6],
-									content_quad[7],  # x4, y4
-								]
-							]
-				except Exception:
-					pass
-
-			# Method 3: Fall back to JavaScript getBoundingClientRect
+			# Method 2: Fall back to JavaScript getBoundingClientRect
 			if not quads:
-				try:
-					result = await self._client.send.DOM.resolveNode(
-						params={'backendNodeId': self._backend_node_id}, session_id=self._session_id
-					)
-					if 'object' in result and 'objectId' in result['object']:
-						object_id = result['object']['objectId']
-
-						# Get bounding rect via JavaScript
-						bounds_result = await self._client.send.Runtime.callFunctionOn(
-							params={
-								'functionDeclaration': """
-									function() {
-										const rect = this.getBoundingClientRect();
-										return {
-											x: rect.left,
-											y: rect.top,
-											width: rect.width,
-											height: rect.height
-										};
-									}
-								""",
-								'objectId': object_id,
-								'returnByValue': True,
-							},
-							session_id=self._session_id,
-						)
-
-						if 'result' in bounds_result and 'value' in bounds_result['result']:
-							rect = bounds_result['result']['value']
-							# Convert rect to quad format
-							x, y, w, h = rect['x'], rect['y'], rect['width'], rect['height']
-							quads = [
-								[
-									x,
-									y,  # top-left
-									x + w,
-									y,  # top-right
-									x + w,
-									y + h,  # bottom-right
-									x,
-									y + h,  # bottom-left
-								]
-							]
-				except Exception:
-					pass
+				rects = await bounding_client_rects(self._client, self._session_id, [self._backend_node_id])
+				rect = rects[self._backend_node_id]
+				if rect:
+					# Convert rect to quad format
+					x, y, w, h = rect.x, rect.y, rect.width, rect.height
+					quads = [
+						[
+							x,
+							y,  # top-left
+							x + w,
+							y,  # top-right
+							x + w,
+							y + h,  # bottom-right
+							x,
+							y + h,  # bottom-left
+						]
+					]
 
 			# If we still don't have quads, fall back to JS click
 			if not quads:
@@ -653,31 +601,13 @@ class Element:
 	async def get_bounding_box(self) -> BoundingBox | None:
 		"""Get the bounding box of the element."""
 		try:
-			node_id = await self._get_node_id()
-			params: 'GetBoxModelParameters' = {'nodeId': node_id}
-			result = await self._client.send.DOM.getBoxModel(params, session_id=self._session_id)
-
-			if 'model' not in result:
-				return None
-
-			# Get content box (first 8 values are content quad: x1,y1,x2,y2,x3,y3,x4,y4)
-			content = result['model']['content']
-			if len(content) < 8:
-				return None
-
-			# Calculate bounding box from quad
-			x_coords = [content[i] for i in range(0, 8, 2)]
-			y_coords = [content[i] for i in range(1, 8, 2)]
-
-			x = min(x_coords)
-			y = min(y_coords)
-			width = max(x_coords) - x
-			height = max(y_coords) - y
-
-			return BoundingBox(x=x, y=y, width=width, height=height)
-
+			_, rects = await measure_element_rects(self._client, self._session_id, [self._backend_node_id])
 		except Exception:
 			return None
+		rect = rects[self._backend_node_id]
+		if rect is None:
+			return None
+		return BoundingBox(x=rect.x, y=rect.y, width=rect.width, height=rect.height)
 
 	async def screenshot(self, format: str = 'jpeg', quality: int | None = None) -> str:
 		"""Take a screenshot of this element and return base64 encoded image.
@@ -155,11 +155,11 @@ class CreateAgentStepEvent(BaseEvent):
 		# Capture screenshot as base64 data URL if available
 		screenshot_url = None
 		if browser_state_summary.screenshot:
-			screenshot_url = f'data:image/jpeg;base64,{browser_state_summary.screenshot}'
+			screenshot_url = browser_state_summary.screenshot.data_url
 			import logging
 
 			logger = logging.getLogger(__name__)
-			logger.debug(f'📸 Including screenshot in CreateAgentStepEvent, length: {len(browser_state_summary.screenshot)}')
+			logger.debug(f'📸 Including screenshot in CreateAgentStepEvent, size: {browser_state_summary.screenshot.size} bytes')
 		else:
 			import logging
 
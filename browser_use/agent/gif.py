@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import base64
 import io
 import logging
 import os
@@ -10,6 +9,7 @@ from typing import TYPE_CHECKING
 from browser_use.agent.views import AgentHistoryList
 from browser_use.browser.views import PLACEHOLDER_4PX_SCREENSHOT
 from browser_use.config import CONFIG
+from browser_use.screenshots.views import Screenshot
 
 if TYPE_CHECKING:
 	from PIL import Image, ImageFont
@@ -61,10 +61,10 @@ def create_history_gif(
 		logger.warning('No history to create GIF from')
 		return
 
-	# Get all screenshots from history (including None placeholders)
-	screenshots = history.screenshots(return_none_if_not_screenshot=True)
+	# Get all screenshots from history (including None placeholders), read as bytes without a base64 round trip
+	screenshots = [item.state.load_screenshot() for item in history.history]
 
-	if not screenshots:
+	if not any(screenshots):
 		logger.warning('No screenshots found in history')
 		return
 
@@ -140,10 +140,9 @@ def create_history_gif(
 	if show_task and task:
 		# Find the first non-placeholder screenshot for the task frame
 		first_real_screenshot = None
-		for item in history.history:
-			screenshot_b64 = item.state.get_screenshot()
-			if screenshot_b64 and screenshot_b64 != PLACEHOLDER_4PX_SCREENSHOT:
-				first_real_screenshot = screenshot_b64
+		for screenshot in screenshots:
+			if screenshot and screenshot != PLACEHOLDER_4PX_SCREENSHOT:
+				first_real_screenshot = screenshot
 				break
 
 		if first_real_screenshot:
@@ -165,7 +164,7 @@ def create_history_gif(
 			continue
 
 		# Skip placeholder screenshots from about:blank pages
-		# These are 4x4 white PNGs encoded as a specific base64 string
+		# These are 4x4 white PNGs, known by their base64 string
 		if screenshot == PLACEHOLDER_4PX_SCREENSHOT:
 			logger.debug(f'Skipping placeholder screenshot from about:blank page at step {i}')
 			continue
@@ -177,9 +176,7 @@ def create_history_gif(
 			logger.debug(f'Skipping screenshot from new tab page ({item.state.url}) at step {i}')
 			continue
 
-		# Convert base64 screenshot to PIL Image
-		img_data = base64.b64decode(screenshot)
-		image = Image.open(io.BytesIO(img_data))
+		image = Image.open(io.BytesIO(screenshot.data))
 
 		if show_goals and item.model_output:
 			image = _add_overlay_to_image(
@@ -211,7 +208,7 @@ def create_history_gif(
 
 def _create_task_frame(
 	task: str,
-	first_screenshot: str,
+	first_screenshot: Screenshot,
 	title_font: ImageFont.FreeTypeFont,
 	regular_font: ImageFont.FreeTypeFont,
 	logo: Image.Image | None = None,
@@ -220,8 +217,7 @@ def _create_task_frame(
 	"""Create initial frame showing the task."""
 	from PIL import Image, ImageDraw, ImageFont
 
-	img_data = base64.b64decode(first_screenshot)
-	template = Image.open(io.BytesIO(img_data))
+	template = Image.open(io.BytesIO(first_screenshot.data))
 	image = Image.new('RGB', template.size, (0, 0, 0))
 	draw = ImageDraw.Draw(image)
 
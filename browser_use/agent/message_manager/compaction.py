@@ -0,0 +1,169 @@
+"""
+Token-budgeted agent history with rolling summaries.
+
+Without a budget the `<agent_history>` block grows with every step. `HistoryCompactor` renders the newest history items
+that fit into `max_tokens` (token counts are estimated, no tokenizer needed). Once older items no longer fit, they are
+folded into a single summary item by a (cheap) LLM in the background, together with the previous summary. The newest
+items are kept verbatim. The summary replaces the folded items in `MessageManagerState.agent_history_items`, so
+checkpointed state stays compact too. Until the summary arrives the folded items are shown as an omission marker, the
+agent never waits for it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from browser_use.agent.message_manager.views import HistoryItem, omitted_history_marker
+from browser_use.llm.messages import SystemMessage, UserMessage
+
+if TYPE_CHECKING:
+	from browser_use.llm.base import BaseChatModel
+
+logger = logging.getLogger(__name__)
+
+# Average characters per token of English text and HTML/markdown for current BPE tokenizers
+CHARS_PER_TOKEN = 4
+
+SUMMARY_SYSTEM_PROMPT = """You compress the step history of a browser automation agent.
+Rewrite the given history into a short record that lets the agent continue the task without the original steps:
+- what has been done and which pages were visited
+- every concrete finding the task may need (keep exact values: names, numbers, URLs, file names)
+- what failed and should not be retried the same way
+- progress towards the task
+If a previous summary is given, merge it in. Never invent information. Answer with the record only."""
+
+
+def estimate_tokens(text: str) -> int:
+	"""Token estimate of a text, close enough to budget prompts without loading a tokenizer."""
+	return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def truncate_to_tokens(text: str, max_tokens: int, marker: str = '\n... [Content truncated]') -> str:
+	"""Cut text down to about `max_tokens` tokens, keeping the beginning."""
+	if estimate_tokens(text) <= max_tokens:
+		return text
+	return text[: max_tokens * CHARS_PER_TOKEN] + marker
+
+
+class HistoryCompactor:
+	"""Renders the agent history within a token budget and folds old items into a rolling summary."""
+
+	def __init__(
+		self,
+		max_tokens: int,
+		summary_llm: BaseChatModel | None = None,
+		summary_max_tokens: int | None = None,
+		task: str = '',
+	):
+		self.max_tokens = max_tokens
+		self.summary_llm = summary_llm
+		# the summary may use up to a quarter of the budget, the verbatim tail keeps at least half of it
+		self.summary_max_tokens = summary_max_tokens or max(max_tokens // 4, 1)
+		self.task = task
+		self.summaries = 0
+		self.summary_failures = 0
+		self._pending: asyncio.Task[None] | None = None
+		# don't retry a failed summary on every step, wait until this many items exist
+		self._retry_after_items = 0
+
+	@property
+	def pending(self) -> bool:
+		return self._pending is not None and not self._pending.done()
+
+	def render(self, items: list[HistoryItem]) -> str:
+		return '\n'.join(self.render_parts(items))
+
+	def render_parts(self, items: list[HistoryItem]) -> list[str]:
+		"""Rendered items that fit into the budget, scheduling a summary of the ones that don't."""
+		if len(items) <= 2:
+			return [item.to_string() for item in items]
+
+		# the initialization item and the current summary are always kept
+		head = items[:2] if items[1].summarized_items else items[:1]
+		budget = self.max_tokens - sum(estimate_tokens(item.to_string()) for item in head)
+
+		kept: list[HistoryItem] = []
+		used = 0
+		for item in reversed(items[len(head) :]):
+			tokens = estimate_tokens(item.to_string())
+			# the newest item is always shown, even if it alone exceeds the budget
+			if kept and used + tokens > budget:
+				break
+			kept.append(item)
+			used += tokens
+		kept.reverse()
+
+		omitted = len(items) - len(head) - len(kept)
+		if omitted:
+			self._schedule_summary(items, len(head), budget)
+
+		parts = [item.to_string() for item in head]
+		if omitted:
+			parts.append(omitted_history_marker(omitted))
+		parts.extend(item.to_string() for item in kept)
+		return parts
+
+	def _schedule_summary(self, items: list[HistoryItem], start: int, budget: int) -> None:
+		if self.summary_llm is None or self.pending or len(items) < self._retry_after_items:
+			return
+		try:
+			loop = asyncio.get_running_loop()
+		except RuntimeError:
+			return
+
+		# fold everything but the newest items that fit into half of the budget, so the next summary is many steps away
+		end = len(items)
+		tail = 0
+		while end - 1 > start and tail + estimate_tokens(items[end - 1].to_string()) <= budget // 2:
+			end -= 1
+			tail += estimate_tokens(items[end].to_string())
+		# the previous summary is part of the span (rolling summary)
+		first = start - 1 if items[start - 1].summarized_items else start
+		span = items[first:end]
+		if not span:
+			return
+
+		self._pending = loop.create_task(self._summarize(items, span))
+
+	async def _summarize(self, items: list[HistoryItem], span: list[HistoryItem]) -> None:
+		assert self.summary_llm is not None
+		history = '\n'.join(item.to_string() for item in span)
+		prompt = (
+			f'<task>\n{self.task}\n</task>\n<agent_history>\n{history}\n</agent_history>\n'
+			f'Write the record in at most {self.summary_max_tokens * 3 // 4} words.'
+		)
+		try:
+			response = await self.summary_llm.ainvoke([SystemMessage(content=SUMMARY_SYSTEM_PROMPT), UserMessage(content=prompt)])
+			summary = truncate_to_tokens(response.completion.strip(), self.summary_max_tokens)
+		except Exception as e:
+			self.summary_failures += 1
+			self._retry_after_items = len(items) + 3
+			logger.warning(
+				f'⚠️ Summarizing {len(span)} agent history items failed, retrying in a few steps: {type(e).__name__}: {e}'
+			)
+			return
+
+		# replace the span in place if nothing else rewrote the history in the meantime
+		try:
+			first = next(i for i, item in enumerate(items) if item is span[0])
+		except StopIteration:
+			return
+		current = items[first : first + len(span)]
+		if len(current) != len(span) or any(a is not b for a, b in zip(current, span)):
+			return
+		summarized_items = sum(item.summarized_items or 1 for item in span)
+		items[first : first + len(span)] = [
+			HistoryItem(
+				system_message=f'<history_summary items="{summarized_items}">\n{summary}\n</history_summary>',
+				summarized_items=summarized_items,
+			)
+		]
+		self.summaries += 1
+		logger.debug(f'🗜️ Folded {len(span)} agent history items into a summary of ~{estimate_tokens(summary)} tokens')
+
+	def cancel(self) -> None:
+		if self._pending is not None and not self._pending.done():
+			self._pending.cancel()
+		self._pending = None
@@ -3,8 +3,10 @@ from __future__ import annotations
 import logging
 from typing import Literal
 
+from browser_use.agent.message_manager.compaction import HistoryCompactor, truncate_to_tokens
 from browser_use.agent.message_manager.views import (
 	HistoryItem,
+	omitted_history_marker,
 )
 from browser_use.agent.prompts import AgentMessagePrompt
 from browser_use.agent.views import (
@@ -15,6 +17,7 @@ from browser_use.agent.views import (
 )
 from browser_use.browser.views import BrowserStateSummary
 from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.base import BaseChatModel
 from browser_use.llm.messages import (
 	BaseMessage,
 	ContentPartImageParam,
@@ -26,6 +29,9 @@ from browser_use.utils import match_url_with_domain_pattern, time_execution_sync
 
 logger = logging.getLogger(__name__)
 
+# Limit for the read_state block and the action results of one step
+MAX_CONTENT_TOKENS = 15_000
+
 
 # ========== Logging Helper Functions ==========
 # These functions are used ONLY for formatting debug log output.
@@ -110,6 +116,9 @@ class MessageManager:
 		include_tool_call_examples: bool = False,
 		include_recent_events: bool = False,
 		sample_images: list[ContentPartTextParam | ContentPartImageParam] | None = None,
+		max_history_tokens: int | None = None,
+		history_summary_llm: BaseChatModel | None = None,
+		llm_screenshot_size: tuple[int, int] | None = None,
 	):
 		self.task = task
 		self.state = state
@@ -122,8 +131,16 @@ class MessageManager:
 		self.include_tool_call_examples = include_tool_call_examples
 		self.include_recent_events = include_recent_events
 		self.sample_images = sample_images
+		# screenshots sent to the LLM are downscaled to fit this size and re-encoded as WebP
+		self.llm_screenshot_size = llm_screenshot_size
 
 		assert max_history_items is None or max_history_items > 5, 'max_history_items must be None or greater than 5'
+		# With a token budget the history is compacted instead of being cut by item count
+		self.history_compactor = (
+			HistoryCompactor(max_tokens=max_history_tokens, summary_llm=history_summary_llm, task=task)
+			if max_history_tokens is not None
+			else None
+		)
 
 		# Store settings as direct attributes instead of in a settings object
 		self.include_attributes = include_attributes or []
@@ -136,16 +153,19 @@ class MessageManager:
 
 	@property
 	def agent_history_description(self) -> str:
-		"""Build agent history description from list of items, respecting max_history_items limit"""
-		if self.max_history_items is None:
-			# Include all items
-			return '\n'.join(item.to_string() for item in self.state.agent_history_items)
+		"""Build agent history description from list of items, respecting max_history_tokens or max_history_items"""
+		return '\n'.join(self._agent_history_parts())
+
+	def _agent_history_parts(self) -> list[str]:
+		"""Rendered history items (and omission markers) in prompt order"""
+		if self.history_compactor is not None:
+			return self.history_compactor.render_parts(self.state.agent_history_items)
 
 		total_items = len(self.state.agent_history_items)
 
-		# If we have fewer items than the limit, just return all items
-		if total_items <= self.max_history_items:
-			return '\n'.join(item.to_string() for item in self.state.agent_history_items)
+		# Include all items if there is no limit or we have fewer items than the limit
+		if self.max_history_items is None or total_items <= self.max_history_items:
+			return [item.to_string() for item in self.state.agent_history_items]
 
 		# We have more items than the limit, so we need to omit some
 		omitted_count = total_items - self.max_history_items
@@ -156,18 +176,20 @@ class MessageManager:
 
 		items_to_include = [
 			self.state.agent_history_items[0].to_string(),  # Keep first item (initialization)
-			f'<sys>[... {omitted_count} previous steps omitted...]</sys>',
+			omitted_history_marker(omitted_count),
 		]
 		# Add most recent items
 		items_to_include.extend([item.to_string() for item in self.state.agent_history_items[-recent_items_count:]])
 
-		return '\n'.join(items_to_include)
+		return items_to_include
 
 	def add_new_task(self, new_task: str) -> None:
 		new_task = '<follow_up_user_request> ' + new_task.strip() + ' </follow_up_user_request>'
 		if '<initial_user_request>' not in self.task:
 			self.task = '<initial_user_request>' + self.task + '</initial_user_request>'
 		self.task += '\n' + new_task
+		if self.history_compactor is not None:
+			self.history_compactor.task = self.task
 		task_update_item = HistoryItem(system_message=new_task)
 		self.state.agent_history_items.append(task_update_item)
 
@@ -212,13 +234,11 @@ class MessageManager:
 				action_results += f'{error_text}\n'
 				logger.debug(f'Added error to action_results: {error_text}')
 
-		# Simple 60k character limit for read_state_description
-		MAX_CONTENT_SIZE = 60000
-		if len(self.state.read_state_description) > MAX_CONTENT_SIZE:
-			self.state.read_state_description = (
-				self.state.read_state_description[:MAX_CONTENT_SIZE] + '\n... [Content truncated at 60k characters]'
-			)
-			logger.debug(f'Truncated read_state_description to {MAX_CONTENT_SIZE} characters')
+		truncation_marker = f'\n... [Content truncated at {MAX_CONTENT_TOKENS // 1000}k tokens]'
+		read_state_description = truncate_to_tokens(self.state.read_state_description, MAX_CONTENT_TOKENS, truncation_marker)
+		if read_state_description is not self.state.read_state_description:
+			self.state.read_state_description = read_state_description
+			logger.debug(f'Truncated read_state_description to {MAX_CONTENT_TOKENS} tokens')
 
 		self.state.read_state_description = self.state.read_state_description.strip('\n')
 
@@ -226,10 +246,11 @@ class MessageManager:
 			action_results = f'Result\n{action_results}'
 		action_results = action_results.strip('\n') if action_results else None
 
-		# Simple 60k character limit for action_results
-		if action_results and len(action_results) > MAX_CONTENT_SIZE:
-			action_results = action_results[:MAX_CONTENT_SIZE] + '\n... [Content truncated at 60k characters]'
-			logger.debug(f'Truncated action_results to {MAX_CONTENT_SIZE} characters')
+		if action_results:
+			truncated_action_results = truncate_to_tokens(action_results, MAX_CONTENT_TOKENS, truncation_marker)
+			if truncated_action_results is not action_results:
+				action_results = truncated_action_results
+				logger.debug(f'Truncated action_results to {MAX_CONTENT_TOKENS} tokens')
 
 		# Build the history item
 		if model_output is None:
@@ -332,7 +353,15 @@ class MessageManager:
 		# else: use_vision is False, never include screenshot (include_screenshot stays False)
 
 		if include_screenshot and browser_state_summary.screenshot:
-			screenshots.append(browser_state_summary.screenshot)
+			screenshot = browser_state_summary.screenshot
+			if self.llm_screenshot_size is not None:
+				try:
+					screenshot = screenshot.resized(self.llm_screenshot_size, format='webp')
+				except Exception as e:
+					logger.warning(
+						f'📸 Could not downscale the screenshot for the LLM, sending it as is: {type(e).__name__}: {e}'
+					)
+			screenshots.append(screenshot)
 
 		# Use vision in the user message if screenshots are included
 		effective_use_vision = len(screenshots) > 0
@@ -342,7 +371,7 @@ class MessageManager:
 		state_message = AgentMessagePrompt(
 			browser_state_summary=browser_state_summary,
 			file_system=self.file_system,
-			agent_history_description=self.agent_history_description,
+			agent_history_items=self._agent_history_parts(),
 			read_state_description=self.state.read_state_description,
 			task=self.task,
 			include_attributes=self.include_attributes,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from browser_use.llm.messages import (
 	BaseMessage,
@@ -12,6 +12,15 @@ if TYPE_CHECKING:
 	pass
 
 
+def omitted_history_marker(count: int) -> str:
+	"""The history part standing in for `count` items left out of the prompt"""
+	return f'<sys>[... {count} previous steps omitted...]</sys>'
+
+
+def is_omitted_history_marker(part: str) -> bool:
+	return part.startswith('<sys>[... ') and part.endswith(' previous steps omitted...]</sys>')
+
+
 class HistoryItem(BaseModel):
 	"""Represents a single agent history item with its data and string representation"""
 
@@ -22,9 +31,14 @@ class HistoryItem(BaseModel):
 	action_results: str | None = None
 	error: str | None = None
 	system_message: str | None = None
+	summarized_items: int = 0
+	"""Number of history items this summary item replaces (0 for regular items)"""
 
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
+	# items are never modified once added to the history, so they are rendered once
+	_rendered: str | None = PrivateAttr(default=None)
+
 	def model_post_init(self, __context) -> None:
 		"""Validate that error and system_message are not both provided"""
 		if self.error is not None and self.system_message is not None:
@@ -32,6 +46,11 @@ class HistoryItem(BaseModel):
 
 	def to_string(self) -> str:
 		"""Get string representation of the history item"""
+		if self._rendered is None:
+			self._rendered = self._render()
+		return self._rendered
+
+	def _render(self) -> str:
 		step_str = 'step' if self.step_number is not None else 'step_unknown'
 
 		if self.error:
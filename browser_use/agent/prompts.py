@@ -1,10 +1,20 @@
 import importlib.resources
+from collections.abc import Sequence
 from datetime import datetime
-from typing import TYPE_CHECKING, Literal, Optional
+from typing import TYPE_CHECKING, Literal, Optional, cast
 
+from browser_use.agent.message_manager.views import is_omitted_history_marker
 from browser_use.dom.views import NodeType, SimplifiedNode
-from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, SystemMessage, UserMessage
+from browser_use.llm.messages import (
+	ContentPartImageParam,
+	ContentPartTextParam,
+	ImageURL,
+	SupportedImageMediaType,
+	SystemMessage,
+	UserMessage,
+)
 from browser_use.observability import observe_debug
+from browser_use.screenshots.views import Screenshot
 from browser_use.utils import is_new_tab_page
 
 if TYPE_CHECKING:
@@ -12,6 +22,9 @@ if TYPE_CHECKING:
 	from browser_use.browser.views import BrowserStateSummary
 	from browser_use.filesystem.file_system import FileSystem
 
+# History items are moved into the cached prompt prefix in chunks of this many, so the prefix only changes every few steps
+HISTORY_CACHE_CHUNK = 10
+
 
 class SystemPrompt:
 	def __init__(
@@ -72,6 +85,7 @@ class AgentMessagePrompt:
 		browser_state_summary: 'BrowserStateSummary',
 		file_system: 'FileSystem',
 		agent_history_description: str | None = None,
+		agent_history_items: list[str] | None = None,
 		read_state_description: str | None = None,
 		task: str | None = None,
 		include_attributes: list[str] | None = None,
@@ -80,7 +94,7 @@ class AgentMessagePrompt:
 		max_clickable_elements_length: int = 40000,
 		sensitive_data: str | None = None,
 		available_file_paths: list[str] | None = None,
-		screenshots: list[str] | None = None,
+		screenshots: Sequence[Screenshot | str] | None = None,
 		vision_detail_level: Literal['auto', 'low', 'high'] = 'auto',
 		include_recent_events: bool = False,
 		sample_images: list[ContentPartTextParam | ContentPartImageParam] | None = None,
@@ -88,6 +102,8 @@ class AgentMessagePrompt:
 		self.browser_state: 'BrowserStateSummary' = browser_state_summary
 		self.file_system: 'FileSystem | None' = file_system
 		self.agent_history_description: str | None = agent_history_description
+		# rendered history items, preferred over agent_history_description so the older ones can be cached
+		self.agent_history_items: list[str] | None = agent_history_items
 		self.read_state_description: str | None = read_state_description
 		self.task: str | None = task
 		self.include_attributes = include_attributes
@@ -96,7 +112,7 @@ class AgentMessagePrompt:
 		self.max_clickable_elements_length: int = max_clickable_elements_length
 		self.sensitive_data: str | None = sensitive_data
 		self.available_file_paths: list[str] | None = available_file_paths
-		self.screenshots = screenshots or []
+		self.screenshots = [screenshot for screenshot in map(Screenshot.coerce, screenshots or []) if screenshot]
 		self.vision_detail_level = vision_detail_level
 		self.include_recent_events = include_recent_events
 		self.sample_images = sample_images or []
@@ -287,9 +303,6 @@ Available tabs:
 			_todo_contents = '[empty todo.md, fill it when applicable]'
 
 		agent_state = f"""
-<user_request>
-{self.task}
-</user_request>
 <file_system>
 {self.file_system.describe() if self.file_system else 'No file system available'}
 </file_system>
@@ -308,7 +321,7 @@ Available tabs:
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_user_message')
 	def get_user_message(self, use_vision: bool = True) -> UserMessage:
-		"""Get complete state as a single cached message"""
+		"""Get complete state as a single message, starting with the parts that can be served from the prompt cache"""
 		# Don't pass screenshot to model if page is a new tab page, step is 0, and there's only one tab
 		if (
 			is_new_tab_page(self.browser_state.url)
@@ -318,12 +331,22 @@ Available tabs:
 		):
 			use_vision = False
 
-		# Build complete state description
-		state_description = (
-			'<agent_history>\n'
-			+ (self.agent_history_description.strip('\n') if self.agent_history_description else '')
-			+ '\n</agent_history>\n\n'
-		)
+		# The task and the settled part of the history come first and are byte-identical across steps, so provider prompt
+		# caches can reuse them. Everything that changes every step follows.
+		prefix_parts: list[ContentPartTextParam] = []
+		if self.task:
+			prefix_parts.append(ContentPartTextParam(text=f'<user_request>\n{self.task}\n</user_request>\n', cache=True))
+
+		settled_history, recent_history = self._get_history_parts()
+		if settled_history:
+			prefix_parts.append(ContentPartTextParam(text=f'<agent_history>\n{settled_history}\n', cache=True))
+			state_description = ''
+		else:
+			state_description = '<agent_history>\n'
+		if recent_history:
+			state_description += recent_history + '\n'
+		state_description += '</agent_history>\n\n'
+
 		state_description += '<agent_state>\n' + self._get_agent_state_description().strip('\n') + '\n</agent_state>\n'
 		state_description += '<browser_state>\n' + self._get_browser_state_description().strip('\n') + '\n</browser_state>\n'
 		# Only add read_state if it has content
@@ -338,7 +361,10 @@ Available tabs:
 
 		if use_vision is True and self.screenshots:
 			# Start with text description
-			content_parts: list[ContentPartTextParam | ContentPartImageParam] = [ContentPartTextParam(text=state_description)]
+			content_parts: list[ContentPartTextParam | ContentPartImageParam] = [
+				*prefix_parts,
+				ContentPartTextParam(text=state_description),
+			]
 
 			# Add sample images
 			content_parts.extend(self.sample_images)
@@ -354,17 +380,32 @@ Available tabs:
 				# Add label as text content
 				content_parts.append(ContentPartTextParam(text=label))
 
-				# Add the screenshot
+				# Add the screenshot, this is the only place it is encoded as base64
 				content_parts.append(
 					ContentPartImageParam(
 						image_url=ImageURL(
-							url=f'data:image/jpeg;base64,{screenshot}',
-							media_type='image/jpeg',
+							url=screenshot.data_url,
+							media_type=cast(SupportedImageMediaType, screenshot.mime_type),
 							detail=self.vision_detail_level,
 						),
 					)
 				)
 
-			return UserMessage(content=content_parts, cache=True)
+			return UserMessage(content=content_parts)
+
+		if prefix_parts:
+			return UserMessage(content=[*prefix_parts, ContentPartTextParam(text=state_description)])
+		return UserMessage(content=state_description)
+
+	def _get_history_parts(self) -> tuple[str, str]:
+		"""Split the history into a settled part, which only grows every HISTORY_CACHE_CHUNK items, and the newest items."""
+		if self.agent_history_items is None:
+			return '', self.agent_history_description.strip('\n') if self.agent_history_description else ''
 
-		return UserMessage(content=state_description, cache=True)
+		items = self.agent_history_items
+		settled_count = len(items) - len(items) % HISTORY_CACHE_CHUNK
+		# the omission marker's count and the items after it change every step, only what precedes it can be cached
+		marker = next((i for i, item in enumerate(items) if is_omitted_history_marker(item)), None)
+		if marker is not None:
+			settled_count = marker
+		return '\n'.join(items[:settled_count]), '\n'.join(items[settled_count:])
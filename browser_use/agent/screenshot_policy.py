@@ -0,0 +1,38 @@
+"""
+Per-step decision whether the browser state needs a screenshot.
+
+Capturing a screenshot, moving it over CDP as base64 and storing it costs time on every step. The policy only asks for
+one when something will look at it: the LLM (`use_vision=True`, or an action that requested one with `use_vision='auto'`),
+the GIF, or the sampled step history (`screenshot_sample_rate`). An agent with `use_vision=False` and none of
+the above never captures a screenshot.
+"""
+
+from browser_use.agent.views import ActionResult, AgentSettings
+
+
+class ScreenshotPolicy:
+	"""Decides per step whether to capture a screenshot, reading the agent settings at decision time."""
+
+	def __init__(self, settings: AgentSettings):
+		self.settings = settings
+
+	@property
+	def sample_rate(self) -> int:
+		"""Record a screenshot every this many steps, 0 to never sample (default: every step unless use_vision=False)"""
+		if self.settings.screenshot_sample_rate is not None:
+			return max(self.settings.screenshot_sample_rate, 0)
+		return 0 if self.settings.use_vision is False else 1
+
+	def reason(self, step_number: int, last_result: list[ActionResult] | None) -> str | None:
+		"""Why the browser state of `step_number` needs a screenshot, None if nothing will use it"""
+		if self.settings.use_vision is True:
+			return 'vision'
+		if self.settings.use_vision == 'auto' and any(
+			result.metadata and result.metadata.get('include_screenshot') for result in last_result or []
+		):
+			return 'requested by action'
+		if self.settings.generate_gif:
+			return 'gif'
+		if self.sample_rate and (step_number - 1) % self.sample_rate == 0:
+			return 'sampled'
+		return None
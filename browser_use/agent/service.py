@@ -7,6 +7,7 @@ import re
 import tempfile
 import time
 from collections.abc import Awaitable, Callable
+from contextlib import aclosing
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Generic, Literal, TypeVar
@@ -24,6 +25,9 @@ from browser_use.agent.cloud_events import (
 from browser_use.agent.message_manager.utils import save_conversation
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.messages import BaseMessage, ContentPartImageParam, ContentPartTextParam, UserMessage
+from browser_use.llm.openai.client_pool import client_pool
+from browser_use.llm.schema import track_schema_stats
+from browser_use.llm.streaming import JSONArrayStreamParser, StreamingChatModel
 from browser_use.tokens.service import TokenCost
 
 load_dotenv()
@@ -40,6 +44,7 @@ from browser_use.agent.message_manager.service import (
 	MessageManager,
 )
 from browser_use.agent.prompts import SystemPrompt
+from browser_use.agent.screenshot_policy import ScreenshotPolicy
 from browser_use.agent.views import (
 	ActionResult,
 	AgentError,
@@ -53,12 +58,14 @@ from browser_use.agent.views import (
 	BrowserStateHistory,
 	StepMetadata,
 )
+from browser_use.browser.events import ScreenshotEvent
 from browser_use.browser.session import DEFAULT_BROWSER_PROFILE
 from browser_use.browser.views import BrowserStateSummary
 from browser_use.config import CONFIG
 from browser_use.dom.views import DOMInteractedElement
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.observability import observe, observe_debug
+from browser_use.screenshots.views import PROVIDER_SCREENSHOT_SIZES, Screenshot
 from browser_use.telemetry.service import ProductTelemetry
 from browser_use.telemetry.views import AgentTelemetryEvent
 from browser_use.tools.registry.views import ActionModel
@@ -163,7 +170,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		use_thinking: bool = True,
 		flash_mode: bool = False,
 		max_history_items: int | None = None,
+		max_history_tokens: int | None = None,
 		page_extraction_llm: BaseChatModel | None = None,
+		history_summary_llm: BaseChatModel | None = None,
 		injected_agent_state: AgentState | None = None,
 		source: str | None = None,
 		file_system_path: str | None = None,
@@ -178,6 +187,10 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		include_recent_events: bool = False,
 		sample_images: list[ContentPartTextParam | ContentPartImageParam] | None = None,
 		final_response_after_failure: bool = True,
+		stream_actions: bool = False,
+		prefetch_browser_state: bool = True,
+		screenshot_sample_rate: int | None = None,
+		llm_screenshot_size: tuple[int, int] | Literal['auto'] | None = None,
 		_url_shortening_limit: int = 25,
 		**kwargs,
 	):
@@ -199,6 +212,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		if page_extraction_llm is None:
 			page_extraction_llm = llm
+		if history_summary_llm is None:
+			history_summary_llm = page_extraction_llm
 		if available_file_paths is None:
 			available_file_paths = []
 
@@ -276,18 +291,30 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			use_thinking=use_thinking,
 			flash_mode=flash_mode,
 			max_history_items=max_history_items,
+			max_history_tokens=max_history_tokens,
 			page_extraction_llm=page_extraction_llm,
+			history_summary_llm=history_summary_llm,
 			calculate_cost=calculate_cost,
 			include_tool_call_examples=include_tool_call_examples,
 			llm_timeout=llm_timeout,
 			step_timeout=step_timeout,
 			final_response_after_failure=final_response_after_failure,
+			stream_actions=stream_actions,
+			prefetch_browser_state=prefetch_browser_state,
+			screenshot_sample_rate=screenshot_sample_rate,
+			llm_screenshot_size=llm_screenshot_size,
 		)
+		self.screenshot_policy = ScreenshotPolicy(self.settings)
+
+		# Each agent holds its own lease on the models it uses, released in close()
+		models = {id(model): model for model in (llm, page_extraction_llm, history_summary_llm)}
+		self._llm_leases = [client_pool.lease_model(model) for model in models.values()]
 
 		# Token cost service
 		self.token_cost_service = TokenCost(include_cost=calculate_cost)
 		self.token_cost_service.register_llm(llm)
 		self.token_cost_service.register_llm(page_extraction_llm)
+		self.token_cost_service.register_llm(history_summary_llm)
 
 		# Initialize state
 		self.state = injected_agent_state or AgentState()
@@ -360,10 +387,17 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			include_attributes=self.settings.include_attributes,
 			sensitive_data=sensitive_data,
 			max_history_items=self.settings.max_history_items,
+			max_history_tokens=self.settings.max_history_tokens,
+			history_summary_llm=self.settings.history_summary_llm,
 			vision_detail_level=self.settings.vision_detail_level,
 			include_tool_call_examples=self.settings.include_tool_call_examples,
 			include_recent_events=self.include_recent_events,
 			sample_images=self.sample_images,
+			llm_screenshot_size=(
+				PROVIDER_SCREENSHOT_SIZES.get(self.llm.provider)
+				if self.settings.llm_screenshot_size == 'auto'
+				else self.settings.llm_screenshot_size
+			),
 		)
 
 		if self.sensitive_data:
@@ -444,6 +478,13 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self._external_pause_event = asyncio.Event()
 		self._external_pause_event.set()
 
+		# Actions dispatched while the model output is still streaming (stream_actions)
+		self._streamed_actions: asyncio.Task[list[ActionResult]] | None = None
+		# Browser state of the step whose register_new_step_callback is still due, streamed actions run it before the first one
+		self._new_step_callback_state: BrowserStateSummary | None = None
+		# Browser state for the next step, captured while the current one is finalized (prefetch_browser_state)
+		self._prefetched_state: tuple[asyncio.Task[BrowserStateSummary], int, bool] | None = None
+
 	def _enhance_task_with_schema(self, task: str, output_model_schema: type[AgentStructuredOutput] | None) -> str:
 		"""Enhance task description with output schema information if provided."""
 		if output_model_schema is None:
@@ -602,21 +643,19 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# Initially only include actions with no filters
 		self.ActionModel = self.tools.registry.create_action_model()
 		# Create output model with the dynamic actions
-		if self.settings.flash_mode:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.ActionModel)
-		elif self.settings.use_thinking:
-			self.AgentOutput = AgentOutput.type_with_custom_actions(self.ActionModel)
-		else:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.ActionModel)
+		self.AgentOutput = self._agent_output_type(self.ActionModel)
 
 		# used to force the done action when max_steps is reached
 		self.DoneActionModel = self.tools.registry.create_action_model(include_actions=['done'])
+		self.DoneAgentOutput = self._agent_output_type(self.DoneActionModel)
+
+	def _agent_output_type(self, action_model: type[ActionModel]) -> type[AgentOutput]:
 		if self.settings.flash_mode:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.DoneActionModel)
+			return AgentOutput.type_with_custom_actions_flash_mode(action_model)
 		elif self.settings.use_thinking:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions(self.DoneActionModel)
+			return AgentOutput.type_with_custom_actions(action_model)
 		else:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
+			return AgentOutput.type_with_custom_actions_no_thinking(action_model)
 
 	def add_new_task(self, new_task: str) -> None:
 		"""Add a new task to the agent, keeping the same task_id as tasks are continuous"""
@@ -661,26 +700,30 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		# Initialize timing first, before any exceptions can occur
 
 		self.step_start_time = time.time()
+		self._step_schema_seconds = 0.0
 
 		browser_state_summary = None
 
-		try:
-			# Phase 1: Prepare context and timing
-			browser_state_summary = await self._prepare_context(step_info)
+		# only this agent's schema builds, other agents running concurrently keep their own counters
+		with track_schema_stats() as self._step_schema_stats:
+			try:
+				# Phase 1: Prepare context and timing
+				browser_state_summary = await self._prepare_context(step_info)
 
-			# Phase 2: Get model output and execute actions
-			await self._get_next_action(browser_state_summary)
-			await self._execute_actions()
+				# Phase 2: Get model output and execute actions
+				await self._get_next_action(browser_state_summary)
+				await self._execute_actions()
 
-			# Phase 3: Post-processing
-			await self._post_process()
+				# Phase 3: Post-processing
+				await self._post_process()
 
-		except Exception as e:
-			# Handle ALL exceptions in one place
-			await self._handle_step_error(e)
+			except Exception as e:
+				# Handle ALL exceptions in one place
+				await self._handle_step_error(e)
 
-		finally:
-			await self._finalize(browser_state_summary)
+			finally:
+				self._cancel_streamed_actions()
+				await self._finalize(browser_state_summary)
 
 	async def _prepare_context(self, step_info: AgentStepInfo | None = None) -> BrowserStateSummary:
 		"""Prepare the context for the step: browser state, action models, page actions"""
@@ -689,14 +732,16 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		assert self.browser_session is not None, 'BrowserSession is not set up'
 
 		self.logger.debug(f'🌐 Step {self.state.n_steps}: Getting browser state...')
-		# Always take screenshots for all steps
-		self.logger.debug('📸 Requesting browser state with include_screenshot=True')
-		browser_state_summary = await self.browser_session.get_browser_state_summary(
-			include_screenshot=True,  # always capture even if use_vision=False so that cloud sync is useful (it's fast now anyway)
-			include_recent_events=self.include_recent_events,
-		)
+		include_screenshot = self._needs_screenshot(self.state.n_steps)
+		browser_state_summary = await self._take_prefetched_state(include_screenshot)
+		if browser_state_summary is None:
+			self.logger.debug(f'📸 Requesting browser state with include_screenshot={include_screenshot}')
+			browser_state_summary = await self.browser_session.get_browser_state_summary(
+				include_screenshot=include_screenshot,
+				include_recent_events=self.include_recent_events,
+			)
 		if browser_state_summary.screenshot:
-			self.logger.debug(f'📸 Got browser state WITH screenshot, length: {len(browser_state_summary.screenshot)}')
+			self.logger.debug(f'📸 Got browser state WITH screenshot, size: {browser_state_summary.screenshot.size} bytes')
 		else:
 			self.logger.debug('📸 Got browser state WITHOUT screenshot')
 
@@ -708,7 +753,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		# Update action models with page-specific actions
 		self.logger.debug(f'📝 Step {self.state.n_steps}: Updating action models...')
+		schema_start = time.perf_counter()
 		await self._update_action_models_for_page(browser_state_summary.url)
+		self._step_schema_seconds += time.perf_counter() - schema_start
 
 		# Get page-specific filtered actions
 		page_filtered_actions = self.tools.registry.get_prompt_description(browser_state_summary.url)
@@ -738,6 +785,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self.logger.debug(
 			f'🤖 Step {self.state.n_steps}: Calling LLM with {len(input_messages)} messages (model: {self.llm.model})...'
 		)
+		self._new_step_callback_state = browser_state_summary
 
 		try:
 			model_output = await asyncio.wait_for(
@@ -772,9 +820,99 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		if self.state.last_model_output is None:
 			raise ValueError('No model output to execute actions from')
 
-		result = await self.multi_act(self.state.last_model_output.action)
+		if self._streamed_actions is not None:
+			# the actions were dispatched while the output was streaming, wait for the rest of them
+			result = await self._streamed_actions
+			self._streamed_actions = None
+		else:
+			result = await self.multi_act(self.state.last_model_output.action)
 		self.state.last_result = result
 
+		if not (result and result[-1].is_done):
+			self._prefetch_browser_state()
+
+	def _prefetch_browser_state(self) -> None:
+		"""Start capturing the next step's browser state while this step's history, screenshot and events are saved"""
+		assert self.browser_session is not None, 'BrowserSession is not set up'
+		if not self.settings.prefetch_browser_state or self.state.stopped:
+			return
+		generation = self.browser_session.navigation_generation
+		if generation is None:
+			return  # navigations aren't tracked, a prefetched state could not be validated
+
+		self._discard_prefetched_state()
+		include_screenshot = self._needs_screenshot(self.state.n_steps + 1)
+		task = asyncio.create_task(
+			self.browser_session.get_browser_state_summary(
+				include_screenshot=include_screenshot,
+				include_recent_events=self.include_recent_events,
+			),
+			name=f'prefetch_browser_state_step_{self.state.n_steps + 1}',
+		)
+		self._prefetched_state = (task, generation, include_screenshot)
+
+	async def _take_prefetched_state(self, include_screenshot: bool) -> BrowserStateSummary | None:
+		"""The prefetched browser state, None if there is none or the page navigated since the capture started"""
+		assert self.browser_session is not None, 'BrowserSession is not set up'
+		if self._prefetched_state is None:
+			return None
+		task, generation, prefetched_screenshot = self._prefetched_state
+		if self.browser_session.navigation_generation != generation:
+			self.logger.debug('📸 Page navigated after the browser state was prefetched, discarding it')
+			self._discard_prefetched_state()
+			return None
+		self._prefetched_state = None
+
+		try:
+			browser_state_summary = await task
+		except Exception as e:
+			self.logger.debug(f'📸 Prefetching the browser state failed, fetching it again: {type(e).__name__}: {e}')
+			return None
+		# a navigation that happened while the capture was running makes it stale as well
+		if self.browser_session.navigation_generation != generation:
+			self.logger.debug('📸 Page navigated while the browser state was prefetched, fetching it again')
+			return None
+		self.logger.debug(f'📸 Using the browser state prefetched after step {self.state.n_steps - 1}')
+		if include_screenshot and not prefetched_screenshot:
+			# the screenshot became necessary after the prefetch started (e.g. settings changed), capture only that now
+			browser_state_summary.screenshot = await self._capture_screenshot()
+		return browser_state_summary
+
+	def _needs_screenshot(self, step_number: int) -> bool:
+		"""Whether the browser state of a step needs a screenshot, see ScreenshotPolicy"""
+		reason = self.screenshot_policy.reason(step_number, self.state.last_result)
+		if reason is None:
+			self.logger.debug(f'📸 Step {step_number}: no screenshot needed')
+			return False
+		self.logger.debug(f'📸 Step {step_number}: screenshot needed ({reason})')
+		return True
+
+	async def _capture_screenshot(self) -> Screenshot | None:
+		"""Capture just a screenshot of the focused page, without rebuilding the DOM"""
+		assert self.browser_session is not None, 'BrowserSession is not set up'
+		try:
+			event = self.browser_session.event_bus.dispatch(ScreenshotEvent(full_page=False))
+			return Screenshot.coerce(await event.event_result(raise_if_any=True, raise_if_none=True))
+		except Exception as e:
+			self.logger.warning(f'📸 Capturing the screenshot failed: {type(e).__name__}: {e}')
+			return None
+
+	def _discard_prefetched_state(self) -> None:
+		"""Drop the prefetched browser state, e.g. because a hook or the user may have changed the page since"""
+		prefetched, self._prefetched_state = self._prefetched_state, None
+		if prefetched is not None:
+			task = prefetched[0]
+			task.cancel()
+			task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+	def _cancel_streamed_actions(self) -> None:
+		"""Stop actions left running by a step that failed before executing them"""
+		task, self._streamed_actions = self._streamed_actions, None
+		if task is not None:
+			task.cancel()
+			# the step error is handled already, don't report the task's own error again
+			task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
 	async def _post_process(self) -> None:
 		"""Handle post-action processing like download tracking and result logging"""
 		assert self.browser_session is not None, 'BrowserSession is not set up'
@@ -837,11 +975,15 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		if not self.state.last_result:
 			return
 
+		# action models built this step plus provider schemas generated for the LLM call
+		schema_seconds = self._step_schema_seconds + self._step_schema_stats.build_seconds
+
 		if browser_state_summary:
 			metadata = StepMetadata(
 				step_number=self.state.n_steps,
 				step_start_time=self.step_start_time,
 				step_end_time=step_end_time,
+				schema_seconds=schema_seconds,
 			)
 
 			# Use _make_history_item like main branch
@@ -854,7 +996,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			)
 
 		# Log step completion summary
-		self._log_step_completion_summary(self.step_start_time, self.state.last_result)
+		self._log_step_completion_summary(self.step_start_time, self.state.last_result, schema_seconds)
 
 		# Save file system state after step completion
 		self.save_file_system_state()
@@ -928,14 +1070,16 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 			if not model_output.action or all(action.model_dump() == {} for action in model_output.action):
 				self.logger.warning('Model still returned empty after retry. Inserting safe noop action.')
-				action_instance = self.ActionModel()
-				setattr(
-					action_instance,
-					'done',
+				# nothing was streamed, the noop has to run through multi_act
+				self._cancel_streamed_actions()
+				# the action model is a union of the registered actions, it can't be built empty and filled in afterwards
+				action_instance = self.ActionModel.model_validate(
 					{
-						'success': False,
-						'text': 'No next action returned by LLM!',
-					},
+						'done': {
+							'success': False,
+							'text': 'No next action returned by LLM!',
+						}
+					}
 				)
 				model_output.action = [action_instance]
 
@@ -947,19 +1091,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		input_messages: list[BaseMessage],
 	) -> None:
 		"""Handle callbacks and conversation saving after LLM interaction"""
-		if self.register_new_step_callback and self.state.last_model_output:
-			if inspect.iscoroutinefunction(self.register_new_step_callback):
-				await self.register_new_step_callback(
-					browser_state_summary,
-					self.state.last_model_output,
-					self.state.n_steps,
-				)
-			else:
-				self.register_new_step_callback(
-					browser_state_summary,
-					self.state.last_model_output,
-					self.state.n_steps,
-				)
+		if self.state.last_model_output:
+			await self._run_new_step_callback(self.state.last_model_output)
 
 		if self.settings.save_conversation_path and self.state.last_model_output:
 			# Treat save_conversation_path as a directory (consistent with other recording paths)
@@ -973,6 +1106,16 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				self.settings.save_conversation_path_encoding,
 			)
 
+	async def _run_new_step_callback(self, model_output: AgentOutput) -> None:
+		"""Call register_new_step_callback once per step, with stream_actions before the first action is executed"""
+		browser_state_summary, self._new_step_callback_state = self._new_step_callback_state, None
+		if browser_state_summary is None or not self.register_new_step_callback:
+			return
+		if inspect.iscoroutinefunction(self.register_new_step_callback):
+			await self.register_new_step_callback(browser_state_summary, model_output, self.state.n_steps)
+		else:
+			self.register_new_step_callback(browser_state_summary, model_output, self.state.n_steps)
+
 	async def _make_history_item(
 		self,
 		model_output: AgentOutput | None,
@@ -992,7 +1135,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		screenshot_path = None
 		if browser_state_summary.screenshot:
 			self.logger.debug(
-				f'📸 Storing screenshot for step {self.state.n_steps}, screenshot length: {len(browser_state_summary.screenshot)}'
+				f'📸 Storing screenshot for step {self.state.n_steps}, screenshot size: {browser_state_summary.screenshot.size} bytes'
 			)
 			screenshot_path = await self.screenshot_service.store_screenshot(browser_state_summary.screenshot, self.state.n_steps)
 			self.logger.debug(f'📸 Screenshot stored at: {screenshot_path}')
@@ -1190,12 +1333,15 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		kwargs: dict = {'output_format': self.AgentOutput}
 
 		try:
-			response = await self.llm.ainvoke(input_messages, **kwargs)
-			parsed: AgentOutput = response.completion  # type: ignore[assignment]
+			if self.settings.stream_actions and isinstance(self.llm, StreamingChatModel):
+				parsed = await self._get_model_output_streaming(input_messages, urls_replaced)
+			else:
+				response = await self.llm.ainvoke(input_messages, **kwargs)
+				parsed: AgentOutput = response.completion  # type: ignore[assignment]
 
-			# Replace any shortened URLs in the LLM response back to original URLs
-			if urls_replaced:
-				self._recursive_process_all_strings_inside_pydantic_model(parsed, urls_replaced)
+				# Replace any shortened URLs in the LLM response back to original URLs
+				if urls_replaced:
+					self._recursive_process_all_strings_inside_pydantic_model(parsed, urls_replaced)
 
 			# cut the number of actions to max_actions_per_step if needed
 			if len(parsed.action) > self.settings.max_actions_per_step:
@@ -1210,6 +1356,64 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			# Just re-raise - Pydantic's validation errors are already descriptive
 			raise
 
+	async def _get_model_output_streaming(self, input_messages: list[BaseMessage], urls_replaced: dict[str, str]) -> AgentOutput:
+		"""
+		Stream the model output and dispatch every action as soon as its JSON object is complete.
+
+		The actions run in `self._streamed_actions` while the rest of the output is generated. Before the first one is
+		dispatched the pause/stop state is checked and register_new_step_callback is called, with the fields generated
+		so far and that first action. If the actions stop early (done, error or the page changed under the remaining
+		actions), the stream is cancelled and the output is made of the fields generated so far and the dispatched actions.
+		"""
+		assert isinstance(self.llm, StreamingChatModel)
+		# a retry of the step streams into a new executor, the previous attempt's one had nothing to run
+		self._cancel_streamed_actions()
+		parser = JSONArrayStreamParser('action')
+		queue: asyncio.Queue[ActionModel | None] = asyncio.Queue()
+		executor = asyncio.create_task(self._act_from_queue(queue, total_actions=None, stop_on_page_change=True))
+		self._streamed_actions = executor
+		dispatched: list[ActionModel] = []
+		rejected = False
+
+		try:
+			async with aclosing(self.llm.astream(input_messages, self.AgentOutput)) as stream:
+				async for chunk in stream:
+					for item in parser.feed(chunk.delta):
+						if rejected or len(dispatched) >= self.settings.max_actions_per_step:
+							continue
+						try:
+							action = self.ActionModel.model_validate(item)
+						except ValidationError as e:
+							# the complete output fails validation too, don't dispatch anything after this action
+							self.logger.debug(f'Streamed action {len(dispatched) + 1} is invalid, not dispatching it: {e}')
+							rejected = True
+							continue
+						if urls_replaced:
+							self._recursive_process_all_strings_inside_pydantic_model(action, urls_replaced)
+						if not dispatched:
+							await self._check_stop_or_pause()
+							step_start = self.AgentOutput.model_validate({**parser.fields_before_array(), 'action': [action]})
+							if urls_replaced:
+								self._recursive_process_all_strings_inside_pydantic_model(step_start, urls_replaced)
+							await self._run_new_step_callback(step_start)
+						dispatched.append(action)
+						queue.put_nowait(action)
+					if executor.done():
+						break
+		finally:
+			queue.put_nowait(None)
+
+		if executor.done() and not parser.complete:
+			self.logger.debug(f'⏹️ Cancelled the LLM output stream after {len(dispatched)} actions')
+			parsed = self.AgentOutput.model_validate({**parser.fields_before_array(), 'action': []})
+		else:
+			parsed = self.AgentOutput.model_validate_json(parser.document)
+		if urls_replaced:
+			self._recursive_process_all_strings_inside_pydantic_model(parsed, urls_replaced)
+		# the dispatched action objects are the ones that were executed
+		parsed.action = dispatched
+		return parsed
+
 	async def _log_agent_run(self) -> None:
 		"""Log the agent run"""
 		# Blue color for task
@@ -1238,7 +1442,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		interactive_count = len(browser_state_summary.dom_state.selector_map) if browser_state_summary else 0
 		self.logger.info('\n')
 		self.logger.info(f'📍 Step {self.state.n_steps}:')
-		self.logger.debug(f'Evaluating page with {interactive_count} interactive elements on: {url_short}')
+		diff = browser_state_summary.dom_state.diff if browser_state_summary else None
+		diff_info = (
+			f' (+{len(diff.added)} new, -{len(diff.removed)} gone, {len(diff.moved)} moved)' if diff and diff.has_changes else ''
+		)
+		self.logger.debug(f'Evaluating page with {interactive_count} interactive elements{diff_info} on: {url_short}')
 
 	def _log_next_action_summary(self, parsed: 'AgentOutput') -> None:
 		"""Log a comprehensive summary of the next action(s)"""
@@ -1274,7 +1482,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			param_str = f'({", ".join(param_summary)})' if param_summary else ''
 			action_details.append(f'{action_name}{param_str}')
 
-	def _log_step_completion_summary(self, step_start_time: float, result: list[ActionResult]) -> None:
+	def _log_step_completion_summary(
+		self, step_start_time: float, result: list[ActionResult], schema_seconds: float = 0.0
+	) -> None:
 		"""Log step completion summary with action count, timing, and success/failure stats"""
 		if not result:
 			return
@@ -1293,7 +1503,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		status_str = ' | '.join(status_parts) if status_parts else '✅ 0'
 
 		self.logger.debug(
-			f'📍 Step {self.state.n_steps}: Ran {action_count} action{"" if action_count == 1 else "s"} in {step_duration:.2f}s: {status_str}'
+			f'📍 Step {self.state.n_steps}: Ran {action_count} action{"" if action_count == 1 else "s"} in {step_duration:.2f}s '
+			f'(schema {schema_seconds * 1000:.1f}ms): {status_str}'
 		)
 
 	def _log_final_outcome_messages(self) -> None:
@@ -1560,6 +1771,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			bool: True if task is done, False otherwise
 		"""
 		if on_step_start is not None:
+			# the hook may drive the browser itself
+			self._discard_prefetched_state()
 			await on_step_start(self)
 
 		self.logger.debug(f'🚶 Starting step {step + 1}/{max_steps}...')
@@ -1578,6 +1791,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			self.state.last_result = [ActionResult(error=error_msg)]
 
 		if on_step_end is not None:
+			self._discard_prefetched_state()
 			await on_step_end(self)
 
 		if self.history.is_done():
@@ -1670,6 +1884,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 					self.logger.debug(f'⏸️ Step {step}: Agent paused, waiting to resume...')
 					await self._external_pause_event.wait()
 					signal_handler.reset()
+					# the user may have used the browser while the agent was paused
+					self._discard_prefetched_state()
 
 				# Check if we should stop due to too many failures, if final_response_after_failure is True, we try one last time
 				if (self.state.consecutive_failures) >= self.settings.max_failures + int(
@@ -1785,34 +2001,44 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 	@time_execution_async('--multi_act')
 	async def multi_act(self, actions: list[ActionModel]) -> list[ActionResult]:
 		"""Execute multiple actions"""
+		queue: asyncio.Queue[ActionModel | None] = asyncio.Queue()
+		for action in actions:
+			queue.put_nowait(action)
+		queue.put_nowait(None)
+		return await self._act_from_queue(queue, total_actions=len(actions))
+
+	async def _act_from_queue(
+		self,
+		queue: 'asyncio.Queue[ActionModel | None]',
+		total_actions: int | None,
+		stop_on_page_change: bool = False,
+	) -> list[ActionResult]:
+		"""Execute actions from the queue until it yields None, total_actions is None while they are still streaming in"""
 		results: list[ActionResult] = []
 		time_elapsed = 0
-		total_actions = len(actions)
 
 		assert self.browser_session is not None, 'BrowserSession is not set up'
-		try:
-			if (
-				self.browser_session._cached_browser_state_summary is not None
-				and self.browser_session._cached_browser_state_summary.dom_state is not None
-			):
-				cached_selector_map = dict(self.browser_session._cached_browser_state_summary.dom_state.selector_map)
-				cached_element_hashes = {e.parent_branch_hash() for e in cached_selector_map.values()}
-			else:
-				cached_selector_map = {}
-				cached_element_hashes = set()
-		except Exception as e:
-			self.logger.error(f'Error getting cached selector map: {e}')
-			cached_selector_map = {}
-			cached_element_hashes = set()
 
-		for i, action in enumerate(actions):
+		page_before: tuple[str | None, str] | None = None
+		if stop_on_page_change:
+			page_before = (self.browser_session.current_target_id, await self.browser_session.get_current_page_url())
+
+		i = 0
+		while (action := await queue.get()) is not None:
 			if i > 0:
 				# ONLY ALLOW TO CALL `done` IF IT IS A SINGLE ACTION
 				if action.model_dump(exclude_unset=True).get('done') is not None:
-					msg = f'Done action is allowed only as a single action - stopped after action {i} / {total_actions}.'
+					msg = f'Done action is allowed only as a single action - stopped after action {i} / {total_actions or i + 1}.'
 					self.logger.debug(msg)
 					break
 
+				# the remaining actions were chosen for the page the model saw, their element indexes are stale now
+				if page_before is not None:
+					page_now = (self.browser_session.current_target_id, await self.browser_session.get_current_page_url())
+					if page_now != page_before:
+						self.logger.info(f'🔄 Page changed after action {i}, skipping the remaining actions')
+						break
+
 			# wait between actions (only after first action)
 			if i > 0:
 				self.logger.debug(f'Waiting {self.browser_profile.wait_between_actions} seconds between actions')
@@ -1825,7 +2051,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				action_name = next(iter(action_data.keys())) if action_data else 'unknown'
 
 				# Log action before execution
-				self._log_action(action, action_name, i + 1, total_actions)
+				self._log_action(action, action_name, i + 1, total_actions or 0)
 
 				time_start = time.time()
 
@@ -1843,7 +2069,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 				results.append(result)
 
-				if results[-1].is_done or results[-1].error or i == total_actions - 1:
+				if results[-1].is_done or results[-1].error or i == (total_actions or 0) - 1:
 					break
 
 			except Exception as e:
@@ -1851,6 +2077,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				self.logger.error(f'❌ Executing action {i + 1} failed -> {type(e).__name__}: {e}')
 				raise e
 
+			i += 1
+
 		return results
 
 	def _log_action(self, action, action_name: str, action_num: int, total_actions: int) -> None:
@@ -2054,16 +2282,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		if not historical_element or not browser_state_summary.dom_state.selector_map:
 			return action
 
-		# selector_hash_map = {hash(e): e for e in browser_state_summary.dom_state.selector_map.values()}
-
-		highlight_index, current_element = next(
-			(
-				(highlight_index, element)
-				for highlight_index, element in browser_state_summary.dom_state.selector_map.items()
-				if element.element_hash == historical_element.element_hash
-			),
-			(None, None),
-		)
+		highlight_index, current_element = browser_state_summary.dom_state.get_element_by_hash(historical_element.element_hash)
 
 		if not current_element or highlight_index is None:
 			return None
@@ -2158,6 +2377,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 	async def close(self):
 		"""Close all resources"""
 		try:
+			self._discard_prefetched_state()
+
 			# Only close browser if keep_alive is False (or not set)
 			if self.browser_session is not None:
 				if not self.browser_session.browser_profile.keep_alive:
@@ -2165,6 +2386,14 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 					# stops the EventBus with clear=True, and recreates a fresh EventBus
 					await self.browser_session.kill()
 
+			# Don't leave a history summary running in the background
+			if self._message_manager.history_compactor is not None:
+				self._message_manager.history_compactor.cancel()
+
+			# Models may be shared with other agents, they are only closed once the last agent using them let go
+			for lease in self._llm_leases:
+				await lease.release()
+
 			# Force garbage collection
 			gc.collect()
 
@@ -2188,24 +2417,18 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 	async def _update_action_models_for_page(self, page_url: str) -> None:
 		"""Update action models with page-specific actions"""
-		# Create new action model with current page's filtered actions
-		self.ActionModel = self.tools.registry.create_action_model(page_url=page_url)
-		# Update output model with the new actions
-		if self.settings.flash_mode:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.ActionModel)
-		elif self.settings.use_thinking:
-			self.AgentOutput = AgentOutput.type_with_custom_actions(self.ActionModel)
-		else:
-			self.AgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.ActionModel)
+		# The registry hands out the same model class while the page's available actions stay the same, so the output
+		# models (and the provider schema caches keyed by them) are only rebuilt when that set changes
+		action_model = self.tools.registry.create_action_model(page_url=page_url)
+		if action_model is not self.ActionModel:
+			self.ActionModel = action_model
+			self.AgentOutput = self._agent_output_type(action_model)
 
 		# Update done action model too
-		self.DoneActionModel = self.tools.registry.create_action_model(include_actions=['done'], page_url=page_url)
-		if self.settings.flash_mode:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_flash_mode(self.DoneActionModel)
-		elif self.settings.use_thinking:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions(self.DoneActionModel)
-		else:
-			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
+		done_action_model = self.tools.registry.create_action_model(include_actions=['done'], page_url=page_url)
+		if done_action_model is not self.DoneActionModel:
+			self.DoneActionModel = done_action_model
+			self.DoneAgentOutput = self._agent_output_type(done_action_model)
 
 	def get_trace_object(self) -> dict[str, Any]:
 		"""Get the trace and trace_details objects for the agent"""
@@ -46,13 +46,19 @@ class AgentSettings(BaseModel):
 	use_thinking: bool = True
 	flash_mode: bool = False  # If enabled, disables evaluation_previous_goal and next_goal, and sets use_thinking = False
 	max_history_items: int | None = None
+	max_history_tokens: int | None = None  # Token budget of the agent history, older steps are summarized by history_summary_llm
 
 	page_extraction_llm: BaseChatModel | None = None
+	history_summary_llm: BaseChatModel | None = None
 	calculate_cost: bool = False
 	include_tool_call_examples: bool = False
 	llm_timeout: int = 60  # Timeout in seconds for LLM calls (auto-detected: 30s for gemini, 90s for o3, 60s default)
 	step_timeout: int = 180  # Timeout in seconds for each step
 	final_response_after_failure: bool = True  # If True, attempt one final recovery call after max_failures
+	stream_actions: bool = False  # If True, actions start executing while the LLM output is still streaming
+	prefetch_browser_state: bool = True  # If True, the next browser state is captured while the current step is finalized
+	screenshot_sample_rate: int | None = None  # Keep a screenshot every N steps (None: every step, unless use_vision=False)
+	llm_screenshot_size: tuple[int, int] | Literal['auto'] | None = None  # Downscale screenshots for the LLM, re-encoded as WebP
 
 
 class AgentState(BaseModel):
@@ -132,6 +138,8 @@ class StepMetadata(BaseModel):
 	step_start_time: float
 	step_end_time: float
 	step_number: int
+	schema_seconds: float = 0.0
+	"""Time spent building action models and LLM output schemas during the step, close to zero while they are cached"""
 
 	@property
 	def duration_seconds(self) -> float:
@@ -0,0 +1,258 @@
+"""
+Batched element geometry used by `BrowserSession.get_element_coordinates()` and the actor `Element`.
+
+Measuring an element used to take up to three sequential CDP round trips (DOM.getContentQuads, DOM.getBoxModel, then a
+JS getBoundingClientRect). Here all requested nodes are measured together: their `DOM.getContentQuads` calls are pipelined
+on the socket, and whatever has no quads is measured with one `Runtime.callFunctionOn` over all of its resolved objects.
+
+`ElementGeometry` additionally serves rects from the DOMSnapshot bounds while the snapshot is younger than a configurable
+age, and caches measured rects for a similarly short age, at most until the next DOM snapshot (one agent step). A layout
+shift without scrolling (lazy images, banners, reflowing text) moves elements without anything telling us, the ages bound
+how long such stale rects can be served. Rects are viewport coordinates, so cached and snapshot rects are only served while
+the page is still scrolled to where they were taken.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from cdp_use.cdp.target import SessionID, TargetID
+
+from browser_use.dom.views import DOMRect, NodeType
+
+if TYPE_CHECKING:
+	from cdp_use import CDPClient
+
+	from browser_use.dom.views import EnhancedDOMTreeNode
+
+logger = logging.getLogger(__name__)
+
+Scroll = tuple[float, float]
+
+_READ_SCROLL_JS = '[window.scrollX, window.scrollY]'
+
+_BOUNDING_CLIENT_RECTS_JS = """
+function(...elements) {
+	return elements.map(element => {
+		const rect = element.getBoundingClientRect();
+		return [rect.x, rect.y, rect.width, rect.height];
+	});
+}"""
+
+# every batch releases its own remote objects, concurrent batches must not share a group
+_object_groups = itertools.count()
+
+
+def _rect_from_quad(quad: list[float]) -> DOMRect | None:
+	if len(quad) < 8:
+		return None
+	x_coords = [quad[i] for i in range(0, 8, 2)]
+	y_coords = [quad[i] for i in range(1, 8, 2)]
+	x, y = min(x_coords), min(y_coords)
+	width, height = max(x_coords) - x, max(y_coords) - y
+	if width <= 0 or height <= 0:
+		return None
+	return DOMRect(x=x, y=y, width=width, height=height)
+
+
+async def _read_scroll(cdp_client: 'CDPClient', session_id: SessionID | None) -> Scroll | None:
+	try:
+		result = await cdp_client.send.Runtime.evaluate(
+			params={'expression': _READ_SCROLL_JS, 'returnByValue': True}, session_id=session_id
+		)
+	except Exception as e:
+		logger.debug(f'Reading the scroll offset failed: {e}')
+		return None
+	value = result.get('result', {}).get('value')
+	return (value[0], value[1]) if value else None
+
+
+async def _content_quads_rect(cdp_client: 'CDPClient', session_id: SessionID | None, backend_node_id: int) -> DOMRect | None:
+	try:
+		result = await cdp_client.send.DOM.getContentQuads(params={'backendNodeId': backend_node_id}, session_id=session_id)
+	except Exception as e:
+		logger.debug(f'DOM.getContentQuads failed for backend node {backend_node_id}: {e}')
+		return None
+	# the first quad is the most relevant one (e.g. the first line of a wrapped link)
+	quads = result.get('quads') or []
+	return _rect_from_quad(quads[0]) if quads else None
+
+
+async def bounding_client_rects(
+	cdp_client: 'CDPClient', session_id: SessionID | None, backend_node_ids: list[int]
+) -> dict[int, DOMRect | None]:
+	"""getBoundingClientRect() of all nodes with a single Runtime.callFunctionOn over their resolved objects."""
+	rects: dict[int, DOMRect | None] = dict.fromkeys(backend_node_ids)
+	object_group = f'browser-use-geometry-{next(_object_groups)}'
+	resolved = await asyncio.gather(
+		*[
+			cdp_client.send.DOM.resolveNode(
+				params={'backendNodeId': backend_node_id, 'objectGroup': object_group}, session_id=session_id
+			)
+			for backend_node_id in backend_node_ids
+		],
+		return_exceptions=True,
+	)
+	object_ids: dict[int, str] = {}
+	for backend_node_id, result in zip(backend_node_ids, resolved):
+		if isinstance(result, BaseException):
+			continue
+		if object_id := result.get('object', {}).get('objectId'):
+			object_ids[backend_node_id] = object_id
+	if not object_ids:
+		return rects
+
+	try:
+		result = await cdp_client.send.Runtime.callFunctionOn(
+			params={
+				'functionDeclaration': _BOUNDING_CLIENT_RECTS_JS,
+				'objectId': next(iter(object_ids.values())),
+				'arguments': [{'objectId': object_id} for object_id in object_ids.values()],
+				'returnByValue': True,
+			},
+			session_id=session_id,
+		)
+		values = result.get('result', {}).get('value') or []
+		for backend_node_id, value in zip(object_ids, values):
+			if value and value[2] > 0 and value[3] > 0:
+				rects[backend_node_id] = DOMRect(x=value[0], y=value[1], width=value[2], height=value[3])
+	except Exception as e:
+		# objects from different frames (execution contexts) can't be passed to the same call
+		logger.debug(f'Batched getBoundingClientRect failed for {len(object_ids)} nodes: {e}')
+		if len(object_ids) > 1:
+			for single in await asyncio.gather(
+				*[bounding_client_rects(cdp_client, session_id, [backend_node_id]) for backend_node_id in object_ids]
+			):
+				rects.update(single)
+	finally:
+		try:
+			await cdp_client.send.Runtime.releaseObjectGroup(params={'objectGroup': object_group}, session_id=session_id)
+		except Exception:
+			pass
+	return rects
+
+
+async def measure_element_rects(
+	cdp_client: 'CDPClient', session_id: SessionID | None, backend_node_ids: list[int]
+) -> tuple[Scroll | None, dict[int, DOMRect | None]]:
+	"""Viewport rects of the given nodes and the scroll offset they were measured at.
+
+	Content quads of all nodes (and the scroll offset) are requested concurrently, nodes without quads fall back to one
+	batched getBoundingClientRect call. Nodes that can't be measured map to None.
+	"""
+	scroll, quad_rects = await asyncio.gather(
+		_read_scroll(cdp_client, session_id),
+		asyncio.gather(*[_content_quads_rect(cdp_client, session_id, backend_node_id) for backend_node_id in backend_node_ids]),
+	)
+	rects: dict[int, DOMRect | None] = dict(zip(backend_node_ids, quad_rects))
+	missing = [backend_node_id for backend_node_id, rect in rects.items() if rect is None]
+	if missing:
+		rects.update(await bounding_client_rects(cdp_client, session_id, missing))
+	return scroll, rects
+
+
+def _root_document_scroll(node: 'EnhancedDOMTreeNode') -> Scroll | None:
+	"""Scroll offset recorded by the snapshot if the node lives in the top document of its target, None otherwise."""
+	html = node
+	while html is not None and not (html.node_type == NodeType.ELEMENT_NODE and html.node_name.upper() == 'HTML'):
+		html = html.parent_node
+	# #document above the <html> is owned by an <iframe> for frame content
+	if html is None or html.parent_node is None or html.parent_node.parent_node is not None:
+		return None
+	scroll_rect = html.snapshot_node.scrollRects if html.snapshot_node else None
+	return (scroll_rect.x, scroll_rect.y) if scroll_rect else (0.0, 0.0)
+
+
+def _same_scroll(a: Scroll | None, b: Scroll | None) -> bool:
+	return a is not None and b is not None and abs(a[0] - b[0]) < 0.5 and abs(a[1] - b[1]) < 0.5
+
+
+class ElementGeometry:
+	"""Short-lived rect cache in front of `measure_element_rects()`, seeded from the latest DOM snapshot."""
+
+	def __init__(self, snapshot_max_age: float = 1.0, cache_max_age: float = 1.0):
+		self.snapshot_max_age = snapshot_max_age
+		self.cache_max_age = cache_max_age
+		self.cache_hits = 0
+		self.snapshot_hits = 0
+		self.measured = 0
+		self._cache: dict[tuple[TargetID, int], tuple[DOMRect, Scroll, float]] = {}
+		self._nodes: dict[tuple[TargetID, int], 'EnhancedDOMTreeNode'] = {}
+		self._snapshot_time: float | None = None
+
+	def new_step(self, selector_map: dict[int, 'EnhancedDOMTreeNode']) -> None:
+		"""Start over from a fresh DOM snapshot, everything measured before it is dropped."""
+		self._cache.clear()
+		self._nodes = {(node.target_id, node.backend_node_id): node for node in selector_map.values()}
+		self._snapshot_time = time.monotonic()
+
+	def reset(self) -> None:
+		self._cache.clear()
+		self._nodes = {}
+		self._snapshot_time = None
+
+	def _known_rect(self, target_id: TargetID, backend_node_id: int) -> tuple[DOMRect, Scroll, bool] | None:
+		"""Cached or snapshot rect with the scroll offset it is valid for, and whether it came from the snapshot."""
+		key = (target_id, backend_node_id)
+		if cached := self._cache.get(key):
+			if time.monotonic() - cached[2] <= self.cache_max_age:
+				return cached[0], cached[1], False
+			del self._cache[key]
+
+		node = self._nodes.get(key)
+		if node is None or self._snapshot_time is None or time.monotonic() - self._snapshot_time > self.snapshot_max_age:
+			return None
+		rect = node.absolute_position
+		snapshot_scroll = _root_document_scroll(node)
+		if rect is None or rect.width <= 0 or rect.height <= 0 or snapshot_scroll is None:
+			return None
+		# snapshot bounds are document coordinates
+		viewport_rect = DOMRect(
+			x=rect.x - snapshot_scroll[0], y=rect.y - snapshot_scroll[1], width=rect.width, height=rect.height
+		)
+		return viewport_rect, snapshot_scroll, True
+
+	async def get_rects(
+		self, cdp_client: 'CDPClient', session_id: SessionID | None, target_id: TargetID, backend_node_ids: list[int]
+	) -> dict[int, DOMRect | None]:
+		"""Viewport rects for the given nodes of one target, measuring only what isn't known for the current scroll offset."""
+		known = {
+			backend_node_id: found
+			for backend_node_id in backend_node_ids
+			if (found := self._known_rect(target_id, backend_node_id)) is not None
+		}
+		to_measure = [backend_node_id for backend_node_id in backend_node_ids if backend_node_id not in known]
+
+		rects: dict[int, DOMRect | None] = {}
+		if to_measure:
+			scroll, measured = await measure_element_rects(cdp_client, session_id, to_measure)
+		else:
+			scroll, measured = await _read_scroll(cdp_client, session_id), {}
+
+		stale: list[int] = []
+		for backend_node_id, (rect, taken_at, from_snapshot) in known.items():
+			if not _same_scroll(taken_at, scroll):
+				stale.append(backend_node_id)
+				continue
+			rects[backend_node_id] = rect
+			if from_snapshot:
+				self.snapshot_hits += 1
+			else:
+				self.cache_hits += 1
+		if stale:
+			# the page scrolled since, measure them again
+			scroll, remeasured = await measure_element_rects(cdp_client, session_id, stale)
+			measured.update(remeasured)
+
+		self.measured += len(measured)
+		for backend_node_id, rect in measured.items():
+			rects[backend_node_id] = rect
+			key = (target_id, backend_node_id)
+			# only top-document rects are keyed by the scroll offset we can observe, iframe content can scroll on its own
+			node = self._nodes.get(key)
+			if rect is not None and scroll is not None and node is not None and _root_document_scroll(node) is not None:
+				self._cache[key] = (rect, scroll, time.monotonic())
+
+		return {backend_node_id: rects.get(backend_node_id) for backend_node_id in backend_node_ids}
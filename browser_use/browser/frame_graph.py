@@ -0,0 +1,125 @@
+"""
+Cache of the frame hierarchy built by `BrowserSession.get_all_frames()`.
+
+Building the hierarchy walks every target with `Page.getFrameTree` plus a `DOM.getFrameOwner` per frame, so the result is
+kept until a Page frame event or a target being created/destroyed says otherwise. Navigations and detached frames are
+patched in place, everything that would need new CDP data (attached frames, new targets) invalidates the cache.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from cdp_use.cdp.page.events import FrameAttachedEvent, FrameDetachedEvent, FrameNavigatedEvent, NavigatedWithinDocumentEvent
+from cdp_use.cdp.target import SessionID, TargetID
+
+if TYPE_CHECKING:
+	from cdp_use import CDPClient
+
+CacheKey = tuple[Any, ...]
+
+
+class FrameGraph:
+	"""Frame id -> frame info dict (as built by get_all_frames) with O(1) frame -> target / session lookups."""
+
+	def __init__(self):
+		self.frames: dict[str, dict] = {}
+		self.target_sessions: dict[TargetID, SessionID] = {}
+		self.is_tracking = False
+		self.hits = 0
+		self.rebuilds = 0
+		self._key: CacheKey | None = None
+		# bumped by every invalidation, a build that raced with one must not be cached
+		self._generation = 0
+		self.navigations = 0
+		"""Top-level and same-document navigations seen so far, never reset (used to detect stale browser state)"""
+
+	def start(self, cdp_client: 'CDPClient') -> None:
+		"""Register the Page frame event handlers on the root client, all flattened sessions share them."""
+		cdp_client.register.Page.frameAttached(self.on_frame_attached)
+		cdp_client.register.Page.frameDetached(self.on_frame_detached)
+		cdp_client.register.Page.frameNavigated(self.on_frame_navigated)
+		cdp_client.register.Page.navigatedWithinDocument(self.on_navigated_within_document)
+		self.is_tracking = True
+
+	def reset(self) -> None:
+		self.invalidate()
+		self.is_tracking = False
+
+	@property
+	def generation(self) -> int:
+		return self._generation
+
+	def get(self, key: CacheKey) -> tuple[dict[str, dict], dict[TargetID, SessionID]] | None:
+		"""The cached hierarchy if it was built for the same key (targets and focus) and nothing invalidated it since."""
+		if not self.is_tracking or self._key is None or self._key != key:
+			return None
+		self.hits += 1
+		return self.frames, self.target_sessions
+
+	def store(self, key: CacheKey, generation: int, frames: dict[str, dict], target_sessions: dict[TargetID, SessionID]) -> None:
+		"""Cache a freshly built hierarchy, unless a frame event arrived while it was being built."""
+		self.rebuilds += 1
+		if generation != self._generation:
+			return
+		self.frames = frames
+		self.target_sessions = target_sessions
+		self._key = key
+
+	def invalidate(self) -> None:
+		self._generation += 1
+		self._key = None
+		self.frames = {}
+		self.target_sessions = {}
+
+	def target_for_frame(self, frame_id: str) -> TargetID | None:
+		frame_info = self.frames.get(frame_id)
+		return frame_info.get('frameTargetId') if frame_info else None
+
+	def session_for_frame(self, frame_id: str) -> SessionID | None:
+		target_id = self.target_for_frame(frame_id)
+		return self.target_sessions.get(target_id) if target_id else None
+
+	def on_frame_attached(self, event: FrameAttachedEvent, session_id: SessionID | None = None) -> None:
+		# a new frame needs its target, origin and owner node resolved, leave that to the next full build
+		if self._key is not None and event['frameId'] not in self.frames:
+			self.invalidate()
+
+	def on_frame_detached(self, event: FrameDetachedEvent, session_id: SessionID | None = None) -> None:
+		if self._key is None:
+			return
+		frame_id = event['frameId']
+		frame_info = self.frames.get(frame_id)
+		if frame_info is None:
+			return
+		if event.get('reason') == 'swap':
+			# the frame moves to another process (OOPIF), its new target arrives with Target events
+			self.invalidate()
+			return
+
+		parent_info = self.frames.get(frame_info.get('parentFrameId') or '')
+		if parent_info and frame_id in parent_info['childFrameIds']:
+			parent_info['childFrameIds'].remove(frame_id)
+		stack = [frame_id]
+		while stack:
+			removed = self.frames.pop(stack.pop(), None)
+			if removed:
+				stack.extend(removed['childFrameIds'])
+
+	def on_frame_navigated(self, event: FrameNavigatedEvent, session_id: SessionID | None = None) -> None:
+		frame = event['frame']
+		if not frame.get('parentId'):
+			self.navigations += 1
+		if self._key is None:
+			return
+		frame_info = self.frames.get(frame['id'])
+		if frame_info is None:
+			self.invalidate()
+			return
+		# url, loaderId, securityOrigin, ... change with the navigation, our own bookkeeping keys stay valid
+		frame_info.update(frame)
+		cross_origin_type = frame.get('crossOriginIsolatedContextType')
+		if cross_origin_type and cross_origin_type != 'NotIsolated':
+			frame_info['isCrossOrigin'] = True
+
+	def on_navigated_within_document(self, event: NavigatedWithinDocumentEvent, session_id: SessionID | None = None) -> None:
+		# history.pushState / anchor navigations keep the frame tree, but the page the agent saw is gone
+		self.navigations += 1
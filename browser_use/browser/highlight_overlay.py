@@ -0,0 +1,273 @@
+"""
+Incremental DOM highlight overlay used by `BrowserSession.add_highlights()`.
+
+The overlay script is installed once per document and keeps one box per highlighted backend node id. Every later call
+only ships the boxes that appeared or moved and the ids that went away as compact `[id, x, y, w, h, tag]` tuples, the
+descriptive hover label (`[id] <tag> text`) is computed in the page the first time the mouse rests on a box.
+"""
+
+import json
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from cdp_use.cdp.target import TargetID
+
+if TYPE_CHECKING:
+	from browser_use.dom.views import EnhancedDOMTreeNode
+
+# (x, y, width, height, tag), rounded to whole CSS pixels so sub-pixel layout jitter doesn't count as a change
+HighlightBox = tuple[int, int, int, int, str]
+
+_INSTALL_OVERLAY_JS = """
+(function(token, boxes) {
+	const HIGHLIGHT_Z_INDEX = 2147483647;
+
+	if (window.__browserUseHighlights) window.__browserUseHighlights.destroy();
+	document.querySelectorAll('[data-browser-use-highlight]').forEach(el => el.remove());
+
+	const container = document.createElement('div');
+	container.id = 'browser-use-debug-highlights';
+	container.setAttribute('data-browser-use-highlight', 'container');
+	container.style.cssText = `
+		position: absolute;
+		top: 0;
+		left: 0;
+		width: 100vw;
+		height: 100vh;
+		pointer-events: none;
+		z-index: ${HIGHLIGHT_Z_INDEX};
+		overflow: visible;
+		margin: 0;
+		padding: 0;
+		border: none;
+		outline: none;
+		box-shadow: none;
+		background: none;
+		font-family: inherit;
+	`;
+
+	const colors = {
+		'button': { main: '#8FA3B8', glow: 'rgba(143, 163, 184, 0.3)', label: '#8FA3B8' },
+		'input': { main: '#A0B4C8', glow: 'rgba(160, 180, 200, 0.3)', label: '#A0B4C8' },
+		'select': { main: '#B8C5D0', glow: 'rgba(184, 197, 208, 0.3)', label: '#B8C5D0' },
+		'a': { main: '#7A92A8', glow: 'rgba(122, 146, 168, 0.3)', label: '#7A92A8' },
+		'textarea': { main: '#C0CCD8', glow: 'rgba(192, 204, 216, 0.3)', label: '#C0CCD8' },
+		'default': { main: '#9CADB8', glow: 'rgba(156, 173, 184, 0.3)', label: '#9CADB8' }
+	};
+	const getElementColor = (tag) => colors[tag] || colors.default;
+
+	// backend node id -> { div, box }
+	const highlights = new Map();
+	// backend node id -> hover label, filled lazily and dropped whenever the box changes
+	const hoverLabels = new Map();
+
+	function upsert(box) {
+		const [id, x, y, width, height, tag] = box;
+		let entry = highlights.get(id);
+		if (!entry) {
+			const color = getElementColor(tag);
+			const div = document.createElement('div');
+			div.setAttribute('data-browser-use-highlight', 'element');
+			div.setAttribute('data-element-id', id);
+			div.style.cssText = `
+				position: absolute;
+				background: linear-gradient(135deg, rgba(255, 255, 255, 0.12) 0%, rgba(255, 255, 255, 0.06) 100%);
+				backdrop-filter: blur(10px) saturate(180%);
+				-webkit-backdrop-filter: blur(10px) saturate(180%);
+				border: 2px solid ${color.main};
+				border-radius: 8px;
+				pointer-events: none;
+				box-sizing: border-box;
+				transition: all 0.2s cubic-bezier(0.4, 0.0, 0.2, 1);
+				margin: 0;
+				padding: 0;
+				box-shadow:
+					0 0 0 1px rgba(255, 255, 255, 0.15) inset,
+					0 8px 32px ${color.glow},
+					0 4px 16px rgba(0, 0, 0, 0.12),
+					0 1px 4px rgba(0, 0, 0, 0.08);
+				transform: translateZ(0);
+				will-change: transform, box-shadow;
+			`;
+
+			const label = document.createElement('div');
+			label.textContent = id;
+			label.style.cssText = `
+				position: absolute;
+				top: -28px;
+				left: 50%;
+				transform: translateX(-50%);
+				background: linear-gradient(135deg, ${color.label}EE 0%, ${color.label}CC 100%);
+				backdrop-filter: blur(20px) saturate(180%);
+				-webkit-backdrop-filter: blur(20px) saturate(180%);
+				color: white;
+				padding: 5px 14px;
+				font-size: 11px;
+				font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
+				font-weight: 600;
+				letter-spacing: 0.4px;
+				border-radius: 10px;
+				white-space: nowrap;
+				z-index: ${HIGHLIGHT_Z_INDEX + 1};
+				box-shadow:
+					0 0 0 1px rgba(255, 255, 255, 0.25) inset,
+					0 4px 24px ${color.glow},
+					0 2px 12px rgba(0, 0, 0, 0.25),
+					0 1px 4px rgba(0, 0, 0, 0.15);
+				border: 1px solid rgba(255, 255, 255, 0.35);
+				outline: none;
+				margin: 0;
+				line-height: 1.4;
+				text-shadow: 0 1px 3px rgba(0, 0, 0, 0.4);
+				transition: all 0.2s cubic-bezier(0.4, 0.0, 0.2, 1);
+			`;
+			div.appendChild(label);
+			container.appendChild(div);
+			entry = { div: div, box: box };
+			highlights.set(id, entry);
+		}
+		entry.box = box;
+		entry.div.style.left = `${x}px`;
+		entry.div.style.top = `${y}px`;
+		entry.div.style.width = `${width}px`;
+		entry.div.style.height = `${height}px`;
+		hoverLabels.delete(id);
+	}
+
+	function remove(id) {
+		const entry = highlights.get(id);
+		if (!entry) return;
+		entry.div.remove();
+		highlights.delete(id);
+		hoverLabels.delete(id);
+	}
+
+	const tooltip = document.createElement('div');
+	tooltip.setAttribute('data-browser-use-highlight', 'tooltip');
+	tooltip.style.cssText = `
+		position: absolute;
+		display: none;
+		max-width: 420px;
+		padding: 4px 10px;
+		border-radius: 6px;
+		background: rgba(30, 36, 44, 0.9);
+		color: white;
+		font-size: 11px;
+		font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
+		white-space: nowrap;
+		overflow: hidden;
+		text-overflow: ellipsis;
+		pointer-events: none;
+		z-index: ${HIGHLIGHT_Z_INDEX + 2};
+	`;
+	container.appendChild(tooltip);
+
+	function hoverLabel(id, box, event) {
+		let text = hoverLabels.get(id);
+		if (text === undefined) {
+			// the overlay has pointer-events: none, so this is the page element below the cursor
+			const element = document.elementFromPoint(event.clientX, event.clientY);
+			const content = element
+				? (element.innerText || element.value || element.getAttribute('aria-label') || '').replace(/\\s+/g, ' ').trim().slice(0, 50)
+				: '';
+			text = `[${id}] <${box[5]}> ${content}`;
+			hoverLabels.set(id, text);
+		}
+		return text;
+	}
+
+	let hoverScheduled = false;
+	function onMouseMove(event) {
+		if (hoverScheduled) return;
+		hoverScheduled = true;
+		requestAnimationFrame(() => {
+			hoverScheduled = false;
+			// innermost (smallest) highlighted box under the cursor
+			let best = null;
+			for (const [id, entry] of highlights) {
+				const [, x, y, width, height] = entry.box;
+				if (event.pageX < x || event.pageX > x + width || event.pageY < y || event.pageY > y + height) continue;
+				if (!best || width * height < best.area) best = { id: id, box: entry.box, area: width * height };
+			}
+			if (!best) {
+				tooltip.style.display = 'none';
+				return;
+			}
+			tooltip.textContent = hoverLabel(best.id, best.box, event);
+			tooltip.style.left = `${event.pageX + 12}px`;
+			tooltip.style.top = `${event.pageY + 16}px`;
+			tooltip.style.display = 'block';
+		});
+	}
+	document.addEventListener('mousemove', onMouseMove, true);
+
+	window.__browserUseHighlights = {
+		token: token,
+		apply(upserts, removed) {
+			// remove_highlights() or the page itself may have taken the container out of the document
+			if (!container.isConnected) return { missing: true };
+			removed.forEach(remove);
+			upserts.forEach(upsert);
+			return { added: upserts.length, removed: removed.length, total: highlights.size };
+		},
+		destroy() {
+			document.removeEventListener('mousemove', onMouseMove, true);
+			container.remove();
+			delete window.__browserUseHighlights;
+		},
+	};
+
+	boxes.forEach(upsert);
+	(document.body || document.documentElement).appendChild(container);
+	return { added: boxes.length, removed: 0, total: highlights.size };
+})"""
+
+_APPLY_OVERLAY_JS = """
+(function(token, upserts, removed) {
+	const overlay = window.__browserUseHighlights;
+	if (!overlay || overlay.token !== token) return { missing: true };
+	return overlay.apply(upserts, removed);
+})"""
+
+
+def boxes_from_selector_map(selector_map: dict[int, 'EnhancedDOMTreeNode']) -> dict[int, HighlightBox]:
+	"""Compact highlight boxes keyed by backend node id, skipping elements without a visible bounding box."""
+	boxes: dict[int, HighlightBox] = {}
+	for node in selector_map.values():
+		# absolute position includes iframe coordinate translations
+		rect = node.absolute_position
+		if not rect or rect.width <= 0 or rect.height <= 0:
+			continue
+		boxes[node.backend_node_id] = (round(rect.x), round(rect.y), round(rect.width), round(rect.height), node.tag_name)
+	return boxes
+
+
+class HighlightOverlay:
+	"""Python side of the in-page overlay: remembers what the page currently shows so only the difference is sent."""
+
+	def __init__(self):
+		self.target_id: TargetID | None = None
+		self.boxes: dict[int, HighlightBox] = {}
+		self.token = uuid4().hex[:8]
+
+	def reset(self, target_id: TargetID | None = None) -> None:
+		"""Forget the page state, the next update installs the overlay from scratch."""
+		self.target_id = target_id
+		self.boxes = {}
+		self.token = uuid4().hex[:8]
+
+	def diff(self, boxes: dict[int, HighlightBox]) -> tuple[list[list[Any]], list[int]]:
+		"""Tuples for boxes that are new or moved, and ids that are no longer highlighted."""
+		upserts = [[backend_node_id, *box] for backend_node_id, box in boxes.items() if self.boxes.get(backend_node_id) != box]
+		removed = [backend_node_id for backend_node_id in self.boxes if backend_node_id not in boxes]
+		return upserts, removed
+
+	def commit(self, boxes: dict[int, HighlightBox]) -> None:
+		self.boxes = dict(boxes)
+
+	def install_expression(self, boxes: dict[int, HighlightBox]) -> str:
+		full = [[backend_node_id, *box] for backend_node_id, box in boxes.items()]
+		return f'{_INSTALL_OVERLAY_JS}({json.dumps(self.token)}, {json.dumps(full)})'
+
+	def apply_expression(self, upserts: list[list[Any]], removed: list[int]) -> str:
+		return f'{_APPLY_OVERLAY_JS}({json.dumps(self.token)}, {json.dumps(upserts)}, {json.dumps(removed)})'
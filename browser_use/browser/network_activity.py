@@ -0,0 +1,234 @@
+"""
+Event-driven network activity tracking for page stability detection.
+
+Requests are tracked per CDP session from `Network.requestWillBeSent` / `loadingFinished` / `loadingFailed`, so checking
+for pending requests or waiting for network idle never has to round-trip to the page.
+"""
+
+import asyncio
+import re
+import time
+from typing import TYPE_CHECKING, Any
+
+from cdp_use.cdp.network.events import LoadingFailedEvent, LoadingFinishedEvent, RequestWillBeSentEvent
+from cdp_use.cdp.target import SessionID, TargetID
+
+from browser_use.browser.views import NetworkRequest
+
+if TYPE_CHECKING:
+	from cdp_use import CDPClient
+
+# Common ad/tracking domains and URL patterns, requests matching any of them never block page stability
+IGNORED_URL_PATTERNS = (
+	# Standard ad/tracking networks
+	'doubleclick.net',
+	'googlesyndication.com',
+	'googletagmanager.com',
+	'facebook.net',
+	'analytics',
+	'ads',
+	'tracking',
+	'pixel',
+	'hotjar.com',
+	'clarity.ms',
+	'mixpanel.com',
+	'segment.com',
+	# Analytics platforms
+	'demdex.net',
+	'omtrdc.net',
+	'adobedtm.com',
+	'ensighten.com',
+	'newrelic.com',
+	'nr-data.net',
+	'google-analytics.com',
+	# Social media trackers
+	'connect.facebook.net',
+	'platform.twitter.com',
+	'platform.linkedin.com',
+	# CDN/image hosts (usually not critical for functionality)
+	'.cloudfront.net/image/',
+	'.akamaized.net/image/',
+	# Common tracking paths
+	'/tracker/',
+	'/collector/',
+	'/beacon/',
+	'/telemetry/',
+	'/log/',
+	'/events/',
+	'/eventBatch',
+	'/track.',
+	'/metrics/',
+)
+_IGNORED_URL_RE = re.compile('|'.join(re.escape(pattern) for pattern in IGNORED_URL_PATTERNS))
+_IMAGE_URL_RE = re.compile(r'\.(jpg|jpeg|png|gif|webp|svg|ico)(\?|$)', re.IGNORECASE)
+
+NON_CRITICAL_RESOURCE_TYPES = frozenset({'Image', 'Font'})
+MAX_URL_LENGTH = 500
+# Requests loading longer than this are most likely long-polling / streaming and are ignored
+STUCK_REQUEST_SECONDS = 10.0
+# Images and fonts loading longer than this don't block stability either
+NON_CRITICAL_REQUEST_SECONDS = 3.0
+# Requests we never saw finish (e.g. the loadingFinished event was lost) are forgotten after this long
+FORGET_REQUEST_SECONDS = 60.0
+
+
+class NetworkRequestTracker:
+	"""Tracks ongoing network requests."""
+
+	def __init__(self, request_id: str, start_time: float, url: str, method: str, resource_type: str | None = None):
+		self.request_id = request_id
+		self.start_time = start_time
+		self.url = url
+		self.method = method
+		self.resource_type = resource_type
+
+
+def is_ignored_request(url: str) -> bool:
+	"""Whether a request is noise (ads, tracking, inline data) that should never block page stability."""
+	return url.startswith('data:') or len(url) > MAX_URL_LENGTH or _IGNORED_URL_RE.search(url) is not None
+
+
+class NetworkActivityTracker:
+	"""In-flight requests of a single CDP session, with an awaitable network idle condition."""
+
+	def __init__(self, session_id: SessionID):
+		self.session_id = session_id
+		self._requests: dict[str, NetworkRequestTracker] = {}
+		self._changed = asyncio.Event()
+
+	def on_request_will_be_sent(self, event: RequestWillBeSentEvent) -> None:
+		request = event['request']
+		url = request['url']
+		if is_ignored_request(url):
+			return
+		# redirects reuse the request id, keep the original start time
+		existing = self._requests.get(event['requestId'])
+		self._requests[event['requestId']] = NetworkRequestTracker(
+			request_id=event['requestId'],
+			start_time=existing.start_time if existing else time.monotonic(),
+			url=url,
+			method=request['method'],
+			resource_type=event.get('type'),
+		)
+		self._changed.set()
+
+	def on_request_done(self, event: LoadingFinishedEvent | LoadingFailedEvent) -> None:
+		if self._requests.pop(event['requestId'], None) is not None:
+			self._changed.set()
+
+	def reset(self) -> None:
+		self._requests.clear()
+		self._changed.set()
+
+	def _blocking_requests(self, now: float) -> tuple[list[NetworkRequestTracker], float | None]:
+		"""Requests that currently block stability, and the delay until one of them stops counting because of its age."""
+		blocking: list[NetworkRequestTracker] = []
+		next_expiry: float | None = None
+		for request_id, request in list(self._requests.items()):
+			age = now - request.start_time
+			if age > FORGET_REQUEST_SECONDS:
+				del self._requests[request_id]
+				continue
+			if age > STUCK_REQUEST_SECONDS:
+				continue
+			expires_at = STUCK_REQUEST_SECONDS
+			if request.resource_type in NON_CRITICAL_RESOURCE_TYPES or _IMAGE_URL_RE.search(request.url):
+				if age > NON_CRITICAL_REQUEST_SECONDS:
+					continue
+				expires_at = NON_CRITICAL_REQUEST_SECONDS
+			blocking.append(request)
+			if next_expiry is None or expires_at - age < next_expiry:
+				next_expiry = expires_at - age
+		return blocking, next_expiry
+
+	def pending_requests(self, limit: int = 20) -> list[NetworkRequest]:
+		"""Currently loading requests that matter for page stability, oldest first."""
+		now = time.monotonic()
+		blocking, _ = self._blocking_requests(now)
+		return [
+			NetworkRequest(
+				url=request.url,
+				method=request.method,
+				loading_duration_ms=round((now - request.start_time) * 1000),
+				resource_type=request.resource_type,
+			)
+			for request in blocking[:limit]
+		]
+
+	async def wait_for_idle(self, idle_time: float, max_inflight: int, timeout: float) -> bool:
+		"""Wait until at most `max_inflight` requests are pending for `idle_time` seconds (networkidle0/networkidle2).
+
+		Wakes up only on network events or when a pending request ages out of the filters, never polls.
+
+		Returns:
+			True if network became idle, False if timeout was reached
+		"""
+		deadline = time.monotonic() + timeout
+		idle_since: float | None = None
+		while True:
+			now = time.monotonic()
+			self._changed.clear()
+			blocking, next_expiry = self._blocking_requests(now)
+			if len(blocking) <= max_inflight:
+				if idle_since is None:
+					idle_since = now
+				if now - idle_since >= idle_time:
+					return True
+				wake_in = idle_since + idle_time - now
+			else:
+				idle_since = None
+				wake_in = next_expiry if next_expiry is not None else timeout
+
+			remaining = deadline - now
+			if remaining <= 0:
+				return False
+			try:
+				await asyncio.wait_for(self._changed.wait(), timeout=min(wake_in, remaining))
+			except TimeoutError:
+				pass
+
+
+class NetworkActivityRouter:
+	"""Registers the Network event handlers once per CDP client and routes events to the tracker of their session.
+
+	cdp-use keeps a single callback per event method per client, so all sessions sharing a websocket share these handlers.
+	"""
+
+	def __init__(self):
+		self.trackers: dict[SessionID, NetworkActivityTracker] = {}
+		self._session_targets: dict[SessionID, TargetID] = {}
+		self._registered_clients: set[int] = set()
+
+	def get_tracker(
+		self, cdp_client: 'CDPClient', target_id: TargetID, session_id: SessionID
+	) -> tuple[NetworkActivityTracker, bool]:
+		"""Returns the tracker of a session and whether it was just created (i.e. `Network.enable` still has to be sent)."""
+		if id(cdp_client) not in self._registered_clients:
+			cdp_client.register.Network.requestWillBeSent(self._make_handler('on_request_will_be_sent'))
+			cdp_client.register.Network.loadingFinished(self._make_handler('on_request_done'))
+			cdp_client.register.Network.loadingFailed(self._make_handler('on_request_done'))
+			self._registered_clients.add(id(cdp_client))
+
+		tracker = self.trackers.get(session_id)
+		if tracker is not None:
+			return tracker, False
+		# a target re-attached under a new session, its old session's tracker will never see an event again
+		self.forget_target(target_id)
+		tracker = NetworkActivityTracker(session_id)
+		self.trackers[session_id] = tracker
+		self._session_targets[session_id] = target_id
+		return tracker, True
+
+	def forget_target(self, target_id: TargetID) -> None:
+		"""Drop every tracker of a target, e.g. once its tab was closed."""
+		for session_id in [session_id for session_id, target in self._session_targets.items() if target == target_id]:
+			del self._session_targets[session_id]
+			self.trackers.pop(session_id, None)
+
+	def _make_handler(self, method: str):
+		def handler(event: Any, session_id: SessionID | None = None) -> None:
+			tracker = self.trackers.get(session_id) if session_id else None
+			if tracker is not None:
+				getattr(tracker, method)(event)
+
+		return handler
@@ -614,6 +614,35 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		default=5,
 		description='Maximum depth for cross-origin iframe recursion (default: 5 levels deep).',
 	)
+	max_concurrent_iframes: int = Field(
+		ge=1,
+		default=5,
+		description='Maximum number of cross-origin iframe documents fetched concurrently.',
+	)
+	incremental_dom: bool = Field(
+		default=False,
+		description='Keep the DOM tree between steps and patch it from CDP DOM mutation events instead of rebuilding it from scratch. Experimental.',
+	)
+	incremental_dom_max_dirty_ratio: float = Field(
+		ge=0,
+		le=1,
+		default=0.25,
+		description='Fraction of mutated nodes above which the incremental DOM tree is rebuilt from scratch.',
+	)
+	element_geometry_snapshot_max_age: float = Field(
+		ge=0,
+		default=1.0,
+		description='Seconds for which element rects are taken from the last DOM snapshot instead of being measured again (0 to always measure).',
+	)
+	element_geometry_cache_max_age: float = Field(
+		ge=0,
+		default=1.0,
+		description='Seconds for which measured element rects are reused within a step, bounding how long a layout shift without scrolling can serve stale rects (0 to always measure).',
+	)
+	check_tab_registry_consistency: bool = Field(
+		default=False,
+		description='Compare the event-driven tab registry against Target.getTargets() on every get_tabs() call and log any drift. Debugging aid, costs a CDP round trip.',
+	)
 
 	# --- Page load/wait timings ---
 
@@ -624,7 +653,7 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 
 	# Network idle settings (adaptive waiting)
 	enable_adaptive_network_idle: bool = Field(
-		default=True, description='Enable adaptive network idle detection (polls until network is stable)'
+		default=True, description='Enable adaptive network idle detection (waits until network is stable)'
 	)
 	network_idle_time: float = Field(
 		default=0.5,
@@ -638,7 +667,8 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		default=10.0, description='Maximum time to wait for network idle before giving up and proceeding anyway (seconds)'
 	)
 	network_idle_poll_interval: float = Field(
-		default=0.1, description='How often to check network state when waiting for idle (seconds)'
+		default=0.1,
+		description='Unused, network idle is now detected from CDP Network events without polling. Kept for backwards compatibility.',
 	)
 
 	# --- UI/viewport/DOM ---
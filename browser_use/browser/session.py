@@ -16,6 +16,7 @@ from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from uuid_extensions import uuid7str
 
 from browser_use.browser.cloud import CloudBrowserAuthError, CloudBrowserError, get_cloud_browser_cdp_url
+from browser_use.browser.element_geometry import ElementGeometry
 
 # CDP logging is now handled by setup_logging() in logging_config.py
 # It automatically sets CDP logs to the same level as browser_use logs
@@ -38,11 +39,14 @@ from browser_use.browser.events import (
 	TabClosedEvent,
 	TabCreatedEvent,
 )
+from browser_use.browser.frame_graph import FrameGraph
+from browser_use.browser.highlight_overlay import HighlightOverlay, boxes_from_selector_map
 from browser_use.browser.profile import BrowserProfile, ProxySettings
+from browser_use.browser.tab_registry import TabRegistry
 from browser_use.browser.views import BrowserStateSummary, TabInfo
 from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, TargetInfo
 from browser_use.observability import observe_debug
-from browser_use.utils import _log_pretty_url, is_new_tab_page
+from browser_use.utils import is_new_tab_page
 
 if TYPE_CHECKING:
 	from browser_use.actor.page import Page
@@ -277,6 +281,8 @@ class BrowserSession(BaseModel):
 		# Iframe processing limits
 		max_iframes: int | None = None,
 		max_iframe_depth: int | None = None,
+		max_concurrent_iframes: int | None = None,
+		incremental_dom: bool | None = None,
 	):
 		# Following the same pattern as AgentSettings in service.py
 		# Only pass non-None values to avoid validation errors
@@ -343,6 +349,11 @@ class BrowserSession(BaseModel):
 	_cached_browser_state_summary: Any = PrivateAttr(default=None)
 	_cached_selector_map: dict[int, EnhancedDOMTreeNode] = PrivateAttr(default_factory=dict)
 	_downloaded_files: list[str] = PrivateAttr(default_factory=list)  # Track files downloaded during this session
+	_tab_registry: TabRegistry = PrivateAttr(default_factory=TabRegistry)
+	_frame_graph: FrameGraph = PrivateAttr(default_factory=FrameGraph)
+	_tab_changes: int = PrivateAttr(default=0)
+	_highlight_overlay: HighlightOverlay = PrivateAttr(default_factory=HighlightOverlay)
+	_element_geometry: ElementGeometry = PrivateAttr(default_factory=ElementGeometry)
 
 	# Watchdogs
 	_crash_watchdog: Any | None = PrivateAttr(default=None)
@@ -404,6 +415,10 @@ class BrowserSession(BaseModel):
 		self._cdp_session_pool.clear()
 
 		self._cdp_client_root = None  # type: ignore
+		self._tab_registry.reset()
+		self._frame_graph.reset()
+		self._highlight_overlay.reset()
+		self._element_geometry.reset()
 		self._cached_browser_state_summary = None
 		self._cached_selector_map.clear()
 		self._downloaded_files.clear()
@@ -773,6 +788,7 @@ class BrowserSession(BaseModel):
 			try:
 				cdp_session = await self.get_or_create_cdp_session(target_id=None, focus=False)
 				await cdp_session.cdp_client.send.Target.closeTarget(params={'targetId': event.target_id})
+				self._tab_registry.forget(event.target_id)
 			except Exception as e:
 				self.logger.debug(f'Target may already be closed: {e}')
 		except Exception as e:
@@ -780,6 +796,7 @@ class BrowserSession(BaseModel):
 
 	async def on_TabCreatedEvent(self, event: TabCreatedEvent) -> None:
 		"""Handle tab creation - apply viewport settings to new tab."""
+		self._tab_changes += 1
 		# Note: Tab switching prevention is handled by the Force Background Tab extension
 		# The extension automatically keeps focus on the current tab when new tabs are created
 
@@ -799,6 +816,7 @@ class BrowserSession(BaseModel):
 
 	async def on_TabClosedEvent(self, event: TabClosedEvent) -> None:
 		"""Handle tab closure - update focus if needed."""
+		self._tab_changes += 1
 		if not self.agent_focus:
 			return
 
@@ -812,6 +830,7 @@ class BrowserSession(BaseModel):
 	async def on_AgentFocusChangedEvent(self, event: AgentFocusChangedEvent) -> None:
 		"""Handle agent focus change - update focus and clear cache."""
 		self.logger.debug(f'🔄 AgentFocusChangedEvent received: target_id=...{event.target_id[-4:]} url={event.url}')
+		self._tab_changes += 1
 
 		# Clear cached DOM state since focus changed
 		# self.logger.debug('🔄 Clearing DOM cache...')
@@ -823,6 +842,7 @@ class BrowserSession(BaseModel):
 		# self.logger.debug('🔄 Clearing cached browser state...')
 		self._cached_browser_state_summary = None
 		self._cached_selector_map.clear()
+		self._element_geometry.reset()
 		self.logger.debug('🔄 Cached browser state cleared')
 		all_targets = await self._cdp_get_all_pages(include_chrome=True)
 
@@ -990,6 +1010,7 @@ class BrowserSession(BaseModel):
 
 		params: CloseTargetParameters = {'targetId': target_id}
 		await self.cdp_client.send.Target.closeTarget(params)
+		self._tab_registry.forget(target_id)
 
 	async def cookies(self, urls: list[str] | None = None) -> list['Cookie']:
 		"""Get cookies, optionally filtered by URLs."""
@@ -1129,6 +1150,17 @@ class BrowserSession(BaseModel):
 	def current_session_id(self) -> str | None:
 		return self.agent_focus.session_id if self.agent_focus else None
 
+	@property
+	def navigation_generation(self) -> int | None:
+		"""Changes whenever a page navigates, a tab opens or closes or the agent focus moves.
+
+		A browser state captured while this value stayed the same still shows the current page. None if navigations
+		are not tracked (not connected yet).
+		"""
+		if not self._frame_graph.is_tracking:
+			return None
+		return self._frame_graph.navigations + self._tab_changes
+
 	# endregion - ========== CDP-based ... ==========
 
 	# region - ========== Helper Methods ==========
@@ -1231,7 +1263,7 @@ class BrowserSession(BaseModel):
 				browser_session=self,
 				# More conservative defaults when auto-enabled
 				auto_save_interval=60.0,  # 1 minute instead of 30 seconds
-				save_on_change=False,  # Only save on shutdown by default
+				save_on_change=False,  # Batch changes into at most one save per auto_save_interval
 			)
 			self._storage_state_watchdog.attach_to_session()
 			self.logger.debug(
@@ -1356,6 +1388,14 @@ class BrowserSession(BaseModel):
 			)
 			self.logger.debug('CDP client connected successfully')
 
+			# Keep a live registry of targets so listing tabs doesn't need a round trip per tab
+			try:
+				await self._tab_registry.start(self._cdp_client_root)
+				# the frame hierarchy cache relies on the registry to notice targets coming and going
+				self._frame_graph.start(self._cdp_client_root)
+			except Exception as e:
+				self.logger.debug(f'Tab registry unavailable, falling back to Target.getTargets(): {type(e).__name__}: {e}')
+
 			# Get browser targets to find available contexts/pages
 			targets = await self._cdp_client_root.send.Target.getTargets()
 
@@ -1608,58 +1648,50 @@ class BrowserSession(BaseModel):
 			self.logger.debug(f'Skipping proxy auth setup: {type(e).__name__}: {e}')
 
 	async def get_tabs(self) -> list[TabInfo]:
-		"""Get information about all open tabs using CDP Target.getTargetInfo for speed."""
+		"""Get information about all open tabs, served from the event-driven tab registry when it is running."""
 		tabs = []
 
 		# Safety check - return empty list if browser not connected yet
 		if not self._cdp_client_root:
 			return tabs
 
-		# Get all page targets using CDP
-		pages = await self._cdp_get_all_pages()
+		if self._tab_registry.is_tracking:
+			if self.browser_profile.check_tab_registry_consistency:
+				await self._tab_registry.check_consistency(self._cdp_client_root)
+			pages = [
+				target
+				for target in self._tab_registry.targets.values()
+				if self._is_valid_target(target, include_http=True, include_about=True, include_pages=True)
+			]
+		else:
+			# Get all page targets using CDP
+			pages = await self._cdp_get_all_pages()
 
-		for i, page_target in enumerate(pages):
+		for page_target in pages:
 			target_id = page_target['targetId']
 			url = page_target['url']
+			# Target infos carry the title, kept up to date by Target.targetInfoChanged
+			title = page_target.get('title', '')
+
+			# Skip JS execution for chrome:// pages and new tab pages
+			if is_new_tab_page(url):
+				# Mark new tabs as unusable
+				title = ''
+			elif url.startswith('chrome://') and not title:
+				# For chrome:// pages without a title, use the URL itself
+				title = url
+
+			# Special handling for PDF pages without titles
+			if (not title or title == '') and (url.endswith('.pdf') or 'pdf' in url):
+				# PDF pages might not have a title, use URL filename
+				try:
+					from urllib.parse import urlparse
 
-			# Try to get the title directly from Target.getTargetInfo - much faster!
-			# The initial getTargets() doesn't include title, but getTargetInfo does
-			try:
-				target_info = await self.cdp_client.send.Target.getTargetInfo(params={'targetId': target_id})
-				# The title is directly available in targetInfo
-				title = target_info.get('targetInfo', {}).get('title', '')
-
-				# Skip JS execution for chrome:// pages and new tab pages
-				if is_new_tab_page(url) or url.startswith('chrome://'):
-					# Use URL as title for chrome pages, or mark new tabs as unusable
-					if is_new_tab_page(url):
-						title = ''
-					elif not title:
-						# For chrome:// pages without a title, use the URL itself
-						title = url
-
-				# Special handling for PDF pages without titles
-				if (not title or title == '') and (url.endswith('.pdf') or 'pdf' in url):
-					# PDF pages might not have a title, use URL filename
-					try:
-						from urllib.parse import urlparse
-
-						filename = urlparse(url).path.split('/')[-1]
-						if filename:
-							title = filename
-					except Exception:
-						pass
-
-			except Exception as e:
-				# Fallback to basic title handling
-				self.logger.debug(f'⚠️ Failed to get target info for tab #{i}: {_log_pretty_url(url)} - {type(e).__name__}')
-
-				if is_new_tab_page(url):
-					title = ''
-				elif url.startswith('chrome://'):
-					title = url
-				else:
-					title = ''
+					filename = urlparse(url).path.split('/')[-1]
+					if filename:
+						title = filename
+				except Exception:
+					pass
 
 			tab_info = TabInfo(
 				target_id=target_id,
@@ -1743,6 +1775,9 @@ class BrowserSession(BaseModel):
 			selector_map: The new selector map from DOM serialization
 		"""
 		self._cached_selector_map = selector_map
+		self._element_geometry.snapshot_max_age = self.browser_profile.element_geometry_snapshot_max_age
+		self._element_geometry.cache_max_age = self.browser_profile.element_geometry_cache_max_age
+		self._element_geometry.new_step(selector_map)
 
 	# Alias for backwards compatibility
 	async def get_element_by_index(self, index: int) -> EnhancedDOMTreeNode | None:
@@ -1883,6 +1918,9 @@ class BrowserSession(BaseModel):
 			# Remove highlights via JavaScript - be thorough
 			script = """
 			(function() {
+				// Detach the incremental overlay (and its hover listener) installed by add_highlights()
+				if (window.__browserUseHighlights) window.__browserUseHighlights.destroy();
+
 				// Remove all browser-use highlight elements
 				const highlights = document.querySelectorAll('[data-browser-use-highlight]');
 				console.log('Removing', highlights.length, 'browser-use highlight elements');
@@ -1906,6 +1944,8 @@ class BrowserSession(BaseModel):
 				params={'expression': script, 'returnByValue': True}, session_id=cdp_session.session_id
 			)
 
+			self._highlight_overlay.reset()
+
 			# Log the result for debugging
 			if result and 'result' in result and 'value' in result['result']:
 				removed_count = result['result']['value'].get('removed', 0)
@@ -1918,10 +1958,10 @@ class BrowserSession(BaseModel):
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_element_coordinates')
 	async def get_element_coordinates(self, backend_node_id: int, cdp_session: CDPSession) -> DOMRect | None:
-		"""Get element coordinates for a backend node ID using multiple methods.
+		"""Get element coordinates for a backend node ID.
 
-		This method tries DOM.getContentQuads first, then falls back to DOM.getBoxModel,
-		and finally uses JavaScript getBoundingClientRect as a last resort.
+		Served from the current step's geometry cache or the fresh DOM snapshot when possible, measured with
+		DOM.getContentQuads (falling back to JavaScript getBoundingClientRect) otherwise.
 
 		Args:
 			backend_node_id: The backend node ID to get coordinates for
@@ -1930,105 +1970,22 @@ class BrowserSession(BaseModel):
 		Returns:
 			DOMRect with coordinates or None if element not found/no bounds
 		"""
-		session_id = cdp_session.session_id
-		quads = []
-
-		# Method 1: Try DOM.getContentQuads first (best for inline elements and complex layouts)
-		try:
-			content_quads_result = await cdp_session.cdp_client.send.DOM.getContentQuads(
-				params={'backendNodeId': backend_node_id}, session_id=session_id
-			)
-			if 'quads' in content_quads_result and content_quads_result['quads']:
-				quads = content_quads_result['quads']
-				self.logger.debug(f'Got {len(quads)} quads from DOM.getContentQuads')
-			else:
-				self.logger.debug(f'No quads found from DOM.getContentQuads {content_quads_result}')
-		except Exception as e:
-			self.logger.debug(f'DOM.getContentQuads failed: {e}')
+		rects = await self.get_elements_coordinates([backend_node_id], cdp_session)
+		return rects[backend_node_id]
 
-		# Method 2: Fall back to DOM.getBoxModel
-		if not quads:
-			try:
-				box_model = await cdp_session.cdp_client.send.DOM.getBoxModel(
-					params={'backendNodeId': backend_node_id}, session_id=session_id
-				)
-				if 'model' in box_model and 'content' in box_model['model']:
-					content_quad = box_model['model']['content']
-					if len(content_quad) >= 8:
-						# Convert box model format to quad format
-						quads = [
-							[
-								content_quad[0],
-								content_quad[1],  # x1, y1
-								content_quad[2],
-								content_quad[3],  # x2, y2
-								content_quad[4],
-								content_quad[5],  # x3, y3
-								content_quad[6],
-								content_quad[7],  # x4, y4
-							]
-						]
-						self.logger.debug('Got quad from DOM.getBoxModel')
-			except Exception as e:
-				self.logger.debug(f'DOM.getBoxModel failed: {e}')
+	async def get_elements_coordinates(self, backend_node_ids: list[int], cdp_session: CDPSession) -> dict[int, DOMRect | None]:
+		"""Get viewport coordinates for several backend node IDs of the same target in one batch.
 
-		# Method 3: Fall back to JavaScript getBoundingClientRect
-		if not quads:
-			try:
-				result = await cdp_session.cdp_client.send.DOM.resolveNode(
-					params={'backendNodeId': backend_node_id},
-					session_id=session_id,
-				)
-				if 'object' in result and 'objectId' in result['object']:
-					object_id = result['object']['objectId']
-					js_result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
-						params={
-							'objectId': object_id,
-							'functionDeclaration': """
-							function() {
-								const rect = this.getBoundingClientRect();
-								return {
-									x: rect.x,
-									y: rect.y,
-									width: rect.width,
-									height: rect.height
-								};
-							}
-							""",
-							'returnByValue': True,
-						},
-						session_id=session_id,
-					)
-					if 'result' in js_result and 'value' in js_result['result']:
-						rect_data = js_result['result']['value']
-						if rect_data['width'] > 0 and rect_data['height'] > 0:
-							return DOMRect(
-								x=rect_data['x'], y=rect_data['y'], width=rect_data['width'], height=rect_data['height']
-							)
-			except Exception as e:
-				self.logger.debug(f'JavaScript getBoundingClientRect failed: {e}')
-
-		# Convert quads to bounding rectangle if we have them
-		if quads:
-			# Use the first quad (most relevant for the element)
-			quad = quads[0]
-			if len(quad) >= 8:
-				# Calculate bounding rect from quad points
-				x_coords = [quad[i] for i in range(0, 8, 2)]
-				y_coords = [quad[i] for i in range(1, 8, 2)]
-
-				min_x = min(x_coords)
-				min_y = min(y_coords)
-				max_x = max(x_coords)
-				max_y = max(y_coords)
-
-				width = max_x - min_x
-				height = max_y - min_y
-
-				if width > 0 and height > 0:
-					return DOMRect(x=min_x, y=min_y, width=width, height=height)
+		Args:
+			backend_node_ids: The backend node IDs to get coordinates for
+			cdp_session: The CDP session of the target the nodes belong to
 
-		return None
+		Returns:
+			Mapping of backend node ID to DOMRect, None for elements that are gone or have no bounds
+		"""
+		return await self._element_geometry.get_rects(
+			cdp_session.cdp_client, cdp_session.session_id, cdp_session.target_id, backend_node_ids
+		)
 
 	async def highlight_interaction_element(self, node: 'EnhancedDOMTreeNode') -> None:
 		"""Temporarily highlight an element during interaction for user visibility.
@@ -2203,218 +2160,46 @@ class BrowserSession(BaseModel):
 			self.logger.debug(f'Failed to highlight interaction element: {e}')
 
 	async def add_highlights(self, selector_map: dict[int, 'EnhancedDOMTreeNode']) -> None:
-		"""Add visual highlights to the browser DOM for user visibility."""
+		"""Add visual highlights to the browser DOM for user visibility.
+
+		Only the boxes that changed since the previous call are sent to the overlay already living in the page, the overlay
+		is (re)installed with the full set when the page doesn't have it (new document, other tab, removed highlights).
+		"""
 		if not self.browser_profile.dom_highlight_elements or not selector_map:
 			return
 
 		try:
-			import json
-
-			# Convert selector_map to the format expected by the highlighting script
-			elements_data = []
-			for _, node in selector_map.items():
-				# Get bounding box using absolute position (includes iframe translations) if available
-				if node.absolute_position:
-					# Use absolute position which includes iframe coordinate translations
-					rect = node.absolute_position
-					bbox = {'x': rect.x, 'y': rect.y, 'width': rect.width, 'height': rect.height}
-
-					# Only include elements with valid bounding boxes
-					if bbox and bbox.get('width', 0) > 0 and bbox.get('height', 0) > 0:
-						element = {
-							'x': bbox['x'],
-							'y': bbox['y'],
-							'width': bbox['width'],
-							'height': bbox['height'],
-							'element_name': node.node_name,
-							'is_clickable': node.snapshot_node.is_clickable if node.snapshot_node else True,
-							'is_scrollable': getattr(node, 'is_scrollable', False),
-							'attributes': node.attributes or {},
-							'frame_id': getattr(node, 'frame_id', None),
-							'node_id': node.node_id,
-							'backend_node_id': node.backend_node_id,
-							'xpath': node.xpath,
-							'text_content': node.get_all_children_text()[:50]
-							if hasattr(node, 'get_all_children_text')
-							else node.node_value[:50],
-						}
-						elements_data.append(element)
-
-			if not elements_data:
+			boxes = boxes_from_selector_map(selector_map)
+			if not boxes:
 				self.logger.debug('⚠️ No valid elements to highlight')
 				return
 
-			self.logger.debug(f'📍 Creating highlights for {len(elements_data)} elements')
-
-			# Always remove existing highlights first
-			await self.remove_highlights()
-
-			# Add a small delay to ensure removal completes
-			import asyncio
-
-			await asyncio.sleep(0.05)
-
-			# Get CDP session
 			cdp_session = await self.get_or_create_cdp_session()
+			overlay = self._highlight_overlay
+			if overlay.target_id != cdp_session.target_id:
+				overlay.reset(cdp_session.target_id)
 
-			# Create the proven highlighting script from v0.6.0 with fixed positioning
-			script = f"""
-			(function() {{
-				// Interactive elements data
-				const interactiveElements = {json.dumps(elements_data)};
-				
-				console.log('=== BROWSER-USE HIGHLIGHTING ===');
-				console.log('Highlighting', interactiveElements.length, 'interactive elements');
-				
-				// Double-check: Remove any existing highlight container first
-				const existingContainer = document.getElementById('browser-use-debug-highlights');
-				if (existingContainer) {{
-					console.log('⚠️ Found existing highlight container, removing it first');
-					existingContainer.remove();
-				}}
-				
-				// Also remove any stray highlight elements
-				const strayHighlights = document.querySelectorAll('[data-browser-use-highlight]');
-				if (strayHighlights.length > 0) {{
-					console.log('⚠️ Found', strayHighlights.length, 'stray highlight elements, removing them');
-					strayHighlights.forEach(el => el.remove());
-				}}
-				
-				// Use maximum z-index for visibility
-				const HIGHLIGHT_Z_INDEX = 2147483647;
-				
-				// Create container for all highlights - use FIXED positioning (key insight from v0.6.0)
-				const container = document.createElement('div');
-				container.id = 'browser-use-debug-highlights';
-				container.setAttribute('data-browser-use-highlight', 'container');
-				
-				container.style.cssText = `
-					position: absolute;
-					top: 0;
-					left: 0;
-					width: 100vw;
-					height: 100vh;
-					pointer-events: none;
-					z-index: ${{HIGHLIGHT_Z_INDEX}};
-					overflow: visible;
-					margin: 0;
-					padding: 0;
-					border: none;
-					outline: none;
-					box-shadow: none;
-					background: none;
-					font-family: inherit;
-				`;
-				
-				// Helper function to create text elements safely
-				function createTextElement(tag, text, styles) {{
-					const element = document.createElement(tag);
-					element.textContent = text;
-					if (styles) element.style.cssText = styles;
-					return element;
-				}}
-				
-				// Professional liquid glass color scheme - sophisticated neutral palette
-				const getElementColor = (elementName) => {{
-					const colors = {{
-						'button': {{ main: '#8FA3B8', glow: 'rgba(143, 163, 184, 0.3)', label: '#8FA3B8' }},
-						'input': {{ main: '#A0B4C8', glow: 'rgba(160, 180, 200, 0.3)', label: '#A0B4C8' }},
-						'select': {{ main: '#B8C5D0', glow: 'rgba(184, 197, 208, 0.3)', label: '#B8C5D0' }},
-						'a': {{ main: '#7A92A8', glow: 'rgba(122, 146, 168, 0.3)', label: '#7A92A8' }},
-						'textarea': {{ main: '#C0CCD8', glow: 'rgba(192, 204, 216, 0.3)', label: '#C0CCD8' }},
-						'default': {{ main: '#9CADB8', glow: 'rgba(156, 173, 184, 0.3)', label: '#9CADB8' }}
-					}};
-					return colors[elementName.toLowerCase()] || colors.default;
-				}};
-
-				// Add highlights for each element with Apple Liquid Glass effect
-				interactiveElements.forEach((element, index) => {{
-					const colors = getElementColor(element.element_name);
-
-					const highlight = document.createElement('div');
-					highlight.setAttribute('data-browser-use-highlight', 'element');
-					highlight.setAttribute('data-element-id', element.backend_node_id);
-					highlight.style.cssText = `
-						position: absolute;
-						left: ${{element.x}}px;
-						top: ${{element.y}}px;
-						width: ${{element.width}}px;
-						height: ${{element.height}}px;
-						background: linear-gradient(135deg, rgba(255, 255, 255, 0.12) 0%, rgba(255, 255, 255, 0.06) 100%);
-						backdrop-filter: blur(10px) saturate(180%);
-						-webkit-backdrop-filter: blur(10px) saturate(180%);
-						border: 2px solid ${{colors.main}};
-						border-radius: 8px;
-						pointer-events: none;
-						box-sizing: border-box;
-						transition: all 0.2s cubic-bezier(0.4, 0.0, 0.2, 1);
-						margin: 0;
-						padding: 0;
-						box-shadow:
-							0 0 0 1px rgba(255, 255, 255, 0.15) inset,
-							0 8px 32px ${{colors.glow}},
-							0 4px 16px rgba(0, 0, 0, 0.12),
-							0 1px 4px rgba(0, 0, 0, 0.08);
-						transform: translateZ(0);
-						will-change: transform, box-shadow;
-					`;
-
-					// Premium glassmorphism label with Apple style
-					const label = createTextElement('div', element.backend_node_id, `
-						position: absolute;
-						top: -28px;
-						left: 50%;
-						transform: translateX(-50%);
-						background: linear-gradient(135deg, ${{colors.label}}EE 0%, ${{colors.label}}CC 100%);
-						backdrop-filter: blur(20px) saturate(180%);
-						-webkit-backdrop-filter: blur(20px) saturate(180%);
-						color: white;
-						padding: 5px 14px;
-						font-size: 11px;
-						font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
-						font-weight: 600;
-						letter-spacing: 0.4px;
-						border-radius: 10px;
-						white-space: nowrap;
-						z-index: ${{HIGHLIGHT_Z_INDEX + 1}};
-						box-shadow:
-							0 0 0 1px rgba(255, 255, 255, 0.25) inset,
-							0 4px 24px ${{colors.glow}},
-							0 2px 12px rgba(0, 0, 0, 0.25),
-							0 1px 4px rgba(0, 0, 0, 0.15);
-						border: 1px solid rgba(255, 255, 255, 0.35);
-						outline: none;
-						margin: 0;
-						line-height: 1.4;
-						text-shadow: 0 1px 3px rgba(0, 0, 0, 0.4);
-						transition: all 0.2s cubic-bezier(0.4, 0.0, 0.2, 1);
-					`);
-					
-					highlight.appendChild(label);
-					container.appendChild(highlight);
-				}});
-				
-				// Add container to document
-				document.body.appendChild(container);
-				
-				console.log('Highlighting complete - added', interactiveElements.length, 'highlights');
-				return {{ added: interactiveElements.length }};
-			}})();
-			"""
-
-			# Execute the script
+			upserts, removed = overlay.diff(boxes)
 			result = await cdp_session.cdp_client.send.Runtime.evaluate(
-				params={'expression': script, 'returnByValue': True}, session_id=cdp_session.session_id
+				params={'expression': overlay.apply_expression(upserts, removed), 'returnByValue': True},
+				session_id=cdp_session.session_id,
 			)
+			value = result.get('result', {}).get('value') or {'missing': True}
+			if value.get('missing'):
+				overlay.reset(cdp_session.target_id)
+				result = await cdp_session.cdp_client.send.Runtime.evaluate(
+					params={'expression': overlay.install_expression(boxes), 'returnByValue': True},
+					session_id=cdp_session.session_id,
+				)
+				value = result.get('result', {}).get('value') or {}
+			overlay.commit(boxes)
 
-			# Log the result
-			if result and 'result' in result and 'value' in result['result']:
-				added_count = result['result']['value'].get('added', 0)
-				self.logger.debug(f'Successfully added {added_count} highlight elements to browser DOM')
-			else:
-				self.logger.debug('Browser highlight injection completed')
+			self.logger.debug(
+				f'📍 Highlights updated: +{value.get("added", 0)} -{value.get("removed", 0)} ({value.get("total", len(boxes))} shown)'
+			)
 
 		except Exception as e:
+			self._highlight_overlay.reset()
 			self.logger.warning(f'Failed to add browser highlights: {e}')
 			import traceback
 
@@ -2506,6 +2291,7 @@ class BrowserSession(BaseModel):
 	async def _cdp_close_page(self, target_id: TargetID) -> None:
 		"""Close a page/tab using CDP Target.closeTarget."""
 		await self.cdp_client.send.Target.closeTarget(params={'targetId': target_id})
+		self._tab_registry.forget(target_id)
 
 	async def _cdp_get_cookies(self) -> list[Cookie]:
 		"""Get cookies using CDP Network.getCookies."""
@@ -2604,8 +2390,11 @@ class BrowserSession(BaseModel):
 			session_id=cdp_session.session_id,
 		)
 
-	async def _cdp_get_origins(self) -> list[dict[str, Any]]:
-		"""Get origins with localStorage and sessionStorage using CDP."""
+	async def _cdp_get_origins(self, disable_dom_storage: bool = True) -> list[dict[str, Any]]:
+		"""Get origins with localStorage and sessionStorage using CDP.
+
+		Pass disable_dom_storage=False to leave the DOMStorage domain enabled when something listens to its events.
+		"""
 		origins = []
 		cdp_session = await self.get_or_create_cdp_session(target_id=None, new_socket=False)
 
@@ -2671,21 +2460,22 @@ class BrowserSession(BaseModel):
 						origins.append(origin_data)
 
 			finally:
-				# Always disable DOMStorage tracking when done
-				await cdp_session.cdp_client.send.DOMStorage.disable(session_id=cdp_session.session_id)
+				# Disable DOMStorage tracking when done, unless its change events are being watched
+				if disable_dom_storage:
+					await cdp_session.cdp_client.send.DOMStorage.disable(session_id=cdp_session.session_id)
 
 		except Exception as e:
 			self.logger.warning(f'Failed to get origins: {e}')
 
 		return origins
 
-	async def _cdp_get_storage_state(self) -> dict:
+	async def _cdp_get_storage_state(self, disable_dom_storage: bool = True) -> dict:
 		"""Get storage state (cookies, localStorage, sessionStorage) using CDP."""
 		# Use the _cdp_get_cookies helper which handles session attachment
 		cookies = await self._cdp_get_cookies()
 
 		# Get origins with localStorage/sessionStorage
-		origins = await self._cdp_get_origins()
+		origins = await self._cdp_get_origins(disable_dom_storage=disable_dom_storage)
 
 		return {
 			'cookies': cookies,
@@ -2763,20 +2553,36 @@ class BrowserSession(BaseModel):
 
 		return url_allowed and type_allowed
 
-	async def get_all_frames(self) -> tuple[dict[str, dict], dict[str, str]]:
+	async def get_all_frames(self, force_refresh: bool = False) -> tuple[dict[str, dict], dict[str, str]]:
 		"""Get a complete frame hierarchy from all browser targets.
 
+		The hierarchy is cached until Page frame events or new/destroyed targets invalidate it.
+		The returned dicts are shared with the cache, don't mutate them.
+
+		Args:
+			force_refresh: Rebuild the hierarchy from CDP even if the cached one is still considered valid
+
 		Returns:
 			Tuple of (all_frames, target_sessions) where:
 			- all_frames: dict mapping frame_id -> frame info dict with all metadata
 			- target_sessions: dict mapping target_id -> session_id for active sessions
 		"""
-		all_frames = {}  # frame_id -> FrameInfo dict
-		target_sessions = {}  # target_id -> session_id (keep sessions alive during collection)
-
 		# Check if cross-origin iframe support is enabled
 		include_cross_origin = self.browser_profile.cross_origin_iframes
 
+		# without cross-origin support only the focused target is walked, so the result depends on it
+		cache_key = (
+			self._tab_registry.version,
+			None if include_cross_origin else self.agent_focus and self.agent_focus.target_id,
+		)
+		if self._tab_registry.is_tracking and not force_refresh:
+			if cached := self._frame_graph.get(cache_key):
+				return cached
+		generation = self._frame_graph.generation
+
+		all_frames = {}  # frame_id -> FrameInfo dict
+		target_sessions = {}  # target_id -> session_id (keep sessions alive during collection)
+
 		# Get all targets - only include iframes if cross-origin support is enabled
 		targets = await self._cdp_get_all_pages(
 			include_http=True,
@@ -2896,6 +2702,8 @@ class BrowserSession(BaseModel):
 		if include_cross_origin:
 			await self._populate_frame_metadata(all_frames, target_sessions)
 
+		if self._tab_registry.is_tracking:
+			self._frame_graph.store(cache_key, generation, all_frames, target_sessions)
 		return all_frames, target_sessions
 
 	async def _populate_frame_metadata(self, all_frames: dict[str, dict], target_sessions: dict[str, str]) -> None:
@@ -2936,18 +2744,21 @@ class BrowserSession(BaseModel):
 						# Frame owner not available (likely cross-origin)
 						pass
 
-	async def find_frame_target(self, frame_id: str, all_frames: dict[str, dict] | None = None) -> dict | None:
+	async def find_frame_target(
+		self, frame_id: str, all_frames: dict[str, dict] | None = None, force_refresh: bool = False
+	) -> dict | None:
 		"""Find the frame info for a specific frame ID.
 
 		Args:
 			frame_id: The frame ID to search for
 			all_frames: Optional pre-built frame hierarchy. If None, will call get_all_frames()
+			force_refresh: Rebuild the cached frame hierarchy before looking the frame up
 
 		Returns:
 			Frame info dict if found, None otherwise
 		"""
 		if all_frames is None:
-			all_frames, _ = await self.get_all_frames()
+			all_frames, _ = await self.get_all_frames(force_refresh=force_refresh)
 
 		return all_frames.get(frame_id)
 
@@ -2973,8 +2784,10 @@ class BrowserSession(BaseModel):
 		if not self.browser_profile.cross_origin_iframes:
 			return await self.get_or_create_cdp_session()
 
-		# Get complete frame hierarchy
+		# Get complete frame hierarchy (cached, refreshed once if the frame is unknown, it may have just been attached)
 		all_frames, target_sessions = await self.get_all_frames()
+		if frame_id not in all_frames:
+			all_frames, target_sessions = await self.get_all_frames(force_refresh=True)
 
 		# Find the requested frame
 		frame_info = await self.find_frame_target(frame_id, all_frames)
@@ -0,0 +1,91 @@
+"""
+Live registry of browser targets maintained from CDP Target events.
+
+`Target.setDiscoverTargets` makes Chrome push `targetCreated` / `targetInfoChanged` / `targetDestroyed` for every target,
+including title and URL changes, so listing tabs becomes an in-memory read instead of one round trip per tab.
+"""
+
+import logging
+from typing import TYPE_CHECKING
+
+from cdp_use.cdp.target import TargetID, TargetInfo
+from cdp_use.cdp.target.events import TargetCreatedEvent, TargetDestroyedEvent, TargetInfoChangedEvent
+
+if TYPE_CHECKING:
+	from cdp_use import CDPClient
+
+logger = logging.getLogger(__name__)
+
+
+class TabRegistry:
+	"""Target infos of the browser, kept up to date from Target domain events."""
+
+	def __init__(self):
+		self.targets: dict[TargetID, TargetInfo] = {}
+		self.is_tracking = False
+		# bumped whenever a target appears or disappears, lets caches derived from the set of targets detect staleness
+		self.version = 0
+
+	async def start(self, cdp_client: 'CDPClient') -> None:
+		"""Register the Target event handlers on the root client and seed the registry with the current targets."""
+		cdp_client.register.Target.targetCreated(self.on_target_created)
+		cdp_client.register.Target.targetInfoChanged(self.on_target_info_changed)
+		cdp_client.register.Target.targetDestroyed(self.on_target_destroyed)
+		await cdp_client.send.Target.setDiscoverTargets(params={'discover': True})
+		await self.resync(cdp_client)
+		self.is_tracking = True
+
+	async def resync(self, cdp_client: 'CDPClient') -> None:
+		"""Replace the registry content with a fresh Target.getTargets() result, keeping the known order."""
+		result = await cdp_client.send.Target.getTargets()
+		fresh = {target['targetId']: target for target in result.get('targetInfos', [])}
+		if fresh.keys() != self.targets.keys():
+			self.version += 1
+		self.targets = {target_id: fresh[target_id] for target_id in self.targets if target_id in fresh}
+		self.targets.update(fresh)
+
+	def reset(self) -> None:
+		self.targets.clear()
+		self.is_tracking = False
+		self.version += 1
+
+	def on_target_created(self, event: TargetCreatedEvent, session_id: str | None = None) -> None:
+		self.targets[event['targetInfo']['targetId']] = event['targetInfo']
+		self.version += 1
+
+	def on_target_info_changed(self, event: TargetInfoChangedEvent, session_id: str | None = None) -> None:
+		self.targets[event['targetInfo']['targetId']] = event['targetInfo']
+
+	def on_target_destroyed(self, event: TargetDestroyedEvent, session_id: str | None = None) -> None:
+		self.forget(event['targetId'])
+
+	def forget(self, target_id: TargetID) -> None:
+		"""Drop a target right away, e.g. after closing it and before Chrome confirms with targetDestroyed."""
+		if self.targets.pop(target_id, None) is not None:
+			self.version += 1
+
+	async def check_consistency(self, cdp_client: 'CDPClient') -> list[str]:
+		"""Compare the registry against Target.getTargets(), log any drift and resync.
+
+		Returns:
+			Human readable descriptions of the differences, empty if the registry was in sync.
+		"""
+		result = await cdp_client.send.Target.getTargets()
+		actual = {target['targetId']: target for target in result.get('targetInfos', [])}
+
+		drift: list[str] = []
+		for target_id in actual.keys() - self.targets.keys():
+			drift.append(f'missing {target_id[-4:]} {actual[target_id].get("type")} {actual[target_id].get("url")}')
+		for target_id in self.targets.keys() - actual.keys():
+			drift.append(f'stale {target_id[-4:]} {self.targets[target_id].get("type")} {self.targets[target_id].get("url")}')
+		for target_id in actual.keys() & self.targets.keys():
+			for key in ('url', 'title', 'type'):
+				if actual[target_id].get(key) != self.targets[target_id].get(key):
+					drift.append(
+						f'{key} of {target_id[-4:]} is {self.targets[target_id].get(key)!r}, expected {actual[target_id].get(key)!r}'
+					)
+
+		if drift:
+			logger.warning(f'⚠️ Tab registry drifted from Target.getTargets(): {"; ".join(drift)}')
+			await self.resync(cdp_client)
+		return drift
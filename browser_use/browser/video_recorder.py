@@ -1,17 +1,20 @@
 """Video Recording Service for Browser Use Sessions."""
 
 import base64
+import io
 import logging
 import math
-import subprocess
+import queue
+import threading
 from pathlib import Path
 from typing import Optional
 
+from PIL import Image
+
 from browser_use.browser.profile import ViewportSize
 
 try:
 	import imageio.v2 as iio  # type: ignore[import-not-found]
-	import imageio_ffmpeg  # type: ignore[import-not-found]
 	import numpy as np  # type: ignore[import-not-found]
 	from imageio.core.format import Format  # type: ignore[import-not-found]
 
@@ -21,6 +24,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Frames waiting to be encoded, a slow encoder drops the oldest ones instead of stalling the screencast
+DEFAULT_MAX_QUEUED_FRAMES = 60
+
 
 def _get_padded_size(size: ViewportSize, macro_block_size: int = 16) -> ViewportSize:
 	"""Calculates the dimensions padded to the nearest multiple of macro_block_size."""
@@ -33,12 +39,12 @@ class VideoRecorderService:
 	"""
 	Handles the video encoding process for a browser session using imageio.
 
-	This service captures individual frames from the CDP screencast, decodes them,
-	and appends them to a video file using a pip-installable ffmpeg backend.
-	It automatically resizes frames to match the target video dimensions.
+	This service captures individual frames from the CDP screencast and queues them for a
+	worker thread, which decodes them in-process, resizes and pads them to the target video
+	dimensions, and streams them into a single long-lived ffmpeg encoder.
 	"""
 
-	def __init__(self, output_path: Path, size: ViewportSize, framerate: int):
+	def __init__(self, output_path: Path, size: ViewportSize, framerate: int, max_queued_frames: int = DEFAULT_MAX_QUEUED_FRAMES):
 		"""
 		Initializes the video recorder.
 
@@ -46,6 +52,7 @@ class VideoRecorderService:
 		    output_path: The full path where the video will be saved.
 		    size: A ViewportSize object specifying the width and height of the video.
 		    framerate: The desired framerate for the output video.
+		    max_queued_frames: How many frames may wait for the encoder before the oldest ones are dropped.
 		"""
 		self.output_path = output_path
 		self.size = size
@@ -54,9 +61,14 @@ class VideoRecorderService:
 		self._is_active = False
 		self.padded_size = _get_padded_size(self.size)
 
+		self.frames_written = 0
+		self.dropped_frames = 0
+		self._frames: queue.Queue[str | None] = queue.Queue(maxsize=max_queued_frames)
+		self._worker: threading.Thread | None = None
+
 	def start(self) -> None:
 		"""
-		Prepares and starts the video writer.
+		Prepares and starts the video writer and the encoding worker thread.
 
 		If the required optional dependencies are not installed, this method will
 		log an error and do nothing.
@@ -78,6 +90,8 @@ class VideoRecorderService:
 				pixelformat='yuv420p',  # Ensures compatibility with most players
 				macro_block_size=None,
 			)
+			self._worker = threading.Thread(target=self._encode_frames, name='video_recorder', daemon=True)
+			self._worker.start()
 			self._is_active = True
 			logger.debug(f'Video recorder started. Output will be saved to {self.output_path}')
 		except Exception as e:
@@ -86,8 +100,9 @@ class VideoRecorderService:
 
 	def add_frame(self, frame_data_b64: str) -> None:
 		"""
-		Decodes a base64-encoded PNG frame, resizes it, pads it to be codec-compatible,
-		and appends it to the video.
+		Queues a base64-encoded PNG frame for encoding without blocking.
+
+		If the encoder falls behind and the queue is full, the oldest queued frame is dropped.
 
 		Args:
 		    frame_data_b64: A base64-encoded string of the PNG frame data.
@@ -95,68 +110,67 @@ class VideoRecorderService:
 		if not self._is_active or not self._writer:
 			return
 
-		try:
-			frame_bytes = base64.b64decode(frame_data_b64)
-
-			# Build a filter chain for ffmpeg:
-			# 1. scale: Resizes the frame to the user-specified dimensions.
-			# 2. pad: Adds black bars to meet codec's macro-block requirements,
-			#    centering the original content.
-			vf_chain = (
-				f'scale={self.size["width"]}:{self.size["height"]},'
-				f'pad={self.padded_size["width"]}:{self.padded_size["height"]}:(ow-iw)/2:(oh-ih)/2:color=black'
-			)
+		while True:
+			try:
+				self._frames.put_nowait(frame_data_b64)
+				return
+			except queue.Full:
+				try:
+					dropped = self._frames.get_nowait()
+				except queue.Empty:
+					continue
+				if dropped is None:
+					# stop_and_save() raced us, keep its stop sentinel
+					self._frames.put_nowait(None)
+					return
+				self.dropped_frames += 1
+
+	def _encode_frames(self) -> None:
+		"""Worker thread: decodes queued frames and appends them to the video until the stop sentinel arrives."""
+		while (frame_data_b64 := self._frames.get()) is not None:
+			try:
+				self._writer.append_data(self._decode_frame(frame_data_b64))  # type: ignore[union-attr]
+				self.frames_written += 1
+			except Exception as e:
+				logger.warning(f'Could not process and add video frame: {e}')
+
+	def _decode_frame(self, frame_data_b64: str) -> 'np.ndarray':
+		"""
+		Decodes a base64-encoded PNG frame, resizes it, and pads it with black bars
+		(centering the original content) to meet the codec's macro-block requirements.
+		"""
+		frame = Image.open(io.BytesIO(base64.b64decode(frame_data_b64))).convert('RGB')
+		target_size = (self.size['width'], self.size['height'])
+		if frame.size != target_size:
+			frame = frame.resize(target_size, Image.Resampling.BILINEAR)
 
-			output_pix_fmt = 'rgb24'
-			command = [
-				imageio_ffmpeg.get_ffmpeg_exe(),
-				'-f',
-				'image2pipe',  # Input format from a pipe
-				'-c:v',
-				'png',  # Specify input codec is PNG
-				'-i',
-				'-',  # Input from stdin
-				'-vf',
-				vf_chain,  # Video filter for resizing and padding
-				'-f',
-				'rawvideo',  # Output format is raw video
-				'-pix_fmt',
-				output_pix_fmt,  # Output pixel format
-				'-',  # Output to stdout
-			]
-
-			# Execute ffmpeg as a subprocess
-			proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-			out, err = proc.communicate(input=frame_bytes)
-
-			if proc.returncode != 0:
-				err_msg = err.decode(errors='ignore').strip()
-				if 'deprecated pixel format used' not in err_msg.lower():
-					raise OSError(f'ffmpeg error during resizing/padding: {err_msg}')
-				else:
-					logger.debug(f'ffmpeg warning during resizing/padding: {err_msg}')
-
-			# Convert the raw output bytes to a numpy array with the padded dimensions
-			img_array = np.frombuffer(out, dtype=np.uint8).reshape((self.padded_size['height'], self.padded_size['width'], 3))
-
-			self._writer.append_data(img_array)
-		except Exception as e:
-			logger.warning(f'Could not process and add video frame: {e}')
+		padded_size = (self.padded_size['width'], self.padded_size['height'])
+		if padded_size != target_size:
+			canvas = Image.new('RGB', padded_size, 'black')
+			canvas.paste(frame, ((padded_size[0] - target_size[0]) // 2, (padded_size[1] - target_size[1]) // 2))
+			frame = canvas
+
+		return np.asarray(frame)
 
 	def stop_and_save(self) -> None:
 		"""
-		Finalizes the video file by closing the writer.
+		Encodes the remaining queued frames and finalizes the video file by closing the writer.
 
-		This method should be called when the recording session is complete.
+		This method blocks until the worker thread is done, call it from an executor.
 		"""
 		if not self._is_active or not self._writer:
 			return
 
+		self._is_active = False
 		try:
+			if self._worker is not None:
+				self._frames.put(None)
+				self._worker.join()
 			self._writer.close()
-			logger.info(f'📹 Video recording saved successfully to: {self.output_path}')
+			dropped = f', {self.dropped_frames} dropped' if self.dropped_frames else ''
+			logger.info(f'📹 Video recording saved successfully to: {self.output_path} ({self.frames_written} frames{dropped})')
 		except Exception as e:
 			logger.error(f'Failed to finalize and save video: {e}')
 		finally:
-			self._is_active = False
+			self._worker = None
 			self._writer = None
@@ -6,6 +6,7 @@ from cdp_use.cdp.target import TargetID
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_serializer
 
 from browser_use.dom.views import DOMInteractedElement, SerializedDOMState
+from browser_use.screenshots.views import Screenshot
 
 # Known placeholder image data for about:blank pages - a 4x4 white PNG
 PLACEHOLDER_4PX_SCREENSHOT = (
@@ -96,7 +97,7 @@ class BrowserStateSummary:
 	url: str
 	title: str
 	tabs: list[TabInfo]
-	screenshot: str | None = field(default=None, repr=False)
+	screenshot: Screenshot | None = field(default=None, repr=False)
 	page_info: PageInfo | None = None  # Enhanced page information
 
 	# Keep legacy fields for backward compatibility
@@ -108,6 +109,10 @@ class BrowserStateSummary:
 	pending_network_requests: list[NetworkRequest] = field(default_factory=list)  # Currently loading network requests
 	pagination_buttons: list[PaginationButton] = field(default_factory=list)  # Detected pagination buttons
 
+	def __post_init__(self):
+		# screenshots used to be passed around as base64 strings
+		self.screenshot = Screenshot.coerce(self.screenshot)
+
 
 @dataclass
 class BrowserStateHistory:
@@ -121,22 +126,23 @@ class BrowserStateHistory:
 
 	def get_screenshot(self) -> str | None:
 		"""Load screenshot from disk and return as base64 string"""
+		screenshot = self.load_screenshot()
+		try:
+			return screenshot.base64 if screenshot else None
+		except Exception:
+			return None
+
+	def load_screenshot(self) -> Screenshot | None:
+		"""The screenshot stored on disk, read as bytes on first access (no base64 round trip)"""
 		if not self.screenshot_path:
 			return None
 
-		import base64
 		from pathlib import Path
 
 		path_obj = Path(self.screenshot_path)
 		if not path_obj.exists():
 			return None
-
-		try:
-			with open(path_obj, 'rb') as f:
-				screenshot_data = f.read()
-			return base64.b64encode(screenshot_data).decode('utf-8')
-		except Exception:
-			return None
+		return Screenshot.from_file(path_obj)
 
 	def to_dict(self) -> dict[str, Any]:
 		data = {}
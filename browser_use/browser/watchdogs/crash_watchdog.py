@@ -16,23 +16,13 @@ from browser_use.browser.events import (
 	BrowserStoppedEvent,
 	TabCreatedEvent,
 )
+from browser_use.browser.network_activity import NetworkRequestTracker
 from browser_use.browser.watchdog_base import BaseWatchdog
 
 if TYPE_CHECKING:
 	pass
 
 
-class NetworkRequestTracker:
-	"""Tracks ongoing network requests."""
-
-	def __init__(self, request_id: str, start_time: float, url: str, method: str, resource_type: str | None = None):
-		self.request_id = request_id
-		self.start_time = start_time
-		self.url = url
-		self.method = method
-		self.resource_type = resource_type
-
-
 class CrashWatchdog(BaseWatchdog):
 	"""Monitors browser health for crashes and network timeouts using CDP."""
 
@@ -1402,14 +1402,14 @@ class DefaultActionWatchdog(BaseWatchdog):
 			# For non-iframe elements, use the standard mouse wheel approach
 			# Get element bounds to know where to scroll
 			backend_node_id = element_node.backend_node_id
-			box_model = await cdp_session.cdp_client.send.DOM.getBoxModel(
-				params={'backendNodeId': backend_node_id}, session_id=cdp_session.session_id
-			)
-			content_quad = box_model['model']['content']
+			element_rect = await self.browser_session.get_element_coordinates(backend_node_id, cdp_session)
+			if not element_rect:
+				self.logger.debug(f'Failed to scroll element container via CDP: no geometry for backend node {backend_node_id}')
+				return False
 
 			# Calculate center point
-			center_x = (content_quad[0] + content_quad[2] + content_quad[4] + content_quad[6]) / 4
-			center_y = (content_quad[1] + content_quad[3] + content_quad[5] + content_quad[7]) / 4
+			center_x = element_rect.x + element_rect.width / 2
+			center_y = element_rect.y + element_rect.height / 2
 
 			# Dispatch mouse wheel event at element location
 			await cdp_session.cdp_client.send.Input.dispatchMouseEvent(
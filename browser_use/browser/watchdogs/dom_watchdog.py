@@ -4,19 +4,26 @@ import asyncio
 import time
 from typing import TYPE_CHECKING
 
+from cdp_use.cdp.target import TargetID
+from pydantic import Field
+
 from browser_use.browser.events import (
 	BrowserErrorEvent,
 	BrowserStateRequestEvent,
 	ScreenshotEvent,
+	TabClosedEvent,
 	TabCreatedEvent,
 )
+from browser_use.browser.network_activity import NetworkActivityRouter, NetworkActivityTracker
 from browser_use.browser.watchdog_base import BaseWatchdog
+from browser_use.dom.markdown_extractor import PageMarkdownCache
 from browser_use.dom.service import DomService
 from browser_use.dom.views import (
 	EnhancedDOMTreeNode,
 	SerializedDOMState,
 )
 from browser_use.observability import observe_debug
+from browser_use.screenshots.views import Screenshot
 from browser_use.utils import time_execution_async
 
 if TYPE_CHECKING:
@@ -31,23 +38,34 @@ class DOMWatchdog(BaseWatchdog):
 	helper methods for other watchdogs.
 	"""
 
-	LISTENS_TO = [TabCreatedEvent, BrowserStateRequestEvent]
+	LISTENS_TO = [TabCreatedEvent, TabClosedEvent, BrowserStateRequestEvent]
 	EMITS = [BrowserErrorEvent]
 
 	# Public properties for other watchdogs
 	selector_map: dict[int, EnhancedDOMTreeNode] | None = None
 	current_dom_state: SerializedDOMState | None = None
 	enhanced_dom_tree: EnhancedDOMTreeNode | None = None
+	page_markdown_cache: PageMarkdownCache = Field(default_factory=PageMarkdownCache)
 
 	# Internal DOM service
 	_dom_service: DomService | None = None
 
-	# Network tracking - maps request_id to (url, start_time, method, resource_type)
-	_pending_requests: dict[str, tuple[str, float, str, str | None]] = {}
+	# Network tracking, fed by CDP Network events per session
+	_network_router: NetworkActivityRouter | None = None
 
 	async def on_TabCreatedEvent(self, event: TabCreatedEvent) -> None:
-		# self.logger.debug('Setting up init scripts in browser')
-		return None
+		# Start tracking network requests right away so page stability checks see requests from the initial load
+		try:
+			await self._get_network_tracker(event.target_id)
+		except Exception as e:
+			self.logger.debug(f'Failed to start network tracking for new tab: {e}')
+
+	async def on_TabClosedEvent(self, event: TabClosedEvent) -> None:
+		# Stop routing DOM mutations and network events of the closed tab to trackers nobody will read again
+		if self._dom_service is not None:
+			self._dom_service.forget_target(event.target_id)
+		if self._network_router is not None:
+			self._network_router.forget_target(event.target_id)
 
 	def _get_recent_events_str(self, limit: int = 10) -> str | None:
 		"""Get the most recent events from the event bus as JSON.
@@ -88,153 +106,41 @@ class DOMWatchdog(BaseWatchdog):
 
 		return json.dumps([])  # Return empty JSON array on error
 
+	async def _get_network_tracker(self, target_id: TargetID | None = None) -> NetworkActivityTracker | None:
+		"""Get the network activity tracker of a target (default: the focused one), enabling the Network domain on first use."""
+		if target_id is None:
+			if not self.browser_session.agent_focus:
+				return None
+			target_id = self.browser_session.agent_focus.target_id
+
+		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id, focus=False)
+		if self._network_router is None:
+			self._network_router = NetworkActivityRouter()
+		tracker, is_new = self._network_router.get_tracker(cdp_session.cdp_client, target_id, cdp_session.session_id)
+		if is_new:
+			try:
+				await cdp_session.cdp_client.send.Network.enable(session_id=cdp_session.session_id)
+			except Exception:
+				# try again on the next call
+				self._network_router.forget_target(target_id)
+				raise
+		return tracker
+
 	async def _get_pending_network_requests(self) -> list['NetworkRequest']:
 		"""Get list of currently pending network requests.
 
-		Uses document.readyState and performance API to detect pending requests.
-		Filters out ads, tracking, and other noise.
+		Tracked from CDP Network events, ads, tracking, and other noise are filtered out.
 
 		Returns:
 			List of NetworkRequest objects representing currently loading resources
 		"""
-		from browser_use.browser.views import NetworkRequest
-
 		try:
-			if not self.browser_session.agent_focus:
+			tracker = await self._get_network_tracker()
+			if tracker is None:
 				return []
-
-			cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
-
-			# Use performance API to get pending requests
-			js_code = """
-(function() {
-	const now = performance.now();
-	const resources = performance.getEntriesByType('resource');
-	const pending = [];
-
-	// Check document readyState
-	const docLoading = document.readyState !== 'complete';
-
-	// Common ad/tracking domains and patterns to filter out
-	const adDomains = [
-		// Standard ad/tracking networks
-		'doubleclick.net', 'googlesyndication.com', 'googletagmanager.com',
-		'facebook.net', 'analytics', 'ads', 'tracking', 'pixel',
-		'hotjar.com', 'clarity.ms', 'mixpanel.com', 'segment.com',
-		// Analytics platforms
-		'demdex.net', 'omtrdc.net', 'adobedtm.com', 'ensighten.com',
-		'newrelic.com', 'nr-data.net', 'google-analytics.com',
-		// Social media trackers
-		'connect.facebook.net', 'platform.twitter.com', 'platform.linkedin.com',
-		// CDN/image hosts (usually not critical for functionality)
-		'.cloudfront.net/image/', '.akamaized.net/image/',
-		// Common tracking paths
-		'/tracker/', '/collector/', '/beacon/', '/telemetry/', '/log/',
-		'/events/', '/eventBatch', '/track.', '/metrics/'
-	];
-
-	// Get resources that are still loading (responseEnd is 0)
-	let totalResourcesChecked = 0;
-	let filteredByResponseEnd = 0;
-	const allDomains = new Set();
-
-	for (const entry of resources) {
-		totalResourcesChecked++;
-
-		// Track all domains from recent resources (for logging)
-		try {
-			const hostname = new URL(entry.name).hostname;
-			if (hostname) allDomains.add(hostname);
-		} catch (e) {}
-
-		if (entry.responseEnd === 0) {
-			filteredByResponseEnd++;
-			const url = entry.name;
-
-			// Filter out ads and tracking
-			const isAd = adDomains.some(domain => url.includes(domain));
-			if (isAd) continue;
-
-			// Filter out data: URLs and very long URLs (often inline resources)
-			if (url.startsWith('data:') || url.length > 500) continue;
-
-			const loadingDuration = now - entry.startTime;
-
-			// Skip requests that have been loading for >10 seconds (likely stuck/polling)
-			if (loadingDuration > 10000) continue;
-
-			const resourceType = entry.initiatorType || 'unknown';
-
-			// Filter out non-critical resources (images, fonts, icons) if loading >3 seconds
-			const nonCriticalTypes = ['img', 'image', 'icon', 'font'];
-			if (nonCriticalTypes.includes(resourceType) && loadingDuration > 3000) continue;
-
-			// Filter out image URLs even if type is unknown
-			const isImageUrl = /\\.(jpg|jpeg|png|gif|webp|svg|ico)(\\?|$)/i.test(url);
-			if (isImageUrl && loadingDuration > 3000) continue;
-
-			pending.push({
-				url: url,
-				method: 'GET',
-				loading_duration_ms: Math.round(loadingDuration),
-				resource_type: resourceType
-			});
-		}
-	}
-
-	return {
-		pending_requests: pending,
-		document_loading: docLoading,
-		document_ready_state: document.readyState,
-		debug: {
-			total_resources: totalResourcesChecked,
-			with_response_end_zero: filteredByResponseEnd,
-			after_all_filters: pending.length,
-			all_domains: Array.from(allDomains)
-		}
-	};
-})()
-"""
-
-			result = await cdp_session.cdp_client.send.Runtime.evaluate(
-				params={'expression': js_code, 'returnByValue': True}, session_id=cdp_session.session_id
-			)
-
-			if result.get('result', {}).get('type') == 'object':
-				data = result['result'].get('value', {})
-				pending = data.get('pending_requests', [])
-				doc_state = data.get('document_ready_state', 'unknown')
-				doc_loading = data.get('document_loading', False)
-				debug_info = data.get('debug', {})
-
-				# Get all domains that had recent activity (from JS)
-				all_domains = debug_info.get('all_domains', [])
-				all_domains_str = ', '.join(sorted(all_domains)[:5]) if all_domains else 'none'
-				if len(all_domains) > 5:
-					all_domains_str += f' +{len(all_domains) - 5} more'
-
-				# Debug logging
-				self.logger.debug(
-					f'🔍 Network check: document.readyState={doc_state}, loading={doc_loading}, '
-					f'total_resources={debug_info.get("total_resources", 0)}, '
-					f'responseEnd=0: {debug_info.get("with_response_end_zero", 0)}, '
-					f'after_filters={len(pending)}, domains=[{all_domains_str}]'
-				)
-
-				# Convert to NetworkRequest objects
-				network_requests = []
-				for req in pending[:20]:  # Limit to 20 to avoid overwhelming the context
-					network_requests.append(
-						NetworkRequest(
-							url=req['url'],
-							method=req.get('method', 'GET'),
-							loading_duration_ms=req.get('loading_duration_ms', 0.0),
-							resource_type=req.get('resource_type'),
-						)
-					)
-
-				return network_requests
-
+			pending = tracker.pending_requests()
+			self.logger.debug(f'🔍 Network check: {len(pending)} pending requests after filters')
+			return pending
 		except Exception as e:
 			self.logger.debug(f'Failed to get pending network requests: {e}')
 
@@ -243,8 +149,8 @@ class DOMWatchdog(BaseWatchdog):
 	async def _wait_for_network_idle(self) -> bool:
 		"""Wait until network is idle (like Puppeteer's networkidle0/networkidle2).
 
-		Polls the network state until it remains stable for the configured idle_time,
-		or until the timeout is reached.
+		Waits on CDP Network events until the number of pending requests stays at or below the configured
+		maximum for the configured idle_time, or until the timeout is reached.
 
 		Returns:
 			True if network became idle, False if timeout was reached
@@ -253,36 +159,19 @@ class DOMWatchdog(BaseWatchdog):
 		idle_time = profile.network_idle_time
 		max_inflight = profile.network_idle_max_inflight
 		timeout = profile.network_idle_timeout
-		poll_interval = profile.network_idle_poll_interval
 
 		start_time = time.time()
-		last_change_time = start_time
-
-		while time.time() - start_time < timeout:
-			try:
-				pending = await self._get_pending_network_requests()
-				current_inflight = len(pending)
-
-				if current_inflight <= max_inflight:
-					# Network is "idle" - check if it's been idle long enough
-					if time.time() - last_change_time >= idle_time:
-						self.logger.debug(
-							f'🔍 Network idle achieved: {current_inflight} requests for {idle_time}s (max_inflight={max_inflight})'
-						)
-						return True
-				else:
-					# Still loading - reset the idle timer
-					self.logger.debug(
-						f'🔍 Network busy: {current_inflight} pending requests (waiting for <= {max_inflight})'
-					)
-					last_change_time = time.time()
-
-				await asyncio.sleep(poll_interval)
+		try:
+			tracker = await self._get_network_tracker()
+		except Exception as e:
+			self.logger.debug(f'Error checking network state: {e}')
+			return False
+		if tracker is None:
+			return False
 
-			except Exception as e:
-				self.logger.debug(f'Error checking network state: {e}')
-				# On error, wait a bit and try again
-				await asyncio.sleep(poll_interval)
+		if await tracker.wait_for_idle(idle_time=idle_time, max_inflight=max_inflight, timeout=timeout):
+			self.logger.debug(f'🔍 Network idle achieved: <= {max_inflight} requests for {idle_time}s')
+			return True
 
 		# Timeout reached
 		elapsed = time.time() - start_time
@@ -555,7 +444,7 @@ class DOMWatchdog(BaseWatchdog):
 				url=page_url,
 				title=title,
 				tabs=tabs_info,
-				screenshot=screenshot_b64,
+				screenshot=Screenshot.coerce(screenshot_b64),
 				page_info=page_info,
 				pixels_above=0,
 				pixels_below=0,
@@ -619,6 +508,9 @@ class DOMWatchdog(BaseWatchdog):
 					paint_order_filtering=self.browser_session.browser_profile.paint_order_filtering,
 					max_iframes=self.browser_session.browser_profile.max_iframes,
 					max_iframe_depth=self.browser_session.browser_profile.max_iframe_depth,
+					max_concurrent_iframes=self.browser_session.browser_profile.max_concurrent_iframes,
+					incremental=self.browser_session.browser_profile.incremental_dom,
+					incremental_max_dirty_ratio=self.browser_session.browser_profile.incremental_dom_max_dirty_ratio,
 				)
 
 			# Get serialized DOM tree using the service
@@ -3,14 +3,25 @@
 import asyncio
 import json
 import os
+import shutil
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from bubus import BaseEvent
+from cdp_use.cdp.domstorage.events import (
+	DomStorageItemAddedEvent,
+	DomStorageItemRemovedEvent,
+	DomStorageItemsClearedEvent,
+	DomStorageItemUpdatedEvent,
+)
 from cdp_use.cdp.network import Cookie
+from cdp_use.cdp.network.events import ResponseReceivedExtraInfoEvent
+from cdp_use.cdp.target import TargetID
+from cdp_use.cdp.target.events import DetachedFromTargetEvent
 from pydantic import Field, PrivateAttr
 
 from browser_use.browser.events import (
+	AgentFocusChangedEvent,
 	BrowserConnectedEvent,
 	BrowserStopEvent,
 	LoadStorageStateEvent,
@@ -20,14 +31,26 @@ from browser_use.browser.events import (
 )
 from browser_use.browser.watchdog_base import BaseWatchdog
 
+if TYPE_CHECKING:
+	from cdp_use import CDPClient
+
+DomStorageEvent = DomStorageItemAddedEvent | DomStorageItemUpdatedEvent | DomStorageItemRemovedEvent | DomStorageItemsClearedEvent
+
 
 class StorageStateWatchdog(BaseWatchdog):
-	"""Monitors and persists browser storage state including cookies and localStorage."""
+	"""Monitors and persists browser storage state including cookies and localStorage.
+
+	Changes are detected from Set-Cookie response headers (Network.responseReceivedExtraInfo) and DOMStorage events of
+	the focused tabs, then written in one debounced save. Saves only re-read what changed and skip the write entirely
+	when the file already matches. Cookie changes no event reports (document.cookie, Network.setCookie, expiry) are
+	caught by comparing the cookie jar every cookie_poll_interval seconds.
+	"""
 
 	# Event contracts
 	LISTENS_TO: ClassVar[list[type[BaseEvent]]] = [
 		BrowserConnectedEvent,
 		BrowserStopEvent,
+		AgentFocusChangedEvent,
 		SaveStorageStateEvent,
 		LoadStorageStateEvent,
 	]
@@ -37,13 +60,25 @@ class StorageStateWatchdog(BaseWatchdog):
 	]
 
 	# Configuration
-	auto_save_interval: float = Field(default=30.0)  # Auto-save every 30 seconds
-	save_on_change: bool = Field(default=True)  # Save immediately when cookies change
+	auto_save_interval: float = Field(default=30.0)  # Save changes at most this often when save_on_change is off
+	save_on_change: bool = Field(default=True)  # Save shortly after cookies or storage change
+	save_debounce: float = Field(default=1.0)  # Changes within this many seconds are written in one save
+	cookie_poll_interval: float = Field(default=60.0)  # Compare the cookie jar this often to catch changes without events
 
 	# Private state
-	_monitoring_task: asyncio.Task | None = PrivateAttr(default=None)
+	_monitoring_task: asyncio.Task | None = PrivateAttr(default=None)  # cookie polling fallback
+	_save_task: asyncio.Task | None = PrivateAttr(default=None)
 	_last_cookie_state: list[dict] = PrivateAttr(default_factory=list)
 	_save_lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
+	_registered_clients: set[int] = PrivateAttr(default_factory=set)
+	_tracked_sessions: dict[str, Any] = PrivateAttr(default_factory=dict)  # session id -> CDP client with the events enabled
+	_cookies_changed: bool = PrivateAttr(default=False)
+	_changed_origins: dict[str, str] = PrivateAttr(default_factory=dict)  # origin -> session id its storage event came from
+	# Contents of the storage_state file as last read or written, reused as long as nobody else touches the file
+	_saved_state: dict[str, Any] | None = PrivateAttr(default=None)
+	_saved_path: Path | None = PrivateAttr(default=None)
+	_saved_stat: tuple[int, int] | None = PrivateAttr(default=None)
+	_backed_up: set[Path] = PrivateAttr(default_factory=set)
 
 	async def on_BrowserConnectedEvent(self, event: BrowserConnectedEvent) -> None:
 		"""Start monitoring when browser starts."""
@@ -60,6 +95,15 @@ class StorageStateWatchdog(BaseWatchdog):
 		self.logger.debug('[StorageStateWatchdog] Stopping storage_state monitoring')
 		await self._stop_monitoring()
 
+	async def on_AgentFocusChangedEvent(self, event: AgentFocusChangedEvent) -> None:
+		"""Watch the cookie and storage events of the newly focused tab."""
+		if not self._registered_clients:
+			return
+		try:
+			await self._track_target(event.target_id)
+		except Exception as e:
+			self.logger.debug(f'[StorageStateWatchdog] Could not watch storage changes of tab {event.target_id[-4:]}: {e}')
+
 	async def on_SaveStorageStateEvent(self, event: SaveStorageStateEvent) -> None:
 		"""Handle storage state save request."""
 		# Use provided path or fall back to profile default
@@ -85,53 +129,109 @@ class StorageStateWatchdog(BaseWatchdog):
 		await self._load_storage_state(path)
 
 	async def _start_monitoring(self) -> None:
-		"""Start the monitoring task."""
-		if self._monitoring_task and not self._monitoring_task.done():
+		"""Watch Set-Cookie headers and DOMStorage events, polling cookies for the changes they don't report."""
+		if self._registered_clients or (self._monitoring_task and not self._monitoring_task.done()):
 			return
 
 		assert self.browser_session.cdp_client is not None
 
+		try:
+			self._register_handlers(self.browser_session.cdp_client)
+			if self.browser_session.agent_focus:
+				await self._track_target(self.browser_session.agent_focus.target_id)
+		except Exception as e:
+			self.logger.debug(
+				f'[StorageStateWatchdog] Storage change events unavailable ({type(e).__name__}: {e}), '
+				f'polling cookies every {self.auto_save_interval}s instead'
+			)
+			self._registered_clients.clear()
 		self._monitoring_task = asyncio.create_task(self._monitor_storage_changes())
-		# self.logger'[StorageStateWatchdog] Started storage monitoring task')
 
 	async def _stop_monitoring(self) -> None:
-		"""Stop the monitoring task."""
-		if self._monitoring_task and not self._monitoring_task.done():
-			self._monitoring_task.cancel()
+		"""Stop watching for changes and cancel any pending save."""
+		for task in (self._monitoring_task, self._save_task):
+			if task and not task.done():
+				task.cancel()
+				try:
+					await task
+				except asyncio.CancelledError:
+					pass
+		self._registered_clients.clear()
+		self._tracked_sessions.clear()
+
+	def _register_handlers(self, cdp_client: 'CDPClient') -> None:
+		"""cdp-use keeps one callback per event per client, all flattened sessions of the client share these."""
+		if id(cdp_client) in self._registered_clients:
+			return
+		cdp_client.register.Network.responseReceivedExtraInfo(self._on_response_extra_info)
+		cdp_client.register.DOMStorage.domStorageItemAdded(self._on_dom_storage_changed)
+		cdp_client.register.DOMStorage.domStorageItemUpdated(self._on_dom_storage_changed)
+		cdp_client.register.DOMStorage.domStorageItemRemoved(self._on_dom_storage_changed)
+		cdp_client.register.DOMStorage.domStorageItemsCleared(self._on_dom_storage_changed)
+		cdp_client.register.Target.detachedFromTarget(self._on_detached_from_target)
+		self._registered_clients.add(id(cdp_client))
+
+	async def _track_target(self, target_id: TargetID) -> None:
+		"""Enable the Network and DOMStorage events of a tab."""
+		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id, focus=False)
+		if cdp_session.session_id in self._tracked_sessions:
+			return
+		self._register_handlers(cdp_session.cdp_client)
+		await asyncio.gather(
+			cdp_session.cdp_client.send.Network.enable(session_id=cdp_session.session_id),
+			cdp_session.cdp_client.send.DOMStorage.enable(session_id=cdp_session.session_id),
+		)
+		self._tracked_sessions[cdp_session.session_id] = cdp_session.cdp_client
+
+	def _on_response_extra_info(self, event: ResponseReceivedExtraInfoEvent, session_id: str | None = None) -> None:
+		"""A response with Set-Cookie headers changed the cookie jar."""
+		if any(name.lower() == 'set-cookie' for name in event.get('headers', {})):
+			self._cookies_changed = True
+			self._schedule_save()
+
+	def _on_dom_storage_changed(self, event: DomStorageEvent, session_id: str | None = None) -> None:
+		"""localStorage or sessionStorage of an origin changed."""
+		origin = event['storageId'].get('securityOrigin')
+		if origin and session_id:
+			self._changed_origins[origin] = session_id
+			self._schedule_save()
+
+	def _on_detached_from_target(self, event: DetachedFromTargetEvent, session_id: str | None = None) -> None:
+		"""The tab closed or its session detached, stop keeping its client around."""
+		self._tracked_sessions.pop(event['sessionId'], None)
+
+	def _schedule_save(self) -> None:
+		"""Save once the changes settled, every change arriving until then is written by the same save."""
+		if self._save_task and not self._save_task.done():
+			return
+		delay = self.save_debounce if self.save_on_change else self.auto_save_interval
+		self._save_task = asyncio.create_task(self._save_changes_after(delay))
+
+	async def _save_changes_after(self, delay: float) -> None:
+		wait = delay
+		while self._cookies_changed or self._changed_origins:
+			await asyncio.sleep(wait)
+			self.logger.debug('[StorageStateWatchdog] Detected changes to sync with storage_state.json')
 			try:
-				await self._monitoring_task
-			except asyncio.CancelledError:
-				pass
-			# self.logger.debug('[StorageStateWatchdog] Stopped storage monitoring task')
-
-	async def _check_for_cookie_changes_cdp(self, event: dict) -> None:
-		"""Check if a CDP network event indicates cookie changes.
-
-		This would be called by Network.responseReceivedExtraInfo events
-		if we set up CDP event listeners.
-		"""
-		try:
-			# Check for Set-Cookie headers in the response
-			headers = event.get('headers', {})
-			if 'set-cookie' in headers or 'Set-Cookie' in headers:
-				self.logger.debug('[StorageStateWatchdog] Cookie change detected via CDP')
-
-				# If save on change is enabled, trigger save immediately
-				if self.save_on_change:
-					await self._save_storage_state()
-		except Exception as e:
-			self.logger.warning(f'[StorageStateWatchdog] Error checking for cookie changes: {e}')
+				saved = await self._save_storage_state(incremental=True)
+			except Exception as e:
+				self.logger.debug(f'[StorageStateWatchdog] Could not save storage changes: {type(e).__name__}: {e}')
+				saved = False
+			# a failed save keeps its changes pending, retry them later instead of hammering a broken disk or browser
+			wait = delay if saved else max(delay, self.auto_save_interval)
 
 	async def _monitor_storage_changes(self) -> None:
-		"""Periodically check for storage changes and auto-save."""
+		"""Periodically compare the cookie jar with the last save, for the changes no CDP event reports."""
 		while True:
 			try:
-				await asyncio.sleep(self.auto_save_interval)
+				# without events this poll is the only way changes are noticed, so it runs as often as saves may happen
+				await asyncio.sleep(self.cookie_poll_interval if self._registered_clients else self.auto_save_interval)
 
-				# Check if cookies have changed
-				if await self._have_cookies_changed():
-					self.logger.debug('[StorageStateWatchdog] Detected changes to sync with storage_state.json')
-					await self._save_storage_state()
+				# Check if cookies have changed, unless there is no file to save them to
+				storage_state = self.browser_session.browser_profile.storage_state
+				if isinstance(storage_state, (str, Path)) and await self._have_cookies_changed():
+					self._cookies_changed = True
+					self._schedule_save()
 
 			except asyncio.CancelledError:
 				break
@@ -161,53 +261,55 @@ class StorageStateWatchdog(BaseWatchdog):
 			self.logger.debug(f'[StorageStateWatchdog] Error comparing cookies: {e}')
 			return False
 
-	async def _save_storage_state(self, path: str | None = None) -> None:
-		"""Save browser storage state to file."""
+	async def _save_storage_state(self, path: str | None = None, incremental: bool = False) -> bool:
+		"""Save browser storage state to file, returns False if the save failed and the changes are still pending.
+
+		With incremental=True only the origins whose storage events fired are read again, and nothing is written when
+		neither cookies nor storage actually differ from the file.
+		"""
 		async with self._save_lock:
 			# Check if CDP client is available
 			assert await self.browser_session.get_or_create_cdp_session(target_id=None, new_socket=False)
 
+			# this save covers every change seen so far
+			cookies_changed, changed_origins = self._cookies_changed, self._changed_origins
+			self._cookies_changed = False
+			self._changed_origins = {}
+
 			save_path = path or self.browser_session.browser_profile.storage_state
 			if not save_path:
-				return
+				return True
 
 			# Skip saving if the storage state is already a dict (indicates it was loaded from memory)
 			# We only save to file if it started as a file path
 			if isinstance(save_path, dict):
 				self.logger.debug('[StorageStateWatchdog] Storage state is already a dict, skipping file save')
-				return
+				return True
 
 			try:
-				# Get current storage state using CDP
-				storage_state = await self.browser_session._cdp_get_storage_state()
-
-				# Update our last known state
-				self._last_cookie_state = storage_state.get('cookies', []).copy()
-
-				# Convert path to Path object
 				json_path = Path(save_path).expanduser().resolve()
-				json_path.parent.mkdir(parents=True, exist_ok=True)
+				existing_state = await asyncio.to_thread(self._read_saved_state, json_path)
 
-				# Merge with existing state if file exists
-				merged_state = storage_state
-				if json_path.exists():
-					try:
-						existing_state = json.loads(json_path.read_text())
-						merged_state = self._merge_storage_states(existing_state, dict(storage_state))
-					except Exception as e:
-						self.logger.error(f'[StorageStateWatchdog] Failed to merge with existing state: {e}')
+				# Get current storage state using CDP
+				if incremental and existing_state is not None:
+					storage_state = {
+						'cookies': await self.browser_session._cdp_get_cookies(),
+						'origins': await self._get_changed_origins(changed_origins),
+					}
+				else:
+					storage_state = await self.browser_session._cdp_get_storage_state(
+						disable_dom_storage=not self._tracked_sessions
+					)
 
-				# Write atomically
-				temp_path = json_path.with_suffix('.json.tmp')
-				temp_path.write_text(json.dumps(merged_state, indent=4))
+				# Update our last known state
+				self._last_cookie_state = list(storage_state.get('cookies', []))
 
-				# Backup existing file
-				if json_path.exists():
-					backup_path = json_path.with_suffix('.json.bak')
-					json_path.replace(backup_path)
+				merged_state, changes = self._apply_storage_changes(existing_state, dict(storage_state))
+				if existing_state is not None and not changes:
+					self.logger.debug(f'[StorageStateWatchdog] Storage state unchanged, not rewriting {json_path}')
+					return True
 
-				# Move temp to final
-				temp_path.replace(json_path)
+				await asyncio.to_thread(self._write_storage_state, json_path, merged_state)
 
 				# Emit success event
 				self.event_bus.dispatch(
@@ -221,11 +323,84 @@ class StorageStateWatchdog(BaseWatchdog):
 				self.logger.debug(
 					f'[StorageStateWatchdog] Saved storage state to {json_path} '
 					f'({len(merged_state.get("cookies", []))} cookies, '
-					f'{len(merged_state.get("origins", []))} origins)'
+					f'{len(merged_state.get("origins", []))} origins, {changes} changed)'
 				)
+				return True
 
 			except Exception as e:
 				self.logger.error(f'[StorageStateWatchdog] Failed to save storage state: {e}')
+				# keep the changes pending for the next save, together with any that arrived meanwhile
+				self._cookies_changed = self._cookies_changed or cookies_changed
+				self._changed_origins = {**changed_origins, **self._changed_origins}
+				if self._cookies_changed or self._changed_origins:
+					self._schedule_save()
+				return False
+
+	async def _get_changed_origins(self, changed_origins: dict[str, str]) -> list[dict[str, Any]]:
+		"""localStorage/sessionStorage of the origins that fired DOMStorage events, read from the tab they fired in.
+
+		An origin without any items left is returned without storage keys, so it is dropped from the saved state.
+		"""
+		origins = []
+		for origin, session_id in changed_origins.items():
+			cdp_client = self._tracked_sessions.get(session_id, self.browser_session.cdp_client)
+			origin_data: dict[str, Any] = {'origin': origin}
+			try:
+				for storage_type, is_local_storage in (('localStorage', True), ('sessionStorage', False)):
+					result = await cdp_client.send.DOMStorage.getDOMStorageItems(
+						params={'storageId': {'securityOrigin': origin, 'isLocalStorage': is_local_storage}},
+						session_id=session_id,
+					)
+					items = [{'name': item[0], 'value': item[1]} for item in result.get('entries', []) if len(item) == 2]
+					if items:
+						origin_data[storage_type] = items
+			except Exception as e:
+				# the tab is gone, keep what was saved for this origin
+				self.logger.debug(f'[StorageStateWatchdog] Failed to read storage of {origin}: {e}')
+				continue
+			origins.append(origin_data)
+		return origins
+
+	def _read_saved_state(self, json_path: Path) -> dict[str, Any] | None:
+		"""The storage state currently in the file, only read from disk if it changed since it was last read or written."""
+		try:
+			stat = json_path.stat()
+		except FileNotFoundError:
+			return None
+		if self._saved_path == json_path and self._saved_stat == (stat.st_mtime_ns, stat.st_size):
+			return self._saved_state
+
+		try:
+			state = json.loads(json_path.read_text())
+		except Exception as e:
+			self.logger.error(f'[StorageStateWatchdog] Failed to merge with existing state: {e}')
+			return None
+		self._remember_saved_state(json_path, state)
+		return state
+
+	def _write_storage_state(self, json_path: Path, state: dict[str, Any]) -> None:
+		"""Write atomically: a crash leaves either the old or the new file, never a truncated one."""
+		json_path.parent.mkdir(parents=True, exist_ok=True)
+		temp_path = json_path.with_suffix('.json.tmp')
+		with open(temp_path, 'w') as f:
+			f.write(json.dumps(state, indent=4))
+			f.flush()
+			os.fsync(f.fileno())
+
+		# Backup the file as it was before this session first overwrote it
+		if json_path not in self._backed_up and json_path.exists():
+			shutil.copyfile(json_path, json_path.with_suffix('.json.bak'))
+		self._backed_up.add(json_path)
+
+		os.replace(temp_path, json_path)
+		self._remember_saved_state(json_path, state)
+
+	def _remember_saved_state(self, path: str | Path, state: dict[str, Any]) -> None:
+		json_path = Path(path).expanduser().resolve()
+		stat = json_path.stat()
+		self._saved_state = state
+		self._saved_path = json_path
+		self._saved_stat = (stat.st_mtime_ns, stat.st_size)
 
 	async def _load_storage_state(self, path: str | None = None) -> None:
 		"""Load browser storage state from file."""
@@ -243,6 +418,7 @@ class StorageStateWatchdog(BaseWatchdog):
 
 			content = await anyio.Path(str(load_path)).read_text()
 			storage = json.loads(content)
+			await asyncio.to_thread(self._remember_saved_state, str(load_path), storage)
 
 			# Apply cookies if present
 			if 'cookies' in storage and storage['cookies']:
@@ -285,26 +461,40 @@ class StorageStateWatchdog(BaseWatchdog):
 	@staticmethod
 	def _merge_storage_states(existing: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
 		"""Merge two storage states, with new values taking precedence."""
+		return StorageStateWatchdog._apply_storage_changes(existing, new)[0]
+
+	@staticmethod
+	def _apply_storage_changes(existing: dict[str, Any] | None, new: dict[str, Any]) -> tuple[dict[str, Any], int]:
+		"""Merge new into existing (new values take precedence), returning the merged state and how many entries changed.
+
+		Origins in new without any storage keys are removed.
+		"""
+		if existing is None:
+			existing = {}
 		merged = existing.copy()
+		changes = 0
 
 		# Merge cookies
-		existing_cookies = {(c['name'], c['domain'], c['path']): c for c in existing.get('cookies', [])}
-
+		cookies = {(c['name'], c['domain'], c['path']): c for c in existing.get('cookies', [])}
 		for cookie in new.get('cookies', []):
 			key = (cookie['name'], cookie['domain'], cookie['path'])
-			existing_cookies[key] = cookie
-
-		merged['cookies'] = list(existing_cookies.values())
+			if cookies.get(key) != cookie:
+				cookies[key] = cookie
+				changes += 1
+		merged['cookies'] = list(cookies.values())
 
 		# Merge origins
-		existing_origins = {origin['origin']: origin for origin in existing.get('origins', [])}
-
+		origins = {origin['origin']: origin for origin in existing.get('origins', [])}
 		for origin in new.get('origins', []):
-			existing_origins[origin['origin']] = origin
-
-		merged['origins'] = list(existing_origins.values())
-
-		return merged
+			if 'localStorage' not in origin and 'sessionStorage' not in origin:
+				if origins.pop(origin['origin'], None) is not None:
+					changes += 1
+			elif origins.get(origin['origin']) != origin:
+				origins[origin['origin']] = origin
+				changes += 1
+		merged['origins'] = list(origins.values())
+
+		return merged, changes
 
 	async def get_current_cookies(self) -> list[dict[str, Any]]:
 		"""Get current cookies using CDP."""
@@ -1683,6 +1683,7 @@ async def run_auth_command():
 			},
 		)
 		await sync_service.handle_event(session_event)
+		await sync_service.flush()
 
 		# Brief delay to ensure session is created in backend before sending task
 		await asyncio.sleep(0.5)
@@ -1701,6 +1702,7 @@ async def run_auth_command():
 			gif_url=None,
 		)
 		await sync_service.handle_event(task_event)
+		await sync_service.flush()
 
 		# Longer delay to ensure task is created in backend before sending step event
 		await asyncio.sleep(1.0)
@@ -1795,6 +1797,7 @@ async def run_auth_command():
 			)
 			print('📤 Sending dummy step event...')
 			await sync_service.handle_event(step_event)
+			await sync_service.flush()
 
 			# Small delay to ensure step is processed before completion
 			await asyncio.sleep(0.5)
@@ -1829,6 +1832,8 @@ async def run_auth_command():
 			print('❌ Authentication failed.')
 			print('   Please try again or check your internet connection.')
 
+		await sync_service.close()
+
 	except Exception as e:
 		print(f'❌ Authentication error: {e}')
 		# Still try to complete the task in UI with error message
@@ -1846,6 +1851,7 @@ async def run_auth_command():
 					gif_url=None,
 				)
 				await sync_service.handle_event(completion_event)
+				await sync_service.close()
 			except Exception:
 				pass  # Don't fail if we can't send the error event
 		sys.exit(1)
@@ -1030,7 +1030,7 @@ __code_exec_coro__ = __code_exec__()
 				state=state, namespace=self.namespace, browser_session=self.browser_session
 			)
 
-			screenshot = state.screenshot if include_screenshot else None
+			screenshot = state.screenshot.base64 if include_screenshot and state.screenshot else None
 			return browser_state_text, screenshot
 
 		except Exception as e:
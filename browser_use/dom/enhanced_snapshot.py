@@ -1,15 +1,20 @@
 """
 Enhanced snapshot processing for browser-use DOM tree extraction.
 
-This module provides stateless functions for parsing Chrome DevTools Protocol (CDP) DOMSnapshot data
+This module provides a lazily read lookup over Chrome DevTools Protocol (CDP) DOMSnapshot data
 to extract visibility, clickability, cursor styles, and other layout information.
 """
 
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, Mapping
+from dataclasses import fields
+from typing import Any
+
 from cdp_use.cdp.domsnapshot.commands import CaptureSnapshotReturns
 from cdp_use.cdp.domsnapshot.types import (
 	LayoutTreeSnapshot,
 	NodeTreeSnapshot,
-	RareBooleanData,
 )
 
 from browser_use.dom.views import DOMRect, EnhancedSnapshotNode
@@ -30,11 +35,6 @@ REQUIRED_COMPUTED_STYLES = [
 ]
 
 
-def _parse_rare_boolean_data(rare_data: RareBooleanData, index: int) -> bool | None:
-	"""Parse rare boolean data from snapshot - returns True if index is in the rare data."""
-	return index in rare_data['index']
-
-
 def _parse_computed_styles(strings: list[str], style_indices: list[int]) -> dict[str, str]:
 	"""Parse computed styles from layout tree using string indices."""
 	styles = {}
@@ -44,118 +44,151 @@ def _parse_computed_styles(strings: list[str], style_indices: list[int]) -> dict
 	return styles
 
 
+def _rect_from_list(rect_data: list[float] | None, scale: float = 1.0) -> DOMRect | None:
+	if not rect_data or len(rect_data) < 4:
+		return None
+	if scale == 1.0:
+		return DOMRect(x=rect_data[0], y=rect_data[1], width=rect_data[2], height=rect_data[3])
+	return DOMRect(x=rect_data[0] / scale, y=rect_data[1] / scale, width=rect_data[2] / scale, height=rect_data[3] / scale)
+
+
+class _DocumentColumns:
+	"""Column view over one snapshot document. Derived index columns are built on first use."""
+
+	__slots__ = ('nodes', 'layout', '_layout_index', '_clickable')
+
+	def __init__(self, nodes: NodeTreeSnapshot, layout: LayoutTreeSnapshot):
+		self.nodes = nodes
+		self.layout = layout
+		self._layout_index: array | None = None
+		self._clickable: set[int] | None = None
+
+	def layout_index(self, snapshot_index: int) -> int:
+		"""Layout row of a snapshot node, -1 if it has none. Duplicates resolve to the FIRST occurrence."""
+		if self._layout_index is None:
+			self._layout_index = array('i', [-1]) * len(self.nodes.get('backendNodeId', []))
+			node_indices = self.layout.get('nodeIndex', []) if self.layout else []
+			# walk backwards so the first occurrence is written last and wins
+			for layout_idx in range(len(node_indices) - 1, -1, -1):
+				node_index = node_indices[layout_idx]
+				if 0 <= node_index < len(self._layout_index):
+					self._layout_index[node_index] = layout_idx
+		return self._layout_index[snapshot_index]
+
+	def is_clickable(self, snapshot_index: int) -> bool | None:
+		if 'isClickable' not in self.nodes:
+			return None
+		if self._clickable is None:
+			self._clickable = set(self.nodes['isClickable']['index'])
+		return snapshot_index in self._clickable
+
+
+class _LazySnapshotNode(EnhancedSnapshotNode):
+	"""Snapshot node view whose fields are read from the snapshot columns the first time they are accessed.
+
+	Fields that were read (or assigned) are stored on the node like on a plain `EnhancedSnapshotNode`, so in-place updates
+	of e.g. `bounds` stick. The view keeps the raw snapshot alive for as long as the tree that references it.
+	"""
+
+	__slots__ = ('_lookup', '_row')
+
+	def __init__(self, lookup: 'SnapshotLookup', row: int):
+		# fields are deliberately left unset, `__getattr__` only runs for unset slots
+		self._lookup = lookup
+		self._row = row
+
+	def __getattr__(self, name: str):
+		if name not in _SNAPSHOT_FIELDS:
+			raise AttributeError(name)
+		value = self._lookup._read_field(self._row, name)
+		setattr(self, name, value)
+		return value
+
+
+_SNAPSHOT_FIELDS = frozenset(field.name for field in fields(EnhancedSnapshotNode))
+
+
+class SnapshotLookup(Mapping[int, EnhancedSnapshotNode]):
+	"""Read-only mapping of backend node ID to enhanced snapshot data, backed by the raw CDP snapshot columns.
+
+	Only an int->int index is built upfront. Looking a node up returns a view over its row: bounds scaling, computed
+	style parsing and rects are only done for the fields that are actually read. Nothing is memoized, every lookup returns
+	a new view, so the tree node holding it owns any in-place updates.
+	"""
+
+	def __init__(self, snapshot: CaptureSnapshotReturns, device_pixel_ratio: float = 1.0):
+		self.strings: list[str] = snapshot['strings'] if snapshot['documents'] else []
+		self.device_pixel_ratio = device_pixel_ratio
+		self._documents: list[_DocumentColumns] = []
+		# global row -> document, as the starting global row of each document
+		self._document_offsets = array('q')
+		self._backend_node_ids = array('q')
+
+		for document in snapshot['documents']:
+			nodes: NodeTreeSnapshot = document['nodes']
+			backend_node_ids = nodes.get('backendNodeId', [])
+			self._document_offsets.append(len(self._backend_node_ids))
+			self._documents.append(_DocumentColumns(nodes, document['layout']))
+			self._backend_node_ids.extend(backend_node_ids)
+
+		# later documents win for duplicate backend node ids, same as overwriting a dict in document order
+		self._row_by_backend_node_id: dict[int, int] = dict(zip(self._backend_node_ids, range(len(self._backend_node_ids))))
+
+	def __len__(self) -> int:
+		return len(self._row_by_backend_node_id)
+
+	def __iter__(self) -> Iterator[int]:
+		return iter(self._row_by_backend_node_id)
+
+	def __contains__(self, backend_node_id: object) -> bool:
+		return backend_node_id in self._row_by_backend_node_id
+
+	def __getitem__(self, backend_node_id: int) -> EnhancedSnapshotNode:
+		return _LazySnapshotNode(self, self._row_by_backend_node_id[backend_node_id])
+
+	def _read_field(self, row: int, name: str) -> Any:
+		"""Read one `EnhancedSnapshotNode` field of a row from the snapshot columns."""
+		document_idx = bisect_right(self._document_offsets, row) - 1
+		document = self._documents[document_idx]
+		snapshot_index = row - self._document_offsets[document_idx]
+
+		if name == 'is_clickable':
+			return document.is_clickable(snapshot_index)
+
+		layout = document.layout
+		layout_idx = document.layout_index(snapshot_index)
+		if layout_idx == -1 or layout_idx >= len(layout.get('bounds', [])):
+			return None
+
+		if name == 'bounds':
+			# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels by dividing by the device pixel ratio
+			return _rect_from_list(layout['bounds'][layout_idx], self.device_pixel_ratio)
+		if name == 'computed_styles':
+			styles = layout.get('styles', [])
+			return (_parse_computed_styles(self.strings, styles[layout_idx]) or None) if layout_idx < len(styles) else None
+		if name == 'cursor_style':
+			styles = layout.get('styles', [])
+			return _parse_computed_styles(self.strings, styles[layout_idx]).get('cursor') if layout_idx < len(styles) else None
+		if name == 'paint_order':
+			paint_orders = layout.get('paintOrders', [])
+			return paint_orders[layout_idx] if layout_idx < len(paint_orders) else None
+		if name == 'clientRects':
+			client_rects_data = layout.get('clientRects', [])
+			return _rect_from_list(client_rects_data[layout_idx]) if layout_idx < len(client_rects_data) else None
+		if name == 'scrollRects':
+			scroll_rects_data = layout.get('scrollRects', [])
+			return _rect_from_list(scroll_rects_data[layout_idx]) if layout_idx < len(scroll_rects_data) else None
+		if name == 'stacking_contexts':
+			stacking_context_indices = layout.get('stackingContexts', {}).get('index', [])
+			if layout_idx < len(layout.get('stackingContexts', [])) and layout_idx < len(stacking_context_indices):
+				return stacking_context_indices[layout_idx]
+			return None
+		raise AttributeError(name)
+
+
 def build_snapshot_lookup(
 	snapshot: CaptureSnapshotReturns,
 	device_pixel_ratio: float = 1.0,
-) -> dict[int, EnhancedSnapshotNode]:
-	"""Build a lookup table of backend node ID to enhanced snapshot data with everything calculated upfront."""
-	snapshot_lookup: dict[int, EnhancedSnapshotNode] = {}
-
-	if not snapshot['documents']:
-		return snapshot_lookup
-
-	strings = snapshot['strings']
-
-	for document in snapshot['documents']:
-		nodes: NodeTreeSnapshot = document['nodes']
-		layout: LayoutTreeSnapshot = document['layout']
-
-		# Build backend node id to snapshot index lookup
-		backend_node_to_snapshot_index = {}
-		if 'backendNodeId' in nodes:
-			for i, backend_node_id in enumerate(nodes['backendNodeId']):
-				backend_node_to_snapshot_index[backend_node_id] = i
-
-		# PERFORMANCE: Pre-build layout index map to eliminate O(n²) double lookups
-		# Preserve original behavior: use FIRST occurrence for duplicates
-		layout_index_map = {}
-		if layout and 'nodeIndex' in layout:
-			for layout_idx, node_index in enumerate(layout['nodeIndex']):
-				if node_index not in layout_index_map:  # Only store first occurrence
-					layout_index_map[node_index] = layout_idx
-
-		# Build snapshot lookup for each backend node id
-		for backend_node_id, snapshot_index in backend_node_to_snapshot_index.items():
-			is_clickable = None
-			if 'isClickable' in nodes:
-				is_clickable = _parse_rare_boolean_data(nodes['isClickable'], snapshot_index)
-
-			# Find corresponding layout node
-			cursor_style = None
-			is_visible = None
-			bounding_box = None
-			computed_styles = {}
-
-			# Look for layout tree node that corresponds to this snapshot node
-			paint_order = None
-			client_rects = None
-			scroll_rects = None
-			stacking_contexts = None
-			if snapshot_index in layout_index_map:
-				layout_idx = layout_index_map[snapshot_index]
-				if layout_idx < len(layout.get('bounds', [])):
-					# Parse bounding box
-					bounds = layout['bounds'][layout_idx]
-					if len(bounds) >= 4:
-						# IMPORTANT: CDP coordinates are in device pixels, convert to CSS pixels
-						# by dividing by the device pixel ratio
-						raw_x, raw_y, raw_width, raw_height = bounds[0], bounds[1], bounds[2], bounds[3]
-
-						# Apply device pixel ratio scaling to convert device pixels to CSS pixels
-						bounding_box = DOMRect(
-							x=raw_x / device_pixel_ratio,
-							y=raw_y / device_pixel_ratio,
-							width=raw_width / device_pixel_ratio,
-							height=raw_height / device_pixel_ratio,
-						)
-
-					# Parse computed styles for this layout node
-					if layout_idx < len(layout.get('styles', [])):
-						style_indices = layout['styles'][layout_idx]
-						computed_styles = _parse_computed_styles(strings, style_indices)
-						cursor_style = computed_styles.get('cursor')
-
-					# Extract paint order if available
-					if layout_idx < len(layout.get('paintOrders', [])):
-						paint_order = layout.get('paintOrders', [])[layout_idx]
-
-					# Extract client rects if available
-					client_rects_data = layout.get('clientRects', [])
-					if layout_idx < len(client_rects_data):
-						client_rect_data = client_rects_data[layout_idx]
-						if client_rect_data and len(client_rect_data) >= 4:
-							client_rects = DOMRect(
-								x=client_rect_data[0],
-								y=client_rect_data[1],
-								width=client_rect_data[2],
-								height=client_rect_data[3],
-							)
-
-					# Extract scroll rects if available
-					scroll_rects_data = layout.get('scrollRects', [])
-					if layout_idx < len(scroll_rects_data):
-						scroll_rect_data = scroll_rects_data[layout_idx]
-						if scroll_rect_data and len(scroll_rect_data) >= 4:
-							scroll_rects = DOMRect(
-								x=scroll_rect_data[0],
-								y=scroll_rect_data[1],
-								width=scroll_rect_data[2],
-								height=scroll_rect_data[3],
-							)
-
-					# Extract stacking contexts if available
-					if layout_idx < len(layout.get('stackingContexts', [])):
-						stacking_contexts = layout.get('stackingContexts', {}).get('index', [])[layout_idx]
-
-			snapshot_lookup[backend_node_id] = EnhancedSnapshotNode(
-				is_clickable=is_clickable,
-				cursor_style=cursor_style,
-				bounds=bounding_box,
-				clientRects=client_rects,
-				scrollRects=scroll_rects,
-				computed_styles=computed_styles if computed_styles else None,
-				paint_order=paint_order,
-				stacking_contexts=stacking_contexts,
-			)
-
-	return snapshot_lookup
+) -> SnapshotLookup:
+	"""Build a lookup table of backend node ID to enhanced snapshot data, read lazily per node and field."""
+	return SnapshotLookup(snapshot, device_pixel_ratio)
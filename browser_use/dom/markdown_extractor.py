@@ -5,17 +5,166 @@ This module provides a unified interface for extracting clean markdown from brow
 used by both the tools service and page actor.
 """
 
+import hashlib
 import re
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Any
 
 from browser_use.dom.serializer.html_serializer import HTMLSerializer
 from browser_use.dom.service import DomService
+from browser_use.dom.views import EnhancedDOMTreeNode
 
 if TYPE_CHECKING:
 	from browser_use.browser.session import BrowserSession
 	from browser_use.browser.watchdogs.dom_watchdog import DOMWatchdog
 
 
+# HTML characters handed to markdownify per call, the unit in which page markdown is produced
+MARKDOWN_CHUNK_HTML_CHARS = 50_000
+
+
+class PageMarkdown:
+	"""Clean markdown of one page, converted chunk by chunk as far as it is read and kept for paging.
+
+	The pipeline is lazy end to end: HTML pieces (see `HTMLSerializer.iter_blocks`) are grouped into chunks, each chunk
+	is converted with markdownify and filtered, and conversion stops as soon as the reader has enough characters.
+	"""
+
+	def __init__(
+		self,
+		html_pieces: Iterable[str],
+		method: str,
+		url: str | None = None,
+		chunk_html_chars: int = MARKDOWN_CHUNK_HTML_CHARS,
+	):
+		self.method = method
+		self.url = url
+		self.complete = False
+		self.original_html_chars = 0
+		self.initial_markdown_chars = 0
+		self._chunk_html_chars = chunk_html_chars
+		self._markdown_chunks = self._convert(iter(html_pieces))
+		self._parts: list[str] = []
+		self._length = 0
+		self._content: str | None = ''
+
+	@property
+	def content(self) -> str:
+		"""Everything converted so far."""
+		if self._content is None:
+			self._content = '\n'.join(self._parts)
+		return self._content
+
+	def read(self, chars: int) -> str:
+		"""Convert until at least `chars` characters are available (or the page is exhausted) and return the content."""
+		while self._length < chars and not self.complete:
+			chunk = next(self._markdown_chunks, None)
+			if chunk is None:
+				self.complete = True
+				break
+			self._length += len(chunk) + (1 if self._parts else 0)
+			self._parts.append(chunk)
+			self._content = None
+		return self.content
+
+	def read_all(self) -> str:
+		return self.read(sys.maxsize)
+
+	@property
+	def stats(self) -> dict[str, Any]:
+		"""Content statistics of what has been converted so far."""
+		content_length = len(self.content)
+		stats: dict[str, Any] = {
+			'method': self.method,
+			'original_html_chars': self.original_html_chars,
+			'initial_markdown_chars': self.initial_markdown_chars,
+			'filtered_chars_removed': max(0, self.initial_markdown_chars - content_length),
+			'final_filtered_chars': content_length,
+			'complete': self.complete,
+		}
+		# Add URL to stats if available
+		if self.url:
+			stats['url'] = self.url
+		return stats
+
+	def _convert(self, html_pieces: Iterator[str]) -> Iterator[str]:
+		batch: list[str] = []
+		batch_chars = 0
+		for piece in html_pieces:
+			batch.append(piece)
+			batch_chars += len(piece)
+			if batch_chars >= self._chunk_html_chars:
+				if markdown := self._convert_batch(batch):
+					yield markdown
+				batch, batch_chars = [], 0
+		if batch and (markdown := self._convert_batch(batch)):
+			yield markdown
+
+	def _convert_batch(self, batch: list[str]) -> str:
+		page_html = ''.join(batch)
+		self.original_html_chars += len(page_html)
+		content = _html_to_markdown(page_html)
+		self.initial_markdown_chars += len(content)
+		content, _ = _preprocess_markdown_content(content)
+		return content
+
+
+class PageMarkdownCache:
+	"""Converted page markdown keyed by (target, URL, extract_links), valid for the DOM version it was built from.
+
+	The DOM version is a digest of the serialized HTML: serializing the enhanced DOM tree is cheap next to markdownify,
+	and a fingerprint survives the DOM tree being rebuilt for every agent step while the page itself didn't change.
+	"""
+
+	def __init__(self, max_entries: int = 8):
+		self.max_entries = max_entries
+		self.hits = 0
+		self.misses = 0
+		self._entries: OrderedDict[tuple[str, str, bool], tuple[EnhancedDOMTreeNode, str, PageMarkdown]] = OrderedDict()
+
+	def get(self, target_id: str, url: str, extract_links: bool, dom_tree: EnhancedDOMTreeNode) -> PageMarkdown:
+		key = (target_id, url, extract_links)
+		entry = self._entries.get(key)
+		if entry is not None and entry[0] is dom_tree:
+			self._entries.move_to_end(key)
+			self.hits += 1
+			return entry[2]
+
+		html_pieces = list(HTMLSerializer(extract_links=extract_links).iter_blocks(dom_tree))
+		digest = hashlib.blake2b(digest_size=16)
+		for piece in html_pieces:
+			digest.update(piece.encode('utf-8', 'surrogatepass'))
+		dom_version = digest.hexdigest()
+
+		if entry is not None and entry[1] == dom_version:
+			page = entry[2]
+			self.hits += 1
+		else:
+			page = PageMarkdown(html_pieces, method='enhanced_dom_tree', url=url)
+			self.misses += 1
+		self._entries[key] = (dom_tree, dom_version, page)
+		self._entries.move_to_end(key)
+		while len(self._entries) > self.max_entries:
+			self._entries.popitem(last=False)
+		return page
+
+	def clear(self) -> None:
+		self._entries.clear()
+
+
+async def get_page_markdown(browser_session: 'BrowserSession', extract_links: bool = False) -> PageMarkdown:
+	"""Markdown of the focused page, reusing the conversion of an earlier call on the same unchanged page."""
+	dom_watchdog: DOMWatchdog | None = browser_session._dom_watchdog
+	assert dom_watchdog is not None, 'DOMWatchdog not available'
+
+	enhanced_dom_tree = await _get_enhanced_dom_tree_from_browser_session(browser_session)
+	current_url = await browser_session.get_current_page_url()
+	target_id = browser_session.agent_focus.target_id if browser_session.agent_focus else ''
+	return dom_watchdog.page_markdown_cache.get(target_id, current_url, extract_links, enhanced_dom_tree)
+
+
 async def extract_clean_markdown(
 	browser_session: 'BrowserSession | None' = None,
 	dom_service: DomService | None = None,
@@ -44,23 +193,47 @@ async def extract_clean_markdown(
 		if dom_service is not None or target_id is not None:
 			raise ValueError('Cannot specify both browser_session and dom_service/target_id')
 		# Browser session path (tools service)
-		enhanced_dom_tree = await _get_enhanced_dom_tree_from_browser_session(browser_session)
-		current_url = await browser_session.get_current_page_url()
-		method = 'enhanced_dom_tree'
+		page = await get_page_markdown(browser_session, extract_links=extract_links)
 	elif dom_service is not None and target_id is not None:
 		# DOM service path (page actor)
 		enhanced_dom_tree = await dom_service.get_dom_tree(target_id=target_id)
-		current_url = None  # Not available via DOM service
-		method = 'dom_service'
+		html_pieces = HTMLSerializer(extract_links=extract_links).iter_blocks(enhanced_dom_tree)
+		page = PageMarkdown(html_pieces, method='dom_service')  # URL not available via DOM service
 	else:
 		raise ValueError('Must provide either browser_session or both dom_service and target_id')
 
-	# Use the HTML serializer with the enhanced DOM tree
-	html_serializer = HTMLSerializer(extract_links=extract_links)
-	page_html = html_serializer.serialize(enhanced_dom_tree)
+	content = page.read_all()
+	return content, page.stats
+
 
-	original_html_length = len(page_html)
+def split_markdown_chunks(content: str, max_chars: int) -> list[str]:
+	"""Split markdown into consecutive chunks of at most `max_chars` that concatenate back to `content`.
 
+	Chunks end at a line break, preferably right before a heading in the last fifth of the window so sections stay
+	together. A single line longer than `max_chars` is cut hard.
+	"""
+	chunks: list[str] = []
+	start = 0
+	while len(content) - start > max_chars:
+		window_end = start + max_chars
+		cut = -1
+		heading = content.rfind('\n#', start + max_chars * 4 // 5, window_end)
+		if heading > start:
+			cut = heading + 1
+		else:
+			line_break = content.rfind('\n', start, window_end)
+			if line_break > start:
+				cut = line_break + 1
+		if cut <= start:
+			cut = window_end
+		chunks.append(content[start:cut])
+		start = cut
+	if start < len(content):
+		chunks.append(content[start:])
+	return chunks
+
+
+def _html_to_markdown(page_html: str) -> str:
 	# Use markdownify for clean markdown conversion
 	from markdownify import markdownify as md
 
@@ -78,30 +251,8 @@ async def extract_clean_markdown(
 		keep_inline_images_in=[],  # Don't keep inline images in any tags (we already filter base64 in HTML)
 	)
 
-	initial_markdown_length = len(content)
-
 	# Minimal cleanup - markdownify already does most of the work
-	content = re.sub(r'%[0-9A-Fa-f]{2}', '', content)  # Remove any remaining URL encoding
-
-	# Apply light preprocessing to clean up excessive whitespace
-	content, chars_filtered = _preprocess_markdown_content(content)
-
-	final_filtered_length = len(content)
-
-	# Content statistics
-	stats = {
-		'method': method,
-		'original_html_chars': original_html_length,
-		'initial_markdown_chars': initial_markdown_length,
-		'filtered_chars_removed': chars_filtered,
-		'final_filtered_chars': final_filtered_length,
-	}
-
-	# Add URL to stats if available
-	if current_url:
-		stats['url'] = current_url
-
-	return content, stats
+	return re.sub(r'%[0-9A-Fa-f]{2}', '', content)  # Remove any remaining URL encoding
 
 
 async def _get_enhanced_dom_tree_from_browser_session(browser_session: 'BrowserSession'):
@@ -0,0 +1,374 @@
+"""
+Incremental DOM tree maintenance driven by CDP DOM mutation events.
+
+A full `DOM.getDocument(depth=-1, pierce=True)` + `Accessibility.getFullAXTree` on every step is the dominant cost on heavy
+SPAs, even when an action only touched a single subtree. The tracker in this module listens to the DOM mutation events that
+Chrome pushes for every node it has already sent to us, patches the cached `EnhancedDOMTreeNode` tree in place and remembers
+which nodes need fresh accessibility data. `DomService` then decides per step whether the patched tree can be reused or a
+full rebuild is required (navigation, unknown nodes, too many changes, lost node bindings).
+"""
+
+import logging
+import sys
+from typing import TYPE_CHECKING, Any
+
+from cdp_use.cdp.dom.events import (
+	AttributeModifiedEvent,
+	AttributeRemovedEvent,
+	CharacterDataModifiedEvent,
+	ChildNodeInsertedEvent,
+	ChildNodeRemovedEvent,
+	DocumentUpdatedEvent,
+	SetChildNodesEvent,
+)
+from cdp_use.cdp.dom.types import Node
+from cdp_use.cdp.target import SessionID, TargetID
+
+from browser_use.dom.utils import parse_node_attributes
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
+
+if TYPE_CHECKING:
+	from cdp_use import CDPClient
+
+logger = logging.getLogger(__name__)
+
+# Hard cap on queued mutation events between two steps, past this point a full rebuild is always cheaper than replaying
+MAX_PENDING_MUTATIONS = 20_000
+
+# Accessibility state that changes without any DOM mutation event (user input, `el.checked = true`, focus moves)
+VOLATILE_AX_TAGS = frozenset({'INPUT', 'SELECT', 'TEXTAREA', 'OPTION'})
+VOLATILE_AX_PROPERTIES = frozenset({'checked', 'selected', 'expanded', 'pressed', 'focused', 'invalid', 'valuenow', 'valuetext'})
+
+
+class DOMMutationTracker:
+	"""Tracks DOM mutations for a single CDP session and patches the cached enhanced tree in place.
+
+	CDP event handlers only queue the raw events (they must stay cheap, they run inside the websocket reader),
+	the actual patching happens in `apply_pending_mutations()` right before the next DOM state is built.
+	"""
+
+	def __init__(self, target_id: TargetID, session_id: SessionID):
+		self.target_id = target_id
+		self.session_id = session_id
+
+		self.root: EnhancedDOMTreeNode | None = None
+		self.node_lookup: dict[int, EnhancedDOMTreeNode] = {}
+		"""NodeId (NOT backend node id) -> enhanced dom tree node, only nodes that belong to `target_id`"""
+		self.total_nodes: int = 0
+		"""Number of nodes in the tree at the last full build, used as the denominator for the dirty ratio"""
+
+		self.ax_dirty_node_ids: set[int] = set()
+		"""Nodes whose own accessibility data is stale (attribute / text changes)"""
+		self.ax_dirty_subtree_ids: set[int] = set()
+		"""Roots of inserted subtrees that have no accessibility data at all yet"""
+		self.pending_child_requests: set[int] = set()
+		"""Inserted nodes whose children were not included in the insertion event and must be requested"""
+		self.dirty_count: int = 0
+
+		self.needs_full_rebuild: bool = True
+		self.full_rebuild_reason: str | None = 'no cached tree'
+
+		self._pending_mutations: list[tuple[str, Any]] = []
+		self._building: bool = False
+
+	# region - Event handlers (called by CDP client, keep cheap)
+
+	def queue_mutation(self, method: str, event: Any) -> None:
+		if self.needs_full_rebuild and not self._building:
+			return  # the next full build will pick everything up anyway
+		if len(self._pending_mutations) >= MAX_PENDING_MUTATIONS:
+			self.mark_for_full_rebuild(f'more than {MAX_PENDING_MUTATIONS} pending DOM mutations')
+			return
+		self._pending_mutations.append((method, event))
+
+	def mark_for_full_rebuild(self, reason: str) -> None:
+		if not self.needs_full_rebuild:
+			logger.debug(f'🧬 Incremental DOM for target {self.target_id[-4:]} invalidated: {reason}')
+		self.needs_full_rebuild = True
+		self.full_rebuild_reason = reason
+		self._pending_mutations.clear()
+
+	# endregion
+
+	def begin_full_build(self) -> None:
+		"""Forget all queued mutations, everything before this point is covered by the upcoming full build."""
+		self._building = True
+		self._pending_mutations.clear()
+		self.ax_dirty_node_ids.clear()
+		self.ax_dirty_subtree_ids.clear()
+		self.pending_child_requests.clear()
+		self.dirty_count = 0
+
+	def finish_full_build(self, root: EnhancedDOMTreeNode) -> bool:
+		"""Index a freshly built tree. Returns False if the tree can't be maintained incrementally.
+
+		Mutations queued while the build was running are kept and replayed on the next step,
+		replaying them is idempotent against nodes that are already part of the fresh tree.
+		"""
+		self._building = False
+		self.root = root
+		self.node_lookup = {}
+		reusable = True
+		stack = [root]
+		while stack:
+			node = stack.pop()
+			if node.target_id != self.target_id:
+				# cross-origin iframe content comes from another target whose mutations we don't see
+				reusable = False
+				continue
+			self.node_lookup[node.node_id] = node
+			if node.content_document:
+				stack.append(node.content_document)
+			if node.shadow_roots:
+				stack.extend(node.shadow_roots)
+			if node.children_nodes:
+				stack.extend(node.children_nodes)
+
+		self.total_nodes = len(self.node_lookup)
+		if reusable:
+			self.needs_full_rebuild = False
+			self.full_rebuild_reason = None
+		else:
+			self.mark_for_full_rebuild('tree contains cross-origin iframe content')
+		return reusable
+
+	@property
+	def dirty_ratio(self) -> float:
+		return self.dirty_count / max(self.total_nodes, 1)
+
+	def apply_pending_mutations(self) -> None:
+		"""Patch the cached tree with all mutations received since the last step."""
+		pending, self._pending_mutations = self._pending_mutations, []
+		for method, event in pending:
+			if self.needs_full_rebuild:
+				return
+			handler = getattr(self, f'_apply_{method}', None)
+			if handler is not None:
+				handler(event)
+
+	# region - Patching
+
+	def _apply_attributeModified(self, event: AttributeModifiedEvent) -> None:
+		node = self.node_lookup.get(event['nodeId'])
+		if node is None:
+			self.mark_for_full_rebuild(f'attribute modified on unknown node {event["nodeId"]}')
+			return
+		node.attributes[event['name']] = event['value']
+		node._element_hash = None
+		self._mark_ax_dirty(node)
+
+	def _apply_attributeRemoved(self, event: AttributeRemovedEvent) -> None:
+		node = self.node_lookup.get(event['nodeId'])
+		if node is None:
+			self.mark_for_full_rebuild(f'attribute removed on unknown node {event["nodeId"]}')
+			return
+		node.attributes.pop(event['name'], None)
+		node._element_hash = None
+		self._mark_ax_dirty(node)
+
+	def _apply_characterDataModified(self, event: CharacterDataModifiedEvent) -> None:
+		node = self.node_lookup.get(event['nodeId'])
+		if node is None:
+			self.mark_for_full_rebuild(f'character data modified on unknown node {event["nodeId"]}')
+			return
+		node.node_value = event['characterData']
+		# the accessible name of the containing element is derived from its text
+		self._mark_ax_dirty(node.parent_node or node)
+
+	def _apply_childNodeInserted(self, event: ChildNodeInsertedEvent) -> None:
+		if event['node']['nodeId'] in self.node_lookup:
+			return  # already part of the tree (event raced with a full build)
+		parent = self.node_lookup.get(event['parentNodeId'])
+		if parent is None:
+			self.mark_for_full_rebuild(f'child inserted into unknown node {event["parentNodeId"]}')
+			return
+
+		new_node = self._create_subtree(event['node'], parent)
+		siblings = parent.children_nodes if parent.children_nodes is not None else []
+		position = 0
+		previous_node_id = event.get('previousNodeId')
+		if previous_node_id:
+			position = next((i + 1 for i, child in enumerate(siblings) if child.node_id == previous_node_id), len(siblings))
+		siblings.insert(position, new_node)
+		parent.children_nodes = siblings
+
+		self.ax_dirty_subtree_ids.add(new_node.node_id)
+		self._mark_ax_dirty(parent)
+
+	def _apply_childNodeRemoved(self, event: ChildNodeRemovedEvent) -> None:
+		node = self.node_lookup.get(event['nodeId'])
+		if node is None:
+			return  # never knew about it, nothing to remove
+		parent = self.node_lookup.get(event['parentNodeId'])
+		if parent is not None and parent.children_nodes:
+			parent.children_nodes = [child for child in parent.children_nodes if child.node_id != node.node_id]
+			self._mark_ax_dirty(parent)
+		self.dirty_count += self._forget_subtree(node)
+
+	def _apply_setChildNodes(self, event: SetChildNodesEvent) -> None:
+		parent = self.node_lookup.get(event['parentId'])
+		if parent is None:
+			self.mark_for_full_rebuild(f'children set on unknown node {event["parentId"]}')
+			return
+		for old_child in parent.children_nodes or []:
+			self._forget_subtree(old_child)
+		parent.children_nodes = [self._create_subtree(child, parent) for child in event['nodes']]
+		self.pending_child_requests.discard(parent.node_id)
+		self.ax_dirty_subtree_ids.add(parent.node_id)
+
+	def _apply_documentUpdated(self, event: DocumentUpdatedEvent) -> None:
+		self.mark_for_full_rebuild('document updated (navigation or DOM.getDocument on this session)')
+
+	def _apply_shadowRootPushed(self, event: Any) -> None:
+		self.mark_for_full_rebuild('shadow root pushed')
+
+	def _apply_shadowRootPopped(self, event: Any) -> None:
+		self.mark_for_full_rebuild('shadow root popped')
+
+	def mark_volatile_ax_dirty(self, focused_backend_node_id: int | None = None) -> None:
+		"""Mark the nodes whose accessibility state may have changed without a DOM mutation: form controls, nodes that
+		carry checked / selected / expanded / focused / value state, and the element that has focus now.
+
+		Not counted in `dirty_count`, these refreshes happen on every step and must not push towards a full rebuild.
+		"""
+		for node in self.node_lookup.values():
+			if node.node_type != NodeType.ELEMENT_NODE:
+				continue
+			if (
+				node.backend_node_id == focused_backend_node_id
+				or node.node_name.upper() in VOLATILE_AX_TAGS
+				or (
+					node.ax_node is not None
+					and node.ax_node.properties
+					and any(prop.name in VOLATILE_AX_PROPERTIES for prop in node.ax_node.properties)
+				)
+			):
+				self.ax_dirty_node_ids.add(node.node_id)
+
+	def _mark_ax_dirty(self, node: EnhancedDOMTreeNode) -> None:
+		if node.node_id not in self.ax_dirty_node_ids:
+			self.ax_dirty_node_ids.add(node.node_id)
+			self.dirty_count += 1
+
+	def _forget_subtree(self, node: EnhancedDOMTreeNode) -> int:
+		"""Drop a subtree from the lookup, returns the number of forgotten nodes."""
+		forgotten = 0
+		stack = [node]
+		while stack:
+			current = stack.pop()
+			if self.node_lookup.pop(current.node_id, None) is not None:
+				forgotten += 1
+			self.ax_dirty_node_ids.discard(current.node_id)
+			self.ax_dirty_subtree_ids.discard(current.node_id)
+			self.pending_child_requests.discard(current.node_id)
+			if current.content_document:
+				stack.append(current.content_document)
+			if current.shadow_roots:
+				stack.extend(current.shadow_roots)
+			if current.children_nodes:
+				stack.extend(current.children_nodes)
+		return forgotten
+
+	def _create_subtree(self, node: Node, parent: EnhancedDOMTreeNode) -> EnhancedDOMTreeNode:
+		"""Build enhanced nodes for a CDP node payload. Layout and AX data are filled in by `DomService` afterwards."""
+		enhanced_node = EnhancedDOMTreeNode(
+			node_id=node['nodeId'],
+			backend_node_id=node['backendNodeId'],
+			node_type=NodeType(node['nodeType']),
+			node_name=sys.intern(node['nodeName']),
+			node_value=node['nodeValue'],
+			attributes=parse_node_attributes(node.get('attributes')),
+			is_scrollable=node.get('isScrollable', None),
+			frame_id=node.get('frameId', None),
+			session_id=self.session_id,
+			target_id=self.target_id,
+			content_document=None,
+			shadow_root_type=node.get('shadowRootType') or None,
+			shadow_roots=None,
+			parent_node=parent,
+			children_nodes=None,
+			ax_node=None,
+			snapshot_node=None,
+			is_visible=None,
+			absolute_position=None,
+		)
+		self.node_lookup[enhanced_node.node_id] = enhanced_node
+		self.dirty_count += 1
+
+		if content_document := node.get('contentDocument'):
+			enhanced_node.content_document = self._create_subtree(content_document, enhanced_node)
+
+		shadow_root_node_ids = set()
+		if shadow_roots := node.get('shadowRoots'):
+			enhanced_node.shadow_roots = []
+			for shadow_root in shadow_roots:
+				shadow_root_node_ids.add(shadow_root['nodeId'])
+				enhanced_node.shadow_roots.append(self._create_subtree(shadow_root, enhanced_node))
+
+		children = node.get('children')
+		if children:
+			enhanced_node.children_nodes = [
+				self._create_subtree(child, enhanced_node) for child in children if child['nodeId'] not in shadow_root_node_ids
+			]
+		if node.get('childNodeCount', 0) > len(children or []):
+			# Chrome only sends the inserted node itself, its descendants have to be requested explicitly
+			self.pending_child_requests.add(enhanced_node.node_id)
+
+		return enhanced_node
+
+	# endregion
+
+
+class DOMMutationRouter:
+	"""Registers the DOM mutation handlers once per CDP client and routes events to the tracker of their session.
+
+	cdp-use keeps a single callback per event method per client, so all sessions sharing a websocket share these handlers.
+	"""
+
+	EVENTS = (
+		'attributeModified',
+		'attributeRemoved',
+		'characterDataModified',
+		'childNodeInserted',
+		'childNodeRemoved',
+		'setChildNodes',
+		'documentUpdated',
+		'shadowRootPushed',
+		'shadowRootPopped',
+	)
+
+	def __init__(self):
+		self.trackers: dict[SessionID, DOMMutationTracker] = {}
+		self._registered_clients: set[int] = set()
+
+	def get_tracker(self, cdp_client: 'CDPClient', target_id: TargetID, session_id: SessionID) -> DOMMutationTracker:
+		if id(cdp_client) not in self._registered_clients:
+			for method in self.EVENTS:
+				getattr(cdp_client.register.DOM, method)(self._make_handler(method))
+			self._registered_clients.add(id(cdp_client))
+
+		tracker = self.trackers.get(session_id)
+		if tracker is None or tracker.target_id != target_id:
+			# a target that was re-attached under a new session leaves its old tracker behind
+			self.forget_target(target_id)
+			tracker = DOMMutationTracker(target_id=target_id, session_id=session_id)
+			self.trackers[session_id] = tracker
+		return tracker
+
+	def remove_tracker(self, tracker: DOMMutationTracker) -> None:
+		"""Stop routing events to this tracker, unless its session was already handed to a newer one."""
+		if self.trackers.get(tracker.session_id) is tracker:
+			del self.trackers[tracker.session_id]
+
+	def forget_target(self, target_id: TargetID) -> None:
+		"""Drop every tracker of a target, e.g. once its tab was closed."""
+		for session_id in [session_id for session_id, tracker in self.trackers.items() if tracker.target_id == target_id]:
+			del self.trackers[session_id]
+
+	def _make_handler(self, method: str):
+		def handler(event: Any, session_id: SessionID | None = None) -> None:
+			tracker = self.trackers.get(session_id) if session_id else None
+			if tracker is not None:
+				tracker.queue_mutation(method, event)
+
+		return handler
@@ -1,7 +1,66 @@
 # @file purpose: Serializes enhanced DOM trees to HTML format including shadow roots
 
+from collections.abc import Iterator
+
 from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
 
+VOID_ELEMENTS = {
+	'area',
+	'base',
+	'br',
+	'col',
+	'embed',
+	'hr',
+	'img',
+	'input',
+	'link',
+	'meta',
+	'param',
+	'source',
+	'track',
+	'wbr',
+}
+
+# Non-content elements, skipped entirely
+SKIPPED_ELEMENTS = {'style', 'script', 'head', 'meta', 'link', 'title'}
+
+# Elements that render as their own block(s), content never continues on the same line across them
+BLOCK_ELEMENTS = {
+	'address',
+	'article',
+	'aside',
+	'blockquote',
+	'body',
+	'details',
+	'dialog',
+	'div',
+	'dl',
+	'fieldset',
+	'figure',
+	'footer',
+	'form',
+	'h1',
+	'h2',
+	'h3',
+	'h4',
+	'h5',
+	'h6',
+	'header',
+	'hr',
+	'html',
+	'main',
+	'nav',
+	'ol',
+	'p',
+	'pre',
+	'section',
+	'table',
+	'ul',
+}
+
+# Pure layout wrappers that iter_blocks() may open up instead of serializing them in one piece
+SPLITTABLE_ELEMENTS = {'html', 'body', 'div', 'main', 'section', 'article', 'header', 'footer', 'nav', 'aside', 'form'}
+
 
 class HTMLSerializer:
 	"""Serializes enhanced DOM trees back to HTML format.
@@ -63,82 +122,19 @@ class HTMLSerializer:
 			return ''.join(parts)
 
 		elif node.node_type == NodeType.ELEMENT_NODE:
-			parts = []
-			tag_name = node.tag_name.lower()
-
-			# Skip non-content elements
-			if tag_name in {'style', 'script', 'head', 'meta', 'link', 'title'}:
+			open_tag = self._open_tag(node)
+			if open_tag is None:
 				return ''
 
-			# Skip code tags with display:none - these often contain JSON state for SPAs
-			if tag_name == 'code' and node.attributes:
-				style = node.attributes.get('style', '')
-				# Check if element is hidden (display:none) - likely JSON data
-				if 'display:none' in style.replace(' ', '') or 'display: none' in style:
-					return ''
-				# Also check for bpr-guid IDs (LinkedIn's JSON data pattern)
-				element_id = node.attributes.get('id', '')
-				if 'bpr-guid' in element_id or 'data' in element_id or 'state' in element_id:
-					return ''
-
-			# Skip base64 inline images - these are usually placeholders or tracking pixels
-			if tag_name == 'img' and node.attributes:
-				src = node.attributes.get('src', '')
-				if src.startswith('data:image/'):
-					return ''
-
-			# Opening tag
-			parts.append(f'<{tag_name}')
-
-			# Add attributes
-			if node.attributes:
-				attrs = self._serialize_attributes(node.attributes)
-				if attrs:
-					parts.append(' ' + attrs)
-
-			# Handle void elements (self-closing)
-			void_elements = {
-				'area',
-				'base',
-				'br',
-				'col',
-				'embed',
-				'hr',
-				'img',
-				'input',
-				'link',
-				'meta',
-				'param',
-				'source',
-				'track',
-				'wbr',
-			}
-			if tag_name in void_elements:
-				parts.append(' />')
-				return ''.join(parts)
-
-			parts.append('>')
-
-			# Handle iframe content document
-			if tag_name in {'iframe', 'frame'} and node.content_document:
-				# Serialize iframe content
-				for child in node.content_document.children_nodes or []:
-					child_html = self.serialize(child, depth + 1)
-					if child_html:
-						parts.append(child_html)
-			else:
-				# Serialize shadow roots FIRST (for declarative shadow DOM)
-				if node.shadow_roots:
-					for shadow_root in node.shadow_roots:
-						child_html = self.serialize(shadow_root, depth + 1)
-						if child_html:
-							parts.append(child_html)
-
-				# Then serialize light DOM children (for slot projection)
-				for child in node.children:
-					child_html = self.serialize(child, depth + 1)
-					if child_html:
-						parts.append(child_html)
+			tag_name = node.tag_name.lower()
+			if tag_name in VOID_ELEMENTS:
+				return open_tag
+
+			parts = [open_tag]
+			for child in self._content_nodes(node):
+				child_html = self.serialize(child, depth + 1)
+				if child_html:
+					parts.append(child_html)
 
 			# Closing tag
 			parts.append(f'</{tag_name}>')
@@ -159,6 +155,91 @@ class HTMLSerializer:
 			# Unknown node type - skip
 			return ''
 
+	def iter_blocks(self, node: EnhancedDOMTreeNode) -> Iterator[str]:
+		"""Serialize lazily as a sequence of HTML pieces that concatenate to `serialize(node)`.
+
+		Layout wrappers (body, div, section, ...) whose children are all block elements are opened, walked and closed
+		piece by piece, everything else is serialized as a whole. Consumers can therefore cut the sequence between any
+		two pieces without splitting a line of text, e.g. to convert a long page in chunks and stop early.
+		"""
+		if node.node_type == NodeType.DOCUMENT_NODE:
+			for child in node.children_and_shadow_roots:
+				yield from self.iter_blocks(child)
+			return
+
+		if node.node_type != NodeType.ELEMENT_NODE or not self._is_splittable(node):
+			html = self.serialize(node)
+			if html:
+				yield html
+			return
+
+		open_tag = self._open_tag(node)
+		if open_tag is None:
+			return
+		yield open_tag
+		for child in self._content_nodes(node):
+			yield from self.iter_blocks(child)
+		yield f'</{node.tag_name.lower()}>'
+
+	def _is_splittable(self, node: EnhancedDOMTreeNode) -> bool:
+		if node.tag_name.lower() not in SPLITTABLE_ELEMENTS or node.shadow_roots:
+			return False
+		for child in node.children:
+			if child.node_type == NodeType.TEXT_NODE:
+				if child.node_value and child.node_value.strip():
+					return False
+			elif child.node_type == NodeType.ELEMENT_NODE:
+				child_tag = child.tag_name.lower()
+				if child_tag not in BLOCK_ELEMENTS and child_tag not in SKIPPED_ELEMENTS:
+					return False
+		return True
+
+	def _open_tag(self, node: EnhancedDOMTreeNode) -> str | None:
+		"""Opening tag of an element (self-closed for void elements), None for elements that are skipped entirely."""
+		tag_name = node.tag_name.lower()
+
+		# Skip non-content elements
+		if tag_name in SKIPPED_ELEMENTS:
+			return None
+
+		# Skip code tags with display:none - these often contain JSON state for SPAs
+		if tag_name == 'code' and node.attributes:
+			style = node.attributes.get('style', '')
+			# Check if element is hidden (display:none) - likely JSON data
+			if 'display:none' in style.replace(' ', '') or 'display: none' in style:
+				return None
+			# Also check for bpr-guid IDs (LinkedIn's JSON data pattern)
+			element_id = node.attributes.get('id', '')
+			if 'bpr-guid' in element_id or 'data' in element_id or 'state' in element_id:
+				return None
+
+		# Skip base64 inline images - these are usually placeholders or tracking pixels
+		if tag_name == 'img' and node.attributes:
+			src = node.attributes.get('src', '')
+			if src.startswith('data:image/'):
+				return None
+
+		# Opening tag
+		parts = [f'<{tag_name}']
+
+		# Add attributes
+		if node.attributes:
+			attrs = self._serialize_attributes(node.attributes)
+			if attrs:
+				parts.append(' ' + attrs)
+
+		# Handle void elements (self-closing)
+		parts.append(' />' if tag_name in VOID_ELEMENTS else '>')
+		return ''.join(parts)
+
+	def _content_nodes(self, node: EnhancedDOMTreeNode) -> list[EnhancedDOMTreeNode]:
+		"""Nodes serialized inside an element, in order."""
+		# Handle iframe content document
+		if node.tag_name.lower() in {'iframe', 'frame'} and node.content_document:
+			return list(node.content_document.children_nodes or [])
+		# Serialize shadow roots FIRST (for declarative shadow DOM), then light DOM children (for slot projection)
+		return [*(node.shadow_roots or []), *node.children]
+
 	def _serialize_attributes(self, attributes: dict[str, str]) -> str:
 		"""Serialize element attributes to HTML attribute string.
 
@@ -8,6 +8,7 @@ from browser_use.dom.utils import cap_text_length
 from browser_use.dom.views import (
 	DOMRect,
 	DOMSelectorMap,
+	DOMStateDiff,
 	EnhancedDOMTreeNode,
 	NodeType,
 	PropagatingBounds,
@@ -68,6 +69,7 @@ class DOMTreeSerializer:
 		self._interactive_counter = 1
 		self._selector_map: DOMSelectorMap = {}
 		self._previous_cached_selector_map = previous_cached_state.selector_map if previous_cached_state else None
+		self._previous_backend_node_ids: set[int] = set()
 		# Add timing tracking
 		self.timing_info: dict[str, float] = {}
 		# Cache for clickable element detection to avoid redundant calls
@@ -135,14 +137,27 @@ class DOMTreeSerializer:
 
 		# Step 4: Assign interactive indices to clickable elements
 		start_step4 = time.time()
+		# Index the previous state once, not per interactive element
+		self._previous_backend_node_ids = (
+			{node.backend_node_id for node in self._previous_cached_selector_map.values()}
+			if self._previous_cached_selector_map
+			else set()
+		)
 		self._assign_interactive_indices_and_mark_new_nodes(filtered_tree)
 		end_step4 = time.time()
 		self.timing_info['assign_interactive_indices'] = end_step4 - start_step4
 
+		# Step 5: Diff interactive elements against the previous state
+		diff = None
+		if self._previous_cached_selector_map is not None:
+			start_step5 = time.time()
+			diff = DOMStateDiff.between(self._previous_cached_selector_map, self._selector_map)
+			self.timing_info['diff_previous_state'] = time.time() - start_step5
+
 		end_total = time.time()
 		self.timing_info['serialize_accessible_elements_total'] = end_total - start_total
 
-		return SerializedDOMState(_root=filtered_tree, selector_map=self._selector_map), self.timing_info
+		return SerializedDOMState(_root=filtered_tree, selector_map=self._selector_map, diff=diff), self.timing_info
 
 	def _add_compound_components(self, simplified: SimplifiedNode, node: EnhancedDOMTreeNode) -> None:
 		"""Enhance compound controls with information from their child components."""
@@ -587,10 +602,9 @@ class DOMTreeSerializer:
 				# Mark compound components as new for visibility
 				if node.is_compound_component:
 					node.is_new = True
-				elif self._previous_cached_selector_map:
+				elif self._previous_backend_node_ids:
 					# Check if node is new for regular elements
-					previous_backend_node_ids = {node.backend_node_id for node in self._previous_cached_selector_map.values()}
-					if node.original_node.backend_node_id not in previous_backend_node_ids:
+					if node.original_node.backend_node_id not in self._previous_backend_node_ids:
 						node.is_new = True
 
 		# Process children
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import sys
 import time
 from typing import TYPE_CHECKING
 
@@ -10,9 +11,12 @@ from cdp_use.cdp.target import TargetID
 
 from browser_use.dom.enhanced_snapshot import (
 	REQUIRED_COMPUTED_STYLES,
+	SnapshotLookup,
 	build_snapshot_lookup,
 )
+from browser_use.dom.mutation_tracker import DOMMutationRouter, DOMMutationTracker
 from browser_use.dom.serializer.serializer import DOMTreeSerializer
+from browser_use.dom.utils import parse_node_attributes
 from browser_use.dom.views import (
 	CurrentPageTargets,
 	DOMRect,
@@ -26,10 +30,13 @@ from browser_use.dom.views import (
 from browser_use.observability import observe_debug
 
 if TYPE_CHECKING:
-	from browser_use.browser.session import BrowserSession
+	from browser_use.browser.session import BrowserSession, CDPSession
 
 # Note: iframe limits are now configurable via BrowserProfile.max_iframes and BrowserProfile.max_iframe_depth
 
+# Above this many single-node AX refreshes in one step, one full AX tree fetch is cheaper than a request per node
+MAX_PARTIAL_AX_REQUESTS = 100
+
 
 class DomService:
 	"""
@@ -50,6 +57,9 @@ class DomService:
 		paint_order_filtering: bool = True,
 		max_iframes: int = 100,
 		max_iframe_depth: int = 5,
+		max_concurrent_iframes: int = 5,
+		incremental: bool = False,
+		incremental_max_dirty_ratio: float = 0.25,
 	):
 		self.browser_session = browser_session
 		self.logger = logger or browser_session.logger
@@ -57,6 +67,13 @@ class DomService:
 		self.paint_order_filtering = paint_order_filtering
 		self.max_iframes = max_iframes
 		self.max_iframe_depth = max_iframe_depth
+		self.incremental = incremental
+		self.incremental_max_dirty_ratio = incremental_max_dirty_ratio
+		self._mutation_router = DOMMutationRouter()
+		# only bounds the CDP fetches, so nested iframes never wait on a permit held by their parent
+		self._iframe_semaphore = asyncio.Semaphore(max_concurrent_iframes)
+		# (frame id, loader id) -> tracker holding the last tree built for that cross-origin iframe document
+		self._iframe_trees: dict[tuple[str, str], DOMMutationTracker] = {}
 
 	async def __aenter__(self):
 		return self
@@ -124,10 +141,11 @@ class DomService:
 				except ValueError:
 					pass
 
+		role = ax_node.get('role', {}).get('value', None)
 		enhanced_ax_node = EnhancedAXNode(
 			ax_node_id=ax_node['nodeId'],
 			ignored=ax_node['ignored'],
-			role=ax_node.get('role', {}).get('value', None),
+			role=sys.intern(role) if isinstance(role, str) else role,
 			name=ax_node.get('name', {}).get('value', None),
 			description=ax_node.get('description', {}).get('value', None),
 			properties=properties,
@@ -288,6 +306,18 @@ class DomService:
 
 		return {'nodes': merged_nodes}
 
+	def _capture_snapshot(self, cdp_session: 'CDPSession'):
+		return cdp_session.cdp_client.send.DOMSnapshot.captureSnapshot(
+			params={
+				'computedStyles': REQUIRED_COMPUTED_STYLES,
+				'includePaintOrder': True,
+				'includeDOMRects': True,
+				'includeBlendedBackgroundColors': False,
+				'includeTextColorOpacities': False,
+			},
+			session_id=cdp_session.session_id,
+		)
+
 	async def _get_all_trees(self, target_id: TargetID) -> TargetAllTrees:
 		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
 
@@ -341,16 +371,7 @@ class DomService:
 
 		# Define CDP request factories to avoid duplication
 		def create_snapshot_request():
-			return cdp_session.cdp_client.send.DOMSnapshot.captureSnapshot(
-				params={
-					'computedStyles': REQUIRED_COMPUTED_STYLES,
-					'includePaintOrder': True,
-					'includeDOMRects': True,
-					'includeBlendedBackgroundColors': False,
-					'includeTextColorOpacities': False,
-				},
-				session_id=cdp_session.session_id,
-			)
+			return self._capture_snapshot(cdp_session)
 
 		def create_dom_tree_request():
 			return cdp_session.cdp_client.send.DOM.getDocument(
@@ -454,6 +475,7 @@ class DomService:
 		initial_html_frames: list[EnhancedDOMTreeNode] | None = None,
 		initial_total_frame_offset: DOMRect | None = None,
 		iframe_depth: int = 0,
+		iframe_targets: dict[str, tuple[TargetID, str]] | None = None,
 	) -> EnhancedDOMTreeNode:
 		"""Get the DOM tree for a specific target.
 
@@ -462,9 +484,24 @@ class DomService:
 			initial_html_frames: List of HTML frame nodes encountered so far
 			initial_total_frame_offset: Accumulated coordinate offset
 			iframe_depth: Current depth of iframe nesting to prevent infinite recursion
+			iframe_targets: Frame id -> (target id, loader id) of out-of-process iframes, discovered once per snapshot
 		"""
 
-		trees = await self._get_all_trees(target_id)
+		# Incremental mode only applies to the top-level document, iframe recursion always does a full build
+		tracker: DOMMutationTracker | None = None
+		if self.incremental and iframe_depth == 0 and initial_html_frames is None and initial_total_frame_offset is None:
+			cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
+			tracker = self._mutation_router.get_tracker(cdp_session.cdp_client, target_id, cdp_session.session_id)
+			patched_tree = await self._get_incremental_dom_tree(tracker, cdp_session)
+			if patched_tree is not None:
+				return patched_tree
+			tracker.begin_full_build()
+
+		if iframe_depth > 0:
+			async with self._iframe_semaphore:
+				trees = await self._get_all_trees(target_id)
+		else:
+			trees = await self._get_all_trees(target_id)
 
 		dom_tree = trees.dom_tree
 		ax_tree = trees.ax_tree
@@ -481,6 +518,9 @@ class DomService:
 		# Parse snapshot data with everything calculated upfront
 		snapshot_lookup = build_snapshot_lookup(snapshot, device_pixel_ratio)
 
+		# visible cross-origin iframes found while building, their documents are fetched concurrently afterwards
+		pending_iframes: list[tuple[EnhancedDOMTreeNode, str, DOMRect]] = []
+
 		async def _construct_enhanced_node(
 			node: Node, html_frames: list[EnhancedDOMTreeNode] | None, total_frame_offset: DOMRect | None
 		) -> EnhancedDOMTreeNode:
@@ -516,11 +556,7 @@ class DomService:
 				enhanced_ax_node = None
 
 			# To make attributes more readable
-			attributes: dict[str, str] | None = None
-			if 'attributes' in node and node['attributes']:
-				attributes = {}
-				for i in range(0, len(node['attributes']), 2):
-					attributes[node['attributes'][i]] = node['attributes'][i + 1]
+			attributes = parse_node_attributes(node.get('attributes'))
 
 			shadow_root_type = None
 			if 'shadowRootType' in node and node['shadowRootType']:
@@ -529,7 +565,7 @@ class DomService:
 				except ValueError:
 					pass
 
-			# Get snapshot data and calculate absolute position
+			# Get a lazy view of the snapshot row, only bounds are read here to calculate the absolute position
 			snapshot_data = snapshot_lookup.get(node['backendNodeId'], None)
 			absolute_position = None
 			if snapshot_data and snapshot_data.bounds:
@@ -544,9 +580,9 @@ class DomService:
 				node_id=node['nodeId'],
 				backend_node_id=node['backendNodeId'],
 				node_type=NodeType(node['nodeType']),
-				node_name=node['nodeName'],
+				node_name=sys.intern(node['nodeName']),
 				node_value=node['nodeValue'],
-				attributes=attributes or {},
+				attributes=attributes,
 				is_scrollable=node.get('isScrollable', None),
 				frame_id=node.get('frameId', None),
 				session_id=self.browser_session.agent_focus.session_id if self.browser_session.agent_focus else None,
@@ -683,44 +719,327 @@ class DomService:
 					else:
 						self.logger.debug('Skipping invisible cross-origin iframe')
 
-					if should_process_iframe:
-						# Use get_all_frames to find the iframe's target
-						frame_id = node.get('frameId', None)
-						if frame_id:
-							all_frames, _ = await self.browser_session.get_all_frames()
-							frame_info = all_frames.get(frame_id)
-							iframe_document_target = None
-							if frame_info and frame_info.get('frameTargetId'):
-								# Get the target info for this iframe
-								targets = await self.browser_session.cdp_client.send.Target.getTargets()
-								iframe_document_target = next(
-									(t for t in targets['targetInfos'] if t['targetId'] == frame_info['frameTargetId']), None
-								)
-						else:
-							iframe_document_target = None
-						# if target actually exists in one of the frames, just recursively build the dom tree for it
-						if iframe_document_target:
-							self.logger.debug(
-								f'Getting content document for iframe {node.get("frameId", None)} at depth {iframe_depth + 1}'
-							)
-							content_document = await self.get_dom_tree(
-								target_id=iframe_document_target.get('targetId'),
-								# TODO: experiment with this values -> not sure whether the whole cross origin iframe should be ALWAYS included as soon as some part of it is visible or not.
-								# Current config: if the cross origin iframe is AT ALL visible, then just include everything inside of it!
-								# initial_html_frames=updated_html_frames,
-								initial_total_frame_offset=total_frame_offset,
-								iframe_depth=iframe_depth + 1,
-							)
-
-							dom_tree_node.content_document = content_document
-							dom_tree_node.content_document.parent_node = dom_tree_node
+					frame_id = node.get('frameId', None)
+					if should_process_iframe and frame_id:
+						pending_iframes.append((dom_tree_node, frame_id, total_frame_offset))
 
 			return dom_tree_node
 
 		enhanced_dom_tree_node = await _construct_enhanced_node(dom_tree['root'], initial_html_frames, initial_total_frame_offset)
 
+		if pending_iframes:
+			if iframe_targets is None:
+				iframe_targets = await self._discover_iframe_targets()
+			await asyncio.gather(
+				*(
+					self._attach_iframe_document(iframe_node, frame_id, frame_offset, target_id, iframe_depth + 1, iframe_targets)
+					for iframe_node, frame_id, frame_offset in pending_iframes
+				)
+			)
+		if iframe_depth == 0:
+			# forget iframe documents that are gone or were navigated (new loader id)
+			live_frame_keys = {(frame_id, loader_id) for frame_id, (_, loader_id) in (iframe_targets or {}).items()}
+			for frame_key in self._iframe_trees.keys() - live_frame_keys:
+				self._forget_iframe_tree(frame_key)
+
+		if tracker is not None:
+			tracker.finish_full_build(enhanced_dom_tree_node)
+
 		return enhanced_dom_tree_node
 
+	async def _discover_iframe_targets(self) -> dict[str, tuple[TargetID, str]]:
+		"""Map frame id -> (target id, loader id) for every frame that can be fetched through an existing target."""
+		(all_frames, _), targets = await asyncio.gather(
+			self.browser_session.get_all_frames(), self.browser_session.cdp_client.send.Target.getTargets()
+		)
+		target_ids = {target['targetId'] for target in targets['targetInfos']}
+		return {
+			frame_id: (frame_info['frameTargetId'], frame_info.get('loaderId', ''))
+			for frame_id, frame_info in all_frames.items()
+			if frame_info.get('frameTargetId') in target_ids
+		}
+
+	async def _attach_iframe_document(
+		self,
+		iframe_node: EnhancedDOMTreeNode,
+		frame_id: str,
+		total_frame_offset: DOMRect,
+		parent_target_id: TargetID,
+		iframe_depth: int,
+		iframe_targets: dict[str, tuple[TargetID, str]],
+	) -> None:
+		"""Build (or reuse) the document of a cross-origin iframe and hang it below its iframe element."""
+		iframe_target = iframe_targets.get(frame_id)
+		# if target actually exists in one of the frames, just recursively build the dom tree for it
+		if iframe_target is None or iframe_target[0] == parent_target_id:
+			return
+		target_id, loader_id = iframe_target
+		frame_key = (frame_id, loader_id)
+
+		try:
+			content_document = None
+			tracker = self._iframe_trees.get(frame_key) if self.incremental else None
+			if tracker is not None and tracker.target_id == target_id:
+				async with self._iframe_semaphore:
+					cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
+					content_document = await self._get_incremental_dom_tree(tracker, cdp_session, total_frame_offset)
+
+			if content_document is None:
+				self.logger.debug(f'Getting content document for iframe {frame_id} at depth {iframe_depth}')
+				cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
+				tracker = None
+				if self.incremental:
+					tracker = self._mutation_router.get_tracker(cdp_session.cdp_client, target_id, cdp_session.session_id)
+					tracker.begin_full_build()
+				content_document = await self.get_dom_tree(
+					target_id=target_id,
+					# TODO: experiment with this values -> not sure whether the whole cross origin iframe should be ALWAYS included as soon as some part of it is visible or not.
+					# Current config: if the cross origin iframe is AT ALL visible, then just include everything inside of it!
+					# initial_html_frames=updated_html_frames,
+					initial_total_frame_offset=total_frame_offset,
+					iframe_depth=iframe_depth,
+					iframe_targets=iframe_targets,
+				)
+				if tracker is not None and tracker.finish_full_build(content_document):
+					self._iframe_trees[frame_key] = tracker
+				else:
+					self._forget_iframe_tree(frame_key)
+		except Exception as e:
+			self.logger.debug(f'Failed to get content document for iframe {frame_id}: {type(e).__name__}: {e}')
+			self._forget_iframe_tree(frame_key)
+			return
+
+		iframe_node.content_document = content_document
+		content_document.parent_node = iframe_node
+
+	def _forget_iframe_tree(self, frame_key: tuple[str, str]) -> None:
+		"""Drop the cached tree of an iframe document and stop tracking its session if no other document uses it."""
+		tracker = self._iframe_trees.pop(frame_key, None)
+		if tracker is not None and tracker not in self._iframe_trees.values():
+			self._mutation_router.remove_tracker(tracker)
+
+	def forget_target(self, target_id: TargetID) -> None:
+		"""Drop the cached trees and mutation trackers of a target that was closed."""
+		for frame_key in [frame_key for frame_key, tracker in self._iframe_trees.items() if tracker.target_id == target_id]:
+			del self._iframe_trees[frame_key]
+		self._mutation_router.forget_target(target_id)
+
+	async def _get_incremental_dom_tree(
+		self,
+		tracker: DOMMutationTracker,
+		cdp_session: 'CDPSession',
+		total_frame_offset: DOMRect | None = None,
+	) -> EnhancedDOMTreeNode | None:
+		"""Reuse the cached tree patched from DOM mutation events.
+
+		DOM structure and AX data are only re-fetched for the subtrees that changed. The layout snapshot is still captured
+		in full because scrolling and reflow move nodes that were never mutated.
+
+		Args:
+			tracker: Tracker holding the cached tree of the target.
+			cdp_session: Session of the target.
+			total_frame_offset: Offset of the document inside the page, for cross-origin iframe documents.
+
+		Returns:
+			The patched tree, or None if a full rebuild is needed.
+		"""
+		if tracker.root is None:
+			return None
+
+		start = time.time()
+		try:
+			tracker.apply_pending_mutations()
+
+			# Inserted nodes arrive without their descendants, request them (answered via setChildNodes events)
+			for _ in range(3):
+				if tracker.needs_full_rebuild or not tracker.pending_child_requests:
+					break
+				node_ids = list(tracker.pending_child_requests)
+				tracker.pending_child_requests.clear()
+				await asyncio.gather(
+					*(
+						cdp_session.cdp_client.send.DOM.requestChildNodes(
+							params={'nodeId': node_id, 'depth': -1, 'pierce': True}, session_id=cdp_session.session_id
+						)
+						for node_id in node_ids
+					)
+				)
+				tracker.apply_pending_mutations()
+
+			if not tracker.needs_full_rebuild and tracker.pending_child_requests:
+				tracker.mark_for_full_rebuild('children of inserted nodes never arrived')
+			if not tracker.needs_full_rebuild and tracker.dirty_ratio > self.incremental_max_dirty_ratio:
+				tracker.mark_for_full_rebuild(
+					f'dirty ratio {tracker.dirty_ratio:.2f} exceeds {self.incremental_max_dirty_ratio:.2f}'
+					f' ({tracker.dirty_count}/{tracker.total_nodes} nodes)'
+				)
+			if not tracker.needs_full_rebuild and not await self._node_bindings_are_valid(tracker, cdp_session):
+				# someone called DOM.getDocument on this session, our node ids no longer map to the same nodes
+				tracker.mark_for_full_rebuild('DOM node bindings were reset')
+			if tracker.needs_full_rebuild:
+				self.logger.debug(f'🧬 Full DOM rebuild needed: {tracker.full_rebuild_reason}')
+				return None
+
+			snapshot, device_pixel_ratio = await asyncio.gather(
+				self._capture_snapshot(cdp_session), self._get_viewport_ratio(tracker.target_id)
+			)
+			if snapshot and 'documents' in snapshot and len(snapshot['documents']) > self.max_iframes:
+				snapshot['documents'] = snapshot['documents'][: self.max_iframes]
+			tracker.mark_volatile_ax_dirty(await self._get_focused_backend_node_id(cdp_session))
+			await self._refresh_dirty_ax_nodes(tracker, cdp_session)
+		except Exception as e:
+			tracker.mark_for_full_rebuild(f'incremental refresh failed: {type(e).__name__}: {e}')
+			self.logger.debug(f'🧬 Full DOM rebuild needed: {tracker.full_rebuild_reason}')
+			return None
+
+		dirty_count = tracker.dirty_count
+		self._update_layout_in_place(tracker.root, build_snapshot_lookup(snapshot, device_pixel_ratio), None, total_frame_offset)
+		tracker.ax_dirty_node_ids.clear()
+		tracker.ax_dirty_subtree_ids.clear()
+		tracker.dirty_count = 0
+
+		self.logger.debug(
+			f'🧬 Reused incremental DOM tree ({dirty_count}/{tracker.total_nodes} dirty nodes) in {time.time() - start:.3f}s'
+		)
+		return tracker.root
+
+	async def _node_bindings_are_valid(self, tracker: DOMMutationTracker, cdp_session: 'CDPSession') -> bool:
+		"""Cheap check that the node ids we cached still point at the same backend nodes."""
+		probe_node_ids = {tracker.root.node_id, max(tracker.node_lookup)} if tracker.root else set()
+		for node_id in probe_node_ids:
+			try:
+				result = await cdp_session.cdp_client.send.DOM.describeNode(
+					params={'nodeId': node_id, 'depth': 0}, session_id=cdp_session.session_id
+				)
+			except Exception:
+				return False
+			if result['node']['backendNodeId'] != tracker.node_lookup[node_id].backend_node_id:
+				return False
+		return True
+
+	async def _get_focused_backend_node_id(self, cdp_session: 'CDPSession') -> int | None:
+		"""Backend node id of `document.activeElement`, None if it can't be resolved."""
+		try:
+			result = await cdp_session.cdp_client.send.Runtime.evaluate(
+				params={'expression': 'document.activeElement'}, session_id=cdp_session.session_id
+			)
+			object_id = result['result'].get('objectId')
+			if not object_id:
+				return None
+			described = await cdp_session.cdp_client.send.DOM.describeNode(
+				params={'objectId': object_id}, session_id=cdp_session.session_id
+			)
+			return described['node']['backendNodeId']
+		except Exception:
+			return None
+
+	async def _refresh_dirty_ax_nodes(self, tracker: DOMMutationTracker, cdp_session: 'CDPSession') -> None:
+		"""Re-fetch accessibility data only for mutated nodes, inserted subtrees and nodes with volatile AX state.
+
+		Past `MAX_PARTIAL_AX_REQUESTS` single nodes, one full AX tree fetch is cheaper than one request per node.
+		"""
+		dirty_nodes: list[EnhancedDOMTreeNode] = []
+		subtree_roots: list[EnhancedDOMTreeNode] = []
+		for node_id in tracker.ax_dirty_subtree_ids:
+			if root := tracker.node_lookup.get(node_id):
+				subtree_roots.append(root)
+				stack = [root]
+				while stack:
+					node = stack.pop()
+					dirty_nodes.append(node)
+					stack.extend(node.children_and_shadow_roots)
+					if node.content_document:
+						stack.append(node.content_document)
+		single_nodes = [
+			node
+			for node_id in tracker.ax_dirty_node_ids - tracker.ax_dirty_subtree_ids
+			if (node := tracker.node_lookup.get(node_id)) is not None
+		]
+		dirty_nodes.extend(single_nodes)
+
+		if not dirty_nodes:
+			return
+
+		if len(single_nodes) > MAX_PARTIAL_AX_REQUESTS:
+			results = [await self._get_ax_tree_for_all_frames(tracker.target_id)]
+		else:
+			requests = [
+				cdp_session.cdp_client.send.Accessibility.queryAXTree(
+					params={'backendNodeId': root.backend_node_id}, session_id=cdp_session.session_id
+				)
+				for root in subtree_roots
+			] + [
+				cdp_session.cdp_client.send.Accessibility.getPartialAXTree(
+					params={'backendNodeId': node.backend_node_id, 'fetchRelatives': False},
+					session_id=cdp_session.session_id,
+				)
+				for node in single_nodes
+			]
+			results = await asyncio.gather(*requests, return_exceptions=True)
+
+		ax_tree_lookup: dict[int, AXNode] = {}
+		for result in results:
+			if isinstance(result, BaseException):
+				continue  # node was detached again before we asked, it will be dropped by a later mutation
+			for ax_node in result['nodes']:
+				if 'backendDOMNodeId' in ax_node:
+					ax_tree_lookup[ax_node['backendDOMNodeId']] = ax_node
+
+		for node in dirty_nodes:
+			ax_node = ax_tree_lookup.get(node.backend_node_id)
+			node.ax_node = self._build_enhanced_ax_node(ax_node) if ax_node else None
+
+	def _update_layout_in_place(
+		self,
+		node: EnhancedDOMTreeNode,
+		snapshot_lookup: SnapshotLookup,
+		html_frames: list[EnhancedDOMTreeNode] | None,
+		total_frame_offset: DOMRect | None,
+	) -> None:
+		"""Re-apply snapshot data, absolute positions and visibility to an existing tree.
+
+		Mirrors the frame offset bookkeeping of `_construct_enhanced_node` in `get_dom_tree`.
+		"""
+		if html_frames is None:
+			html_frames = []
+		if total_frame_offset is None:
+			total_frame_offset = DOMRect(x=0.0, y=0.0, width=0.0, height=0.0)
+		else:
+			total_frame_offset = DOMRect(
+				total_frame_offset.x, total_frame_offset.y, total_frame_offset.width, total_frame_offset.height
+			)
+
+		snapshot_data = snapshot_lookup.get(node.backend_node_id, None)
+		node.snapshot_node = snapshot_data
+		node.absolute_position = None
+		node._compound_children = []  # filled in again by the serializer
+		if snapshot_data and snapshot_data.bounds:
+			node.absolute_position = DOMRect(
+				x=snapshot_data.bounds.x + total_frame_offset.x,
+				y=snapshot_data.bounds.y + total_frame_offset.y,
+				width=snapshot_data.bounds.width,
+				height=snapshot_data.bounds.height,
+			)
+
+		updated_html_frames = html_frames.copy()
+		if node.node_type == NodeType.ELEMENT_NODE and node.node_name == 'HTML' and node.frame_id is not None:
+			updated_html_frames.append(node)
+			if snapshot_data and snapshot_data.scrollRects:
+				total_frame_offset.x -= snapshot_data.scrollRects.x
+				total_frame_offset.y -= snapshot_data.scrollRects.y
+
+		if node.node_name.upper() in ('IFRAME', 'FRAME') and snapshot_data and snapshot_data.bounds:
+			updated_html_frames.append(node)
+			total_frame_offset.x += snapshot_data.bounds.x
+			total_frame_offset.y += snapshot_data.bounds.y
+
+		if node.content_document:
+			self._update_layout_in_place(node.content_document, snapshot_lookup, updated_html_frames, total_frame_offset)
+		for child in node.children_and_shadow_roots:
+			self._update_layout_in_place(child, snapshot_lookup, updated_html_frames, total_frame_offset)
+
+		node.is_visible = self.is_element_visible_according_to_all_parents(node, updated_html_frames)
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='get_serialized_dom_tree')
 	async def get_serialized_dom_tree(
 		self, previous_cached_state: SerializedDOMState | None = None
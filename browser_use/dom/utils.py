@@ -1,3 +1,26 @@
+import sys
+
+# Longer attribute values (inline styles, data blobs, long hrefs) rarely repeat across nodes, interning them would only cost time
+MAX_INTERNED_ATTRIBUTE_VALUE_LENGTH = 64
+
+
+def parse_node_attributes(raw_attributes: list[str] | None) -> dict[str, str]:
+	"""Turn the flat CDP `[name, value, name, value, ...]` attribute list into a dict.
+
+	Attribute names and short values are interned, so the thousands of `class="btn"` / `type="button"` strings of a large page
+	share one object per distinct value across nodes, trees and sessions.
+	"""
+	attributes: dict[str, str] = {}
+	if not raw_attributes:
+		return attributes
+	for i in range(0, len(raw_attributes), 2):
+		value = raw_attributes[i + 1]
+		if len(value) <= MAX_INTERNED_ATTRIBUTE_VALUE_LENGTH:
+			value = sys.intern(value)
+		attributes[sys.intern(raw_attributes[i])] = value
+	return attributes
+
+
 def cap_text_length(text: str, max_length: int) -> str:
 	"""Cap text length for display."""
 	if len(text) <= max_length:
@@ -304,7 +304,7 @@ class EnhancedSnapshotNode:
 # 	element_index: int | None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False)
 class EnhancedDOMTreeNode:
 	"""
 	Enhanced DOM tree node that contains information from AX, DOM, and Snapshot trees. It's mostly based on the types on DOM node type with enhanced data from AX and Snapshot trees.
@@ -378,7 +378,18 @@ class EnhancedDOMTreeNode:
 	# Compound control child components information
 	_compound_children: list[dict[str, Any]] = field(default_factory=list)
 
-	uuid: str = field(default_factory=uuid7str)
+	_uuid: str | None = None
+
+	# Memoized hashes, see `__hash__` and `parent_branch_hash`. Reset `_element_hash` when static attributes change.
+	_element_hash: int | None = None
+	_parent_branch_hash: int | None = None
+
+	@property
+	def uuid(self) -> str:
+		# generated on first access, most nodes of a tree never need one
+		if self._uuid is None:
+			self._uuid = uuid7str()
+		return self._uuid
 
 	@property
 	def parent(self) -> 'EnhancedDOMTreeNode | None':
@@ -749,33 +760,39 @@ class EnhancedDOMTreeNode:
 		"""
 		Hash the element based on its parent branch path and attributes.
 
+		Computed once per node and memoized, the value is persisted in agent history (`DOMInteractedElement.element_hash`)
+		and compared on rerun, so the algorithm must stay stable across processes.
+
 		TODO: migrate this to use only backendNodeId + current SessionId
 		"""
+		if self._element_hash is None:
+			# Get parent branch path
+			parent_branch_path = self._get_parent_branch_path()
+			parent_branch_path_string = '/'.join(parent_branch_path)
 
-		# Get parent branch path
-		parent_branch_path = self._get_parent_branch_path()
-		parent_branch_path_string = '/'.join(parent_branch_path)
+			attributes_string = ''.join(
+				f'{k}={v}' for k, v in sorted((k, v) for k, v in self.attributes.items() if k in STATIC_ATTRIBUTES)
+			)
 
-		attributes_string = ''.join(
-			f'{k}={v}' for k, v in sorted((k, v) for k, v in self.attributes.items() if k in STATIC_ATTRIBUTES)
-		)
-
-		# Combine both for final hash
-		combined_string = f'{parent_branch_path_string}|{attributes_string}'
-		element_hash = hashlib.sha256(combined_string.encode()).hexdigest()
+			# Combine both for final hash
+			combined_string = f'{parent_branch_path_string}|{attributes_string}'
+			element_hash = hashlib.sha256(combined_string.encode()).hexdigest()
 
-		# Convert to int for __hash__ return type - use first 16 chars and convert from hex to int
-		return int(element_hash[:16], 16)
+			# Convert to int for __hash__ return type - use first 16 chars and convert from hex to int
+			self._element_hash = int(element_hash[:16], 16)
+		return self._element_hash
 
 	def parent_branch_hash(self) -> int:
 		"""
 		Hash the element based on its parent branch path and attributes.
 		"""
-		parent_branch_path = self._get_parent_branch_path()
-		parent_branch_path_string = '/'.join(parent_branch_path)
-		element_hash = hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
+		if self._parent_branch_hash is None:
+			parent_branch_path = self._get_parent_branch_path()
+			parent_branch_path_string = '/'.join(parent_branch_path)
+			element_hash = hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
 
-		return int(element_hash[:16], 16)
+			self._parent_branch_hash = int(element_hash[:16], 16)
+		return self._parent_branch_hash
 
 	def _get_parent_branch_path(self) -> list[str]:
 		"""Get the parent branch path as a list of tag names from root to current element."""
@@ -794,6 +811,44 @@ class EnhancedDOMTreeNode:
 DOMSelectorMap = dict[int, EnhancedDOMTreeNode]
 
 
+@dataclass(slots=True)
+class DOMStateDiff:
+	"""Interactive elements that changed between two consecutive serialized DOM states, keyed by selector map index."""
+
+	added: list[int]
+	"""Indices of elements that were not interactive in the previous state"""
+	removed: list[int]
+	"""Indices of elements from the previous state that are gone"""
+	moved: dict[int, int]
+	"""Previous index -> current index for elements that were re-rendered under a new backend node id but kept their `element_hash`"""
+
+	@classmethod
+	def between(cls, previous_selector_map: DOMSelectorMap, selector_map: DOMSelectorMap) -> 'DOMStateDiff':
+		added_indices = [index for index in selector_map if index not in previous_selector_map]
+		removed_indices = [index for index in previous_selector_map if index not in selector_map]
+
+		# only elements that changed identity need hashing, unchanged ones are matched by index above
+		removed_by_hash: dict[int, int] = {}
+		for index in removed_indices:
+			removed_by_hash.setdefault(previous_selector_map[index].element_hash, index)
+		moved: dict[int, int] = {}
+		for index in added_indices:
+			previous_index = removed_by_hash.pop(selector_map[index].element_hash, None)
+			if previous_index is not None:
+				moved[previous_index] = index
+
+		moved_to = set(moved.values())
+		return cls(
+			added=[index for index in added_indices if index not in moved_to],
+			removed=[index for index in removed_indices if index not in moved],
+			moved=moved,
+		)
+
+	@property
+	def has_changes(self) -> bool:
+		return bool(self.added or self.removed or self.moved)
+
+
 @dataclass
 class SerializedDOMState:
 	_root: SimplifiedNode | None
@@ -801,6 +856,21 @@ class SerializedDOMState:
 
 	selector_map: DOMSelectorMap
 
+	diff: DOMStateDiff | None = None
+	"""Changes against the previous state, None if there was no previous state to compare with"""
+
+	_hash_index: dict[int, tuple[int, EnhancedDOMTreeNode]] | None = field(default=None, repr=False, compare=False)
+
+	def get_element_by_hash(self, element_hash: int) -> tuple[int, EnhancedDOMTreeNode] | tuple[None, None]:
+		"""Find the `(index, node)` of an interactive element by its `element_hash` in O(1), e.g. to locate a moved element on rerun."""
+		if self._hash_index is None:
+			hash_index: dict[int, tuple[int, EnhancedDOMTreeNode]] = {}
+			for index, node in self.selector_map.items():
+				# keep the first match for duplicate hashes, same as a linear scan over the selector map
+				hash_index.setdefault(node.element_hash, (index, node))
+			self._hash_index = hash_index
+		return self._hash_index.get(element_hash, (None, None))
+
 	@observe_debug(ignore_input=True, ignore_output=True, name='llm_representation')
 	def llm_representation(
 		self,
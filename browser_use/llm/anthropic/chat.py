@@ -1,5 +1,5 @@
 import json
-from collections.abc import Mapping
+from collections.abc import AsyncGenerator, Mapping
 from dataclasses import dataclass
 from typing import Any, TypeVar, overload
 
@@ -24,7 +24,7 @@ from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.schema import SchemaOptimizer
-from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeStreamChunk, ChatInvokeUsage
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -124,6 +124,23 @@ class ChatAnthropic(BaseChatModel):
 		)
 		return usage
 
+	def _get_output_tool(self, output_format: type[BaseModel]) -> tuple[ToolParam, ToolChoiceToolParam]:
+		"""Create a tool that represents the output format and force the model to use it"""
+		tool_name = output_format.__name__
+		schema = SchemaOptimizer.create_optimized_json_schema(output_format)
+
+		# Remove title from schema if present (Anthropic doesn't like it in parameters)
+		if 'title' in schema:
+			del schema['title']
+
+		tool = ToolParam(
+			name=tool_name,
+			description=f'Extract information in the format of {tool_name}',
+			input_schema=schema,
+			cache_control=CacheControlEphemeralParam(type='ephemeral'),
+		)
+		return tool, ToolChoiceToolParam(type='tool', name=tool_name)
+
 	@overload
 	async def ainvoke(self, messages: list[BaseMessage], output_format: None = None) -> ChatInvokeCompletion[str]: ...
 
@@ -171,23 +188,7 @@ class ChatAnthropic(BaseChatModel):
 
 			else:
 				# Use tool calling for structured output
-				# Create a tool that represents the output format
-				tool_name = output_format.__name__
-				schema = SchemaOptimizer.create_optimized_json_schema(output_format)
-
-				# Remove title from schema if present (Anthropic doesn't like it in parameters)
-				if 'title' in schema:
-					del schema['title']
-
-				tool = ToolParam(
-					name=tool_name,
-					description=f'Extract information in the format of {tool_name}',
-					input_schema=schema,
-					cache_control=CacheControlEphemeralParam(type='ephemeral'),
-				)
-
-				# Force the model to use this tool
-				tool_choice = ToolChoiceToolParam(type='tool', name=tool_name)
+				tool, tool_choice = self._get_output_tool(output_format)
 
 				response = await self.get_client().messages.create(
 					model=self.model,
@@ -240,3 +241,32 @@ class ChatAnthropic(BaseChatModel):
 			raise ModelProviderError(message=e.message, status_code=e.status_code, model=self.name) from e
 		except Exception as e:
 			raise ModelProviderError(message=str(e), model=self.name) from e
+
+	async def astream(
+		self, messages: list[BaseMessage], output_format: type[BaseModel]
+	) -> AsyncGenerator[ChatInvokeStreamChunk, None]:
+		"""Stream the JSON input of the output tool call, the last chunk carries the usage."""
+		anthropic_messages, system_prompt = AnthropicMessageSerializer.serialize_messages(messages)
+		tool, tool_choice = self._get_output_tool(output_format)
+
+		try:
+			async with self.get_client().messages.stream(
+				model=self.model,
+				messages=anthropic_messages,
+				tools=[tool],
+				system=system_prompt or omit,
+				tool_choice=tool_choice,
+				**self._get_client_params_for_invoke(),
+			) as stream:
+				async for event in stream:
+					if event.type == 'input_json':
+						yield ChatInvokeStreamChunk(delta=event.partial_json)
+				response = await stream.get_final_message()
+				yield ChatInvokeStreamChunk(usage=self._get_usage(response), stop_reason=response.stop_reason)
+
+		except APIConnectionError as e:
+			raise ModelProviderError(message=e.message, model=self.name) from e
+		except RateLimitError as e:
+			raise ModelRateLimitError(message=e.message, model=self.name) from e
+		except APIStatusError as e:
+			raise ModelProviderError(message=e.message, status_code=e.status_code, model=self.name) from e
@@ -55,6 +55,10 @@ class ChatAWSBedrock(BaseChatModel):
 	# Request parameters
 	request_params: dict[str, Any] | None = None
 
+	# Place cache points after the system prompt and the stable prefix of the state message.
+	# None enables them for models that support prompt caching on Bedrock (Claude, Nova).
+	prompt_caching: bool | None = None
+
 	# Static
 	@property
 	def provider(self) -> str:
@@ -141,18 +145,25 @@ class ChatAWSBedrock(BaseChatModel):
 			}
 		]
 
+	def _uses_prompt_caching(self) -> bool:
+		if self.prompt_caching is not None:
+			return self.prompt_caching
+		return 'anthropic.claude' in self.model or 'amazon.nova' in self.model
+
 	def _get_usage(self, response: dict[str, Any]) -> ChatInvokeUsage | None:
 		"""Extract usage information from the response."""
 		if 'usage' not in response:
 			return None
 
 		usage_data = response['usage']
+		cache_read_tokens = usage_data.get('cacheReadInputTokens')
 		return ChatInvokeUsage(
-			prompt_tokens=usage_data.get('inputTokens', 0),
+			# inputTokens only counts the uncached part of the prompt
+			prompt_tokens=usage_data.get('inputTokens', 0) + (cache_read_tokens or 0),
 			completion_tokens=usage_data.get('outputTokens', 0),
 			total_tokens=usage_data.get('totalTokens', 0),
-			prompt_cached_tokens=None,  # Bedrock doesn't provide this
-			prompt_cache_creation_tokens=None,
+			prompt_cached_tokens=cache_read_tokens,
+			prompt_cache_creation_tokens=usage_data.get('cacheWriteInputTokens'),
 			prompt_image_tokens=None,
 		)
 
@@ -182,7 +193,9 @@ class ChatAWSBedrock(BaseChatModel):
 				'`boto3` not installed. Please install using `pip install browser-use[aws] or pip install browser-use[all]`'
 			)
 
-		bedrock_messages, system_message = AWSBedrockMessageSerializer.serialize_messages(messages)
+		bedrock_messages, system_message = AWSBedrockMessageSerializer.serialize_messages(
+			messages, use_cache_points=self._uses_prompt_caching()
+		)
 
 		try:
 			# Prepare the request body
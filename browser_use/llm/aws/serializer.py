@@ -14,6 +14,8 @@ from browser_use.llm.messages import (
 	UserMessage,
 )
 
+CACHE_POINT: dict[str, Any] = {'cachePoint': {'type': 'default'}}
+
 
 class AWSBedrockMessageSerializer:
 	"""Serializer for converting between custom message types and AWS Bedrock message format."""
@@ -118,8 +120,9 @@ class AWSBedrockMessageSerializer:
 	@staticmethod
 	def _serialize_user_content(
 		content: str | list[ContentPartTextParam | ContentPartImageParam],
+		use_cache_points: bool = False,
 	) -> list[dict[str, Any]]:
-		"""Serialize content for user messages."""
+		"""Serialize content for user messages, with a cache point after text parts marked for caching if enabled."""
 		if isinstance(content, str):
 			return [{'text': content}]
 
@@ -127,6 +130,8 @@ class AWSBedrockMessageSerializer:
 		for part in content:
 			if part.type == 'text':
 				content_blocks.append(AWSBedrockMessageSerializer._serialize_content_part_text(part))
+				if use_cache_points and part.cache:
+					content_blocks.append(CACHE_POINT)
 			elif part.type == 'image_url':
 				content_blocks.append(AWSBedrockMessageSerializer._serialize_content_part_image(part))
 
@@ -135,16 +140,19 @@ class AWSBedrockMessageSerializer:
 	@staticmethod
 	def _serialize_system_content(
 		content: str | list[ContentPartTextParam],
+		use_cache: bool = False,
 	) -> list[dict[str, Any]]:
-		"""Serialize content for system messages."""
+		"""Serialize content for system messages, followed by a cache point if use_cache is set."""
 		if isinstance(content, str):
-			return [{'text': content}]
-
-		content_blocks: list[dict[str, Any]] = []
-		for part in content:
-			if part.type == 'text':
-				content_blocks.append(AWSBedrockMessageSerializer._serialize_content_part_text(part))
+			content_blocks: list[dict[str, Any]] = [{'text': content}]
+		else:
+			content_blocks = []
+			for part in content:
+				if part.type == 'text':
+					content_blocks.append(AWSBedrockMessageSerializer._serialize_content_part_text(part))
 
+		if use_cache and content_blocks:
+			content_blocks.append(CACHE_POINT)
 		return content_blocks
 
 	@staticmethod
@@ -185,24 +193,24 @@ class AWSBedrockMessageSerializer:
 	# region - Serialize overloads
 	@overload
 	@staticmethod
-	def serialize(message: UserMessage) -> dict[str, Any]: ...
+	def serialize(message: UserMessage, use_cache_points: bool = False) -> dict[str, Any]: ...
 
 	@overload
 	@staticmethod
-	def serialize(message: SystemMessage) -> SystemMessage: ...
+	def serialize(message: SystemMessage, use_cache_points: bool = False) -> SystemMessage: ...
 
 	@overload
 	@staticmethod
-	def serialize(message: AssistantMessage) -> dict[str, Any]: ...
+	def serialize(message: AssistantMessage, use_cache_points: bool = False) -> dict[str, Any]: ...
 
 	@staticmethod
-	def serialize(message: BaseMessage) -> dict[str, Any] | SystemMessage:
+	def serialize(message: BaseMessage, use_cache_points: bool = False) -> dict[str, Any] | SystemMessage:
 		"""Serialize a custom message to AWS Bedrock format."""
 
 		if isinstance(message, UserMessage):
 			return {
 				'role': 'user',
-				'content': AWSBedrockMessageSerializer._serialize_user_content(message.content),
+				'content': AWSBedrockMessageSerializer._serialize_user_content(message.content, use_cache_points),
 			}
 
 		elif isinstance(message, SystemMessage):
@@ -234,10 +242,15 @@ class AWSBedrockMessageSerializer:
 			raise ValueError(f'Unknown message type: {type(message)}')
 
 	@staticmethod
-	def serialize_messages(messages: list[BaseMessage]) -> tuple[list[dict[str, Any]], list[dict[str, Any]] | None]:
+	def serialize_messages(
+		messages: list[BaseMessage], use_cache_points: bool = False
+	) -> tuple[list[dict[str, Any]], list[dict[str, Any]] | None]:
 		"""
 		Serialize a list of messages, extracting any system message.
 
+		With use_cache_points, a prompt cache point is placed after the system message (if marked with cache=True) and
+		after user text parts marked with cache=True.
+
 		Returns:
 			Tuple of (bedrock_messages, system_message) where system_message is extracted
 			from any SystemMessage in the list.
@@ -248,10 +261,12 @@ class AWSBedrockMessageSerializer:
 		for message in messages:
 			if isinstance(message, SystemMessage):
 				# Extract system message content
-				system_message = AWSBedrockMessageSerializer._serialize_system_content(message.content)
+				system_message = AWSBedrockMessageSerializer._serialize_system_content(
+					message.content, use_cache=use_cache_points and message.cache
+				)
 			else:
 				# Serialize and add to regular messages
-				serialized = AWSBedrockMessageSerializer.serialize(message)
+				serialized = AWSBedrockMessageSerializer.serialize(message, use_cache_points)
 				bedrock_messages.append(serialized)
 
 		return bedrock_messages, system_message
@@ -2,10 +2,10 @@ import os
 from dataclasses import dataclass
 from typing import Any
 
-import httpx
 from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
 from openai.types.shared import ChatModel
 
+from browser_use.llm.openai.client_pool import client_pool
 from browser_use.llm.openai.like import ChatOpenAILike
 
 
@@ -81,11 +81,21 @@ class ChatAzureOpenAI(ChatOpenAILike):
 		if self.http_client:
 			_client_params['http_client'] = self.http_client
 		else:
-			# Create a new async HTTP client with custom limits
-			_client_params['http_client'] = httpx.AsyncClient(
-				limits=httpx.Limits(max_connections=20, max_keepalive_connections=6)
+			# Lease a pooled async HTTP client so connections stay warm across calls
+			self._pool_key, _client_params['http_client'] = client_pool.acquire(
+				base_url=self.azure_endpoint or self.base_url,
+				api_key=self.api_key,
+				max_connections=self.max_connections,
+				max_keepalive_connections=self.max_keepalive_connections,
+				keepalive_expiry=self.keepalive_expiry,
+				http2=self.http2,
 			)
 
 		self.client = AsyncAzureOpenAIClient(**_client_params)
 
 		return self.client
+
+	async def aclose(self) -> None:
+		"""Release the pooled connection, the next call transparently acquires a new one."""
+		self.client = None
+		await super().aclose()
@@ -0,0 +1,164 @@
+"""
+Opt-in response cache around any chat model.
+
+Wrap a model to replay identical requests from disk instead of calling the provider again:
+
+	llm = ChatCached(llm=ChatOpenAI(model='gpt-4.1-mini'))
+
+Requests are keyed by the sha256 of (provider, model, serialized messages, output_format JSON schema), so a changed
+prompt, screenshot or action set is always a miss. Cache failures never fail the call, the wrapped model is used instead.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar, overload
+
+from pydantic import BaseModel
+
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.cache.store import ResponseCacheStore
+from browser_use.llm.messages import BaseMessage
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+
+T = TypeVar('T', bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+CacheLookupCallback = Callable[[str, bool, ChatInvokeUsage | None], None]
+
+
+def response_cache_key(provider: str, model: str, messages: list[BaseMessage], output_format: type[BaseModel] | None) -> str:
+	payload = {
+		'provider': provider,
+		'model': model,
+		'messages': [message.model_dump(mode='json') for message in messages],
+		'output_format': output_format.model_json_schema() if output_format is not None else None,
+	}
+	return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+
+@dataclass
+class ChatCached(BaseChatModel):
+	"""
+	Caches completions of the wrapped chat model in a local SQLite file.
+
+	A hit returns the stored completion with `usage=None` since no tokens were spent, the usage of the original call is
+	reported to `on_lookup` (wired to `TokenCost` when the model is registered) as saved tokens.
+	"""
+
+	llm: BaseChatModel
+
+	# Defaults to $XDG_CACHE_HOME/browser_use/llm_cache.sqlite
+	path: str | Path | None = None
+	ttl: float | None = 7 * 24 * 3600
+	"""Seconds a cached completion stays valid, None to keep entries until they are evicted for size."""
+	max_size_mb: float | None = 512
+	"""Least recently used entries are evicted above this size, None for no limit."""
+
+	on_lookup: CacheLookupCallback | None = None
+
+	model: str = field(init=False, default='')
+	hits: int = field(init=False, default=0)
+	misses: int = field(init=False, default=0)
+	_store: ResponseCacheStore = field(init=False, repr=False)
+
+	def __post_init__(self) -> None:
+		self.model = self.llm.model
+		if self.path is None:
+			from browser_use.tokens.service import xdg_cache_home
+
+			self.path = xdg_cache_home() / 'browser_use' / 'llm_cache.sqlite'
+		max_size_bytes = int(self.max_size_mb * 1024 * 1024) if self.max_size_mb is not None else None
+		self._store = ResponseCacheStore(self.path, ttl=self.ttl, max_size_bytes=max_size_bytes)
+
+	@property
+	def provider(self) -> str:
+		return self.llm.provider
+
+	@property
+	def name(self) -> str:
+		return self.llm.name
+
+	async def aclose(self) -> None:
+		self._store.close()
+		aclose = getattr(self.llm, 'aclose', None)
+		if aclose is not None:
+			await aclose()
+
+	def clear(self) -> None:
+		"""Drop every cached completion (of all models sharing the cache file)."""
+		self._store.clear()
+
+	def _record(self, hit: bool, usage: ChatInvokeUsage | None) -> None:
+		if hit:
+			self.hits += 1
+		else:
+			self.misses += 1
+		if self.on_lookup is not None:
+			self.on_lookup(self.model, hit, usage)
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: None = None) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T]) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		key: str | None = None
+		try:
+			key = response_cache_key(self.provider, self.model, messages, output_format)
+			cached = await self._store.aget(key)
+			if cached is not None:
+				completion, usage = self._load(cached, output_format)
+				self._record(True, usage)
+				logger.debug(f'💾 LLM response cache hit for {self.provider}/{self.model}')
+				return completion
+		except Exception as e:
+			logger.debug(f'LLM response cache lookup failed, calling the model: {type(e).__name__}: {e}')
+
+		result = await self.llm.ainvoke(messages, output_format)
+		self._record(False, None)
+
+		if key is not None:
+			try:
+				await self._store.aset(key, self._dump(result))
+			except Exception as e:
+				logger.debug(f'Storing the LLM response in the cache failed: {type(e).__name__}: {e}')
+		return result
+
+	@staticmethod
+	def _dump(result: ChatInvokeCompletion[Any]) -> str:
+		completion = result.completion
+		return json.dumps(
+			{
+				'completion': completion.model_dump(mode='json', exclude_unset=True)
+				if isinstance(completion, BaseModel)
+				else completion,
+				'thinking': result.thinking,
+				'redacted_thinking': result.redacted_thinking,
+				'stop_reason': result.stop_reason,
+				'usage': result.usage.model_dump(mode='json') if result.usage else None,
+			}
+		)
+
+	@staticmethod
+	def _load(value: str, output_format: type[T] | None) -> tuple[ChatInvokeCompletion[Any], ChatInvokeUsage | None]:
+		data = json.loads(value)
+		usage = ChatInvokeUsage.model_validate(data['usage']) if data['usage'] else None
+		completion = output_format.model_validate(data['completion']) if output_format is not None else data['completion']
+		return (
+			ChatInvokeCompletion(
+				completion=completion,
+				thinking=data['thinking'],
+				redacted_thinking=data['redacted_thinking'],
+				stop_reason=data['stop_reason'],
+				usage=None,
+			),
+			usage,
+		)
@@ -0,0 +1,109 @@
+"""
+SQLite store for cached chat completions.
+
+One row per request key holding the serialized `ChatInvokeCompletion`. Entries expire `ttl` seconds after they were
+written, and once the stored values exceed `max_size_bytes` the least recently read entries are evicted. All access goes
+through one connection guarded by a lock, the async wrappers run it in a worker thread so the event loop never blocks on
+disk I/O.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+	key TEXT PRIMARY KEY,
+	created_at REAL NOT NULL,
+	accessed_at REAL NOT NULL,
+	size INTEGER NOT NULL,
+	value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+class ResponseCacheStore:
+	"""Key -> JSON text store with TTL and size-based LRU eviction."""
+
+	def __init__(self, path: str | Path, ttl: float | None = None, max_size_bytes: int | None = None):
+		self.path = Path(path).expanduser()
+		self.ttl = ttl
+		self.max_size_bytes = max_size_bytes
+		self._lock = threading.Lock()
+		self._connection: sqlite3.Connection | None = None
+
+	def _connect(self) -> sqlite3.Connection:
+		if self._connection is None:
+			self.path.parent.mkdir(parents=True, exist_ok=True)
+			connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+			# concurrent runs (e.g. parallel regression jobs) share the file
+			connection.execute('PRAGMA journal_mode=WAL')
+			connection.execute('PRAGMA busy_timeout=5000')
+			connection.executescript(_SCHEMA)
+			self._connection = connection
+		return self._connection
+
+	def get(self, key: str) -> str | None:
+		now = time.time()
+		with self._lock:
+			connection = self._connect()
+			row = connection.execute('SELECT created_at, value FROM entries WHERE key = ?', (key,)).fetchone()
+			if row is None:
+				return None
+			created_at, value = row
+			if self.ttl is not None and now - created_at > self.ttl:
+				connection.execute('DELETE FROM entries WHERE key = ?', (key,))
+				return None
+			connection.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (now, key))
+			return value
+
+	def set(self, key: str, value: str) -> None:
+		now = time.time()
+		size = len(value.encode())
+		with self._lock:
+			connection = self._connect()
+			connection.execute(
+				'INSERT OR REPLACE INTO entries (key, created_at, accessed_at, size, value) VALUES (?, ?, ?, ?, ?)',
+				(key, now, now, size, value),
+			)
+			self._evict(connection, now)
+
+	def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+		if self.ttl is not None:
+			connection.execute('DELETE FROM entries WHERE created_at < ?', (now - self.ttl,))
+		if self.max_size_bytes is None:
+			return
+		total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+		if total <= self.max_size_bytes:
+			return
+		# drop least recently read entries until the store fits again
+		evicted = 0
+		for key, size in connection.execute('SELECT key, size FROM entries ORDER BY accessed_at').fetchall():
+			if total <= self.max_size_bytes:
+				break
+			connection.execute('DELETE FROM entries WHERE key = ?', (key,))
+			total -= size
+			evicted += 1
+		logger.debug(f'LLM response cache evicted {evicted} entries to stay below {self.max_size_bytes} bytes')
+
+	def clear(self) -> None:
+		with self._lock:
+			self._connect().execute('DELETE FROM entries')
+
+	def close(self) -> None:
+		with self._lock:
+			if self._connection is not None:
+				self._connection.close()
+				self._connection = None
+
+	async def aget(self, key: str) -> str | None:
+		return await asyncio.to_thread(self.get, key)
+
+	async def aset(self, key: str, value: str) -> None:
+		await asyncio.to_thread(self.set, key, value)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from typing import Any, TypeVar, overload
 
 import httpx
@@ -19,6 +20,7 @@ from browser_use.llm.base import BaseChatModel
 from browser_use.llm.cerebras.serializer import CerebrasMessageSerializer
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
+from browser_use.llm.openai.client_pool import PoolKey, client_pool
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
 
 T = TypeVar('T', bound=BaseModel)
@@ -42,17 +44,43 @@ class ChatCerebras(BaseChatModel):
 	timeout: float | httpx.Timeout | None = None
 	client_params: dict[str, Any] | None = None
 
+	_async_client: AsyncOpenAI | None = field(default=None, init=False, repr=False)
+	_client_loop: asyncio.AbstractEventLoop | None = field(default=None, init=False, repr=False)
+	_pool_key: PoolKey | None = field(default=None, init=False, repr=False)
+
 	@property
 	def provider(self) -> str:
 		return 'cerebras'
 
 	def _client(self) -> AsyncOpenAI:
-		return AsyncOpenAI(
+		loop = asyncio.get_running_loop()
+		if self._async_client is not None and self._client_loop is loop:
+			return self._async_client
+
+		client_params = dict(self.client_params or {})
+		if self._pool_key is not None:
+			# the client of the previous event loop is not used anymore, give its lease back before taking a new one
+			client_pool.release_nowait(self._pool_key)
+			self._pool_key = None
+		if 'http_client' not in client_params:
+			# Lease a pooled HTTP client so consecutive calls reuse warm connections
+			self._pool_key, client_params['http_client'] = client_pool.acquire(base_url=self.base_url, api_key=self.api_key)
+		self._async_client = AsyncOpenAI(
 			api_key=self.api_key,
 			base_url=self.base_url,
 			timeout=self.timeout,
-			**(self.client_params or {}),
+			**client_params,
 		)
+		self._client_loop = loop
+		return self._async_client
+
+	async def aclose(self) -> None:
+		"""Release the pooled connection, the next call transparently acquires a new one."""
+		pool_key, self._pool_key = self._pool_key, None
+		self._async_client = None
+		self._client_loop = None
+		if pool_key is not None:
+			await client_pool.release(pool_key)
 
 	@property
 	def name(self) -> str:
@@ -1,7 +1,9 @@
 import asyncio
+import hashlib
 import json
 import logging
 import time
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from typing import Any, Literal, TypeVar, overload
 
@@ -16,7 +18,7 @@ from browser_use.llm.exceptions import ModelProviderError
 from browser_use.llm.google.serializer import GoogleMessageSerializer
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.schema import SchemaOptimizer
-from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeStreamChunk, ChatInvokeUsage
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -60,6 +62,8 @@ class ChatGoogle(BaseChatModel):
 		http_options: HTTP options for the client
 		include_system_in_user: If True, system messages are included in the first user message
 		supports_structured_output: If True, uses native JSON mode; if False, uses prompt-based fallback
+		context_cache_ttl: If set, the system instruction is stored in an explicit context cache that lives this many
+			seconds, so its tokens are billed at the cached rate on every call. Otherwise Gemini's implicit caching applies.
 
 	Example:
 		from google.genai import types
@@ -82,6 +86,7 @@ class ChatGoogle(BaseChatModel):
 	config: types.GenerateContentConfigDict | None = None
 	include_system_in_user: bool = False
 	supports_structured_output: bool = True  # New flag
+	context_cache_ttl: int | None = None
 
 	# Client initialization parameters
 	api_key: str | None = None
@@ -93,6 +98,8 @@ class ChatGoogle(BaseChatModel):
 
 	# Internal client cache to prevent connection issues
 	_client: genai.Client | None = None
+	# Explicit context caches by system instruction hash: (cache name, expiry time), None if creating the cache failed
+	_context_caches: dict[str, tuple[str, float] | None] | None = None
 
 	# Static
 	@property
@@ -139,6 +146,42 @@ class ChatGoogle(BaseChatModel):
 	def name(self) -> str:
 		return str(self.model)
 
+	async def _get_context_cache(self, system_instruction: str) -> str | None:
+		"""Name of the explicit context cache holding the system instruction, created on first use and after it expired."""
+		assert self.context_cache_ttl is not None
+		if self._context_caches is None:
+			self._context_caches = {}
+		key = hashlib.sha256(f'{self.model}\n{system_instruction}'.encode()).hexdigest()
+		if key in self._context_caches:
+			cached = self._context_caches[key]
+			if cached is None:
+				return None
+			name, expires_at = cached
+			# leave a margin so the cache doesn't expire while the request is in flight
+			if time.time() < expires_at - 30:
+				return name
+
+		try:
+			cache = await self.get_client().aio.caches.create(
+				model=self.model,
+				config=types.CreateCachedContentConfig(
+					system_instruction=system_instruction,
+					ttl=f'{self.context_cache_ttl}s',
+				),
+			)
+		except Exception as e:
+			# e.g. the system instruction is below the minimum size for explicit caching, don't retry every call
+			self.logger.debug(f'Creating a context cache failed, sending the system instruction: {type(e).__name__}: {e}')
+			self._context_caches[key] = None
+			return None
+
+		if not cache.name:
+			self._context_caches[key] = None
+			return None
+		self._context_caches[key] = (cache.name, time.time() + self.context_cache_ttl)
+		self.logger.debug(f'🗄️ Created context cache {cache.name} for the system instruction')
+		return cache.name
+
 	def _get_stop_reason(self, response: types.GenerateContentResponse) -> str | None:
 		"""Extract stop_reason from Google response."""
 		if hasattr(response, 'candidates') and response.candidates:
@@ -169,31 +212,8 @@ class ChatGoogle(BaseChatModel):
 
 		return usage
 
-	@overload
-	async def ainvoke(self, messages: list[BaseMessage], output_format: None = None) -> ChatInvokeCompletion[str]: ...
-
-	@overload
-	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T]) -> ChatInvokeCompletion[T]: ...
-
-	async def ainvoke(
-		self, messages: list[BaseMessage], output_format: type[T] | None = None
-	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
-		"""
-		Invoke the model with the given messages.
-
-		Args:
-			messages: List of chat messages
-			output_format: Optional Pydantic model class for structured output
-
-		Returns:
-			Either a string response or an instance of output_format
-		"""
-
-		# Serialize messages to Google format with the include_system_in_user flag
-		contents, system_instruction = GoogleMessageSerializer.serialize_messages(
-			messages, include_system_in_user=self.include_system_in_user
-		)
-
+	async def _get_config(self, system_instruction: str | None) -> types.GenerateContentConfigDict:
+		"""Generation config from the model settings, with the system instruction (or its context cache)"""
 		# Build config dictionary starting with user-provided config
 		config: types.GenerateContentConfigDict = {}
 		if self.config:
@@ -203,9 +223,15 @@ class ChatGoogle(BaseChatModel):
 		if self.temperature is not None:
 			config['temperature'] = self.temperature
 
-		# Add system instruction if present
+		# Add system instruction if present, from the context cache if enabled
 		if system_instruction:
-			config['system_instruction'] = system_instruction
+			# requests using a context cache can't set tools, they would have to be part of the cache
+			use_context_cache = self.context_cache_ttl is not None and not config.get('tools')
+			cache_name = await self._get_context_cache(system_instruction) if use_context_cache else None
+			if cache_name:
+				config['cached_content'] = cache_name
+			else:
+				config['system_instruction'] = system_instruction
 
 		if self.top_p is not None:
 			config['top_p'] = self.top_p
@@ -224,6 +250,74 @@ class ChatGoogle(BaseChatModel):
 		if self.max_output_tokens is not None:
 			config['max_output_tokens'] = self.max_output_tokens
 
+		return config
+
+	async def astream(
+		self, messages: list[BaseMessage], output_format: type[BaseModel]
+	) -> AsyncGenerator[ChatInvokeStreamChunk, None]:
+		"""Stream the JSON text of the structured output, the last chunk carries the usage."""
+		if not self.supports_structured_output:
+			# the prompt-based JSON fallback can't be streamed, return the whole output as one chunk
+			# (calling the class method keeps TokenCost from counting the usage twice)
+			result = await type(self).ainvoke(self, messages, output_format)
+			yield ChatInvokeStreamChunk(
+				delta=result.completion.model_dump_json(), usage=result.usage, stop_reason=result.stop_reason
+			)
+			return
+
+		contents, system_instruction = GoogleMessageSerializer.serialize_messages(
+			messages, include_system_in_user=self.include_system_in_user
+		)
+		config = await self._get_config(system_instruction)
+		config['response_mime_type'] = 'application/json'
+		config['response_schema'] = self._fix_gemini_schema(SchemaOptimizer.create_gemini_optimized_schema(output_format))
+
+		try:
+			stream = await self.get_client().aio.models.generate_content_stream(
+				model=self.model,
+				contents=contents,
+				config=config,
+			)
+			# usage_metadata is cumulative and repeated on every chunk, only the last one is reported
+			last_response: types.GenerateContentResponse | None = None
+			async for response in stream:
+				last_response = response
+				if response.text:
+					yield ChatInvokeStreamChunk(delta=response.text)
+			if last_response is not None:
+				yield ChatInvokeStreamChunk(
+					usage=self._get_usage(last_response), stop_reason=self._get_stop_reason(last_response)
+				)
+		except Exception as e:
+			raise ModelProviderError(message=str(e), model=self.name) from e
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: None = None) -> ChatInvokeCompletion[str]: ...
+
+	@overload
+	async def ainvoke(self, messages: list[BaseMessage], output_format: type[T]) -> ChatInvokeCompletion[T]: ...
+
+	async def ainvoke(
+		self, messages: list[BaseMessage], output_format: type[T] | None = None
+	) -> ChatInvokeCompletion[T] | ChatInvokeCompletion[str]:
+		"""
+		Invoke the model with the given messages.
+
+		Args:
+			messages: List of chat messages
+			output_format: Optional Pydantic model class for structured output
+
+		Returns:
+			Either a string response or an instance of output_format
+		"""
+
+		# Serialize messages to Google format with the include_system_in_user flag
+		contents, system_instruction = GoogleMessageSerializer.serialize_messages(
+			messages, include_system_in_user=self.include_system_in_user
+		)
+
+		config = await self._get_config(system_instruction)
+
 		async def _make_api_call():
 			start_time = time.time()
 			self.logger.debug(f'🚀 Starting API call to {self.model}')
@@ -348,7 +442,7 @@ class ChatGoogle(BaseChatModel):
 
 						# Update config with fallback system instruction if present
 						fallback_config = config.copy()
-						if fallback_system:
+						if fallback_system and 'cached_content' not in fallback_config:
 							fallback_config['system_instruction'] = fallback_system
 
 						response = await self.get_client().aio.models.generate_content(
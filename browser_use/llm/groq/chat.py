@@ -1,4 +1,5 @@
 import logging
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from typing import Literal, TypeVar, overload
 
@@ -11,7 +12,7 @@ from groq import (
 	RateLimitError,
 	Timeout,
 )
-from groq.types.chat import ChatCompletion, ChatCompletionToolChoiceOptionParam, ChatCompletionToolParam
+from groq.types.chat import ChatCompletion, ChatCompletionChunk, ChatCompletionToolChoiceOptionParam, ChatCompletionToolParam
 from groq.types.chat.completion_create_params import (
 	ResponseFormatResponseFormatJsonSchema,
 	ResponseFormatResponseFormatJsonSchemaJsonSchema,
@@ -25,7 +26,7 @@ from browser_use.llm.groq.parser import try_parse_groq_failed_generation
 from browser_use.llm.groq.serializer import GroqMessageSerializer
 from browser_use.llm.messages import BaseMessage
 from browser_use.llm.schema import SchemaOptimizer
-from browser_use.llm.views import ChatInvokeUsage
+from browser_use.llm.views import ChatInvokeStreamChunk, ChatInvokeUsage
 
 GroqVerifiedModels = Literal[
 	'meta-llama/llama-4-maverick-17b-128e-instruct',
@@ -84,17 +85,21 @@ class ChatGroq(BaseChatModel):
 	def name(self) -> str:
 		return str(self.model)
 
-	def _get_usage(self, response: ChatCompletion) -> ChatInvokeUsage | None:
+	def _get_usage(self, response: ChatCompletion | ChatCompletionChunk) -> ChatInvokeUsage | None:
+		# streamed responses report the usage of the whole completion in x_groq on the last chunk
+		response_usage = response.usage
+		if response_usage is None and isinstance(response, ChatCompletionChunk) and response.x_groq is not None:
+			response_usage = response.x_groq.usage
 		usage = (
 			ChatInvokeUsage(
-				prompt_tokens=response.usage.prompt_tokens,
-				completion_tokens=response.usage.completion_tokens,
-				total_tokens=response.usage.total_tokens,
+				prompt_tokens=response_usage.prompt_tokens,
+				completion_tokens=response_usage.completion_tokens,
+				total_tokens=response_usage.total_tokens,
 				prompt_cached_tokens=None,  # Groq doesn't support cached tokens
 				prompt_cache_creation_tokens=None,
 				prompt_image_tokens=None,
 			)
-			if response.usage is not None
+			if response_usage is not None
 			else None
 		)
 		return usage
@@ -146,6 +151,50 @@ class ChatGroq(BaseChatModel):
 		except Exception as e:
 			raise ModelProviderError(message=str(e), model=self.name) from e
 
+	async def astream(
+		self, messages: list[BaseMessage], output_format: type[BaseModel]
+	) -> AsyncGenerator[ChatInvokeStreamChunk, None]:
+		"""Stream the JSON arguments of the output tool call, the last chunk carries the usage.
+
+		Groq can't stream structured outputs in JSON schema mode, for those models the whole output is returned as one chunk.
+		"""
+		groq_messages = GroqMessageSerializer.serialize_messages(messages)
+
+		try:
+			if self.model not in ToolCallingModels:
+				response = await self._invoke_structured_output(groq_messages, output_format)
+				yield ChatInvokeStreamChunk(delta=response.completion.model_dump_json(), usage=response.usage)
+				return
+
+			stream = await self.get_client().chat.completions.create(
+				model=self.model,
+				messages=groq_messages,
+				temperature=self.temperature,
+				top_p=self.top_p,
+				seed=self.seed,
+				tools=[self._get_output_tool(output_format)],
+				tool_choice='required',
+				service_tier=self.service_tier,
+				stream=True,
+			)
+			async for chunk in stream:
+				delta = ''
+				if chunk.choices and chunk.choices[0].delta.tool_calls:
+					function = chunk.choices[0].delta.tool_calls[0].function
+					delta = (function.arguments if function else None) or ''
+				yield ChatInvokeStreamChunk(
+					delta=delta,
+					usage=self._get_usage(chunk),
+					stop_reason=chunk.choices[0].finish_reason if chunk.choices else None,
+				)
+
+		except RateLimitError as e:
+			raise ModelRateLimitError(message=e.response.text, status_code=e.response.status_code, model=self.name) from e
+		except APIStatusError as e:
+			raise ModelProviderError(message=e.response.text, status_code=e.response.status_code, model=self.name) from e
+		except APIError as e:
+			raise ModelProviderError(message=e.message, model=self.name) from e
+
 	async def _invoke_regular_completion(self, groq_messages) -> ChatInvokeCompletion[str]:
 		"""Handle regular completion without structured output."""
 		chat_completion = await self.get_client().chat.completions.create(
@@ -188,14 +237,7 @@ class ChatGroq(BaseChatModel):
 
 	async def _invoke_with_tool_calling(self, groq_messages, output_format: type[T], schema) -> ChatCompletion:
 		"""Handle structured output using tool calling."""
-		tool = ChatCompletionToolParam(
-			function={
-				'name': output_format.__name__,
-				'description': f'Extract information in the format of {output_format.__name__}',
-				'parameters': schema,
-			},
-			type='function',
-		)
+		tool = self._get_output_tool(output_format, schema)
 		tool_choice: ChatCompletionToolChoiceOptionParam = 'required'
 
 		return await self.get_client().chat.completions.create(
@@ -209,6 +251,17 @@ class ChatGroq(BaseChatModel):
 			service_tier=self.service_tier,
 		)
 
+	def _get_output_tool(self, output_format: type[BaseModel], schema: dict | None = None) -> ChatCompletionToolParam:
+		"""Create a tool that represents the output format"""
+		return ChatCompletionToolParam(
+			function={
+				'name': output_format.__name__,
+				'description': f'Extract information in the format of {output_format.__name__}',
+				'parameters': schema if schema is not None else SchemaOptimizer.create_optimized_json_schema(output_format),
+			},
+			type='function',
+		)
+
 	async def _invoke_with_json_schema(self, groq_messages, output_format: type[T], schema) -> ChatCompletion:
 		"""Handle structured output using JSON schema."""
 		return await self.get_client().chat.completions.create(
@@ -6,6 +6,7 @@ This implementation is based on the OpenAI types, while removing all the parts t
 from typing import Literal, Union
 
 from openai import BaseModel
+from pydantic import Field
 
 
 def _truncate(text: str, max_length: int = 50) -> str:
@@ -30,6 +31,11 @@ class ContentPartTextParam(BaseModel):
 	text: str
 	type: Literal['text'] = 'text'
 
+	cache: bool = Field(default=False, exclude=True)
+	"""Whether to place a prompt cache breakpoint after this part, the content up to here is cached by providers with
+	explicit prompt caching (Anthropic, AWS Bedrock). Serializers read it, it is never dumped into a request.
+	"""
+
 	def __str__(self) -> str:
 		return f'Text: {_truncate(self.text)}'
 
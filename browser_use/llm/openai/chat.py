@@ -1,4 +1,6 @@
-from collections.abc import Iterable, Mapping
+import asyncio
+import os
+from collections.abc import AsyncGenerator, Iterable, Mapping
 from dataclasses import dataclass, field
 from typing import Any, Literal, TypeVar, overload
 
@@ -6,17 +8,19 @@ import httpx
 from openai import APIConnectionError, APIStatusError, AsyncOpenAI, RateLimitError
 from openai.types.chat import ChatCompletionContentPartTextParam
 from openai.types.chat.chat_completion import ChatCompletion
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 from openai.types.shared.chat_model import ChatModel
 from openai.types.shared_params.reasoning_effort import ReasoningEffort
 from openai.types.shared_params.response_format_json_schema import JSONSchema, ResponseFormatJSONSchema
 from pydantic import BaseModel
 
 from browser_use.llm.base import BaseChatModel
-from browser_use.llm.exceptions import ModelProviderError
+from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
+from browser_use.llm.openai.client_pool import PoolKey, client_pool
 from browser_use.llm.openai.serializer import OpenAIMessageSerializer
 from browser_use.llm.schema import SchemaOptimizer
-from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeStreamChunk, ChatInvokeUsage
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -54,6 +58,11 @@ class ChatOpenAI(BaseChatModel):
 	default_query: Mapping[str, object] | None = None
 	http_client: httpx.AsyncClient | None = None
 	_strict_response_validation: bool = False
+	# Pooled connection settings, only used when no `http_client` is passed
+	max_connections: int = 20
+	max_keepalive_connections: int = 10
+	keepalive_expiry: float = 30.0
+	http2: bool = True  # only effective if the optional `h2` package is installed
 	max_completion_tokens: int | None = 4096
 	reasoning_models: list[ChatModel | str] | None = field(
 		default_factory=lambda: [
@@ -69,6 +78,10 @@ class ChatOpenAI(BaseChatModel):
 		]
 	)
 
+	_client: AsyncOpenAI | None = field(default=None, init=False, repr=False)
+	_client_loop: asyncio.AbstractEventLoop | None = field(default=None, init=False, repr=False)
+	_pool_key: PoolKey | None = field(default=None, init=False, repr=False)
+
 	# Static
 	@property
 	def provider(self) -> str:
@@ -103,17 +116,51 @@ class ChatOpenAI(BaseChatModel):
 		"""
 		Returns an AsyncOpenAI client.
 
+		The client is created once per event loop and, unless a custom `http_client` is passed, uses a pooled
+		httpx client so consecutive calls reuse warm connections. Call `aclose()` to release it.
+
 		Returns:
 			AsyncOpenAI: An instance of the AsyncOpenAI client.
 		"""
+		try:
+			loop = asyncio.get_running_loop()
+		except RuntimeError:
+			return AsyncOpenAI(**self._get_client_params())
+
+		if self._client is not None and self._client_loop is loop:
+			return self._client
+
 		client_params = self._get_client_params()
-		return AsyncOpenAI(**client_params)
+		if self._pool_key is not None:
+			# the client of the previous event loop is not used anymore, give its lease back before taking a new one
+			client_pool.release_nowait(self._pool_key)
+			self._pool_key = None
+		if 'http_client' not in client_params:
+			self._pool_key, client_params['http_client'] = client_pool.acquire(
+				base_url=client_params.get('base_url') or os.getenv('OPENAI_BASE_URL'),
+				api_key=client_params.get('api_key') or os.getenv('OPENAI_API_KEY'),
+				max_connections=self.max_connections,
+				max_keepalive_connections=self.max_keepalive_connections,
+				keepalive_expiry=self.keepalive_expiry,
+				http2=self.http2,
+			)
+		self._client = AsyncOpenAI(**client_params)
+		self._client_loop = loop
+		return self._client
+
+	async def aclose(self) -> None:
+		"""Release the pooled connection, the next call transparently acquires a new one."""
+		pool_key, self._pool_key = self._pool_key, None
+		self._client = None
+		self._client_loop = None
+		if pool_key is not None:
+			await client_pool.release(pool_key)
 
 	@property
 	def name(self) -> str:
 		return str(self.model)
 
-	def _get_usage(self, response: ChatCompletion) -> ChatInvokeUsage | None:
+	def _get_usage(self, response: ChatCompletion | ChatCompletionChunk) -> ChatInvokeUsage | None:
 		if response.usage is not None:
 			completion_tokens = response.usage.completion_tokens
 			completion_token_details = response.usage.completion_tokens_details
@@ -138,6 +185,53 @@ class ChatOpenAI(BaseChatModel):
 
 		return usage
 
+	def _get_model_params(self) -> dict[str, Any]:
+		model_params: dict[str, Any] = {}
+
+		if self.temperature is not None:
+			model_params['temperature'] = self.temperature
+
+		if self.frequency_penalty is not None:
+			model_params['frequency_penalty'] = self.frequency_penalty
+
+		if self.max_completion_tokens is not None:
+			model_params['max_completion_tokens'] = self.max_completion_tokens
+
+		if self.top_p is not None:
+			model_params['top_p'] = self.top_p
+
+		if self.seed is not None:
+			model_params['seed'] = self.seed
+
+		if self.service_tier is not None:
+			model_params['service_tier'] = self.service_tier
+
+		if self.reasoning_models and any(str(m).lower() in str(self.model).lower() for m in self.reasoning_models):
+			model_params['reasoning_effort'] = self.reasoning_effort
+			del model_params['temperature']
+			del model_params['frequency_penalty']
+
+		return model_params
+
+	def _get_response_format(self, openai_messages: list[Any], output_format: type[BaseModel]) -> ResponseFormatJSONSchema:
+		response_format: JSONSchema = {
+			'name': 'agent_output',
+			'strict': True,
+			'schema': SchemaOptimizer.create_optimized_json_schema(output_format),
+		}
+
+		# Add JSON schema to system prompt if requested
+		if self.add_schema_to_system_prompt and openai_messages and openai_messages[0]['role'] == 'system':
+			schema_text = f'\n<json_schema>\n{response_format}\n</json_schema>'
+			if isinstance(openai_messages[0]['content'], str):
+				openai_messages[0]['content'] += schema_text
+			elif isinstance(openai_messages[0]['content'], Iterable):
+				openai_messages[0]['content'] = list(openai_messages[0]['content']) + [
+					ChatCompletionContentPartTextParam(text=schema_text, type='text')
+				]
+
+		return ResponseFormatJSONSchema(json_schema=response_format, type='json_schema')
+
 	@overload
 	async def ainvoke(self, messages: list[BaseMessage], output_format: None = None) -> ChatInvokeCompletion[str]: ...
 
@@ -161,30 +255,7 @@ class ChatOpenAI(BaseChatModel):
 		openai_messages = OpenAIMessageSerializer.serialize_messages(messages)
 
 		try:
-			model_params: dict[str, Any] = {}
-
-			if self.temperature is not None:
-				model_params['temperature'] = self.temperature
-
-			if self.frequency_penalty is not None:
-				model_params['frequency_penalty'] = self.frequency_penalty
-
-			if self.max_completion_tokens is not None:
-				model_params['max_completion_tokens'] = self.max_completion_tokens
-
-			if self.top_p is not None:
-				model_params['top_p'] = self.top_p
-
-			if self.seed is not None:
-				model_params['seed'] = self.seed
-
-			if self.service_tier is not None:
-				model_params['service_tier'] = self.service_tier
-
-			if self.reasoning_models and any(str(m).lower() in str(self.model).lower() for m in self.reasoning_models):
-				model_params['reasoning_effort'] = self.reasoning_effort
-				del model_params['temperature']
-				del model_params['frequency_penalty']
+			model_params = self._get_model_params()
 
 			if output_format is None:
 				# Return string response
@@ -202,27 +273,13 @@ class ChatOpenAI(BaseChatModel):
 				)
 
 			else:
-				response_format: JSONSchema = {
-					'name': 'agent_output',
-					'strict': True,
-					'schema': SchemaOptimizer.create_optimized_json_schema(output_format),
-				}
-
-				# Add JSON schema to system prompt if requested
-				if self.add_schema_to_system_prompt and openai_messages and openai_messages[0]['role'] == 'system':
-					schema_text = f'\n<json_schema>\n{response_format}\n</json_schema>'
-					if isinstance(openai_messages[0]['content'], str):
-						openai_messages[0]['content'] += schema_text
-					elif isinstance(openai_messages[0]['content'], Iterable):
-						openai_messages[0]['content'] = list(openai_messages[0]['content']) + [
-							ChatCompletionContentPartTextParam(text=schema_text, type='text')
-						]
+				response_format = self._get_response_format(openai_messages, output_format)
 
 				# Return structured response
 				response = await self.get_client().chat.completions.create(
 					model=self.model,
 					messages=openai_messages,
-					response_format=ResponseFormatJSONSchema(json_schema=response_format, type='json_schema'),
+					response_format=response_format,
 					**model_params,
 				)
 
@@ -273,3 +330,36 @@ class ChatOpenAI(BaseChatModel):
 
 		except Exception as e:
 			raise ModelProviderError(message=str(e), model=self.name) from e
+
+	async def astream(
+		self, messages: list[BaseMessage], output_format: type[BaseModel]
+	) -> AsyncGenerator[ChatInvokeStreamChunk, None]:
+		"""Stream the JSON text of the structured output, the last chunk carries the usage."""
+		openai_messages = OpenAIMessageSerializer.serialize_messages(messages)
+
+		try:
+			stream = await self.get_client().chat.completions.create(
+				model=self.model,
+				messages=openai_messages,
+				response_format=self._get_response_format(openai_messages, output_format),
+				stream=True,
+				stream_options={'include_usage': True},
+				**self._get_model_params(),
+			)
+			try:
+				async for chunk in stream:
+					delta = chunk.choices[0].delta.content if chunk.choices else None
+					yield ChatInvokeStreamChunk(
+						delta=delta or '',
+						usage=self._get_usage(chunk),
+						stop_reason=chunk.choices[0].finish_reason if chunk.choices else None,
+					)
+			finally:
+				await stream.close()
+
+		except RateLimitError as e:
+			raise ModelRateLimitError(message=e.message, status_code=e.status_code, model=self.name) from e
+		except APIConnectionError as e:
+			raise ModelProviderError(message=str(e), model=self.name) from e
+		except APIStatusError as e:
+			raise ModelProviderError(message=e.message, status_code=e.status_code, model=self.name) from e
@@ -0,0 +1,308 @@
+"""
+Shared, lifecycle-managed httpx connection pools for OpenAI-compatible chat models.
+
+Creating a fresh `AsyncOpenAI` per call also creates a fresh httpx connection pool, so every agent step pays TCP + TLS
+setup to the provider. Chat models lease a pooled `httpx.AsyncClient` keyed by (event loop, base_url, api_key, proxy
+settings, limits) instead, and release it on `aclose()`. The pool closes a client once nobody holds a lease anymore and
+the requests still in flight on it have finished, or when its event loop shuts down.
+
+Users of a model that may be shared (e.g. agents) take a `ModelLease` through `client_pool.lease_model(llm)` instead of
+closing the model themselves: the model is only closed once every lease on it was released.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from openai import DefaultAsyncHttpxClient
+
+logger = logging.getLogger(__name__)
+
+_PROXY_ENV_VARS = ('HTTPS_PROXY', 'https_proxy', 'HTTP_PROXY', 'http_proxy', 'ALL_PROXY', 'all_proxy', 'NO_PROXY', 'no_proxy')
+
+try:
+	import h2  # type: ignore[import-not-found]  # noqa: F401
+
+	HTTP2_AVAILABLE = True
+except ImportError:
+	HTTP2_AVAILABLE = False
+
+
+@dataclass
+class ConnectionPoolStats:
+	"""Connection reuse metrics of one pooled client."""
+
+	requests: int = 0
+	new_connections: int = 0
+	tls_handshakes: int = 0
+
+	@property
+	def reused_connections(self) -> int:
+		return max(self.requests - self.new_connections, 0)
+
+
+class _PooledHttpClient(DefaultAsyncHttpxClient):
+	"""httpx client that counts the requests in flight, so closing it can wait for the calls other models still make."""
+
+	def __init__(self, **kwargs: Any):
+		super().__init__(**kwargs)
+		self._in_flight = 0
+		self._idle = asyncio.Event()
+		self._idle.set()
+
+	async def send(self, request: httpx.Request, *, stream: bool = False, **kwargs: Any) -> httpx.Response:
+		self._in_flight += 1
+		self._idle.clear()
+		try:
+			response = await super().send(request, stream=stream, **kwargs)
+		except BaseException:
+			self._request_finished()
+			raise
+		if not stream:
+			self._request_finished()
+		else:
+			# streamed bodies are read after send() returns, the request is over once the response is closed
+			response.stream = _ClosingByteStream(response.stream, self._request_finished)
+		return response
+
+	async def wait_idle(self) -> None:
+		await self._idle.wait()
+
+	def _request_finished(self) -> None:
+		self._in_flight -= 1
+		if self._in_flight == 0:
+			self._idle.set()
+
+
+class _ClosingByteStream(httpx.AsyncByteStream):
+	"""Streamed response body that reports when it is closed."""
+
+	def __init__(self, stream: Any, on_close: Callable[[], None]):
+		self._stream = stream
+		self._on_close: Callable[[], None] | None = on_close
+
+	async def __aiter__(self) -> AsyncIterator[bytes]:
+		async for chunk in self._stream:
+			yield chunk
+
+	async def aclose(self) -> None:
+		on_close, self._on_close = self._on_close, None
+		try:
+			await self._stream.aclose()
+		finally:
+			if on_close is not None:
+				on_close()
+
+
+@dataclass
+class _PooledClient:
+	http_client: _PooledHttpClient
+	loop: asyncio.AbstractEventLoop
+	base_url: str
+	stats: ConnectionPoolStats = field(default_factory=ConnectionPoolStats)
+	leases: int = 0
+
+
+PoolKey = tuple[Any, ...]
+
+
+class ModelLease:
+	"""One user's hold on a chat model, e.g. an agent. Released at most once."""
+
+	def __init__(self, pool: 'HttpClientPool', llm: Any):
+		self.llm = llm
+		self._pool = pool
+		self._released = False
+
+	async def release(self) -> None:
+		if self._released:
+			return
+		self._released = True
+		await self._pool._release_model(self.llm)
+
+
+class HttpClientPool:
+	"""Process-wide pool of httpx clients shared by all OpenAI-compatible chat models."""
+
+	def __init__(self):
+		self._clients: dict[PoolKey, _PooledClient] = {}
+		self._closing: set[asyncio.Task[None]] = set()
+		# one task per event loop that closes its clients when the loop shuts down, see `_close_on_loop_shutdown`
+		self._loop_watchers: dict[asyncio.AbstractEventLoop, asyncio.Task[None]] = {}
+		# id(llm) -> number of unreleased `ModelLease`s
+		self._model_leases: dict[int, int] = {}
+
+	def acquire(
+		self,
+		base_url: str | httpx.URL | None,
+		api_key: str | None,
+		max_connections: int = 20,
+		max_keepalive_connections: int = 10,
+		keepalive_expiry: float = 30.0,
+		http2: bool = True,
+	) -> tuple[PoolKey, httpx.AsyncClient]:
+		"""Lease a pooled client for the running event loop. Every acquire must be paired with `release(key)`."""
+		loop = asyncio.get_running_loop()
+		self._forget_closed_loops()
+		if loop not in self._loop_watchers:
+			self._loop_watchers[loop] = loop.create_task(self._close_on_loop_shutdown(loop))
+
+		http2 = http2 and HTTP2_AVAILABLE
+		proxy_settings = tuple(os.getenv(name) for name in _PROXY_ENV_VARS)
+		key: PoolKey = (
+			id(loop),
+			str(base_url or ''),
+			api_key,
+			proxy_settings,
+			max_connections,
+			max_keepalive_connections,
+			keepalive_expiry,
+			http2,
+		)
+
+		pooled = self._clients.get(key)
+		if pooled is None or pooled.http_client.is_closed:
+			stats = ConnectionPoolStats()
+			pooled = _PooledClient(
+				http_client=_PooledHttpClient(
+					limits=httpx.Limits(
+						max_connections=max_connections,
+						max_keepalive_connections=max_keepalive_connections,
+						keepalive_expiry=keepalive_expiry,
+					),
+					http2=http2,
+					event_hooks={'request': [self._make_request_hook(stats)]},
+				),
+				loop=loop,
+				base_url=str(base_url or 'default'),
+				stats=stats,
+			)
+			self._clients[key] = pooled
+		pooled.leases += 1
+		return key, pooled.http_client
+
+	async def release(self, key: PoolKey) -> None:
+		"""Give back a lease, the client is closed once the last lease is released and its requests have finished."""
+		pooled = self._drop_lease(key)
+		if pooled is not None:
+			await self._close(pooled)
+
+	def release_nowait(self, key: PoolKey) -> None:
+		"""Give back a lease from sync code, e.g. a lease of another event loop. The client is closed on its own loop."""
+		pooled = self._drop_lease(key)
+		if pooled is None or pooled.loop.is_closed():
+			return
+		try:
+			running_loop = asyncio.get_running_loop()
+		except RuntimeError:
+			running_loop = None
+		if pooled.loop is running_loop:
+			task = pooled.loop.create_task(self._close(pooled))
+			self._closing.add(task)
+			task.add_done_callback(self._closing.discard)
+		elif pooled.loop.is_running():
+			asyncio.run_coroutine_threadsafe(self._close(pooled), pooled.loop)
+
+	def _drop_lease(self, key: PoolKey) -> _PooledClient | None:
+		"""Remove one lease and return the client if it was the last one."""
+		pooled = self._clients.get(key)
+		if pooled is None:
+			return None
+		pooled.leases -= 1
+		if pooled.leases > 0:
+			return None
+		del self._clients[key]
+		return pooled
+
+	async def _close(self, pooled: _PooledClient) -> None:
+		await pooled.http_client.wait_idle()
+		self._log_stats(pooled)
+		await pooled.http_client.aclose()
+
+	async def aclose(self) -> None:
+		"""Close every pooled client of the running event loop regardless of outstanding leases, after their requests finished."""
+		loop = asyncio.get_running_loop()
+		for key, pooled in list(self._clients.items()):
+			if pooled.loop is loop:
+				del self._clients[key]
+				await self._close(pooled)
+
+	def lease_model(self, llm: Any) -> ModelLease:
+		"""Register a user of `llm`. Its `aclose()` is called when the last lease on it is released."""
+		self._model_leases[id(llm)] = self._model_leases.get(id(llm), 0) + 1
+		return ModelLease(self, llm)
+
+	async def _release_model(self, llm: Any) -> None:
+		leases = self._model_leases.get(id(llm), 0) - 1
+		if leases > 0:
+			self._model_leases[id(llm)] = leases
+			return
+		self._model_leases.pop(id(llm), None)
+		aclose = getattr(llm, 'aclose', None)  # models without a pool simply don't implement aclose
+		if aclose is not None:
+			await aclose()
+
+	def stats(self) -> dict[str, ConnectionPoolStats]:
+		"""Connection reuse metrics of the currently pooled clients, by base URL."""
+		result: dict[str, ConnectionPoolStats] = {}
+		for pooled in self._clients.values():
+			total = result.setdefault(pooled.base_url, ConnectionPoolStats())
+			total.requests += pooled.stats.requests
+			total.new_connections += pooled.stats.new_connections
+			total.tls_handshakes += pooled.stats.tls_handshakes
+		return result
+
+	async def _close_on_loop_shutdown(self, loop: asyncio.AbstractEventLoop) -> None:
+		"""Wait until the loop shuts down, then close its clients while it can still run their `aclose()`.
+
+		`asyncio.run()` (and `asyncio.Runner`) cancel every pending task before closing the loop, which ends up here.
+		"""
+		try:
+			await asyncio.Event().wait()
+		finally:
+			self._loop_watchers.pop(loop, None)
+			for key, pooled in list(self._clients.items()):
+				if pooled.loop is loop:
+					del self._clients[key]
+					self._log_stats(pooled)
+					await pooled.http_client.aclose()
+
+	def _forget_closed_loops(self) -> None:
+		# only reached for loops that were closed without cancelling their tasks (no asyncio.run), their connections are
+		# bound to the closed loop and can't be closed anymore
+		for key, pooled in list(self._clients.items()):
+			if pooled.loop.is_closed():
+				logger.debug(f'🔌 LLM HTTP pool {pooled.base_url}: event loop was closed before its client, dropping it')
+				del self._clients[key]
+		for loop in [loop for loop in self._loop_watchers if loop.is_closed()]:
+			del self._loop_watchers[loop]
+
+	@staticmethod
+	def _make_request_hook(stats: ConnectionPoolStats):
+		async def trace(event_name: str, info: dict[str, Any]) -> None:
+			if event_name == 'connection.connect_tcp.complete':
+				stats.new_connections += 1
+			elif event_name == 'connection.start_tls.complete':
+				stats.tls_handshakes += 1
+
+		async def on_request(request: httpx.Request) -> None:
+			stats.requests += 1
+			request.extensions['trace'] = trace
+
+		return on_request
+
+	@staticmethod
+	def _log_stats(pooled: _PooledClient) -> None:
+		stats = pooled.stats
+		if stats.requests:
+			logger.debug(
+				f'🔌 LLM HTTP pool {pooled.base_url}: {stats.requests} requests, {stats.reused_connections} on reused connections, '
+				f'{stats.new_connections} new connections ({stats.tls_handshakes} TLS handshakes)'
+			)
+
+
+client_pool = HttpClientPool()
@@ -14,6 +14,7 @@ from pydantic import BaseModel
 from browser_use.llm.base import BaseChatModel
 from browser_use.llm.exceptions import ModelProviderError, ModelRateLimitError
 from browser_use.llm.messages import BaseMessage
+from browser_use.llm.openai.client_pool import client_pool
 from browser_use.llm.openrouter.serializer import OpenRouterMessageSerializer
 from browser_use.llm.schema import SchemaOptimizer
 from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
@@ -87,9 +88,21 @@ class ChatOpenRouter(BaseChatModel):
 		"""
 		if not hasattr(self, '_client'):
 			client_params = self._get_client_params()
+			if 'http_client' not in client_params:
+				# Lease a pooled HTTP client so connections stay warm across calls
+				self._pool_key, client_params['http_client'] = client_pool.acquire(base_url=self.base_url, api_key=self.api_key)
 			self._client = AsyncOpenAI(**client_params)
 		return self._client
 
+	async def aclose(self) -> None:
+		"""Release the pooled connection, the next call transparently acquires a new one."""
+		if hasattr(self, '_client'):
+			del self._client
+		pool_key = getattr(self, '_pool_key', None)
+		self._pool_key = None
+		if pool_key is not None:
+			await client_pool.release(pool_key)
+
 	@property
 	def name(self) -> str:
 		return str(self.model)
@@ -2,14 +2,88 @@
 Utilities for creating optimized Pydantic schemas for LLM usage.
 """
 
+import json
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
 from pydantic import BaseModel
 
 
+@dataclass
+class SchemaCacheStats:
+	"""Counters of the optimized schema cache, process-wide (`SchemaOptimizer.stats`) or per task (`track_schema_stats`)."""
+
+	hits: int = 0
+	misses: int = 0
+	build_seconds: float = 0.0
+
+
+# Optimized schemas serialized to JSON, keyed by model class. The agent reuses its AgentOutput class for as long as the
+# available actions don't change, so after the first request every provider call is a dict lookup plus json.loads()
+# (which also hands each caller its own copy to modify). Weak keys let models that are no longer used be collected.
+_optimized_schemas: 'weakref.WeakKeyDictionary[type[BaseModel], str]' = weakref.WeakKeyDictionary()
+_gemini_schemas: 'weakref.WeakKeyDictionary[type[BaseModel], str]' = weakref.WeakKeyDictionary()
+
+_task_stats: ContextVar[SchemaCacheStats | None] = ContextVar('schema_cache_task_stats', default=None)
+
+
+@contextmanager
+def track_schema_stats() -> Iterator[SchemaCacheStats]:
+	"""Count the schema cache work done by the current task (and the tasks it starts) separately from other tasks."""
+	stats = SchemaCacheStats()
+	token = _task_stats.set(stats)
+	try:
+		yield stats
+	finally:
+		_task_stats.reset(token)
+
+
+def _cached_schema(
+	cache: 'weakref.WeakKeyDictionary[type[BaseModel], str]',
+	model: type[BaseModel],
+	build: Callable[[type[BaseModel]], dict[str, Any]],
+) -> dict[str, Any]:
+	task_stats = _task_stats.get()
+	if (cached := cache.get(model)) is not None:
+		SchemaOptimizer.stats.hits += 1
+		if task_stats is not None:
+			task_stats.hits += 1
+		return json.loads(cached)
+
+	stats = SchemaOptimizer.stats
+	nested_seconds = stats.build_seconds
+	start = time.perf_counter()
+	schema = build(model)
+	cache[model] = json.dumps(schema)
+	# the Gemini schema is built from the cached standard schema, don't count that build twice
+	seconds = (time.perf_counter() - start) - (stats.build_seconds - nested_seconds)
+	stats.misses += 1
+	stats.build_seconds += seconds
+	if task_stats is not None:
+		task_stats.misses += 1
+		task_stats.build_seconds += seconds
+	return schema
+
+
 class SchemaOptimizer:
+	stats = SchemaCacheStats()
+
 	@staticmethod
 	def create_optimized_json_schema(model: type[BaseModel]) -> dict[str, Any]:
+		"""
+		Optimized JSON schema of the model (see `_build_optimized_json_schema`), built once per model class.
+
+		Returns a fresh copy on every call, so callers may modify it.
+		"""
+		return _cached_schema(_optimized_schemas, model, SchemaOptimizer._build_optimized_json_schema)
+
+	@staticmethod
+	def _build_optimized_json_schema(model: type[BaseModel]) -> dict[str, Any]:
 		"""
 		Create the most optimized schema by flattening all $ref/$defs while preserving
 		FULL descriptions and ALL action definitions. Also ensures OpenAI strict mode compatibility.
@@ -173,6 +247,10 @@ class SchemaOptimizer:
 		Returns:
 			Optimized schema without required arrays
 		"""
+		return _cached_schema(_gemini_schemas, model, SchemaOptimizer._build_gemini_optimized_schema)
+
+	@staticmethod
+	def _build_gemini_optimized_schema(model: type[BaseModel]) -> dict[str, Any]:
 		# Start with standard optimized schema
 		schema = SchemaOptimizer.create_optimized_json_schema(model)
 
@@ -0,0 +1,127 @@
+"""
+Streaming structured output.
+
+Chat models that implement `astream` yield the JSON document of a structured output piece by piece while it is
+generated. `JSONArrayStreamParser` picks complete elements of one top-level array out of that stream, so the agent can
+start executing the first action while the model is still writing the next ones.
+"""
+
+import json
+from collections.abc import AsyncGenerator
+from typing import Any, Protocol, runtime_checkable
+
+from pydantic import BaseModel
+
+from browser_use.llm.messages import BaseMessage
+from browser_use.llm.views import ChatInvokeStreamChunk
+
+
+@runtime_checkable
+class StreamingChatModel(Protocol):
+	"""A chat model that can stream the JSON text of a structured output (OpenAI, Anthropic, Google, Groq)."""
+
+	model: str
+
+	def astream(
+		self, messages: list[BaseMessage], output_format: type[BaseModel]
+	) -> AsyncGenerator[ChatInvokeStreamChunk, None]: ...
+
+
+class JSONArrayStreamParser:
+	"""
+	Incremental parser for a JSON object whose `key` member is an array of objects.
+
+	`feed` returns the array elements completed by the new text. Text around the top-level object (e.g. markdown fences)
+	is ignored. Every character is scanned once, so feeding a long completion token by token stays linear.
+	"""
+
+	def __init__(self, key: str):
+		self.key = key
+		self.text = ''
+		self._pos = 0
+		self._depth = 0
+		self._in_string = False
+		self._escaped = False
+		self._string_start = -1
+		self._last_string = ''
+		self._start = -1  # index of the top-level '{'
+		self._end = -1  # index after the top-level '}'
+		self._array_start = -1  # index of the '[' of the array
+		self._array_done = False
+		self._element_start = -1
+
+	@property
+	def document(self) -> str:
+		"""The top-level JSON object, complete once the stream is finished."""
+		if self._start < 0:
+			return self.text
+		return self.text[self._start : self._end if self.complete else len(self.text)]
+
+	@property
+	def complete(self) -> bool:
+		"""Whether the top-level object has been closed."""
+		return self._end >= 0
+
+	@property
+	def array_started(self) -> bool:
+		return self._array_start >= 0
+
+	def fields_before_array(self) -> dict[str, Any]:
+		"""The members of the top-level object that precede the array, once the array has started."""
+		if not self.array_started:
+			return {}
+		data = json.loads(self.text[self._start : self._array_start] + '[]}')
+		data.pop(self.key, None)
+		return data
+
+	def feed(self, delta: str) -> list[Any]:
+		"""Add the next piece of the stream, returning the array elements it completed."""
+		self.text += delta
+		completed: list[Any] = []
+		text = self.text
+
+		for i in range(self._pos, len(text)):
+			char = text[i]
+			if self.complete:
+				break
+
+			if self._in_string:
+				if self._escaped:
+					self._escaped = False
+				elif char == '\\':
+					self._escaped = True
+				elif char == '"':
+					self._in_string = False
+					if self._depth == 1:
+						self._last_string = text[self._string_start + 1 : i]
+				continue
+
+			if char == '"':
+				if self._depth > 0:
+					self._in_string = True
+					self._string_start = i
+			elif char in '{[':
+				if self._depth == 0:
+					if char == '{':
+						self._start = i
+						self._depth = 1
+					continue
+				if self._depth == 1 and char == '[' and self._last_string == self.key and not self.array_started:
+					self._array_start = i
+				elif self._depth == 2 and char == '{' and self.array_started and not self._array_done:
+					self._element_start = i
+				self._depth += 1
+			elif char in '}]':
+				if self._depth == 0:
+					continue
+				self._depth -= 1
+				if self._depth == 2 and char == '}' and self._element_start >= 0:
+					completed.append(json.loads(text[self._element_start : i + 1]))
+					self._element_start = -1
+				elif self._depth == 1 and char == ']' and self.array_started:
+					self._array_done = True
+				elif self._depth == 0:
+					self._end = i + 1
+
+		self._pos = len(text)
+		return completed
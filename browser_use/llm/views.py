@@ -46,3 +46,17 @@ class ChatInvokeCompletion(BaseModel, Generic[T]):
 
 	stop_reason: str | None = None
 	"""The reason the model stopped generating. Common values: 'end_turn', 'max_tokens', 'stop_sequence'."""
+
+
+class ChatInvokeStreamChunk(BaseModel):
+	"""
+	A piece of a streamed chat model invocation.
+	"""
+
+	delta: str = ''
+	"""Newly generated text, for structured output the next piece of the JSON document."""
+
+	usage: ChatInvokeUsage | None = None
+	"""The usage of the whole invocation, set on the last chunk if the provider reports it."""
+
+	stop_reason: str | None = None
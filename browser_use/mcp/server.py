@@ -874,7 +874,7 @@ class BrowserUseServer:
 			result['interactive_elements'].append(elem_info)
 
 		if include_screenshot and state.screenshot:
-			result['screenshot'] = state.screenshot
+			result['screenshot'] = state.screenshot.base64
 
 		return json.dumps(result, indent=2)
 
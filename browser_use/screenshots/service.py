@@ -2,12 +2,12 @@
 Screenshot storage service for browser-use agents.
 """
 
-import base64
 from pathlib import Path
 
 import anyio
 
 from browser_use.observability import observe_debug
+from browser_use.screenshots.views import Screenshot
 
 
 class ScreenshotService:
@@ -22,16 +22,15 @@ class ScreenshotService:
 		self.screenshots_dir.mkdir(parents=True, exist_ok=True)
 
 	@observe_debug(ignore_input=True, ignore_output=True, name='store_screenshot')
-	async def store_screenshot(self, screenshot_b64: str, step_number: int) -> str:
-		"""Store screenshot to disk and return the full path as string"""
+	async def store_screenshot(self, screenshot: Screenshot | str, step_number: int) -> str:
+		"""Store screenshot (handle or base64 string) to disk and return the full path as string"""
 		screenshot_filename = f'step_{step_number}.png'
 		screenshot_path = self.screenshots_dir / screenshot_filename
 
-		# Decode base64 and save to disk
-		screenshot_data = base64.b64decode(screenshot_b64)
+		screenshot = Screenshot.coerce(screenshot) or Screenshot(b'')
 
 		async with await anyio.open_file(screenshot_path, 'wb') as f:
-			await f.write(screenshot_data)
+			await f.write(screenshot.data)
 
 		return str(screenshot_path)
 
@@ -49,4 +48,4 @@ class ScreenshotService:
 		async with await anyio.open_file(path, 'rb') as f:
 			screenshot_data = await f.read()
 
-		return base64.b64encode(screenshot_data).decode('utf-8')
+		return Screenshot(screenshot_data).base64
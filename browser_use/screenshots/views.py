@@ -0,0 +1,194 @@
+"""
+Screenshot handle passed from the browser to the LLM, the history and the GIF.
+
+CDP sends a screenshot as base64 text, the LLM and JSON payloads want base64 text, disk and image processing want bytes.
+`Screenshot` keeps whichever form it was created from (the base64 string CDP sent, raw bytes, or a file on disk) and
+derives the other one only when somebody asks for it, so a screenshot is not decoded and re-encoded on every hop and
+screenshots stored on disk are only read when they are used.
+"""
+
+import base64
+import binascii
+import io
+from pathlib import Path
+from typing import Any, Literal
+
+ImageFormat = Literal['jpeg', 'png', 'webp']
+
+# Largest (width, height) the providers use without downscaling the image themselves, bigger screenshots only cost
+# upload time and encoding. Anthropic resizes images with a long edge over 1568px, OpenAI (high detail) scales the
+# short side of a landscape image to 768px.
+PROVIDER_SCREENSHOT_SIZES: dict[str, tuple[int, int]] = {
+	'anthropic': (1568, 1568),
+	'openai': (2048, 768),
+}
+
+# (magic prefix, mime type) of the formats Chrome can capture
+_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+	(b'\xff\xd8\xff', 'image/jpeg'),
+	(b'\x89PNG\r\n\x1a\n', 'image/png'),
+	(b'RIFF', 'image/webp'),
+)
+
+
+def _sniff_mime_type(data: bytes | memoryview) -> str | None:
+	header = bytes(data[:12])
+	for signature, mime_type in _SIGNATURES:
+		if header.startswith(signature):
+			return mime_type
+	return None
+
+
+class Screenshot:
+	"""An encoded screenshot image (JPEG, PNG or WebP) with lazy conversion between bytes and base64.
+
+	Converts to its base64 text with `str()`, so it can be used where a base64 screenshot string used to be.
+	"""
+
+	__slots__ = ('_data', '_base64', '_path', '_mime_type')
+
+	def __init__(
+		self,
+		data: bytes | memoryview | None = None,
+		mime_type: str | None = None,
+		*,
+		base64_data: str | None = None,
+		path: Path | None = None,
+	):
+		self._data = data
+		self._base64 = base64_data
+		self._path = path
+		self._mime_type = mime_type
+
+	@classmethod
+	def from_base64(cls, data: str, mime_type: str | None = None) -> 'Screenshot':
+		"""Wrap base64 text (e.g. from Page.captureScreenshot) without decoding it yet"""
+		return cls(mime_type=mime_type, base64_data=data)
+
+	@classmethod
+	def from_file(cls, path: str | Path, mime_type: str | None = None) -> 'Screenshot':
+		"""Screenshot stored on disk, read on first access"""
+		return cls(mime_type=mime_type, path=Path(path))
+
+	@classmethod
+	def coerce(cls, value: 'Screenshot | str | bytes | None') -> 'Screenshot | None':
+		"""Accept the base64 strings and bytes screenshots used to be passed around as"""
+		if value is None or isinstance(value, Screenshot):
+			return value
+		if not value:
+			return None
+		if isinstance(value, str):
+			return cls.from_base64(value)
+		return cls(bytes(value))
+
+	@classmethod
+	def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> Any:
+		"""Validate Screenshot instances (and base64 strings or bytes, converted) in pydantic models and event results"""
+		from pydantic_core import core_schema
+
+		return core_schema.no_info_plain_validator_function(
+			cls._validate,
+			serialization=core_schema.plain_serializer_function_ser_schema(str, when_used='json'),
+		)
+
+	@classmethod
+	def _validate(cls, value: Any) -> 'Screenshot | None':
+		if value is None or isinstance(value, (Screenshot, str, bytes)):
+			return cls.coerce(value)
+		raise ValueError(f'expected a Screenshot, base64 str or bytes, got {type(value).__name__}')
+
+	@property
+	def data(self) -> bytes | memoryview:
+		"""The encoded image bytes"""
+		if self._data is None:
+			if self._base64 is not None:
+				self._data = base64.b64decode(self._base64)
+			elif self._path is not None:
+				self._data = self._path.read_bytes()
+			else:
+				self._data = b''
+		return self._data
+
+	@property
+	def base64(self) -> str:
+		"""The image as base64 text, encoded once on first use"""
+		if self._base64 is None:
+			self._base64 = base64.b64encode(self.data).decode('ascii')
+		return self._base64
+
+	@property
+	def mime_type(self) -> str:
+		if self._mime_type is None:
+			if self._data is None and self._base64 is not None:
+				# 16 base64 chars decode to the 12 header bytes, no need to decode the whole image
+				try:
+					self._mime_type = _sniff_mime_type(base64.b64decode(self._base64[:16]))
+				except (binascii.Error, ValueError):
+					pass
+			else:
+				self._mime_type = _sniff_mime_type(self.data)
+			self._mime_type = self._mime_type or 'image/png'
+		return self._mime_type
+
+	@property
+	def data_url(self) -> str:
+		return f'data:{self.mime_type};base64,{self.base64}'
+
+	@property
+	def size(self) -> int:
+		"""Size of the encoded image in bytes, computed without decoding"""
+		if self._data is not None:
+			return len(self._data)
+		if self._base64 is not None:
+			return len(self._base64) * 3 // 4 - self._base64[-2:].count('=')
+		if self._path is not None:
+			return self._path.stat().st_size
+		return 0
+
+	def resized(self, max_size: tuple[int, int] | None = None, format: ImageFormat = 'webp', quality: int = 80) -> 'Screenshot':
+		"""Downscale to fit into max_size (width, height) keeping the aspect ratio, and re-encode (WebP by default)"""
+		from PIL import Image
+
+		with Image.open(io.BytesIO(self.data)) as image:
+			if max_size is not None and (image.width > max_size[0] or image.height > max_size[1]):
+				image.thumbnail(max_size, Image.Resampling.LANCZOS)
+			if format == 'jpeg' and image.mode not in ('RGB', 'L'):
+				image = image.convert('RGB')
+			output = io.BytesIO()
+			image.save(output, format=format.upper(), quality=quality)
+		return Screenshot(output.getvalue(), f'image/{format}')
+
+	def __bool__(self) -> bool:
+		return self.size > 0
+
+	def __len__(self) -> int:
+		"""Length of the base64 text, like the str this handle replaces"""
+		if self._base64 is not None:
+			return len(self._base64)
+		return (self.size + 2) // 3 * 4
+
+	def __str__(self) -> str:
+		return self.base64
+
+	def __repr__(self) -> str:
+		source = f'path={str(self._path)!r}' if self._path is not None else f'size={self.size}'
+		return f'Screenshot({source}, mime_type={self._mime_type!r})'
+
+	def __eq__(self, other: object) -> bool:
+		if isinstance(other, Screenshot):
+			if self._base64 is not None and other._base64 is not None:
+				return self._base64 == other._base64
+			return self.size == other.size and self.data == other.data
+		if isinstance(other, str):
+			if self._base64 is not None:
+				return self._base64 == other
+			# compare the cheap way round: decode the (usually short) string rather than encoding the image
+			if len(other) != len(self):
+				return False
+			try:
+				return self.data == base64.b64decode(other)
+			except (binascii.Error, ValueError):
+				return False
+		return NotImplemented
+
+	__hash__ = None  # type: ignore[assignment]
@@ -1,10 +1,26 @@
 """
 Cloud sync service for sending events to the Browser Use cloud.
+
+Events are queued and shipped in batches by a background flusher over one long-lived HTTP client, so the agent loop
+never waits on the cloud endpoint. Batches that can't be delivered (offline or failing endpoint) are appended to a local
+spool file and replayed, in order, once the endpoint is reachable again. The spool is shared by every process using
+the same config dir: appends hold a file lock, and a replay first claims the whole spool by renaming it, so two processes
+never replay the same events or lose each other's appends.
 """
 
+import asyncio
+import json
 import logging
+import os
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Any, Literal
 
 import httpx
+import portalocker
+import psutil
 from bubus import BaseEvent
 
 from browser_use.config import CONFIG
@@ -12,11 +28,30 @@ from browser_use.sync.auth import TEMP_USER_ID, DeviceAuthClient
 
 logger = logging.getLogger(__name__)
 
+# The spool is a safety net for short outages, not an archive
+MAX_SPOOL_BYTES = 50 * 1024 * 1024
+# How long an append or a spool claim waits for another process holding the spool lock
+SPOOL_LOCK_TIMEOUT_SECONDS = 10.0
+# How long to wait before retrying after a failed delivery, doubled on every consecutive failure
+RETRY_BACKOFF_SECONDS = 5.0
+MAX_RETRY_BACKOFF_SECONDS = 300.0
+
 
 class CloudSync:
 	"""Service for syncing events to the Browser Use cloud"""
 
-	def __init__(self, base_url: str | None = None, allow_session_events_for_auth: bool = False):
+	def __init__(
+		self,
+		base_url: str | None = None,
+		allow_session_events_for_auth: bool = False,
+		batch_size: int = 50,
+		flush_interval: float = 1.0,
+		max_queue_size: int = 1000,
+		overflow_policy: Literal['drop_oldest', 'block'] = 'drop_oldest',
+		spool_path: str | Path | None = None,
+		use_spool: bool = True,
+		request_timeout: float = 10.0,
+	):
 		# Backend API URL for all API requests - can be passed directly or defaults to env var
 		self.base_url = base_url or CONFIG.BROWSER_USE_CLOUD_API_URL
 		self.auth_client = DeviceAuthClient(base_url=self.base_url)
@@ -26,6 +61,30 @@ class CloudSync:
 		# Check if cloud sync is actually enabled - if not, we should remain silent
 		self.enabled = CONFIG.BROWSER_USE_CLOUD_SYNC
 
+		# Batching: a batch is shipped once batch_size events are queued or flush_interval seconds after its first event
+		self.batch_size = batch_size
+		self.flush_interval = flush_interval
+		# Backpressure: when max_queue_size events are waiting, either drop the oldest one or make the producer wait
+		self.max_queue_size = max_queue_size
+		self.overflow_policy = overflow_policy
+		self.spool_path = Path(spool_path) if spool_path else CONFIG.BROWSER_USE_CONFIG_DIR / 'events' / 'cloud_sync_spool.jsonl'
+		self.use_spool = use_spool
+		self.request_timeout = request_timeout
+
+		self.sent_events = 0
+		self.dropped_events = 0
+		self.spooled_events = 0
+
+		self._queue: deque[dict[str, Any]] = deque()
+		self._wake = asyncio.Event()
+		self._space_available = asyncio.Event()
+		self._flush_lock = asyncio.Lock()
+		self._flusher_task: asyncio.Task | None = None
+		self._client: httpx.AsyncClient | None = None
+		self._retry_at = 0.0
+		self._retry_backoff = RETRY_BACKOFF_SECONDS
+		self._claim_token: str | None = None
+
 	async def handle_event(self, event: BaseEvent) -> None:
 		"""Handle an event by sending it to the cloud"""
 		try:
@@ -55,54 +114,244 @@ class CloudSync:
 			logger.error(f'Failed to handle {event.event_type} event: {type(e).__name__}: {e}', exc_info=True)
 
 	async def _send_event(self, event: BaseEvent) -> None:
-		"""Send event to cloud API"""
-		try:
-			headers = {}
-
-			# Override user_id only if it's not already set to a specific value
-			# This allows CLI and other code to explicitly set temp user_id when needed
-			if self.auth_client and self.auth_client.is_authenticated:
-				# Only override if we're fully authenticated and event doesn't have temp user_id
-				current_user_id = getattr(event, 'user_id', None)
-				if current_user_id != TEMP_USER_ID:
-					setattr(event, 'user_id', str(self.auth_client.user_id))
+		"""Queue event for the background flusher"""
+		# Override user_id only if it's not already set to a specific value
+		# This allows CLI and other code to explicitly set temp user_id when needed
+		if self.auth_client and self.auth_client.is_authenticated:
+			# Only override if we're fully authenticated and event doesn't have temp user_id
+			current_user_id = getattr(event, 'user_id', None)
+			if current_user_id != TEMP_USER_ID:
+				setattr(event, 'user_id', str(self.auth_client.user_id))
+		else:
+			# Set temp user_id if not already set
+			if not hasattr(event, 'user_id') or not getattr(event, 'user_id', None):
+				setattr(event, 'user_id', TEMP_USER_ID)
+
+		# Serialize now so later mutations of the event don't leak into what gets shipped, and add device_id to all events
+		event_data = event.model_dump(mode='json')
+		if self.auth_client and self.auth_client.device_id:
+			event_data['device_id'] = self.auth_client.device_id
+
+		while len(self._queue) >= self.max_queue_size:
+			if self.overflow_policy == 'block':
+				self._space_available.clear()
+				self._wake.set()
+				await self._space_available.wait()
 			else:
-				# Set temp user_id if not already set
-				if not hasattr(event, 'user_id') or not getattr(event, 'user_id', None):
-					setattr(event, 'user_id', TEMP_USER_ID)
-
-			# Add auth headers if available
-			if self.auth_client:
-				headers.update(self.auth_client.get_headers())
-
-			# Send event (batch format with direct BaseEvent serialization)
-			async with httpx.AsyncClient() as client:
-				# Serialize event and add device_id to all events
-				event_data = event.model_dump(mode='json')
-				if self.auth_client and self.auth_client.device_id:
-					event_data['device_id'] = self.auth_client.device_id
-
-				response = await client.post(
-					f'{self.base_url.rstrip("/")}/api/v1/events',
-					json={'events': [event_data]},
-					headers=headers,
-					timeout=10.0,
-				)
-
-				if response.status_code >= 400:
-					# Log error but don't raise - we want to fail silently
-					logger.debug(
-						f'Failed to send sync event: POST {response.request.url} {response.status_code} - {response.text}'
-					)
+				dropped = self._queue.popleft()
+				self.dropped_events += 1
+				logger.debug(f'Cloud sync queue full, dropped oldest event {dropped.get("event_type")}')
+
+		self._queue.append(event_data)
+		self._ensure_flusher()
+		# wake the flusher to start the time window of a new batch, or to ship a full one right away
+		if len(self._queue) == 1 or len(self._queue) >= self.batch_size:
+			self._wake.set()
+
+	def _ensure_flusher(self) -> None:
+		if self._flusher_task is None or self._flusher_task.done():
+			self._flusher_task = asyncio.create_task(self._flush_loop(), name='cloud_sync_flusher')
+
+	async def _flush_loop(self) -> None:
+		"""Ship queued events in batches, by size or time window, until cancelled."""
+		while True:
+			await self._wake.wait()
+			self._wake.clear()
+			if len(self._queue) < self.batch_size:
+				try:
+					await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+				except TimeoutError:
+					pass
+				self._wake.clear()
+			try:
+				await self._flush_pending()
+			except Exception as e:
+				logger.debug(f'Unexpected error flushing sync events: {type(e).__name__}: {e}')
+
+	async def flush(self) -> None:
+		"""Ship everything queued (and spooled) now, without waiting for the batch window or retry backoff."""
+		self._retry_at = 0.0
+		await self._flush_pending()
+
+	async def close(self) -> None:
+		"""Flush remaining events, stop the background flusher and close the HTTP client."""
+		try:
+			await self.flush()
+		finally:
+			if self._flusher_task is not None:
+				self._flusher_task.cancel()
+				try:
+					await self._flusher_task
+				except asyncio.CancelledError:
+					pass
+				self._flusher_task = None
+			if self._client is not None:
+				await self._client.aclose()
+				self._client = None
+
+	async def _flush_pending(self) -> None:
+		async with self._flush_lock:
+			# spooled events are older than anything queued, replay them first to keep events in order
+			if self.use_spool and time.monotonic() >= self._retry_at:
+				await self._replay_spool()
+
+			while self._queue:
+				batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+				self._space_available.set()
+				if time.monotonic() < self._retry_at or not await self._post_batch(batch):
+					await self._spool(batch)
+
+	async def _post_batch(self, events: list[dict[str, Any]]) -> bool:
+		"""POST one batch. Returns False if the batch should be retried later (endpoint unreachable or failing)."""
+		# Add auth headers if available
+		headers = self.auth_client.get_headers() if self.auth_client else {}
+		if self._client is None:
+			self._client = httpx.AsyncClient(timeout=self.request_timeout)
+
+		try:
+			response = await self._client.post(
+				f'{self.base_url.rstrip("/")}/api/v1/events',
+				json={'events': events},
+				headers=headers,
+			)
 		except httpx.TimeoutException:
-			logger.debug(f'Event send timed out after 10 seconds: {event}')
-		except httpx.ConnectError as e:
+			logger.debug(f'Sending {len(events)} sync events timed out after {self.request_timeout} seconds')
+			return self._delivery_failed()
+		except httpx.ConnectError:
 			# logger.warning(f'⚠️ Failed to connect to cloud service at {self.base_url}: {e}')
-			pass
+			return self._delivery_failed()
 		except httpx.HTTPError as e:
-			logger.debug(f'HTTP error sending event {event}: {type(e).__name__}: {e}')
-		except Exception as e:
-			logger.debug(f'Unexpected error sending event {event}: {type(e).__name__}: {e}')
+			logger.debug(f'HTTP error sending {len(events)} sync events: {type(e).__name__}: {e}')
+			return self._delivery_failed()
+
+		if response.status_code >= 500:
+			logger.debug(f'Failed to send sync events: POST {response.request.url} {response.status_code} - {response.text}')
+			return self._delivery_failed()
+		if response.status_code >= 400:
+			# Log error but don't raise or retry - the same batch would be rejected again
+			logger.debug(f'Failed to send sync events: POST {response.request.url} {response.status_code} - {response.text}')
+		else:
+			self.sent_events += len(events)
+		self._retry_backoff = RETRY_BACKOFF_SECONDS
+		return True
+
+	def _delivery_failed(self) -> bool:
+		self._retry_at = time.monotonic() + self._retry_backoff
+		self._retry_backoff = min(self._retry_backoff * 2, MAX_RETRY_BACKOFF_SECONDS)
+		return False
+
+	async def _spool(self, events: list[dict[str, Any]]) -> None:
+		"""Append undeliverable events to the spool file, or drop them if spooling is disabled or the spool is full."""
+		if not self.use_spool:
+			self.dropped_events += len(events)
+			return
+		try:
+			written = await asyncio.to_thread(self._append_to_spool, events)
+		except (OSError, portalocker.LockException) as e:
+			logger.debug(f'Failed to spool {len(events)} sync events to {self.spool_path}: {type(e).__name__}: {e}')
+			written = 0
+		self.spooled_events += written
+		self.dropped_events += len(events) - written
+
+	def _spool_lock(self) -> portalocker.Lock:
+		"""Exclusive lock shared by all processes writing the spool, held only for short file operations."""
+		self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+		return portalocker.Lock(self.spool_path.with_name(self.spool_path.name + '.lock'), timeout=SPOOL_LOCK_TIMEOUT_SECONDS)
+
+	def _append_to_spool(self, events: list[dict[str, Any]]) -> int:
+		with self._spool_lock():
+			if self.spool_path.exists() and self.spool_path.stat().st_size >= MAX_SPOOL_BYTES:
+				return 0
+			with self.spool_path.open('a', encoding='utf-8') as f:
+				f.writelines(json.dumps(event) + '\n' for event in events)
+		return len(events)
+
+	async def _replay_spool(self) -> None:
+		"""Re-send spooled events in batches, putting whatever still can't be delivered back in front of the spool."""
+		try:
+			lines = await asyncio.to_thread(self._claim_spool)
+		except (OSError, portalocker.LockException) as e:
+			logger.debug(f'Failed to read sync event spool {self.spool_path}: {type(e).__name__}: {e}')
+			return
+		if not lines:
+			return
+
+		delivered = 0
+		while delivered < len(lines):
+			batch = lines[delivered : delivered + self.batch_size]
+			events: list[dict[str, Any]] = []
+			for line in batch:
+				try:
+					events.append(json.loads(line))
+				except json.JSONDecodeError:
+					pass  # a partially written line from a crash, nothing to recover
+			if events and not await self._post_batch(events):
+				break
+			delivered += len(batch)
+
+		self.spooled_events = max(self.spooled_events - delivered, 0)
+		try:
+			await asyncio.to_thread(self._release_spool_claim, lines[delivered:])
+		except (OSError, portalocker.LockException) as e:
+			# the claim file stays on disk and is adopted by the next replay once this process is gone
+			logger.debug(
+				f'Failed to put {len(lines) - delivered} sync events back into {self.spool_path}: {type(e).__name__}: {e}'
+			)
+
+	@property
+	def _claim_path(self) -> Path:
+		# one claim per CloudSync instance, the pid lets other processes adopt it if this one dies mid-replay
+		if self._claim_token is None:
+			self._claim_token = uuid.uuid4().hex[:8]
+		return self.spool_path.with_name(f'{self.spool_path.name}.{os.getpid()}.{self._claim_token}.replaying')
+
+	def _orphaned_claims(self) -> list[Path]:
+		"""Claims left behind by processes that died while replaying, oldest first."""
+		orphans: list[tuple[float, Path]] = []
+		for path in self.spool_path.parent.glob(f'{self.spool_path.name}.*.*.replaying'):
+			pid = path.name[len(self.spool_path.name) + 1 :].split('.', 1)[0]
+			if pid.isdigit() and not psutil.pid_exists(int(pid)):
+				orphans.append((path.stat().st_mtime, path))
+		return [path for _, path in sorted(orphans)]
+
+	def _spool_sources(self) -> list[Path]:
+		"""Files to replay, oldest events first: orphaned claims, a claim of ours that could not be released, the spool."""
+		return self._orphaned_claims() + [path for path in (self._claim_path, self.spool_path) if path.exists()]
+
+	def _claim_spool(self) -> list[str]:
+		"""Take the spool (and orphaned claims) over for this replay, so no other process replays the same events."""
+		if not self._spool_sources():
+			return []  # nothing to replay, don't touch the lock
+		with self._spool_lock():
+			sources = self._spool_sources()
+			lines: list[str] = []
+			for path in sources:
+				lines.extend(line for line in path.read_text(encoding='utf-8').splitlines() if line.strip())
+			if not lines:
+				for path in sources:
+					path.unlink(missing_ok=True)
+				return []
+			self._write_atomically(self._claim_path, lines)
+			for path in sources:
+				path.unlink(missing_ok=True)
+		return lines
+
+	def _release_spool_claim(self, remaining: list[str]) -> None:
+		"""Put undelivered events back in front of whatever other processes spooled meanwhile, then drop the claim."""
+		with self._spool_lock():
+			if remaining:
+				if self.spool_path.exists():
+					remaining = remaining + [
+						line for line in self.spool_path.read_text(encoding='utf-8').splitlines() if line.strip()
+					]
+				self._write_atomically(self.spool_path, remaining)
+			self._claim_path.unlink(missing_ok=True)
+
+	@staticmethod
+	def _write_atomically(path: Path, lines: list[str]) -> None:
+		tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp')
+		tmp_path.write_text(''.join(line + '\n' for line in lines), encoding='utf-8')
+		os.replace(tmp_path, path)
 
 	# async def _update_wal_user_ids(self, session_id: str) -> None:
 	# 	"""Update user IDs in WAL file after authentication"""
@@ -8,6 +8,7 @@ Automatically tracks token usage when LLMs are registered and invoked.
 import asyncio
 import logging
 import os
+from contextlib import aclosing
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -22,6 +23,7 @@ from browser_use.tokens.custom_pricing import CUSTOM_MODEL_PRICING
 from browser_use.tokens.mappings import MODEL_TO_LITELLM
 from browser_use.tokens.views import (
 	CachedPricingData,
+	ModelCacheStats,
 	ModelPricing,
 	ModelUsageStats,
 	ModelUsageTokens,
@@ -57,6 +59,7 @@ class TokenCost:
 
 		self.usage_history: list[TokenUsageEntry] = []
 		self.registered_llms: dict[str, BaseChatModel] = {}
+		self.cache_stats: dict[str, ModelCacheStats] = {}
 		self._pricing_data: dict[str, Any] | None = None
 		self._initialized = False
 		self._cache_dir = xdg_cache_home() / self.CACHE_DIR_NAME
@@ -236,6 +239,17 @@ class TokenCost:
 
 		return entry
 
+	def record_cache_lookup(self, model: str, hit: bool, usage: ChatInvokeUsage | None = None) -> None:
+		"""Count a response cache lookup, `usage` is the usage of the original call a hit replays"""
+		stats = self.cache_stats.setdefault(model, ModelCacheStats(model=model))
+		if not hit:
+			stats.misses += 1
+			return
+		stats.hits += 1
+		if usage:
+			stats.saved_prompt_tokens += usage.prompt_tokens
+			stats.saved_completion_tokens += usage.completion_tokens
+
 	# async def _log_non_usage_llm(self, llm: BaseChatModel) -> None:
 	# 	"""Log non-usage to the logger"""
 	# 	C_CYAN = '\033[96m'
@@ -330,6 +344,11 @@ class TokenCost:
 
 		self.registered_llms[instance_id] = llm
 
+		from browser_use.llm.cache.chat import ChatCached
+
+		if isinstance(llm, ChatCached) and llm.on_lookup is None:
+			llm.on_lookup = self.record_cache_lookup
+
 		# Store the original method
 		original_ainvoke = llm.ainvoke
 		# Store reference to self for use in the closure
@@ -358,6 +377,20 @@ class TokenCost:
 		# Using setattr to avoid type checking issues with overloaded methods
 		setattr(llm, 'ainvoke', tracked_ainvoke)
 
+		# Streamed completions report their usage on the last chunk
+		original_astream = getattr(llm, 'astream', None)
+		if original_astream is not None:
+
+			async def tracked_astream(messages, output_format, **kwargs):
+				async with aclosing(original_astream(messages, output_format, **kwargs)) as stream:
+					async for chunk in stream:
+						if chunk.usage:
+							usage = token_cost_service.add_usage(llm.model, chunk.usage)
+							asyncio.create_task(token_cost_service._log_usage(llm.model, usage))
+						yield chunk
+
+			setattr(llm, 'astream', tracked_astream)
+
 		return llm
 
 	def get_usage_tokens_for_model(self, model: str) -> ModelUsageTokens:
@@ -414,6 +447,8 @@ class TokenCost:
 
 			stats = model_stats[entry.model]
 			stats.prompt_tokens += entry.usage.prompt_tokens
+			stats.prompt_cached_tokens += entry.usage.prompt_cached_tokens or 0
+			stats.prompt_cache_creation_tokens += entry.usage.prompt_cache_creation_tokens or 0
 			stats.completion_tokens += entry.usage.completion_tokens
 			stats.total_tokens += entry.usage.prompt_tokens + entry.usage.completion_tokens
 			stats.invocations += 1
@@ -457,6 +492,13 @@ class TokenCost:
 
 	async def log_usage_summary(self) -> None:
 		"""Log a comprehensive usage summary per model with colors and nice formatting"""
+		for stats in self.cache_stats.values():
+			saved_fmt = self._format_tokens(stats.saved_prompt_tokens + stats.saved_completion_tokens)
+			cost_logger.debug(
+				f'  💾 {stats.model} response cache: {stats.hits} hits | {stats.misses} misses | '
+				f'{stats.hit_rate:.0%} hit rate | {saved_fmt} tokens saved'
+			)
+
 		if not self.usage_history:
 			return
 
@@ -493,6 +535,7 @@ class TokenCost:
 			cost_logger.debug(
 				f'💲 {C_BOLD}Total Usage Summary{C_RESET}: {C_BLUE}{total_tokens_fmt} tokens{C_RESET}{total_cost_part} | '
 				f'⬅️ {C_YELLOW}{prompt_tokens_fmt}{prompt_cost_part}{C_RESET} | ➡️ {C_GREEN}{completion_tokens_fmt}{completion_cost_part}{C_RESET}'
+				+ (f' | 🗄️ {summary.prompt_cache_hit_rate:.0%} cached' if summary.total_prompt_cached_tokens else '')
 			)
 
 		for model, stats in summary.by_model.items():
@@ -536,6 +579,7 @@ class TokenCost:
 				f'  🤖 {C_CYAN}{model}{C_RESET}: {C_BLUE}{model_total_fmt} tokens{C_RESET}{cost_part} | '
 				f'⬅️ {prompt_part} | ➡️ {completion_part} | '
 				f'📞 {stats.invocations} calls | 📈 {avg_tokens_fmt}/call'
+				+ (f' | 🗄️ {stats.prompt_cache_hit_rate:.0%} cached' if stats.prompt_cached_tokens else '')
 			)
 
 	async def get_cost_by_model(self) -> dict[str, ModelUsageStats]:
@@ -546,6 +590,7 @@ class TokenCost:
 	def clear_history(self) -> None:
 		"""Clear usage history"""
 		self.usage_history = []
+		self.cache_stats = {}
 
 	async def refresh_pricing_data(self) -> None:
 		"""Force refresh of pricing data from GitHub"""
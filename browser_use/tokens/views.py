@@ -73,12 +73,34 @@ class ModelUsageStats(BaseModel):
 
 	model: str
 	prompt_tokens: int = 0
+	prompt_cached_tokens: int = 0
+	prompt_cache_creation_tokens: int = 0
 	completion_tokens: int = 0
 	total_tokens: int = 0
 	cost: float = 0.0
 	invocations: int = 0
 	average_tokens_per_invocation: float = 0.0
 
+	@property
+	def prompt_cache_hit_rate(self) -> float:
+		"""Share of prompt tokens served from the provider's prompt cache"""
+		return self.prompt_cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+
+class ModelCacheStats(BaseModel):
+	"""Response cache statistics for a single model (see `ChatCached`)"""
+
+	model: str
+	hits: int = 0
+	misses: int = 0
+	saved_prompt_tokens: int = 0
+	saved_completion_tokens: int = 0
+
+	@property
+	def hit_rate(self) -> float:
+		lookups = self.hits + self.misses
+		return self.hits / lookups if lookups else 0.0
+
 
 class ModelUsageTokens(BaseModel):
 	"""Usage tokens for a single model"""
@@ -106,3 +128,8 @@ class UsageSummary(BaseModel):
 	entry_count: int
 
 	by_model: dict[str, ModelUsageStats] = Field(default_factory=dict)
+
+	@property
+	def prompt_cache_hit_rate(self) -> float:
+		"""Share of prompt tokens served from the providers' prompt caches"""
+		return self.total_prompt_cached_tokens / self.total_prompt_tokens if self.total_prompt_tokens else 0.0
@@ -36,6 +36,10 @@ class Registry(Generic[Context]):
 		self.registry = ActionRegistry()
 		self.telemetry = ProductTelemetry()
 		self.exclude_actions = exclude_actions if exclude_actions is not None else []
+		# Action models by the names of the actions they contain, see create_action_model()
+		self._action_models: dict[tuple[str, ...], tuple[tuple[RegisteredAction, ...], type[ActionModel]]] = {}
+		self.action_model_cache_hits = 0
+		self.action_model_cache_misses = 0
 
 	def _get_special_param_types(self) -> dict[str, type | UnionType | None]:
 		"""Get the expected types for special parameters from SpecialActionParameters"""
@@ -481,9 +485,10 @@ class Registry(Generic[Context]):
 
 		Each action model contains only the specific action being used,
 		rather than all actions with most set to None.
-		"""
-		from typing import Union
 
+		Models are cached by the set of actions that survive the filters, so the agent gets the same class back on every
+		step until the available actions change (which in turn keeps the provider schema caches warm).
+		"""
 		# Filter actions based on page_url if provided:
 		#   if page_url is None, only include actions with no filters
 		#   if page_url is provided, only include actions that match the URL
@@ -506,6 +511,22 @@ class Registry(Generic[Context]):
 			if domain_is_allowed:
 				available_actions[name] = action
 
+		key = tuple(available_actions)
+		actions = tuple(available_actions.values())
+		cached = self._action_models.get(key)
+		# an action re-registered under the same name needs a new model
+		if cached is not None and all(a is b for a, b in zip(cached[0], actions)):
+			self.action_model_cache_hits += 1
+			return cached[1]
+
+		self.action_model_cache_misses += 1
+		action_model = self._build_action_model(available_actions)
+		self._action_models[key] = (actions, action_model)
+		return action_model
+
+	def _build_action_model(self, available_actions: dict[str, RegisteredAction]) -> type[ActionModel]:
+		from typing import Union
+
 		# Create individual action models for each action
 		individual_action_models: list[type[BaseModel]] = []
 
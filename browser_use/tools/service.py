@@ -99,15 +99,72 @@ def handle_browser_error(e: BrowserError) -> ActionResult:
 	raise e
 
 
+async def _map_reduce_extract(
+	page_extraction_llm: BaseChatModel,
+	query: str,
+	stats_summary: str,
+	chunks: list[str],
+	system_prompt: str,
+	max_concurrency: int,
+) -> str:
+	"""Extract from each chunk of a long page concurrently, then merge the partial results with one final call."""
+	semaphore = asyncio.Semaphore(max_concurrency)
+
+	async def extract_chunk(index: int, chunk: str) -> str:
+		prompt = (
+			f'<query>\n{query}\n</query>\n\n<content_stats>\n{stats_summary}\nThis is part {index + 1} of {len(chunks)} of the page, '
+			'only extract what is in this part.\n</content_stats>\n\n'
+			f'<webpage_content>\n{chunk}\n</webpage_content>'
+		)
+		async with semaphore:
+			response = await asyncio.wait_for(
+				page_extraction_llm.ainvoke([SystemMessage(content=system_prompt), UserMessage(content=prompt)]),
+				timeout=120.0,
+			)
+		return response.completion
+
+	partial_results = await asyncio.gather(*[extract_chunk(index, chunk) for index, chunk in enumerate(chunks)])
+	logger.debug(f'📄 Extracted {len(chunks)} page parts concurrently, merging the results')
+
+	reduce_system_prompt = """
+You are an expert at merging data extracted from consecutive parts of the same webpage.
+
+<instructions>
+- You will be given a query and the results extracted from each part of the page, in page order.
+- Combine them into a single answer to the query, keeping the page order and removing duplicates.
+- ONLY use information present in the partial results. Ignore parts that report the information is unavailable when other parts have it.
+- If the query asks for all items, products, etc., make sure to list all of them from all parts.
+</instructions>
+
+<output>
+- Directly output the merged information (or that it is unavailable), not a conversational answer and not a per-part summary.
+</output>
+""".strip()
+	parts = '\n\n'.join(f'<part index="{index + 1}">\n{result}\n</part>' for index, result in enumerate(partial_results))
+	prompt = f'<query>\n{query}\n</query>\n\n<content_stats>\n{stats_summary}\n</content_stats>\n\n<partial_results>\n{parts}\n</partial_results>'
+	response = await asyncio.wait_for(
+		page_extraction_llm.ainvoke([SystemMessage(content=reduce_system_prompt), UserMessage(content=prompt)]),
+		timeout=120.0,
+	)
+	return response.completion
+
+
 class Tools(Generic[Context]):
 	def __init__(
 		self,
 		exclude_actions: list[str] = [],
 		output_model: type[T] | None = None,
 		display_files_in_done_text: bool = True,
+		extract_max_chunks: int = 1,
+		extract_max_concurrency: int = 4,
 	):
 		self.registry = Registry[Context](exclude_actions)
 		self.display_files_in_done_text = display_files_in_done_text
+		# extract reads one 30k char chunk per action by default, the model pages through longer content with start_from_char.
+		# extract_max_chunks > 1 opts into map-reduce: up to that many chunks are read in one action, costing one
+		# page_extraction_llm call per chunk (at most extract_max_concurrency at once) plus one call to merge the results
+		self.extract_max_chunks = max(1, extract_max_chunks)
+		self.extract_max_concurrency = max(1, extract_max_concurrency)
 
 		"""Register all default browser actions"""
 
@@ -583,13 +640,15 @@ class Tools(Generic[Context]):
 			# Constants
 			MAX_CHAR_LIMIT = 30000
 
-			# Extract clean markdown using the unified method
+			# Page markdown is converted once per unchanged page and only as far as this call reads into it,
+			# so continuing with start_from_char is served from the cache
 			try:
-				from browser_use.dom.markdown_extractor import extract_clean_markdown
+				from browser_use.dom.markdown_extractor import get_page_markdown, split_markdown_chunks
 
-				content, content_stats = await extract_clean_markdown(
-					browser_session=browser_session, extract_links=extract_links
-				)
+				page_markdown = await get_page_markdown(browser_session, extract_links=extract_links)
+				# map-reduce mode reads up to extract_max_chunks chunks in one action
+				content = page_markdown.read(start_from_char + MAX_CHAR_LIMIT * self.extract_max_chunks + 1)
+				content_stats = page_markdown.stats
 			except Exception as e:
 				raise RuntimeError(f'Could not extract clean markdown: {type(e).__name__}')
 
@@ -604,9 +663,24 @@ class Tools(Generic[Context]):
 				content = content[start_from_char:]
 				content_stats['started_from_char'] = start_from_char
 
+			# Long pages are split at line boundaries and extracted chunk by chunk in parallel (map), then merged (reduce)
+			chunks: list[str] = []
+			if len(content) > MAX_CHAR_LIMIT and self.extract_max_chunks > 1:
+				chunks = split_markdown_chunks(content, MAX_CHAR_LIMIT)
+				if len(chunks) == 1:
+					chunks = []
+
 			# Smart truncation with context preservation
 			truncated = False
-			if len(content) > MAX_CHAR_LIMIT:
+			if chunks:
+				if len(chunks) > self.extract_max_chunks:
+					chunks = chunks[: self.extract_max_chunks]
+					truncate_at = sum(len(chunk) for chunk in chunks)
+					truncated = True
+					content_stats['truncated_at_char'] = truncate_at
+					content_stats['next_start_char'] = (start_from_char or 0) + truncate_at
+				content_stats['map_reduce_chunks'] = len(chunks)
+			elif len(content) > MAX_CHAR_LIMIT:
 				# Try to truncate at a natural break point (paragraph, sentence)
 				truncate_at = MAX_CHAR_LIMIT
 
@@ -632,10 +706,15 @@ class Tools(Generic[Context]):
 			chars_filtered = content_stats['filtered_chars_removed']
 
 			stats_summary = f"""Content processed: {original_html_length:,} HTML chars → {initial_markdown_length:,} initial markdown → {final_filtered_length:,} filtered markdown"""
+			if not content_stats['complete']:
+				stats_summary += ' (rest of the page not converted yet)'
 			if start_from_char > 0:
 				stats_summary += f' (started from char {start_from_char:,})'
+			if chunks:
+				stats_summary += f' → extracted in {len(chunks)} parts'
 			if truncated:
-				stats_summary += f' → {len(content):,} final chars (truncated, use start_from_char={content_stats["next_start_char"]} to continue)'
+				final_chars = content_stats['truncated_at_char']
+				stats_summary += f' → {final_chars:,} final chars (truncated, use start_from_char={content_stats["next_start_char"]} to continue)'
 			elif chars_filtered > 0:
 				stats_summary += f' (filtered {chars_filtered:,} chars of noise)'
 
@@ -660,18 +739,21 @@ You will be given a query and the markdown of a webpage that has been filtered t
 </output>
 """.strip()
 
-			prompt = f'<query>\n{query}\n</query>\n\n<content_stats>\n{stats_summary}\n</content_stats>\n\n<webpage_content>\n{content}\n</webpage_content>'
-
 			try:
-				response = await asyncio.wait_for(
-					page_extraction_llm.ainvoke([SystemMessage(content=system_prompt), UserMessage(content=prompt)]),
-					timeout=120.0,
-				)
+				if chunks:
+					completion = await _map_reduce_extract(
+						page_extraction_llm, query, stats_summary, chunks, system_prompt, self.extract_max_concurrency
+					)
+				else:
+					prompt = f'<query>\n{query}\n</query>\n\n<content_stats>\n{stats_summary}\n</content_stats>\n\n<webpage_content>\n{content}\n</webpage_content>'
+					response = await asyncio.wait_for(
+						page_extraction_llm.ainvoke([SystemMessage(content=system_prompt), UserMessage(content=prompt)]),
+						timeout=120.0,
+					)
+					completion = response.completion
 
 				current_url = await browser_session.get_current_page_url()
-				extracted_content = (
-					f'<url>\n{current_url}\n</url>\n<query>\n{query}\n</query>\n<result>\n{response.completion}\n</result>'
-				)
+				extracted_content = f'<url>\n{current_url}\n</url>\n<query>\n{query}\n</query>\n<result>\n{completion}\n</result>'
 
 				# Simple memory handling
 				MAX_MEMORY_LENGTH = 1000
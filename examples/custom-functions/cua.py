@@ -193,14 +193,14 @@ async def openai_cua_fallback(params: OpenAICUAAction, browser_session: BrowserS
 
 		print(f'📐 Viewport size: {page_info.viewport_width}x{page_info.viewport_height}')
 
-		screenshot_b64 = state.screenshot
-		if not screenshot_b64:
+		screenshot = state.screenshot
+		if not screenshot:
 			raise Exception('Screenshot not found - cannot execute CUA action')
 
-		print(f'📸 Screenshot captured (base64 length: {len(screenshot_b64)} chars)')
+		print(f'📸 Screenshot captured ({screenshot.size} bytes)')
 
 		# Debug: Check screenshot dimensions
-		image = Image.open(BytesIO(base64.b64decode(screenshot_b64)))
+		image = Image.open(BytesIO(screenshot.data))
 		print(f'📏 Screenshot actual dimensions: {image.size[0]}x{image.size[1]}')
 
 		# rescale the screenshot to the viewport size
@@ -0,0 +1,222 @@
+"""Test that DOMMutationTracker patches a cached DOM tree from CDP mutation events."""
+
+import logging
+from types import SimpleNamespace
+from typing import Any
+
+from browser_use.dom.mutation_tracker import DOMMutationTracker
+from browser_use.dom.service import DomService
+from browser_use.dom.views import DOMStateDiff, EnhancedAXNode, EnhancedAXProperty, EnhancedDOMTreeNode, NodeType
+
+
+def _make_node(node_id: int, node_name: str, node_type: NodeType = NodeType.ELEMENT_NODE, **kwargs: Any) -> EnhancedDOMTreeNode:
+	return EnhancedDOMTreeNode(
+		node_id=node_id,
+		backend_node_id=node_id + 1000,
+		node_type=node_type,
+		node_name=node_name,
+		node_value=kwargs.get('node_value', ''),
+		attributes=kwargs.get('attributes', {}),
+		is_scrollable=None,
+		is_visible=None,
+		absolute_position=None,
+		target_id='target-1',
+		frame_id=None,
+		session_id='session-1',
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=None,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=None,
+	)
+
+
+def _add_child(parent: EnhancedDOMTreeNode, child: EnhancedDOMTreeNode) -> EnhancedDOMTreeNode:
+	child.parent_node = parent
+	parent.children_nodes = (parent.children_nodes or []) + [child]
+	return child
+
+
+def _build_tracker() -> tuple[DOMMutationTracker, EnhancedDOMTreeNode]:
+	document = _make_node(1, '#document', NodeType.DOCUMENT_NODE)
+	body = _add_child(document, _make_node(2, 'BODY'))
+	button = _add_child(body, _make_node(3, 'BUTTON', attributes={'class': 'old'}))
+	_add_child(button, _make_node(4, '#text', NodeType.TEXT_NODE, node_value='Click'))
+
+	tracker = DOMMutationTracker(target_id='target-1', session_id='session-1')
+	tracker.begin_full_build()
+	assert tracker.finish_full_build(document)
+	return tracker, document
+
+
+def test_attribute_and_text_mutations_patch_nodes_in_place():
+	tracker, _ = _build_tracker()
+
+	tracker.queue_mutation('attributeModified', {'nodeId': 3, 'name': 'class', 'value': 'new'})
+	tracker.queue_mutation('characterDataModified', {'nodeId': 4, 'characterData': 'Submit'})
+	tracker.apply_pending_mutations()
+
+	assert not tracker.needs_full_rebuild
+	assert tracker.node_lookup[3].attributes['class'] == 'new'
+	assert tracker.node_lookup[4].node_value == 'Submit'
+	# the text change invalidates the accessible name of its parent element
+	assert tracker.ax_dirty_node_ids == {3}
+
+
+def test_inserted_and_removed_children_update_tree_and_lookup():
+	tracker, _ = _build_tracker()
+	body = tracker.node_lookup[2]
+
+	tracker.queue_mutation(
+		'childNodeInserted',
+		{
+			'parentNodeId': 2,
+			'previousNodeId': 3,
+			'node': {
+				'nodeId': 10,
+				'backendNodeId': 1010,
+				'nodeType': 1,
+				'nodeName': 'DIV',
+				'localName': 'div',
+				'nodeValue': '',
+				'childNodeCount': 1,
+				'attributes': ['id', 'added'],
+			},
+		},
+	)
+	tracker.queue_mutation('childNodeRemoved', {'parentNodeId': 2, 'nodeId': 3})
+	tracker.apply_pending_mutations()
+
+	assert not tracker.needs_full_rebuild
+	assert [child.node_id for child in body.children_nodes or []] == [10]
+	assert tracker.node_lookup[10].attributes == {'id': 'added'}
+	assert 3 not in tracker.node_lookup and 4 not in tracker.node_lookup
+	# the inserted div has children that Chrome did not send yet
+	assert tracker.pending_child_requests == {10}
+
+	tracker.queue_mutation(
+		'setChildNodes',
+		{
+			'parentId': 10,
+			'nodes': [{'nodeId': 11, 'backendNodeId': 1011, 'nodeType': 3, 'nodeName': '#text', 'nodeValue': 'hi'}],
+		},
+	)
+	tracker.apply_pending_mutations()
+
+	assert not tracker.pending_child_requests
+	assert tracker.node_lookup[11].parent_node is tracker.node_lookup[10]
+	assert 10 in tracker.ax_dirty_subtree_ids
+
+
+def test_unknown_nodes_and_document_updates_force_full_rebuild():
+	tracker, _ = _build_tracker()
+	tracker.queue_mutation('attributeModified', {'nodeId': 999, 'name': 'class', 'value': 'x'})
+	tracker.apply_pending_mutations()
+	assert tracker.needs_full_rebuild
+
+	tracker, _ = _build_tracker()
+	tracker.queue_mutation('documentUpdated', {})
+	tracker.apply_pending_mutations()
+	assert tracker.needs_full_rebuild
+
+
+def test_element_hash_is_memoized_and_reset_on_static_attribute_change():
+	tracker, _ = _build_tracker()
+	button = tracker.node_lookup[3]
+
+	original_hash = button.element_hash
+	assert button._element_hash == original_hash
+
+	tracker.queue_mutation('attributeModified', {'nodeId': 3, 'name': 'class', 'value': 'new'})
+	tracker.apply_pending_mutations()
+
+	assert button._element_hash is None
+	assert button.element_hash != original_hash
+
+
+def test_dom_state_diff_reports_added_removed_and_moved_elements():
+	_, document = _build_tracker()
+	body = document.children[0]
+	link = _add_child(body, _make_node(5, 'A', attributes={'href': '/a'}))
+	input_element = _add_child(body, _make_node(6, 'INPUT', attributes={'name': 'q'}))
+	previous = {3: body.children[0], 5: link, 6: input_element}
+
+	# the input was re-rendered under a new backend node id, the link disappeared and a select appeared
+	rerendered_input = _add_child(body, _make_node(7, 'INPUT', attributes={'name': 'q'}))
+	select = _add_child(body, _make_node(8, 'SELECT', attributes={'name': 'country'}))
+	current = {3: body.children[0], 7: rerendered_input, 8: select}
+
+	diff = DOMStateDiff.between(previous, current)
+
+	assert diff.added == [8]
+	assert diff.removed == [5]
+	assert diff.moved == {6: 7}
+	assert diff.has_changes
+	assert not DOMStateDiff.between(current, current).has_changes
+
+
+def _ax_node(role: str, **properties: Any) -> EnhancedAXNode:
+	return EnhancedAXNode(
+		ax_node_id=role,
+		ignored=False,
+		role=role,
+		name=None,
+		description=None,
+		properties=[EnhancedAXProperty(name=name, value=value) for name, value in properties.items()],  # type: ignore[arg-type]
+		child_ids=None,
+	)
+
+
+async def test_ax_state_without_dom_mutations_is_refreshed():
+	document = _make_node(1, '#document', NodeType.DOCUMENT_NODE)
+	body = _add_child(document, _make_node(2, 'BODY'))
+	checkbox = _add_child(body, _make_node(3, 'INPUT', attributes={'type': 'checkbox'}))
+	checkbox.ax_node = _ax_node('checkbox', checked=False)
+	menu = _add_child(body, _make_node(4, 'DIV', attributes={'role': 'button'}))
+	menu.ax_node = _ax_node('button', expanded=False)
+	link = _add_child(body, _make_node(5, 'A'))
+	link.ax_node = _ax_node('link', focusable=True)
+	_add_child(body, _make_node(6, 'P'))
+	tracker = DOMMutationTracker(target_id='target-1', session_id='session-1')
+	tracker.begin_full_build()
+	assert tracker.finish_full_build(document)
+
+	# the user ticked the box, opened the menu and tabbed to the link: Chrome sends no DOM mutation for any of it
+	tracker.mark_volatile_ax_dirty(focused_backend_node_id=link.backend_node_id)
+	assert tracker.ax_dirty_node_ids == {3, 4, 5}
+	assert tracker.dirty_count == 0
+
+	fresh_ax_nodes = {
+		checkbox.backend_node_id: {'checked': True},
+		menu.backend_node_id: {'expanded': True},
+		link.backend_node_id: {'focusable': True, 'focused': True},
+	}
+
+	async def get_partial_ax_tree(params: dict, session_id: str | None = None) -> dict:
+		properties = fresh_ax_nodes[params['backendNodeId']]
+		return {
+			'nodes': [
+				{
+					'nodeId': str(params['backendNodeId']),
+					'ignored': False,
+					'backendDOMNodeId': params['backendNodeId'],
+					'properties': [
+						{'name': name, 'value': {'type': 'boolean', 'value': value}} for name, value in properties.items()
+					],
+				}
+			]
+		}
+
+	cdp_session = SimpleNamespace(
+		session_id='session-1',
+		cdp_client=SimpleNamespace(send=SimpleNamespace(Accessibility=SimpleNamespace(getPartialAXTree=get_partial_ax_tree))),
+	)
+	service = DomService(browser_session=SimpleNamespace(), logger=logging.getLogger('test'))  # type: ignore[arg-type]
+	await service._refresh_dirty_ax_nodes(tracker, cdp_session)  # type: ignore[arg-type]
+
+	assert checkbox.ax_node is not None and checkbox.ax_node.properties == [EnhancedAXProperty(name='checked', value=True)]  # type: ignore[arg-type]
+	assert menu.ax_node is not None and menu.ax_node.properties == [EnhancedAXProperty(name='expanded', value=True)]  # type: ignore[arg-type]
+	assert link.ax_node is not None and link.ax_node.properties is not None
+	assert {prop.name for prop in link.ax_node.properties} == {'focusable', 'focused'}
@@ -0,0 +1,138 @@
+"""Test that element rects are measured in batches and reused from the DOM snapshot and the per-step cache."""
+
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any
+
+from browser_use.browser.element_geometry import ElementGeometry, measure_element_rects
+from browser_use.dom.views import DOMRect, NodeType
+
+
+class FakeCDPClient:
+	"""Answers the geometry commands from a backend node id -> viewport rect table and counts every command."""
+
+	def __init__(self, rects: dict[int, tuple[float, float, float, float]], scroll: tuple[float, float] = (0, 0)):
+		self.rects = rects
+		self.scroll = scroll
+		self.no_quads: set[int] = set()
+		self.calls: Counter[str] = Counter()
+		self.send = SimpleNamespace(
+			DOM=SimpleNamespace(getContentQuads=self.get_content_quads, resolveNode=self.resolve_node),
+			Runtime=SimpleNamespace(
+				evaluate=self.evaluate, callFunctionOn=self.call_function_on, releaseObjectGroup=self.release_object_group
+			),
+		)
+
+	async def get_content_quads(self, params: Any, session_id: Any = None) -> Any:
+		self.calls['getContentQuads'] += 1
+		backend_node_id = params['backendNodeId']
+		if backend_node_id in self.no_quads or backend_node_id not in self.rects:
+			return {'quads': []}
+		x, y, w, h = self.rects[backend_node_id]
+		return {'quads': [[x, y, x + w, y, x + w, y + h, x, y + h]]}
+
+	async def resolve_node(self, params: Any, session_id: Any = None) -> Any:
+		self.calls['resolveNode'] += 1
+		return {'object': {'objectId': f'object-{params["backendNodeId"]}'}}
+
+	async def evaluate(self, params: Any, session_id: Any = None) -> Any:
+		self.calls['evaluate'] += 1
+		return {'result': {'value': list(self.scroll)}}
+
+	async def call_function_on(self, params: Any, session_id: Any = None) -> Any:
+		self.calls['callFunctionOn'] += 1
+		ids = [int(argument['objectId'].removeprefix('object-')) for argument in params['arguments']]
+		return {'result': {'value': [list(self.rects[backend_node_id]) for backend_node_id in ids]}}
+
+	async def release_object_group(self, params: Any, session_id: Any = None) -> Any:
+		self.calls['releaseObjectGroup'] += 1
+		return {}
+
+
+def _selector_map(positions: dict[int, tuple[float, float, float, float]], scroll_y: float = 0) -> Any:
+	"""Nodes of the top document of 'page-target', as built by the DOM service (absolute_position in page coordinates)."""
+	document = SimpleNamespace(node_type=NodeType.DOCUMENT_NODE, node_name='#document', parent_node=None)
+	scroll_rect = DOMRect(x=0, y=scroll_y, width=1280, height=4000)
+	html = SimpleNamespace(
+		node_type=NodeType.ELEMENT_NODE,
+		node_name='HTML',
+		parent_node=document,
+		snapshot_node=SimpleNamespace(scrollRects=scroll_rect),
+	)
+	return {
+		index: SimpleNamespace(
+			node_type=NodeType.ELEMENT_NODE,
+			node_name='BUTTON',
+			parent_node=html,
+			target_id='page-target',
+			backend_node_id=backend_node_id,
+			absolute_position=DOMRect(x=x, y=y, width=w, height=h),
+			snapshot_node=None,
+		)
+		for index, (backend_node_id, (x, y, w, h)) in enumerate(positions.items())
+	}
+
+
+async def test_nodes_are_measured_together_with_one_batched_fallback_call():
+	client = FakeCDPClient({1: (10, 20, 100, 30), 2: (10, 60, 100, 30), 3: (5, 5, 40, 40), 4: (0, 0, 50, 50)})
+	client.no_quads = {3, 4}
+
+	scroll, rects = await measure_element_rects(client, 'session-1', [1, 2, 3, 4])  # type: ignore[arg-type]
+
+	assert scroll == (0, 0)
+	assert rects[1] == DOMRect(x=10, y=20, width=100, height=30)
+	assert rects[4] == DOMRect(x=0, y=0, width=50, height=50)
+	# nodes without content quads share a single getBoundingClientRect call
+	assert client.calls['callFunctionOn'] == 1
+	assert client.calls['getContentQuads'] == 4
+
+
+async def test_fresh_snapshot_bounds_are_used_while_the_page_is_not_scrolled():
+	client = FakeCDPClient({1: (10, 20, 100, 30)}, scroll=(0, 200))
+	geometry = ElementGeometry(snapshot_max_age=60)
+	geometry.new_step(_selector_map({1: (10, 220, 100, 30)}, scroll_y=200))
+
+	rects = await geometry.get_rects(client, 'session-1', 'page-target', [1])  # type: ignore[arg-type]
+
+	assert rects[1] == DOMRect(x=10, y=20, width=100, height=30)
+	assert geometry.snapshot_hits == 1
+	assert client.calls['getContentQuads'] == 0
+
+	# the page scrolled since the snapshot, the element is measured again
+	client.scroll = (0, 0)
+	client.rects[1] = (10, 220, 100, 30)
+	rects = await geometry.get_rects(client, 'session-1', 'page-target', [1])  # type: ignore[arg-type]
+	assert rects[1] == DOMRect(x=10, y=220, width=100, height=30)
+	assert client.calls['getContentQuads'] == 1
+
+
+async def test_measured_rects_are_cached_until_the_next_snapshot():
+	client = FakeCDPClient({1: (10, 20, 100, 30)})
+	geometry = ElementGeometry(snapshot_max_age=0)
+	selector_map = _selector_map({1: (10, 20, 100, 30)})
+	geometry.new_step(selector_map)
+
+	await geometry.get_rects(client, 'session-1', 'page-target', [1])  # type: ignore[arg-type]
+	await geometry.get_rects(client, 'session-1', 'page-target', [1])  # type: ignore[arg-type]
+	assert client.calls['getContentQuads'] == 1
+	assert geometry.cache_hits == 1
+
+	geometry.new_step(selector_map)
+	await geometry.get_rects(client, 'session-1', 'page-target', [1])  # type: ignore[arg-type]
+	assert client.calls['getContentQuads'] == 2
+
+
+async def test_measured_rects_expire_after_cache_max_age():
+	client = FakeCDPClient({1: (10, 20, 100, 30)})
+	geometry = ElementGeometry(snapshot_max_age=0, cache_max_age=0.05)
+	geometry.new_step(_selector_map({1: (10, 20, 100, 30)}))
+
+	await geometry.get_rects(client, 'session-1', 'page-target', [1])  # type: ignore[arg-type]
+	# a banner pushed the element down without scrolling the page
+	client.rects[1] = (10, 120, 100, 30)
+	await asyncio.sleep(0.1)
+	rects = await geometry.get_rects(client, 'session-1', 'page-target', [1])  # type: ignore[arg-type]
+
+	assert rects[1] == DOMRect(x=10, y=120, width=100, height=30)
+	assert client.calls['getContentQuads'] == 2 and geometry.cache_hits == 0
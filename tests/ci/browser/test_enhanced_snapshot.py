@@ -0,0 +1,92 @@
+"""Test the lazily read snapshot lookup built from CDP DOMSnapshot data."""
+
+from typing import Any
+
+from browser_use.dom import enhanced_snapshot
+from browser_use.dom.enhanced_snapshot import build_snapshot_lookup
+from browser_use.dom.views import DOMRect
+
+
+def _make_snapshot() -> Any:
+	return {
+		'strings': ['block', 'pointer', 'visible'],
+		'documents': [
+			{
+				'nodes': {'backendNodeId': [10, 11, 12], 'isClickable': {'index': [1]}},
+				'layout': {
+					# node 1 appears twice, the first layout row must win
+					'nodeIndex': [1, 2, 1],
+					'bounds': [[20, 40, 200, 100], [0, 0, 10, 10], [999, 999, 999, 999]],
+					'styles': [[0, 2, -1, -1, -1, -1, 1], [], []],
+					'paintOrders': [5, 6, 7],
+					'clientRects': [[1, 2, 3, 4], [], []],
+					'scrollRects': [[], [], []],
+					'text': [],
+					'stackingContexts': {'index': []},
+				},
+			},
+			{
+				'nodes': {'backendNodeId': [20]},
+				'layout': {
+					'nodeIndex': [0],
+					'bounds': [[2, 2, 2, 2]],
+					'styles': [[]],
+					'text': [],
+					'stackingContexts': {'index': []},
+				},
+			},
+		],
+	}
+
+
+def test_snapshot_lookup_reads_nodes_on_access():
+	lookup = build_snapshot_lookup(_make_snapshot(), device_pixel_ratio=2.0)
+
+	assert len(lookup) == 4
+	assert set(lookup) == {10, 11, 12, 20}
+	assert lookup.get(999) is None
+
+	node = lookup[11]
+	assert node.is_clickable is True
+	assert node.bounds == DOMRect(x=10, y=20, width=100, height=50)
+	assert node.computed_styles == {'display': 'block', 'visibility': 'visible', 'cursor': 'pointer'}
+	assert node.cursor_style == 'pointer'
+	assert node.paint_order == 5
+	assert node.clientRects == DOMRect(x=1, y=2, width=3, height=4)
+	assert node.scrollRects is None
+	# nothing is memoized by the lookup, in-place updates stay on the node that was handed out
+	assert node.bounds is not None
+	node.bounds.x += 5
+	assert node.bounds.x == 15 and lookup[11].bounds == DOMRect(x=10, y=20, width=100, height=50)
+
+	no_layout = lookup[10]
+	assert no_layout.bounds is None and no_layout.computed_styles is None and no_layout.is_clickable is False
+
+	other_document = lookup[20]
+	assert other_document.bounds == DOMRect(x=1, y=1, width=1, height=1)
+	assert other_document.is_clickable is None
+
+
+def test_snapshot_lookup_only_reads_the_fields_that_are_accessed(monkeypatch):
+	parsed: list[list[int]] = []
+	parse_computed_styles = enhanced_snapshot._parse_computed_styles
+	monkeypatch.setattr(
+		enhanced_snapshot,
+		'_parse_computed_styles',
+		lambda strings, style_indices: parsed.append(style_indices) or parse_computed_styles(strings, style_indices),
+	)
+	lookup = build_snapshot_lookup(_make_snapshot())
+
+	nodes = [lookup[backend_node_id] for backend_node_id in lookup]
+	assert [node.bounds for node in nodes][1] == DOMRect(x=20, y=40, width=200, height=100)
+	assert parsed == []
+
+	assert nodes[1].computed_styles is not None
+	assert nodes[1].computed_styles is nodes[1].computed_styles
+	assert len(parsed) == 1
+
+
+def test_snapshot_lookup_handles_empty_snapshot():
+	lookup = build_snapshot_lookup({'documents': [], 'strings': []})
+	assert len(lookup) == 0
+	assert lookup.get(1) is None
@@ -0,0 +1,91 @@
+"""Test that the FrameGraph cache is patched and invalidated by Page frame events."""
+
+from typing import Any
+
+from browser_use.browser.frame_graph import FrameGraph
+
+
+def _frame_info(frame_id: str, target_id: str, parent_frame_id: str | None = None, children: list[str] | None = None) -> dict:
+	return {
+		'id': frame_id,
+		'url': f'https://example.com/{frame_id}',
+		'loaderId': f'loader-{frame_id}',
+		'frameTargetId': target_id,
+		'parentFrameId': parent_frame_id,
+		'childFrameIds': children or [],
+		'isCrossOrigin': False,
+	}
+
+
+def _build_graph() -> FrameGraph:
+	graph = FrameGraph()
+	graph.is_tracking = True
+	frames = {
+		'main': _frame_info('main', 'page-target', children=['ad']),
+		'ad': _frame_info('ad', 'page-target', 'main', children=['nested']),
+		'nested': _frame_info('nested', 'page-target', 'ad'),
+		'oopif': _frame_info('oopif', 'iframe-target', 'main'),
+	}
+	graph.store((1, None), graph.generation, frames, {'page-target': 'session-1', 'iframe-target': 'session-2'})
+	return graph
+
+
+def _navigated(frame_id: str, url: str) -> Any:
+	return {'frame': {'id': frame_id, 'loaderId': 'loader-2', 'url': url, 'securityOrigin': url, 'mimeType': 'text/html'}}
+
+
+def test_cached_hierarchy_answers_lookups_until_targets_change():
+	graph = _build_graph()
+
+	assert graph.get((1, None)) is not None
+	assert graph.target_for_frame('oopif') == 'iframe-target'
+	assert graph.session_for_frame('nested') == 'session-1'
+	# a target appeared or disappeared since the build (tab registry version changed)
+	assert graph.get((2, None)) is None
+
+
+def test_navigation_and_detach_are_patched_in_place():
+	graph = _build_graph()
+
+	graph.on_frame_navigated(_navigated('main', 'https://example.org/'))
+	graph.on_frame_detached({'frameId': 'ad', 'reason': 'remove'})
+
+	cached = graph.get((1, None))
+	assert cached is not None
+	frames, _ = cached
+	assert frames['main']['url'] == 'https://example.org/'
+	assert frames['main']['loaderId'] == 'loader-2'
+	assert frames['main']['frameTargetId'] == 'page-target'
+	assert frames['main']['childFrameIds'] == []
+	assert set(frames) == {'main', 'oopif'}
+
+
+def test_attached_frames_invalidate_the_cache():
+	graph = _build_graph()
+	graph.on_frame_attached({'frameId': 'new-frame', 'parentFrameId': 'main'})
+	assert graph.get((1, None)) is None
+
+
+def test_build_racing_with_a_frame_event_is_not_cached():
+	graph = FrameGraph()
+	graph.is_tracking = True
+	generation = graph.generation
+
+	graph.invalidate()  # e.g. frameAttached arrived while get_all_frames() was walking the targets
+	graph.store((1, None), generation, {'main': _frame_info('main', 'page-target')}, {'page-target': 'session-1'})
+
+	assert graph.get((1, None)) is None
+
+
+def test_only_page_navigations_are_counted():
+	graph = _build_graph()
+
+	ad_navigated = _navigated('ad', 'https://ads.example/')
+	ad_navigated['frame']['parentId'] = 'main'
+	graph.on_frame_navigated(ad_navigated)
+	assert graph.navigations == 0
+
+	graph.on_frame_navigated(_navigated('main', 'https://example.org/'))
+	graph.on_navigated_within_document({'frameId': 'main', 'url': 'https://example.org/#reviews', 'navigationType': 'fragment'})
+	graph.reset()
+	assert graph.navigations == 2
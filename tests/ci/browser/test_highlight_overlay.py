@@ -0,0 +1,57 @@
+"""Test that DOM highlights are sent to the page as compact tuples and only the difference is sent on updates."""
+
+import json
+from types import SimpleNamespace
+from typing import Any
+
+from browser_use.browser.highlight_overlay import HighlightOverlay, boxes_from_selector_map
+from browser_use.dom.views import DOMRect
+
+
+def _node(backend_node_id: int, x: float, y: float, width: float = 80.0, height: float = 20.0, tag: str = 'button') -> Any:
+	return SimpleNamespace(
+		backend_node_id=backend_node_id, absolute_position=DOMRect(x=x, y=y, width=width, height=height), tag_name=tag
+	)
+
+
+def test_boxes_are_compact_and_skip_invisible_elements():
+	selector_map = {
+		1: _node(101, 10.4, 20.6),
+		2: _node(102, 0, 0, width=0),
+		3: SimpleNamespace(backend_node_id=103, absolute_position=None, tag_name='a'),
+	}
+
+	assert boxes_from_selector_map(selector_map) == {101: (10, 21, 80, 20, 'button')}  # type: ignore[arg-type]
+
+
+def test_only_changed_boxes_are_sent_after_the_first_update():
+	overlay = HighlightOverlay()
+	first = {101: (10, 20, 80, 20, 'button'), 102: (10, 60, 200, 30, 'input')}
+
+	upserts, removed = overlay.diff(first)
+	assert len(upserts) == 2 and removed == []
+	overlay.commit(first)
+
+	second = {101: (10, 20, 80, 20, 'button'), 102: (10, 90, 200, 30, 'input'), 103: (5, 5, 40, 40, 'a')}
+	upserts, removed = overlay.diff(second)
+	assert upserts == [[102, 10, 90, 200, 30, 'input'], [103, 5, 5, 40, 40, 'a']]
+	assert removed == []
+	overlay.commit(second)
+
+	upserts, removed = overlay.diff({103: (5, 5, 40, 40, 'a')})
+	assert upserts == []
+	assert removed == [101, 102]
+
+
+def test_reset_forgets_the_page_state_and_rotates_the_token():
+	overlay = HighlightOverlay()
+	overlay.commit({101: (10, 20, 80, 20, 'button')})
+	token = overlay.token
+
+	overlay.reset('other-target')
+
+	assert overlay.target_id == 'other-target'
+	assert overlay.token != token
+	upserts, removed = overlay.diff({101: (10, 20, 80, 20, 'button')})
+	assert upserts == [[101, 10, 20, 80, 20, 'button']] and removed == []
+	assert json.dumps(overlay.token) in overlay.apply_expression(upserts, removed)
@@ -0,0 +1,136 @@
+"""Test that cross-origin iframe documents are cached by frame id and loader id across DOM snapshots."""
+
+import logging
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+from browser_use.dom.service import DomService
+from browser_use.dom.views import DOMRect, EnhancedDOMTreeNode, NodeType
+
+
+def _make_node(node_id: int, node_name: str, target_id: str, node_type: NodeType = NodeType.ELEMENT_NODE) -> EnhancedDOMTreeNode:
+	return EnhancedDOMTreeNode(
+		node_id=node_id,
+		backend_node_id=node_id + 1000,
+		node_type=node_type,
+		node_name=node_name,
+		node_value='',
+		attributes={},
+		is_scrollable=None,
+		is_visible=None,
+		absolute_position=None,
+		target_id=target_id,
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=None,
+		children_nodes=None,
+		ax_node=None,
+		snapshot_node=None,
+	)
+
+
+def _build_service(incremental: bool = True) -> tuple[DomService, dict[str, int]]:
+	cdp_session = SimpleNamespace(cdp_client=MagicMock(), session_id='iframe-session')
+
+	async def get_or_create_cdp_session(target_id: str | None = None, focus: bool = True) -> Any:
+		return cdp_session
+
+	browser_session = SimpleNamespace(get_or_create_cdp_session=get_or_create_cdp_session, agent_focus=None)
+	service = DomService(
+		browser_session=browser_session,  # type: ignore[arg-type]
+		logger=logging.getLogger('test'),
+		cross_origin_iframes=True,
+		incremental=incremental,
+	)
+	calls = {'full': 0, 'reused': 0}
+
+	async def get_dom_tree(target_id: str, **kwargs: Any) -> EnhancedDOMTreeNode:
+		calls['full'] += 1
+		return _make_node(calls['full'], '#document', target_id, NodeType.DOCUMENT_NODE)
+
+	async def get_incremental_dom_tree(tracker: Any, cdp_session: Any, *args: Any, **kwargs: Any) -> EnhancedDOMTreeNode | None:
+		calls['reused'] += 1
+		return tracker.root
+
+	service.get_dom_tree = get_dom_tree  # type: ignore[method-assign]
+	service._get_incremental_dom_tree = get_incremental_dom_tree  # type: ignore[method-assign]
+	return service, calls
+
+
+async def test_unchanged_iframe_document_is_reused_until_its_loader_changes():
+	service, calls = _build_service()
+	offset = DOMRect(x=0.0, y=0.0, width=0.0, height=0.0)
+
+	first_iframe = _make_node(1, 'IFRAME', 'page-target')
+	iframe_targets = {'frame-1': ('iframe-target', 'loader-1')}
+	await service._attach_iframe_document(first_iframe, 'frame-1', offset, 'page-target', 1, iframe_targets)
+	assert calls == {'full': 1, 'reused': 0}
+	assert first_iframe.content_document is not None
+	assert first_iframe.content_document.parent_node is first_iframe
+
+	# next snapshot, same document in the frame: the cached tree is reused and re-parented
+	second_iframe = _make_node(2, 'IFRAME', 'page-target')
+	await service._attach_iframe_document(second_iframe, 'frame-1', offset, 'page-target', 1, iframe_targets)
+	assert calls == {'full': 1, 'reused': 1}
+	assert second_iframe.content_document is not None
+	assert second_iframe.content_document is first_iframe.content_document
+	assert second_iframe.content_document.parent_node is second_iframe
+
+	# the frame navigated, so its document is built from scratch
+	navigated_iframe = _make_node(3, 'IFRAME', 'page-target')
+	iframe_targets = {'frame-1': ('iframe-target', 'loader-2')}
+	await service._attach_iframe_document(navigated_iframe, 'frame-1', offset, 'page-target', 1, iframe_targets)
+	assert calls == {'full': 2, 'reused': 1}
+
+
+async def test_iframe_documents_are_not_tracked_without_incremental_dom():
+	service, calls = _build_service(incremental=False)
+	offset = DOMRect(x=0.0, y=0.0, width=0.0, height=0.0)
+	iframe_targets = {'frame-1': ('iframe-target', 'loader-1')}
+
+	for node_id in (1, 2):
+		iframe = _make_node(node_id, 'IFRAME', 'page-target')
+		await service._attach_iframe_document(iframe, 'frame-1', offset, 'page-target', 1, iframe_targets)
+		assert iframe.content_document is not None
+
+	assert calls == {'full': 2, 'reused': 0}
+	assert service._iframe_trees == {} and service._mutation_router.trackers == {}
+
+
+async def test_trackers_of_forgotten_iframe_documents_stop_receiving_mutations():
+	service, calls = _build_service()
+	offset = DOMRect(x=0.0, y=0.0, width=0.0, height=0.0)
+
+	iframe = _make_node(1, 'IFRAME', 'page-target')
+	await service._attach_iframe_document(iframe, 'frame-1', offset, 'page-target', 1, {'frame-1': ('iframe-target', 'loader-1')})
+	await service._attach_iframe_document(iframe, 'frame-1', offset, 'page-target', 1, {'frame-1': ('iframe-target', 'loader-2')})
+	assert list(service._mutation_router.trackers) == ['iframe-session']
+
+	# the old document shares its session with the new one, which still needs the tracker
+	service._forget_iframe_tree(('frame-1', 'loader-1'))
+	assert list(service._mutation_router.trackers) == ['iframe-session']
+
+	# the frame is gone from the page
+	service._forget_iframe_tree(('frame-1', 'loader-2'))
+	assert service._iframe_trees == {} and service._mutation_router.trackers == {}
+
+	# closing the tab drops its trees and trackers as well
+	await service._attach_iframe_document(iframe, 'frame-1', offset, 'page-target', 1, {'frame-1': ('iframe-target', 'loader-3')})
+	service.forget_target('iframe-target')
+	assert service._iframe_trees == {} and service._mutation_router.trackers == {}
+
+
+async def test_frames_without_their_own_target_are_skipped():
+	service, calls = _build_service()
+	offset = DOMRect(x=0.0, y=0.0, width=0.0, height=0.0)
+
+	iframe = _make_node(1, 'IFRAME', 'page-target')
+	await service._attach_iframe_document(iframe, 'frame-1', offset, 'page-target', 1, {})
+	await service._attach_iframe_document(iframe, 'frame-1', offset, 'page-target', 1, {'frame-1': ('page-target', 'loader-1')})
+
+	assert calls == {'full': 0, 'reused': 0}
+	assert iframe.content_document is None
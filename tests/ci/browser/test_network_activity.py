@@ -0,0 +1,94 @@
+"""Test event-driven network idle detection fed by CDP Network events."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from browser_use.browser.network_activity import NetworkActivityRouter, NetworkActivityTracker, is_ignored_request
+
+
+def _request(request_id: str, url: str, resource_type: str = 'Fetch') -> dict:
+	return {'requestId': request_id, 'request': {'url': url, 'method': 'GET'}, 'type': resource_type}
+
+
+def test_ads_tracking_and_inline_requests_are_ignored():
+	assert is_ignored_request('https://www.google-analytics.com/collect?v=1')
+	assert is_ignored_request('https://example.com/api/metrics/flush')
+	assert is_ignored_request('data:image/png;base64,AAAA')
+	assert is_ignored_request('https://example.com/' + 'a' * 600)
+	assert not is_ignored_request('https://example.com/api/items?page=2')
+
+	tracker = NetworkActivityTracker('session-1')
+	tracker.on_request_will_be_sent(_request('1', 'https://doubleclick.net/pixel'))
+	assert tracker.pending_requests() == []
+
+
+def test_pending_requests_follow_loading_events():
+	tracker = NetworkActivityTracker('session-1')
+	tracker.on_request_will_be_sent(_request('1', 'https://example.com/api/items'))
+	tracker.on_request_will_be_sent(_request('2', 'https://example.com/app.js', 'Script'))
+
+	assert [request.url for request in tracker.pending_requests()] == [
+		'https://example.com/api/items',
+		'https://example.com/app.js',
+	]
+
+	tracker.on_request_done({'requestId': '1'})
+	tracker.on_request_done({'requestId': '2'})
+	assert tracker.pending_requests() == []
+
+
+def test_slow_images_stop_blocking_stability():
+	tracker = NetworkActivityTracker('session-1')
+	tracker.on_request_will_be_sent(_request('1', 'https://example.com/hero.jpg', 'Image'))
+	tracker._requests['1'].start_time = time.monotonic() - 5
+
+	assert tracker.pending_requests() == []
+
+
+async def test_wait_for_idle_wakes_up_on_loading_finished():
+	tracker = NetworkActivityTracker('session-1')
+	tracker.on_request_will_be_sent(_request('1', 'https://example.com/api/items'))
+
+	async def finish_request():
+		await asyncio.sleep(0.05)
+		tracker.on_request_done({'requestId': '1'})
+
+	start = time.monotonic()
+	finisher = asyncio.create_task(finish_request())
+	assert await tracker.wait_for_idle(idle_time=0.05, max_inflight=0, timeout=2)
+	await finisher
+	assert time.monotonic() - start < 1
+
+
+async def test_wait_for_idle_times_out_while_busy():
+	tracker = NetworkActivityTracker('session-1')
+	tracker.on_request_will_be_sent(_request('1', 'https://example.com/api/items'))
+
+	assert not await tracker.wait_for_idle(idle_time=0.05, max_inflight=0, timeout=0.1)
+
+
+def test_router_drops_trackers_of_closed_and_reattached_targets():
+	callbacks: dict[str, object] = {}
+	register = SimpleNamespace(
+		requestWillBeSent=lambda cb: callbacks.__setitem__('requestWillBeSent', cb),
+		loadingFinished=lambda cb: callbacks.__setitem__('loadingFinished', cb),
+		loadingFailed=lambda cb: callbacks.__setitem__('loadingFailed', cb),
+	)
+	cdp_client = SimpleNamespace(register=SimpleNamespace(Network=register))
+	router = NetworkActivityRouter()
+
+	first, is_new = router.get_tracker(cdp_client, 'target-1', 'session-1')  # type: ignore[arg-type]
+	assert is_new and router.get_tracker(cdp_client, 'target-1', 'session-1') == (first, False)  # type: ignore[arg-type]
+	router.get_tracker(cdp_client, 'target-2', 'session-2')  # type: ignore[arg-type]
+
+	# the target re-attached under a new session: the old tracker is replaced
+	second, is_new = router.get_tracker(cdp_client, 'target-1', 'session-3')  # type: ignore[arg-type]
+	assert is_new and second is not first
+	assert set(router.trackers) == {'session-2', 'session-3'}
+
+	# the tab closed
+	router.forget_target('target-1')
+	assert set(router.trackers) == {'session-2'}
+	callbacks['requestWillBeSent'](_request('1', 'https://example.com/api'), 'session-3')  # type: ignore[operator]
+	assert second.pending_requests() == []
@@ -0,0 +1,97 @@
+"""Test that page markdown is converted lazily in chunks and cached per page for paging with start_from_char."""
+
+from browser_use.dom.markdown_extractor import PageMarkdown, PageMarkdownCache
+from browser_use.dom.serializer.html_serializer import HTMLSerializer
+from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
+
+
+def _node(node_type: NodeType, node_name: str, node_value: str = '', children: list | None = None) -> EnhancedDOMTreeNode:
+	node = EnhancedDOMTreeNode(
+		node_id=0,
+		backend_node_id=0,
+		node_type=node_type,
+		node_name=node_name,
+		node_value=node_value,
+		attributes={},
+		is_scrollable=None,
+		is_visible=None,
+		absolute_position=None,
+		target_id='page-target',
+		frame_id=None,
+		session_id=None,
+		content_document=None,
+		shadow_root_type=None,
+		shadow_roots=None,
+		parent_node=None,
+		children_nodes=children or [],
+		ax_node=None,
+		snapshot_node=None,
+	)
+	for child in node.children:
+		child.parent_node = node
+	return node
+
+
+def _element(tag: str, *children: EnhancedDOMTreeNode) -> EnhancedDOMTreeNode:
+	return _node(NodeType.ELEMENT_NODE, tag.upper(), children=list(children))
+
+
+def _text(value: str) -> EnhancedDOMTreeNode:
+	return _node(NodeType.TEXT_NODE, '#text', value)
+
+
+def _build_page(sections: int) -> EnhancedDOMTreeNode:
+	body = _element(
+		'body',
+		_element(
+			'div',
+			*[
+				_element('section', _element('h2', _text(f'Section {i}')), _element('p', _text('lorem ipsum ' * 20)))
+				for i in range(sections)
+			],
+		),
+	)
+	return _node(
+		NodeType.DOCUMENT_NODE, '#document', children=[_element('html', _element('head', _element('title', _text('x'))), body)]
+	)
+
+
+def test_html_pieces_concatenate_to_the_full_serialization():
+	page = _build_page(5)
+	serializer = HTMLSerializer()
+
+	pieces = list(serializer.iter_blocks(page))
+
+	assert ''.join(pieces) == serializer.serialize(page)
+	# layout wrappers are opened up, content blocks stay whole
+	assert pieces[:5] == ['<html>', '<body>', '<div>', '<section>', '<h2>Section 0</h2>']
+
+
+def test_conversion_stops_once_enough_characters_are_read():
+	page = PageMarkdown(HTMLSerializer().iter_blocks(_build_page(50)), method='test', chunk_html_chars=1000)
+
+	first = page.read(500)
+	assert 500 <= len(first)
+	assert not page.complete
+	assert 'Section 0' in first and 'Section 49' not in first
+
+	everything = page.read_all()
+	assert page.complete
+	assert everything.startswith(first)
+	# chunked conversion yields the same markdown as converting the page in one go
+	assert everything == PageMarkdown(HTMLSerializer().iter_blocks(_build_page(50)), method='test').read_all()
+	assert page.stats['final_filtered_chars'] == len(everything)
+
+
+def test_cache_survives_a_rebuilt_but_identical_dom_tree():
+	cache = PageMarkdownCache()
+
+	first = cache.get('page-target', 'https://example.com/', False, _build_page(3))
+	first.read_all()
+	# the DOM watchdog builds a new tree every step, the page itself didn't change
+	again = cache.get('page-target', 'https://example.com/', False, _build_page(3))
+	changed = cache.get('page-target', 'https://example.com/', False, _build_page(4))
+
+	assert again is first
+	assert changed is not first
+	assert (cache.hits, cache.misses) == (1, 2)
@@ -0,0 +1,249 @@
+"""Test that StorageStateWatchdog saves on Set-Cookie headers and DOMStorage events, polling only for the rest."""
+
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from bubus import EventBus
+
+from browser_use.browser.events import StorageStateSavedEvent
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.watchdogs.storage_state_watchdog import StorageStateWatchdog
+
+
+class FakeCDPClient:
+	"""Records the registered event callbacks and answers the few commands the watchdog sends."""
+
+	def __init__(self, storage: dict[tuple[str, bool], list[list[str]]]):
+		self.callbacks: dict[str, Any] = {}
+		self.enabled: list[tuple[str, str | None]] = []
+		self.storage_reads: list[tuple[str, bool, str | None]] = []
+		self.storage = storage
+
+		def register(domain: str):
+			return SimpleNamespace(
+				**{
+					event: (lambda callback, event=event: self.callbacks.__setitem__(f'{domain}.{event}', callback))
+					for event in (
+						'responseReceivedExtraInfo',
+						'domStorageItemAdded',
+						'domStorageItemUpdated',
+						'domStorageItemRemoved',
+						'domStorageItemsCleared',
+						'detachedFromTarget',
+					)
+				}
+			)
+
+		async def enable(domain: str, session_id: str | None = None):
+			self.enabled.append((domain, session_id))
+
+		async def get_dom_storage_items(params: dict, session_id: str | None = None):
+			storage_id = params['storageId']
+			self.storage_reads.append((storage_id['securityOrigin'], storage_id['isLocalStorage'], session_id))
+			return {'entries': self.storage.get((storage_id['securityOrigin'], storage_id['isLocalStorage']), [])}
+
+		self.register = SimpleNamespace(Network=register('Network'), DOMStorage=register('DOMStorage'), Target=register('Target'))
+		self.send = SimpleNamespace(
+			Network=SimpleNamespace(enable=lambda session_id=None: enable('Network', session_id)),
+			DOMStorage=SimpleNamespace(
+				enable=lambda session_id=None: enable('DOMStorage', session_id),
+				getDOMStorageItems=get_dom_storage_items,
+			),
+		)
+
+	def set_cookie_response(self, session_id: str = 'session-1') -> None:
+		self.callbacks['Network.responseReceivedExtraInfo']({'headers': {'Set-Cookie': 'sid=abc; Path=/'}}, session_id)
+
+	def storage_event(self, origin: str, session_id: str = 'session-1') -> None:
+		event = {'storageId': {'securityOrigin': origin, 'isLocalStorage': True}, 'key': 'theme', 'newValue': 'dark'}
+		self.callbacks['DOMStorage.domStorageItemAdded'](event, session_id)
+
+
+def _cookie(name: str, value: str) -> dict[str, Any]:
+	return {'name': name, 'value': value, 'domain': 'example.com', 'path': '/', 'expires': -1}
+
+
+def _watchdog(tmp_path: Path, monkeypatch, storage: dict[tuple[str, bool], list[list[str]]] | None = None):
+	storage_path = tmp_path / 'storage_state.json'
+	session = BrowserSession(browser_profile=BrowserProfile(storage_state=storage_path, user_data_dir=None))
+	cdp_client = FakeCDPClient(storage or {})
+	session._cdp_client_root = cdp_client  # type: ignore[assignment]
+	browser = {'cookies': [_cookie('sid', '1')], 'full_reads': 0}
+
+	async def get_or_create_cdp_session(self, target_id=None, focus=True, new_socket=None):
+		return SimpleNamespace(session_id='session-1', cdp_client=cdp_client, target_id=target_id)
+
+	async def get_cookies(self) -> list[dict[str, Any]]:
+		return [dict(cookie) for cookie in browser['cookies']]
+
+	async def get_storage_state(self, disable_dom_storage: bool = True) -> dict:
+		browser['full_reads'] += 1
+		return {'cookies': await get_cookies(self), 'origins': []}
+
+	monkeypatch.setattr(BrowserSession, 'get_or_create_cdp_session', get_or_create_cdp_session)
+	monkeypatch.setattr(BrowserSession, '_cdp_get_cookies', get_cookies)
+	monkeypatch.setattr(BrowserSession, '_cdp_get_storage_state', get_storage_state)
+
+	watchdog = StorageStateWatchdog(event_bus=EventBus(), browser_session=session, save_debounce=0.05)
+	saved: list[StorageStateSavedEvent] = []
+	monkeypatch.setattr(watchdog.event_bus, 'dispatch', saved.append)
+	return watchdog, cdp_client, browser, storage_path, saved
+
+
+async def _settle(watchdog: StorageStateWatchdog) -> None:
+	assert watchdog._save_task is not None
+	await asyncio.wait_for(watchdog._save_task, timeout=2)
+
+
+async def test_set_cookie_headers_trigger_one_debounced_save(tmp_path, monkeypatch):
+	watchdog, cdp_client, browser, storage_path, saved = _watchdog(tmp_path, monkeypatch)
+	await watchdog._start_monitoring()
+	await watchdog._track_target('target-1')
+	assert watchdog._monitoring_task is not None and not watchdog._monitoring_task.done()
+	assert sorted(cdp_client.enabled) == [('DOMStorage', 'session-1'), ('Network', 'session-1')]
+
+	# responses without cookies are ignored, a burst of Set-Cookie responses is written once
+	cdp_client.callbacks['Network.responseReceivedExtraInfo']({'headers': {'content-type': 'text/html'}}, 'session-1')
+	assert watchdog._save_task is None
+	for _ in range(5):
+		cdp_client.set_cookie_response()
+	await _settle(watchdog)
+
+	assert browser['full_reads'] == 1 and len(saved) == 1
+	assert json.loads(storage_path.read_text())['cookies'] == [_cookie('sid', '1')]
+	assert not storage_path.with_suffix('.json.tmp').exists()
+
+	# the cookie jar did not actually change: nothing is written
+	mtime = storage_path.stat().st_mtime_ns
+	cdp_client.set_cookie_response()
+	await _settle(watchdog)
+	assert len(saved) == 1 and storage_path.stat().st_mtime_ns == mtime
+
+	# one changed cookie is merged into the state kept from the last write, the file is not read again
+	reads: list[Path] = []
+	read_text = Path.read_text
+	monkeypatch.setattr(Path, 'read_text', lambda self, *args, **kwargs: reads.append(self) or read_text(self, *args, **kwargs))
+	browser['cookies'] = [_cookie('sid', '2')]
+	cdp_client.set_cookie_response()
+	await _settle(watchdog)
+
+	assert reads == [] and browser['full_reads'] == 1 and len(saved) == 2
+	assert json.loads(read_text(storage_path))['cookies'] == [_cookie('sid', '2')]
+
+
+async def test_only_the_changed_origin_is_read_from_the_tab_it_changed_in(tmp_path, monkeypatch):
+	storage = {('https://shop.example.com', True): [['theme', 'dark']]}
+	watchdog, cdp_client, browser, storage_path, saved = _watchdog(tmp_path, monkeypatch, storage)
+	storage_path.write_text(
+		json.dumps(
+			{
+				'cookies': [_cookie('sid', '1')],
+				'origins': [
+					{'origin': 'https://docs.example.com', 'localStorage': [{'name': 'lang', 'value': 'en'}]},
+					{'origin': 'https://old.example.com', 'localStorage': [{'name': 'seen', 'value': '1'}]},
+				],
+			}
+		)
+	)
+	await watchdog._start_monitoring()
+	await watchdog._track_target('target-1')
+
+	cdp_client.storage_event('https://shop.example.com')
+	cdp_client.storage_event('https://old.example.com')
+	await _settle(watchdog)
+
+	# no frame walk over every origin, only the two origins that fired events are read
+	assert browser['full_reads'] == 0
+	assert {(origin, session_id) for origin, _, session_id in cdp_client.storage_reads} == {
+		('https://shop.example.com', 'session-1'),
+		('https://old.example.com', 'session-1'),
+	}
+	origins = {origin['origin']: origin for origin in json.loads(storage_path.read_text())['origins']}
+	assert origins == {
+		'https://docs.example.com': {'origin': 'https://docs.example.com', 'localStorage': [{'name': 'lang', 'value': 'en'}]},
+		'https://shop.example.com': {'origin': 'https://shop.example.com', 'localStorage': [{'name': 'theme', 'value': 'dark'}]},
+	}
+	# the file as it was before the session first overwrote it is kept as backup
+	assert 'old.example.com' in storage_path.with_suffix('.json.bak').read_text()
+
+
+async def test_saves_wait_for_auto_save_interval_without_save_on_change(tmp_path, monkeypatch):
+	watchdog, cdp_client, browser, storage_path, saved = _watchdog(tmp_path, monkeypatch)
+	watchdog.save_on_change = False
+	watchdog.auto_save_interval = 0.3
+	await watchdog._start_monitoring()
+	await watchdog._track_target('target-1')
+
+	cdp_client.set_cookie_response()
+	await asyncio.sleep(0.1)
+	assert not storage_path.exists()
+	await _settle(watchdog)
+	assert len(saved) == 1
+
+	# a file edited by someone else is read again and its cookies are kept
+	storage_path.write_text(json.dumps({'cookies': [_cookie('other', 'x')], 'origins': []}))
+	browser['cookies'] = [_cookie('sid', '2')]
+	await watchdog._stop_monitoring()
+	await watchdog._save_storage_state()
+	assert json.loads(storage_path.read_text())['cookies'] == [_cookie('other', 'x'), _cookie('sid', '2')]
+
+
+async def test_failed_save_keeps_the_changes_pending_and_retries(tmp_path, monkeypatch):
+	watchdog, cdp_client, browser, storage_path, saved = _watchdog(tmp_path, monkeypatch)
+	watchdog.auto_save_interval = 0.1
+	await watchdog._start_monitoring()
+	await watchdog._track_target('target-1')
+
+	write = watchdog._write_storage_state
+	failures: list[Path] = []
+
+	def write_storage_state(json_path: Path, state: dict[str, Any]) -> None:
+		if not failures:
+			failures.append(json_path)
+			raise OSError('No space left on device')
+		write(json_path, state)
+
+	monkeypatch.setattr(watchdog, '_write_storage_state', write_storage_state)
+	cdp_client.set_cookie_response()
+	cdp_client.storage_event('https://shop.example.com')
+	await _settle(watchdog)
+
+	# the first write failed, the same changes were saved by the retry without any new event
+	assert failures == [storage_path] and len(saved) == 1
+	assert json.loads(storage_path.read_text())['cookies'] == [_cookie('sid', '1')]
+	assert not watchdog._cookies_changed and not watchdog._changed_origins
+
+
+async def test_detached_sessions_are_forgotten(tmp_path, monkeypatch):
+	watchdog, cdp_client, browser, storage_path, saved = _watchdog(tmp_path, monkeypatch)
+	await watchdog._start_monitoring()
+	await watchdog._track_target('target-1')
+	assert list(watchdog._tracked_sessions) == ['session-1']
+
+	cdp_client.callbacks['Target.detachedFromTarget']({'sessionId': 'session-1', 'targetId': 'target-1'}, None)
+
+	assert watchdog._tracked_sessions == {}
+
+
+async def test_cookie_changes_without_events_are_caught_by_the_poll(tmp_path, monkeypatch):
+	watchdog, cdp_client, browser, storage_path, saved = _watchdog(tmp_path, monkeypatch)
+	watchdog.cookie_poll_interval = 0.1
+	await watchdog._start_monitoring()
+	await watchdog._track_target('target-1')
+	await watchdog._save_storage_state()
+	assert len(saved) == 1
+
+	# document.cookie, Network.setCookie and expiry change the jar without any Set-Cookie response
+	browser['cookies'] = [_cookie('sid', '1'), _cookie('consent', 'yes')]
+	for _ in range(20):
+		await asyncio.sleep(0.05)
+		if len(saved) == 2:
+			break
+	await watchdog._stop_monitoring()
+
+	assert len(saved) == 2
+	assert json.loads(storage_path.read_text())['cookies'] == [_cookie('sid', '1'), _cookie('consent', 'yes')]
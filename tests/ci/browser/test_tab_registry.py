@@ -0,0 +1,48 @@
+"""Test that TabRegistry follows Target events and detects drift from Target.getTargets()."""
+
+from types import SimpleNamespace
+from typing import Any
+
+from browser_use.browser.tab_registry import TabRegistry
+
+
+def _target(target_id: str, url: str, title: str = '', target_type: str = 'page') -> Any:
+	return {'targetId': target_id, 'type': target_type, 'title': title, 'url': url, 'attached': False, 'canAccessOpener': False}
+
+
+def _fake_cdp_client(targets: list[Any]) -> Any:
+	async def get_targets(params: Any = None) -> Any:
+		return {'targetInfos': targets}
+
+	return SimpleNamespace(send=SimpleNamespace(Target=SimpleNamespace(getTargets=get_targets)))
+
+
+def test_registry_follows_target_events():
+	registry = TabRegistry()
+	registry.on_target_created({'targetInfo': _target('target-1', 'about:blank')})
+	registry.on_target_created({'targetInfo': _target('target-2', 'https://example.com')})
+	registry.on_target_info_changed({'targetInfo': _target('target-1', 'https://example.org', 'Example Domain')})
+	registry.on_target_destroyed({'targetId': 'target-2'})
+
+	assert list(registry.targets) == ['target-1']
+	assert registry.targets['target-1']['title'] == 'Example Domain'
+	assert registry.targets['target-1']['url'] == 'https://example.org'
+
+
+async def test_consistency_check_reports_drift_and_resyncs():
+	registry = TabRegistry()
+	registry.on_target_created({'targetInfo': _target('target-1', 'https://example.com', 'Old title')})
+	registry.on_target_created({'targetInfo': _target('target-2', 'https://closed.example.com')})
+
+	actual = [_target('target-1', 'https://example.com', 'New title'), _target('target-3', 'https://new.example.com')]
+	drift = await registry.check_consistency(_fake_cdp_client(actual))
+
+	assert len(drift) == 3
+	assert any(line.startswith('missing') for line in drift)
+	assert any(line.startswith('stale') for line in drift)
+	assert any(line.startswith('title') for line in drift)
+	# known targets keep their order, new ones are appended
+	assert list(registry.targets) == ['target-1', 'target-3']
+	assert registry.targets['target-1']['title'] == 'New title'
+
+	assert await registry.check_consistency(_fake_cdp_client(actual)) == []
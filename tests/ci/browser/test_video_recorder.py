@@ -0,0 +1,76 @@
+"""Test that VideoRecorderService encodes screencast frames on a worker thread without blocking the caller."""
+
+import base64
+import io
+import threading
+
+import pytest
+from PIL import Image
+
+from browser_use.browser.profile import ViewportSize
+from browser_use.browser.video_recorder import VideoRecorderService
+
+iio = pytest.importorskip('imageio.v2')
+pytest.importorskip('imageio_ffmpeg')
+
+
+def _png_frame(width: int, height: int, color: str = 'red') -> str:
+	buffer = io.BytesIO()
+	Image.new('RGB', (width, height), color).save(buffer, format='PNG')
+	return base64.b64encode(buffer.getvalue()).decode()
+
+
+class _BlockingWriter:
+	"""Wraps the real writer and holds the worker thread on its first frame until released."""
+
+	def __init__(self, writer):
+		self.writer = writer
+		self.busy = threading.Event()
+		self.release = threading.Event()
+
+	def append_data(self, frame):
+		self.busy.set()
+		self.release.wait(timeout=10)
+		self.writer.append_data(frame)
+
+	def close(self):
+		self.writer.close()
+
+
+def test_frames_are_resized_padded_and_encoded(tmp_path):
+	output_path = tmp_path / 'recording.mp4'
+	recorder = VideoRecorderService(output_path=output_path, size=ViewportSize(width=100, height=70), framerate=10)
+	recorder.start()
+
+	for color in ('red', 'green', 'blue', 'white', 'black'):
+		recorder.add_frame(_png_frame(50, 30, color))
+	recorder.stop_and_save()
+
+	assert recorder.frames_written == 5
+	assert recorder.dropped_frames == 0
+	reader = iio.get_reader(str(output_path))
+	frames = [frame for frame in reader]  # list(reader) asks for a length ffmpeg readers report as inf
+	reader.close()
+	assert len(frames) == 5
+	# padded up to the next multiple of the 16px macro block
+	assert frames[0].shape == (80, 112, 3)
+
+
+def test_slow_encoder_drops_oldest_frames_instead_of_blocking(tmp_path):
+	recorder = VideoRecorderService(
+		output_path=tmp_path / 'recording.mp4', size=ViewportSize(width=64, height=48), framerate=10, max_queued_frames=2
+	)
+	recorder.start()
+	writer = _BlockingWriter(recorder._writer)
+	recorder._writer = writer  # type: ignore[assignment]
+
+	recorder.add_frame(_png_frame(64, 48))
+	assert writer.busy.wait(timeout=10)
+	for _ in range(5):
+		recorder.add_frame(_png_frame(64, 48))
+
+	# one frame is being encoded, two are queued, the three oldest queued ones were dropped
+	assert recorder.dropped_frames == 3
+	writer.release.set()
+	recorder.stop_and_save()
+	assert recorder.frames_written == 3
@@ -4,9 +4,11 @@ Pytest configuration for browser-use CI tests.
 Sets up environment variables to ensure tests never connect to production services.
 """
 
+import asyncio
 import os
 import socketserver
 import tempfile
+from typing import cast
 from unittest.mock import AsyncMock
 
 import pytest
@@ -21,7 +23,7 @@ socketserver.ThreadingMixIn.daemon_threads = True
 
 from browser_use.agent.views import AgentOutput
 from browser_use.llm import BaseChatModel
-from browser_use.llm.views import ChatInvokeCompletion
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeStreamChunk, ChatInvokeUsage
 from browser_use.tools.service import Tools
 
 # Load environment variables before any imports
@@ -154,6 +156,45 @@ def create_mock_llm(actions: list[str] | None = None) -> BaseChatModel:
 	return llm
 
 
+def create_mock_streaming_llm(outputs: list[str], chunk_size: int = 16) -> AsyncMock:
+	"""Create a mock LLM that streams the given JSON outputs in small chunks, one output per astream() call.
+
+	The last output is repeated once they are exhausted. `llm.calls` counts the astream() calls, `llm.chunks` are the
+	chunks of the current output, `llm.sent` the chunks yielded so far and `llm.closed` is set once a stream closed.
+	ainvoke() fails, the agent is expected to stream.
+	"""
+	llm = cast(AsyncMock, create_mock_llm())
+	chunked = [[output[i : i + chunk_size] for i in range(0, len(output), chunk_size)] for output in outputs]
+	llm.chunks = chunked[0]
+	llm.calls = 0
+	llm.sent = 0
+	llm.closed = False
+
+	async def mock_astream(messages, output_format):
+		llm.chunks = chunked[min(llm.calls, len(chunked) - 1)]
+		llm.calls += 1
+		try:
+			for chunk in llm.chunks:
+				await asyncio.sleep(0.005)
+				llm.sent += 1
+				yield ChatInvokeStreamChunk(delta=chunk)
+			usage = ChatInvokeUsage(
+				prompt_tokens=1000,
+				prompt_cached_tokens=None,
+				prompt_cache_creation_tokens=None,
+				prompt_image_tokens=None,
+				completion_tokens=200,
+				total_tokens=1200,
+			)
+			yield ChatInvokeStreamChunk(usage=usage, stop_reason='end_turn')
+		finally:
+			llm.closed = True
+
+	llm.astream = mock_astream
+	llm.ainvoke.side_effect = AssertionError('the agent should stream the output')
+	return llm
+
+
 @pytest.fixture(scope='module')
 async def browser_session():
 	"""Create a real browser session for testing"""
@@ -0,0 +1,86 @@
+"""Test that action models are reused for the same set of available actions and their optimized schemas are built once."""
+
+import asyncio
+
+from browser_use.agent.views import ActionResult, AgentOutput
+from browser_use.llm.schema import SchemaCacheStats, SchemaOptimizer, track_schema_stats
+from browser_use.tools.registry.service import Registry
+
+
+def _registry() -> Registry:
+	registry = Registry()
+
+	@registry.action('Scroll the page')
+	async def scroll(down: bool):
+		return ActionResult()
+
+	@registry.action('Search the GitHub repository', domains=['github.com'])
+	async def search_repository(query: str):
+		return ActionResult()
+
+	return registry
+
+
+def test_same_available_actions_give_the_same_model_class():
+	registry = _registry()
+
+	first = registry.create_action_model(page_url='https://example.com/a')
+	# a different URL exposing the same actions
+	again = registry.create_action_model(page_url='https://example.org/b')
+	on_github = registry.create_action_model(page_url='https://github.com/browser-use')
+
+	assert again is first
+	assert on_github is not first
+	assert 'search_repository' in str(on_github.model_json_schema())
+	assert registry.create_action_model(page_url='https://github.com/other') is on_github
+	assert (registry.action_model_cache_hits, registry.action_model_cache_misses) == (2, 2)
+
+
+def test_re_registering_an_action_rebuilds_the_model():
+	registry = _registry()
+	first = registry.create_action_model(page_url='https://example.com')
+
+	@registry.action('Scroll the page by a number of pages')
+	async def scroll(pages: float):
+		return ActionResult()
+
+	rebuilt = registry.create_action_model(page_url='https://example.com')
+	assert rebuilt is not first
+	assert 'pages' in str(rebuilt.model_json_schema())
+
+
+def test_optimized_schema_is_built_once_per_model_and_returned_as_a_copy():
+	output_model = AgentOutput.type_with_custom_actions(_registry().create_action_model())
+	stats = SchemaOptimizer.stats
+	hits, misses = stats.hits, stats.misses
+
+	first = SchemaOptimizer.create_optimized_json_schema(output_model)
+	first['properties'].clear()
+	again = SchemaOptimizer.create_optimized_json_schema(output_model)
+
+	assert 'action' in again['properties']
+	assert (stats.hits - hits, stats.misses - misses) == (1, 1)
+	# the Gemini variant reuses the cached standard schema
+	assert 'required' not in SchemaOptimizer.create_gemini_optimized_schema(output_model)
+	assert stats.misses - misses == 2
+
+
+async def test_concurrent_tasks_only_count_their_own_schema_builds():
+	output_models = [AgentOutput.type_with_custom_actions(_registry().create_action_model()) for _ in range(2)]
+	started = asyncio.Event()
+
+	async def build(output_model, wait: bool) -> SchemaCacheStats:
+		with track_schema_stats() as stats:
+			if wait:
+				await started.wait()
+			else:
+				started.set()
+			SchemaOptimizer.create_optimized_json_schema(output_model)
+			await asyncio.sleep(0)
+			SchemaOptimizer.create_optimized_json_schema(output_model)
+			return stats
+
+	first, second = await asyncio.gather(build(output_models[0], True), build(output_models[1], False))
+
+	assert (first.hits, first.misses) == (second.hits, second.misses) == (1, 1)
+	assert first.build_seconds > 0 and second.build_seconds > 0
@@ -0,0 +1,148 @@
+"""Test that CloudSync ships events in batches from a background flusher, with backpressure and a local spool."""
+
+import asyncio
+import json
+import os
+
+from pytest_httpserver import HTTPServer
+
+from browser_use.agent.cloud_events import UpdateAgentTaskEvent
+from browser_use.sync.service import CloudSync
+
+
+def _event(task_id: str) -> UpdateAgentTaskEvent:
+	return UpdateAgentTaskEvent(
+		id=task_id,
+		user_id='test-user',
+		device_id=None,
+		done_output=None,
+		user_feedback_type=None,
+		user_comment=None,
+		gif_url=None,
+	)
+
+
+def _shipped_task_ids(httpserver: HTTPServer) -> list[list[str]]:
+	return [[event['id'] for event in json.loads(request.data)['events']] for request, _ in httpserver.log]
+
+
+async def test_events_are_shipped_in_batches(httpserver: HTTPServer, tmp_path):
+	httpserver.expect_request('/api/v1/events', method='POST').respond_with_json({'ok': True})
+	sync = CloudSync(
+		base_url=httpserver.url_for(''),
+		allow_session_events_for_auth=True,
+		batch_size=3,
+		flush_interval=60,
+		spool_path=tmp_path / 'spool.jsonl',
+	)
+
+	for i in range(7):
+		await sync.handle_event(_event(f'task-{i}'))
+	await sync.close()
+
+	# two full batches plus the remainder, in order
+	assert _shipped_task_ids(httpserver) == [['task-0', 'task-1', 'task-2'], ['task-3', 'task-4', 'task-5'], ['task-6']]
+	assert sync.sent_events == 7
+
+
+async def test_full_queue_drops_oldest_events(httpserver: HTTPServer, tmp_path):
+	httpserver.expect_request('/api/v1/events', method='POST').respond_with_json({'ok': True})
+	sync = CloudSync(
+		base_url=httpserver.url_for(''),
+		allow_session_events_for_auth=True,
+		batch_size=50,
+		flush_interval=60,
+		max_queue_size=3,
+		spool_path=tmp_path / 'spool.jsonl',
+	)
+
+	for i in range(5):
+		await sync.handle_event(_event(f'task-{i}'))
+	await sync.close()
+
+	assert _shipped_task_ids(httpserver) == [['task-2', 'task-3', 'task-4']]
+	assert sync.dropped_events == 2
+
+
+async def test_undeliverable_events_are_spooled_and_replayed_in_order(httpserver: HTTPServer, tmp_path):
+	spool_path = tmp_path / 'spool.jsonl'
+	offline = CloudSync(
+		base_url='http://127.0.0.1:1',
+		allow_session_events_for_auth=True,
+		flush_interval=60,
+		spool_path=spool_path,
+	)
+	for i in range(3):
+		await offline.handle_event(_event(f'task-{i}'))
+	await offline.close()
+
+	assert offline.spooled_events == 3
+	assert len(spool_path.read_text().splitlines()) == 3
+
+	httpserver.expect_request('/api/v1/events', method='POST').respond_with_json({'ok': True})
+	online = CloudSync(
+		base_url=httpserver.url_for(''),
+		allow_session_events_for_auth=True,
+		flush_interval=60,
+		spool_path=spool_path,
+	)
+	await online.handle_event(_event('task-3'))
+	await online.close()
+
+	# spooled events go out first, in a batch of their own
+	assert _shipped_task_ids(httpserver) == [['task-0', 'task-1', 'task-2'], ['task-3']]
+	assert not spool_path.exists()
+
+
+def _spool_lines(task_ids: list[str]) -> str:
+	return ''.join(json.dumps(_event(task_id).model_dump(mode='json')) + '\n' for task_id in task_ids)
+
+
+async def test_concurrent_replays_ship_each_spooled_event_once(httpserver: HTTPServer, tmp_path):
+	spool_path = tmp_path / 'spool.jsonl'
+	spool_path.write_text(_spool_lines([f'task-{i}' for i in range(6)]))
+	httpserver.expect_request('/api/v1/events', method='POST').respond_with_json({'ok': True})
+
+	# two processes sharing the same config dir
+	first, second = (
+		CloudSync(base_url=httpserver.url_for(''), allow_session_events_for_auth=True, batch_size=2, spool_path=spool_path)
+		for _ in range(2)
+	)
+	await asyncio.gather(first.flush(), second.flush())
+	await asyncio.gather(first.close(), second.close())
+
+	assert [task_id for batch in _shipped_task_ids(httpserver) for task_id in batch] == [f'task-{i}' for i in range(6)]
+	assert not spool_path.exists()
+	assert [path.name for path in tmp_path.iterdir() if path.name != 'spool.jsonl.lock'] == []
+
+
+def test_undelivered_events_go_back_in_front_of_events_spooled_meanwhile(tmp_path):
+	spool_path = tmp_path / 'spool.jsonl'
+	spool_path.write_text(_spool_lines(['task-0', 'task-1']))
+	replaying = CloudSync(allow_session_events_for_auth=True, spool_path=spool_path)
+	other_process = CloudSync(allow_session_events_for_auth=True, spool_path=spool_path)
+
+	lines = replaying._claim_spool()
+	assert len(lines) == 2 and not spool_path.exists()
+	# a second replay finds nothing to send while the first one holds the claim
+	assert other_process._claim_spool() == []
+	other_process._append_to_spool([_event('task-2').model_dump(mode='json')])
+
+	# only task-0 was delivered
+	replaying._release_spool_claim(lines[1:])
+
+	assert [json.loads(line)['id'] for line in spool_path.read_text().splitlines()] == ['task-1', 'task-2']
+	assert not replaying._claim_path.exists()
+
+
+def test_claims_of_dead_processes_are_replayed(tmp_path):
+	spool_path = tmp_path / 'spool.jsonl'
+	(tmp_path / f'spool.jsonl.{2**31 - 1}.deadbeef.replaying').write_text(_spool_lines(['task-0']))
+	(tmp_path / f'spool.jsonl.{os.getpid()}.otherone.replaying').write_text(_spool_lines(['task-x']))
+	spool_path.write_text(_spool_lines(['task-1']))
+
+	lines = CloudSync(allow_session_events_for_auth=True, spool_path=spool_path)._claim_spool()
+
+	# the claim of a live process (here: another CloudSync in this one) is left alone
+	assert [json.loads(line)['id'] for line in lines] == ['task-0', 'task-1']
+	assert (tmp_path / f'spool.jsonl.{os.getpid()}.otherone.replaying').exists()
@@ -0,0 +1,77 @@
+"""Test that the agent history stays within its token budget on long tasks and old steps are folded into a rolling summary."""
+
+import asyncio
+from typing import Any
+
+from browser_use.agent.message_manager.compaction import HistoryCompactor, estimate_tokens
+from browser_use.agent.message_manager.views import HistoryItem
+from browser_use.llm.views import ChatInvokeCompletion
+
+
+class FakeSummaryLLM:
+	model = 'fake-summarizer'
+
+	def __init__(self):
+		self.prompts: list[str] = []
+
+	async def ainvoke(self, messages: list[Any], output_format: Any = None) -> ChatInvokeCompletion[str]:
+		self.prompts.append(messages[-1].content)
+		return ChatInvokeCompletion(completion=f'Summary #{len(self.prompts)}: opened the shop, collected prices.', usage=None)
+
+
+def _step(n: int) -> HistoryItem:
+	return HistoryItem(
+		step_number=n,
+		evaluation_previous_goal='Success - page loaded',
+		memory=f'Visited product page {n}, price is {n * 3} dollars.',
+		next_goal=f'Open product page {n + 1}',
+		action_results='Result\nClicked element',
+	)
+
+
+def test_rendered_history_stays_within_budget_without_a_summarizer():
+	compactor = HistoryCompactor(max_tokens=500)
+	items = [HistoryItem(step_number=0, system_message='Agent initialized')]
+
+	sizes = []
+	for n in range(1, 201):
+		items.append(_step(n))
+		sizes.append(estimate_tokens(compactor.render(items)))
+
+	assert max(sizes) <= 520
+	rendered = compactor.render(items)
+	assert rendered.startswith('Agent initialized')
+	assert 'previous steps omitted' in rendered
+	assert 'product page 200' in rendered
+
+
+def test_rendering_is_cached_per_item():
+	item = _step(1)
+
+	assert item.to_string() is item.to_string()
+
+
+async def test_old_steps_are_folded_into_one_rolling_summary():
+	llm = FakeSummaryLLM()
+	compactor = HistoryCompactor(max_tokens=500, summary_llm=llm, task='Collect all prices')  # type: ignore[arg-type]
+	items = [HistoryItem(step_number=0, system_message='Agent initialized')]
+
+	sizes = []
+	for n in range(1, 201):
+		items.append(_step(n))
+		sizes.append(estimate_tokens(compactor.render(items)))
+		# one step of the agent takes longer than the summary call
+		await asyncio.sleep(0)
+		await asyncio.sleep(0)
+
+	# the summarizer runs every few dozen steps, not every step
+	assert 2 <= len(llm.prompts) <= 30
+	assert compactor.summaries == len(llm.prompts)
+	# the previous summary is merged into the next one
+	assert 'Summary #1' in llm.prompts[1]
+	assert 'Collect all prices' in llm.prompts[0]
+	# one summary item right after the initialization item, then the verbatim recent steps
+	assert [item.summarized_items > 0 for item in items[:3]] == [False, True, False]
+	assert items[1].summarized_items + len(items) - 2 == 200
+	assert max(sizes[100:]) <= 520
+	assert f'Summary #{len(llm.prompts)}' in compactor.render(items)
@@ -0,0 +1,137 @@
+"""Test that the state message starts with a prefix that is byte-identical across steps and carries provider cache breakpoints."""
+
+from browser_use.agent.message_manager.views import omitted_history_marker
+from browser_use.agent.prompts import HISTORY_CACHE_CHUNK, AgentMessagePrompt
+from browser_use.agent.views import AgentStepInfo
+from browser_use.browser.views import BrowserStateSummary, TabInfo
+from browser_use.dom.views import SerializedDOMState
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.anthropic.serializer import AnthropicMessageSerializer
+from browser_use.llm.aws.serializer import AWSBedrockMessageSerializer
+from browser_use.llm.browser_use.chat import ChatBrowserUse
+from browser_use.llm.messages import ContentPartTextParam, SystemMessage, UserMessage
+from browser_use.llm.views import ChatInvokeUsage
+from browser_use.tokens.service import TokenCost
+
+
+def _state_message(tmp_path, history_items: list[str], url: str = 'https://example.com') -> UserMessage:
+	browser_state = BrowserStateSummary(
+		dom_state=SerializedDOMState(_root=None, selector_map={}),
+		url=url,
+		title='Example',
+		tabs=[TabInfo(target_id='ABCD1234ABCD1234ABCD1234ABCD1234ABCD1234', url=url, title='Example')],
+	)
+	prompt = AgentMessagePrompt(
+		browser_state_summary=browser_state,
+		file_system=FileSystem(tmp_path),
+		agent_history_items=history_items,
+		task='Collect the prices of all products',
+		step_info=AgentStepInfo(step_number=len(history_items), max_steps=100),
+	)
+	return prompt.get_user_message(use_vision=False)
+
+
+def _cached_prefix(message: UserMessage) -> list[str]:
+	assert isinstance(message.content, list)
+	return [part.text for part in message.content if isinstance(part, ContentPartTextParam) and part.cache]
+
+
+def _message_text(message: UserMessage) -> str:
+	assert isinstance(message.content, list)
+	return ''.join(part.text for part in message.content if isinstance(part, ContentPartTextParam))
+
+
+def _history(steps: int) -> list[str]:
+	return ['Agent initialized'] + [f'<step_{n}>\nMemory: visited product page {n}\n</step_{n}>' for n in range(1, steps + 1)]
+
+
+def test_prefix_only_changes_once_per_history_chunk(tmp_path):
+	start = HISTORY_CACHE_CHUNK + 1
+	messages = [
+		_state_message(tmp_path, _history(steps), url=f'https://example.com/{steps}') for steps in range(start, start + 12)
+	]
+
+	prefixes = [_cached_prefix(message) for message in messages]
+	assert prefixes[0][0].startswith('<user_request>')
+	# the settled history chunk is cached, the newest steps and the page state are not
+	assert 'visited product page 9\n' in prefixes[0][1]
+	assert f'visited product page {start}\n' not in prefixes[0][1]
+	assert f'/{start}' not in ''.join(prefixes[0])
+	# the prefix stays byte-identical until a full chunk of new items moves into it
+	changes = sum(1 for a, b in zip(prefixes, prefixes[1:]) if a != b)
+	assert changes == 1
+	# the prompt still reads as one continuous history block
+	text = _message_text(messages[-1])
+	assert text.count('<agent_history>') == 1 and text.index('<agent_history>') < text.index('</agent_history>')
+	assert text.index('product page 1\n') < text.index(f'product page {start + 11}\n')
+
+
+def test_omitted_history_marker_stays_out_of_the_cached_prefix(tmp_path):
+	# with max_history_items the omission count and the items after it change every step
+	def windowed(steps: int) -> list[str]:
+		items = _history(steps)
+		return [items[0], omitted_history_marker(steps - 11), *items[-11:]]
+
+	messages = [_state_message(tmp_path, windowed(steps)) for steps in range(30, 33)]
+
+	prefixes = [_cached_prefix(message) for message in messages]
+	assert prefixes[0] == prefixes[1] == prefixes[2]
+	assert prefixes[0][1] == '<agent_history>\nAgent initialized\n'
+	assert 'previous steps omitted' in _message_text(messages[0])
+
+
+def test_anthropic_gets_cache_control_on_the_prefix_parts(tmp_path):
+	messages = [SystemMessage(content='You are a browser agent.', cache=True), _state_message(tmp_path, _history(25))]
+
+	serialized, system = AnthropicMessageSerializer.serialize_messages(messages)
+
+	blocks = serialized[-1]['content']
+	assert isinstance(blocks, list) and isinstance(system, list)
+	breakpoints = [isinstance(block, dict) and bool(block.get('cache_control')) for block in blocks]
+	assert breakpoints == [True, True, False]
+	# Anthropic allows at most 4 cache breakpoints per request
+	assert sum(breakpoints) + sum(bool(block.get('cache_control')) for block in system) <= 4
+
+
+def test_bedrock_gets_cache_points_only_when_enabled(tmp_path):
+	messages = [SystemMessage(content='You are a browser agent.', cache=True), _state_message(tmp_path, _history(25))]
+
+	serialized, system = AWSBedrockMessageSerializer.serialize_messages(messages, use_cache_points=True)
+	assert system is not None and system[-1] == {'cachePoint': {'type': 'default'}}
+	assert ['cachePoint' in block for block in serialized[-1]['content']] == [False, True, False, True, False]
+
+	serialized, system = AWSBedrockMessageSerializer.serialize_messages(messages)
+	assert system == [{'text': 'You are a browser agent.'}]
+	assert not any('cachePoint' in block for block in serialized[-1]['content'])
+
+
+async def test_token_cost_reports_prompt_cache_hit_rate():
+	token_cost = TokenCost()
+	for cached in (0, 3000, 3500):
+		token_cost.add_usage(
+			'claude-sonnet',
+			ChatInvokeUsage(
+				prompt_tokens=4000,
+				prompt_cached_tokens=cached,
+				prompt_cache_creation_tokens=3000 if not cached else None,
+				prompt_image_tokens=None,
+				completion_tokens=100,
+				total_tokens=4100,
+			),
+		)
+
+	summary = await token_cost.get_usage_summary()
+
+	stats = summary.by_model['claude-sonnet']
+	assert (stats.prompt_cached_tokens, stats.prompt_cache_creation_tokens) == (6500, 3000)
+	assert stats.prompt_cache_hit_rate == summary.prompt_cache_hit_rate == 6500 / 12000
+
+
+def test_cache_flags_are_not_sent_as_message_fields(tmp_path):
+	message = _state_message(tmp_path, _history(25))
+
+	serialized = ChatBrowserUse(api_key='test')._serialize_message(message)
+
+	assert isinstance(serialized['content'], list)
+	assert all('cache' not in part for part in serialized['content'])
+	assert any(isinstance(part, ContentPartTextParam) and part.cache for part in message.content)
@@ -0,0 +1,133 @@
+"""Test that screenshots are passed around as one binary handle and only converted to base64 at the LLM/JSON boundary."""
+
+import base64
+import io
+
+from bubus import EventBus
+from PIL import Image
+from pydantic import TypeAdapter
+
+from browser_use.agent.gif import create_history_gif
+from browser_use.agent.prompts import AgentMessagePrompt
+from browser_use.agent.views import ActionResult, AgentHistory, AgentHistoryList
+from browser_use.browser.events import BrowserStateRequestEvent
+from browser_use.browser.views import PLACEHOLDER_4PX_SCREENSHOT, BrowserStateHistory, BrowserStateSummary
+from browser_use.dom.views import SerializedDOMState
+from browser_use.filesystem.file_system import FileSystem
+from browser_use.llm.messages import ContentPartImageParam
+from browser_use.screenshots.service import ScreenshotService
+from browser_use.screenshots.views import Screenshot
+
+
+def _jpeg(width: int = 1280, height: int = 800, color: tuple[int, int, int] = (200, 30, 30)) -> bytes:
+	output = io.BytesIO()
+	Image.new('RGB', (width, height), color).save(output, format='JPEG', quality=60)
+	return output.getvalue()
+
+
+def test_base64_from_cdp_is_kept_until_bytes_are_needed():
+	data = _jpeg()
+	cdp_base64 = base64.b64encode(data).decode()
+
+	screenshot = Screenshot.from_base64(cdp_base64)
+
+	# size, type and the base64 text come without decoding the image
+	assert screenshot.size == len(data) and len(screenshot) == len(cdp_base64)
+	assert screenshot.mime_type == 'image/jpeg'
+	assert screenshot.base64 is cdp_base64 and screenshot._data is None
+	assert screenshot.data == data
+	assert screenshot == cdp_base64 and Screenshot(data) == screenshot
+
+
+def test_state_summary_accepts_base64_strings():
+	state = BrowserStateSummary(
+		dom_state=SerializedDOMState(_root=None, selector_map={}),
+		url='https://example.com',
+		title='Example',
+		tabs=[],
+		screenshot=PLACEHOLDER_4PX_SCREENSHOT,  # type: ignore[arg-type]  # callers that still pass base64 text
+	)
+
+	assert isinstance(state.screenshot, Screenshot) and state.screenshot.mime_type == 'image/png'
+	assert f'{state.screenshot}' == PLACEHOLDER_4PX_SCREENSHOT
+
+
+async def test_stored_screenshots_are_read_back_as_bytes(tmp_path):
+	data = _jpeg()
+	path = await ScreenshotService(tmp_path).store_screenshot(Screenshot(data), step_number=1)
+	state = BrowserStateHistory(url='https://example.com', title='Example', tabs=[], interacted_element=[], screenshot_path=path)
+
+	screenshot = state.load_screenshot()
+
+	assert screenshot is not None and screenshot._data is None  # read on first access
+	assert screenshot.size == len(data) and screenshot.data == data
+	assert screenshot != PLACEHOLDER_4PX_SCREENSHOT
+	assert state.get_screenshot() == base64.b64encode(data).decode()
+
+
+def test_llm_copy_is_downscaled_webp(tmp_path):
+	screenshot = Screenshot(_jpeg(2560, 1600))
+
+	small = screenshot.resized((1568, 1568))
+
+	assert small.mime_type == 'image/webp' and small.size < screenshot.size
+	with Image.open(io.BytesIO(small.data)) as image:
+		assert image.format == 'WEBP' and image.size == (1568, 980)
+
+	prompt = AgentMessagePrompt(
+		browser_state_summary=BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=None, selector_map={}), url='https://example.com', title='Example', tabs=[]
+		),
+		file_system=FileSystem(tmp_path),
+		screenshots=[small],
+	)
+	image_part = prompt.get_user_message(use_vision=True).content[-1]
+	assert isinstance(image_part, ContentPartImageParam)
+	assert image_part.image_url.media_type == 'image/webp'
+	assert image_part.image_url.url == f'data:image/webp;base64,{small.base64}'
+
+
+async def test_gif_is_built_from_the_stored_bytes(tmp_path):
+	service = ScreenshotService(tmp_path)
+	history = AgentHistoryList(history=[])
+	for step, screenshot in enumerate(
+		[PLACEHOLDER_4PX_SCREENSHOT, Screenshot(_jpeg(640, 400)), Screenshot(_jpeg(640, 400, (30, 30, 200)))]
+	):
+		path = await service.store_screenshot(screenshot, step_number=step)
+		state = BrowserStateHistory(
+			url=f'https://example.com/{step}', title='Example', tabs=[], interacted_element=[], screenshot_path=path
+		)
+		history.history.append(AgentHistory(model_output=None, result=[ActionResult()], state=state))
+
+	output_path = tmp_path / 'history.gif'
+	create_history_gif(task='Look at the products', history=history, output_path=str(output_path))
+
+	with Image.open(output_path) as gif:
+		# task frame + the two real screenshots, the about:blank placeholder is skipped
+		assert getattr(gif, 'n_frames') == 3 and gif.size == (640, 400)
+
+
+async def test_state_summary_with_screenshot_is_a_valid_event_result():
+	bus = EventBus()
+	screenshot = Screenshot(_jpeg())
+	summary = BrowserStateSummary(
+		dom_state=SerializedDOMState(_root=None, selector_map={}),
+		url='https://example.com',
+		title='Example',
+		tabs=[],
+		screenshot=screenshot,
+	)
+
+	async def on_BrowserStateRequestEvent(event: BrowserStateRequestEvent) -> BrowserStateSummary:
+		return summary
+
+	bus.on(BrowserStateRequestEvent, on_BrowserStateRequestEvent)
+	try:
+		event = await bus.dispatch(BrowserStateRequestEvent())
+		result = await event.event_result(raise_if_any=True, raise_if_none=True)
+	finally:
+		await bus.stop(clear=True, timeout=5)
+
+	assert isinstance(result, BrowserStateSummary) and result.screenshot == screenshot
+	# serialized like the base64 string the field used to hold
+	assert TypeAdapter(BrowserStateSummary).dump_python(result, mode='json')['screenshot'] == screenshot.base64
@@ -0,0 +1,87 @@
+"""Test that screenshots are only captured on the steps where something will look at them."""
+
+from browser_use.agent.screenshot_policy import ScreenshotPolicy
+from browser_use.agent.service import Agent
+from browser_use.agent.views import ActionResult, AgentSettings
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.views import BrowserStateSummary
+from browser_use.dom.views import SerializedDOMState
+from browser_use.screenshots.views import Screenshot
+from tests.ci.conftest import create_mock_llm
+
+
+def _captured_steps(policy: ScreenshotPolicy, steps: int = 6, last_result: list[ActionResult] | None = None) -> list[int]:
+	return [step for step in range(1, steps + 1) if policy.reason(step, last_result)]
+
+
+def test_text_only_agent_never_captures():
+	policy = ScreenshotPolicy(AgentSettings(use_vision=False))
+
+	assert _captured_steps(policy) == []
+	# the screenshot action is not available without vision, a stray request is ignored
+	assert policy.reason(2, [ActionResult(metadata={'include_screenshot': True})]) is None
+
+
+def test_consumers_of_the_screenshot_turn_capturing_on():
+	assert _captured_steps(ScreenshotPolicy(AgentSettings(use_vision=True))) == [1, 2, 3, 4, 5, 6]
+	assert _captured_steps(ScreenshotPolicy(AgentSettings(use_vision=False, generate_gif=True))) == [1, 2, 3, 4, 5, 6]
+
+	auto = ScreenshotPolicy(AgentSettings(use_vision='auto', screenshot_sample_rate=0))
+	assert _captured_steps(auto) == []
+	assert auto.reason(3, [ActionResult(), ActionResult(metadata={'include_screenshot': True})]) == 'requested by action'
+
+
+def test_history_is_sampled():
+	assert _captured_steps(ScreenshotPolicy(AgentSettings(use_vision='auto'))) == [1, 2, 3, 4, 5, 6]
+	assert _captured_steps(ScreenshotPolicy(AgentSettings(use_vision=False, screenshot_sample_rate=3))) == [1, 4]
+
+
+def _agent(monkeypatch) -> tuple[Agent, list[bool]]:
+	agent = Agent(task='Read the article', llm=create_mock_llm(), use_vision=False, browser_profile=BrowserProfile())
+	requests: list[bool] = []
+
+	async def get_browser_state_summary(self, include_screenshot: bool = True, **kwargs) -> BrowserStateSummary:
+		requests.append(include_screenshot)
+		return BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=None, selector_map={}),
+			url='https://example.com/article',
+			title='Article',
+			tabs=[],
+			screenshot=Screenshot.from_base64('aW1hZ2U=') if include_screenshot else None,
+		)
+
+	monkeypatch.setattr(BrowserSession, 'get_browser_state_summary', get_browser_state_summary)
+	monkeypatch.setattr(BrowserSession, 'navigation_generation', property(lambda self: 0))
+	agent._step_schema_seconds = 0.0  # set by step()
+	return agent, requests
+
+
+async def test_agent_requests_the_state_without_screenshot(monkeypatch):
+	agent, requests = _agent(monkeypatch)
+
+	state = await agent._prepare_context()
+	assert requests == [False] and state.screenshot is None
+
+	agent.settings.screenshot_sample_rate = 1
+	state = await agent._prepare_context()
+	assert requests == [False, True] and state.screenshot == 'aW1hZ2U='
+
+
+async def test_screenshot_is_added_to_a_prefetched_state_when_it_becomes_necessary(monkeypatch):
+	agent, requests = _agent(monkeypatch)
+	screenshots: list[int] = []
+
+	async def capture_screenshot(self) -> Screenshot:
+		screenshots.append(self.state.n_steps)
+		return Screenshot.from_base64('bGF0ZQ==')
+
+	monkeypatch.setattr(Agent, '_capture_screenshot', capture_screenshot)
+
+	agent._prefetch_browser_state()
+	agent.settings.use_vision = True
+	state = await agent._prepare_context()
+
+	# the prefetched DOM is kept, only the screenshot is captured on demand
+	assert requests == [False] and screenshots == [1]
+	assert state.screenshot == 'bGF0ZQ=='
@@ -0,0 +1,83 @@
+"""Test that the next browser state is captured in the background after the actions of a step and dropped after a late navigation."""
+
+import asyncio
+
+from browser_use.agent.service import Agent
+from browser_use.agent.views import ActionResult
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.browser.views import BrowserStateSummary, TabInfo
+from browser_use.dom.views import SerializedDOMState
+from tests.ci.conftest import create_mock_llm
+
+
+def _agent(monkeypatch, done: bool = False) -> tuple[Agent, dict, list[str]]:
+	agent = Agent(task='Open the second product', llm=create_mock_llm(), browser_profile=BrowserProfile(wait_between_actions=0))
+	browser = {'url': 'https://example.com/products', 'navigations': 0}
+	captures: list[str] = []
+
+	async def get_browser_state_summary(self, include_screenshot: bool = True, **kwargs) -> BrowserStateSummary:
+		url = browser['url']
+		captures.append(url)
+		await asyncio.sleep(0.05)  # DOM + screenshot capture
+		return BrowserStateSummary(
+			dom_state=SerializedDOMState(_root=None, selector_map={}),
+			url=url,
+			title='Shop',
+			tabs=[TabInfo(target_id='ABCD1234ABCD1234ABCD1234ABCD1234ABCD1234', url=url, title='Shop')],
+		)
+
+	async def act(action, **kwargs) -> ActionResult:
+		return ActionResult(is_done=done, success=True if done else None, extracted_content='clicked')
+
+	monkeypatch.setattr(BrowserSession, 'get_browser_state_summary', get_browser_state_summary)
+	monkeypatch.setattr(BrowserSession, 'navigation_generation', property(lambda self: browser['navigations']))
+	monkeypatch.setattr(agent.tools, 'act', act)
+	agent._step_schema_seconds = 0.0  # set by step()
+
+	action = {'done': {'text': 'finished', 'success': True}} if done else {'click': {'index': 3}}
+	agent.state.last_model_output = agent.AgentOutput.model_validate(
+		{'evaluation_previous_goal': 'Success', 'memory': '', 'next_goal': 'Open it', 'action': [action]}
+	)
+	return agent, browser, captures
+
+
+async def test_capture_starts_right_after_the_actions_and_is_used_by_the_next_step(monkeypatch):
+	agent, browser, captures = _agent(monkeypatch)
+
+	await agent._execute_actions()
+	await asyncio.sleep(0)
+	# the capture runs while the step is finalized
+	assert captures == ['https://example.com/products']
+
+	state = await agent._prepare_context()
+
+	assert state.url == 'https://example.com/products'
+	assert len(captures) == 1
+
+
+async def test_late_navigation_discards_the_prefetched_state(monkeypatch):
+	agent, browser, captures = _agent(monkeypatch)
+
+	await agent._execute_actions()
+	await asyncio.sleep(0.01)
+	# the click navigates after the action already returned
+	browser['url'] = 'https://example.com/products/2'
+	browser['navigations'] += 1
+
+	state = await agent._prepare_context()
+
+	assert state.url == 'https://example.com/products/2'
+	assert captures == ['https://example.com/products', 'https://example.com/products/2']
+
+
+async def test_no_prefetch_after_done_or_when_disabled(monkeypatch):
+	agent, _, captures = _agent(monkeypatch, done=True)
+	await agent._execute_actions()
+	assert agent._prefetched_state is None
+
+	agent, _, captures = _agent(monkeypatch)
+	agent.settings.prefetch_browser_state = False
+	await agent._execute_actions()
+	await asyncio.sleep(0)
+	assert agent._prefetched_state is None and captures == []
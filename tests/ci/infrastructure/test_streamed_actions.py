@@ -0,0 +1,212 @@
+"""Test that with stream_actions the agent starts executing actions while the model output is still streaming."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+from google.genai import types
+from pydantic import BaseModel
+
+from browser_use.agent.service import Agent
+from browser_use.agent.views import ActionResult
+from browser_use.browser.profile import BrowserProfile
+from browser_use.browser.session import BrowserSession
+from browser_use.llm.google.chat import ChatGoogle
+from browser_use.llm.messages import UserMessage
+from browser_use.llm.streaming import JSONArrayStreamParser
+from browser_use.tokens.service import TokenCost
+from tests.ci.conftest import create_mock_streaming_llm
+
+
+def _llm(*outputs: dict[str, Any]) -> AsyncMock:
+	return create_mock_streaming_llm([json.dumps(output) for output in outputs])
+
+
+def _output(actions: list[dict[str, Any]]) -> dict[str, Any]:
+	return {
+		'thinking': 'The products are listed, fill in the search form.',
+		'evaluation_previous_goal': 'Success',
+		'memory': 'On the products page',
+		'next_goal': 'Search for shoes',
+		'action': actions,
+	}
+
+
+def _agent(llm: AsyncMock, monkeypatch) -> tuple[Agent, list[tuple[str, int]]]:
+	agent = Agent(
+		task='Search for shoes',
+		llm=llm,
+		browser_profile=BrowserProfile(wait_between_actions=0),
+		stream_actions=True,
+	)
+	page = {'url': 'https://example.com/products'}
+	executed: list[tuple[str, int]] = []
+
+	async def get_current_page_url(self) -> str:
+		return page['url']
+
+	async def act(action, **kwargs) -> ActionResult:
+		name = next(iter(action.model_dump(exclude_unset=True)))
+		executed.append((name, llm.sent))
+		if name == 'click':
+			page['url'] = 'https://example.com/products/shoes'
+		return ActionResult()
+
+	monkeypatch.setattr(BrowserSession, 'get_current_page_url', get_current_page_url)
+	monkeypatch.setattr(agent.tools, 'act', act)
+	return agent, executed
+
+
+async def test_first_action_runs_before_the_output_is_complete(monkeypatch):
+	actions = [
+		{'input': {'index': 4, 'text': 'shoes'}},
+		{'send_keys': {'keys': 'Enter'}},
+		{'scroll': {'down': True, 'pages': 1.0}},
+	]
+	llm = _llm(_output(actions))
+	agent, executed = _agent(llm, monkeypatch)
+
+	output = await agent.get_model_output([UserMessage(content='state')])
+	agent.state.last_model_output = output
+	await agent._execute_actions()
+
+	assert [name for name, _ in executed] == ['input', 'send_keys', 'scroll']
+	# the first action started while most of the output was still being generated
+	assert executed[0][1] < len(llm.chunks) - 2
+	assert output.memory == 'On the products page'
+	assert len(output.action) == 3 and agent.state.last_result is not None and len(agent.state.last_result) == 3
+	# the usage on the last chunk is tracked
+	assert agent.token_cost_service.get_usage_tokens_for_model(llm.model).total_tokens == 1200
+
+
+async def test_page_change_skips_the_remaining_actions_and_cancels_the_stream(monkeypatch):
+	actions = [
+		{'click': {'index': 7}},
+		{'input': {'index': 4, 'text': 'shoes'}},
+		{'input': {'index': 5, 'text': 'a long description ' * 40}},
+	]
+	llm = _llm(_output(actions))
+	agent, executed = _agent(llm, monkeypatch)
+
+	output = await agent.get_model_output([UserMessage(content='state')])
+	agent.state.last_model_output = output
+	await agent._execute_actions()
+
+	assert [name for name, _ in executed] == ['click']
+	assert agent.state.last_result is not None and len(agent.state.last_result) == 1
+	# the rest of the output was never generated, the step keeps what was streamed so far
+	assert llm.closed and llm.sent < len(llm.chunks)
+	assert output.next_goal == 'Search for shoes'
+	assert 1 <= len(output.action) < 3
+
+
+def test_parser_emits_array_elements_as_soon_as_they_are_closed():
+	document = '```json\n{"memory": "braces } and [brackets] in \\"strings\\"", "action": [{"click": {"index": 1}}, {"input": {"text": "a}b"}}]}\n```'
+	parser = JSONArrayStreamParser('action')
+
+	emitted: list[tuple[int, Any]] = []
+	for i, char in enumerate(document):
+		emitted.extend((i, element) for element in parser.feed(char))
+
+	assert [element for _, element in emitted] == [{'click': {'index': 1}}, {'input': {'text': 'a}b'}}]
+	assert document[emitted[0][0] - 1 : emitted[0][0] + 1] == '}}'
+	assert parser.fields_before_array() == {'memory': 'braces } and [brackets] in "strings"'}
+	assert parser.complete and json.loads(parser.document)['action'][1] == {'input': {'text': 'a}b'}}
+
+
+async def test_gemini_stream_reports_the_cumulative_usage_once(monkeypatch):
+	class Output(BaseModel):
+		memory: str
+
+	document = json.dumps({'memory': 'On the products page'})
+	pieces = [document[:10], document[10:20], document[20:]]
+
+	async def generate_content_stream(**kwargs):
+		async def stream():
+			# like Gemini, every chunk repeats the prompt tokens and the completion tokens generated so far
+			for i, piece in enumerate(pieces, start=1):
+				last = i == len(pieces)
+				yield types.GenerateContentResponse(
+					candidates=[
+						types.Candidate(
+							content=types.Content(role='model', parts=[types.Part(text=piece)]),
+							finish_reason=types.FinishReason.STOP if last else None,
+						)
+					],
+					usage_metadata=types.GenerateContentResponseUsageMetadata(
+						prompt_token_count=1000, candidates_token_count=10 * i, total_token_count=1000 + 10 * i
+					),
+				)
+
+		return stream()
+
+	llm = ChatGoogle(model='gemini-flash-latest', api_key='test')
+	client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content_stream=generate_content_stream)))
+	monkeypatch.setattr(llm, 'get_client', lambda: client)
+	token_cost = TokenCost()
+	token_cost.register_llm(llm)
+
+	chunks = [chunk async for chunk in llm.astream([UserMessage(content='state')], Output)]
+
+	assert ''.join(chunk.delta for chunk in chunks) == document
+	assert [chunk.usage is not None for chunk in chunks] == [False, False, False, True]
+	usage = token_cost.get_usage_tokens_for_model('gemini-flash-latest')
+	assert (usage.prompt_tokens, usage.completion_tokens) == (1000, 30)
+
+
+async def test_empty_output_retry_runs_only_the_retried_actions(monkeypatch):
+	llm = _llm(_output([]), _output([{'scroll': {'down': True, 'pages': 1.0}}]))
+	agent, executed = _agent(llm, monkeypatch)
+
+	output = await agent._get_model_output_with_retry([UserMessage(content='state')])
+	agent.state.last_model_output = output
+	await agent._execute_actions()
+
+	assert llm.calls == 2
+	assert [name for name, _ in executed] == ['scroll']
+	assert agent.state.last_result is not None and len(agent.state.last_result) == 1
+
+
+async def test_noop_done_after_two_empty_outputs_is_executed(monkeypatch):
+	llm = _llm(_output([]))
+	agent, executed = _agent(llm, monkeypatch)
+
+	output = await agent._get_model_output_with_retry([UserMessage(content='state')])
+	agent.state.last_model_output = output
+	await agent._execute_actions()
+
+	assert llm.calls == 2 and agent._streamed_actions is None
+	assert [name for name, _ in executed] == ['done']
+
+
+async def test_step_callback_and_pause_check_come_before_the_first_streamed_action(monkeypatch):
+	actions = [{'input': {'index': 4, 'text': 'shoes'}}, {'send_keys': {'keys': 'Enter'}}]
+	llm = _llm(_output(actions))
+	agent, executed = _agent(llm, monkeypatch)
+	calls: list[tuple[int, str, int]] = []
+
+	def on_new_step(browser_state_summary, model_output, n_steps) -> None:
+		calls.append((len(executed), model_output.next_goal, len(model_output.action)))
+
+	agent.register_new_step_callback = on_new_step
+	browser_state = SimpleNamespace(url='https://example.com/products')
+	await agent._get_next_action(browser_state)  # type: ignore[arg-type]
+	await agent._execute_actions()
+
+	# called once, before anything ran, with the plan and the first action
+	assert calls == [(0, 'Search for shoes', 1)]
+	assert [name for name, _ in executed] == ['input', 'send_keys']
+
+	# a paused agent does not start the streamed actions
+	llm = _llm(_output(actions))
+	agent, executed = _agent(llm, monkeypatch)
+	agent.pause()
+	try:
+		await agent._get_next_action(browser_state)  # type: ignore[arg-type]
+	except InterruptedError:
+		pass
+	agent._cancel_streamed_actions()
+	await asyncio.sleep(0.05)
+	assert executed == []
@@ -0,0 +1,159 @@
+"""Test that OpenAI-compatible chat models reuse pooled HTTP connections across calls."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from browser_use.llm.messages import UserMessage
+from browser_use.llm.openai.chat import ChatOpenAI
+from browser_use.llm.openai.client_pool import client_pool
+
+COMPLETION_RESPONSE = {
+	'id': 'chatcmpl-1',
+	'object': 'chat.completion',
+	'created': 0,
+	'model': 'gpt-4o-mini',
+	'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': 'ok'}, 'finish_reason': 'stop'}],
+	'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+async def _serve_completions(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+	# pytest-httpserver (werkzeug) closes the connection after every response, this one keeps it alive like real providers
+	body = json.dumps(COMPLETION_RESPONSE).encode()
+	while headers := await reader.readuntil(b'\r\n\r\n'):
+		content_length = next(
+			(int(line.split(b':', 1)[1]) for line in headers.split(b'\r\n') if line.lower().startswith(b'content-length:')), 0
+		)
+		await reader.readexactly(content_length)
+		writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s' % (len(body), body))
+		await writer.drain()
+
+
+@pytest.fixture
+async def completions_url():
+	async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+		try:
+			await _serve_completions(reader, writer)
+		except (asyncio.IncompleteReadError, ConnectionError):
+			pass
+		finally:
+			writer.close()
+
+	server = await asyncio.start_server(handle, '127.0.0.1', 0)
+	port = server.sockets[0].getsockname()[1]
+	yield f'http://127.0.0.1:{port}/v1'
+	server.close()
+
+
+async def test_consecutive_calls_reuse_one_pooled_connection(completions_url):
+	llm = ChatOpenAI(model='gpt-4o-mini', api_key='test-key', base_url=completions_url)
+
+	for _ in range(3):
+		result = await llm.ainvoke([UserMessage(content='hi')])
+		assert result.completion == 'ok'
+
+	stats = client_pool.stats()[completions_url]
+	assert stats.requests == 3
+	assert stats.new_connections == 1
+	assert stats.reused_connections == 2
+
+	await llm.aclose()
+	assert completions_url not in client_pool.stats()
+
+
+async def test_models_with_same_endpoint_share_a_client_until_last_release(completions_url):
+	first = ChatOpenAI(model='gpt-4o-mini', api_key='test-key', base_url=completions_url)
+	second = ChatOpenAI(model='gpt-4o', api_key='test-key', base_url=completions_url)
+
+	assert first.get_client()._client is second.get_client()._client
+
+	await first.aclose()
+	assert not second.get_client()._client.is_closed
+
+	await second.aclose()
+	assert completions_url not in client_pool.stats()
+
+
+async def test_releasing_a_shared_client_waits_for_calls_in_flight(completions_url):
+	first = ChatOpenAI(model='gpt-4o-mini', api_key='test-key', base_url=completions_url)
+	second = ChatOpenAI(model='gpt-4o', api_key='test-key', base_url=completions_url)
+	http_client = first.get_client()._client
+	assert second.get_client()._client is http_client
+
+	# hold the response back until both leases were given up
+	transport = http_client._transport
+	handle_async_request = transport.handle_async_request
+	released = asyncio.Event()
+
+	async def slow_handle_async_request(request):
+		await released.wait()
+		return await handle_async_request(request)
+
+	transport.handle_async_request = slow_handle_async_request  # type: ignore[method-assign]
+	call = asyncio.create_task(second.ainvoke([UserMessage(content='hi')]))
+	await asyncio.sleep(0.05)
+
+	await first.aclose()
+	close = asyncio.create_task(second.aclose())
+	await asyncio.sleep(0.05)
+	assert not close.done() and not http_client.is_closed
+
+	released.set()
+	assert (await call).completion == 'ok'
+	await close
+	assert http_client.is_closed
+
+
+async def test_a_new_event_loop_gives_back_the_lease_of_the_old_one(completions_url):
+	llm = ChatOpenAI(model='gpt-4o-mini', api_key='test-key', base_url=completions_url)
+	http_client = llm.get_client()._client
+
+	async def use_in_other_loop() -> None:
+		llm.get_client()
+		await llm.aclose()
+
+	await asyncio.to_thread(asyncio.run, use_in_other_loop())
+	for _ in range(5):
+		await asyncio.sleep(0)
+
+	# the model's only lease on this loop was released when it moved to the other loop
+	assert http_client.is_closed
+	assert completions_url not in client_pool.stats()
+
+
+async def test_clients_are_closed_when_their_event_loop_shuts_down(completions_url):
+	llm = ChatOpenAI(model='gpt-4o-mini', api_key='test-key', base_url=completions_url)
+
+	async def call_without_closing() -> httpx.AsyncClient:
+		await llm.ainvoke([UserMessage(content='hi')])
+		return llm.get_client()._client
+
+	http_client = await asyncio.to_thread(asyncio.run, call_without_closing())
+
+	assert http_client.is_closed
+	assert completions_url not in client_pool.stats()
+
+
+async def test_models_shared_by_agents_are_closed_by_the_last_agent(completions_url):
+	from browser_use import Agent
+	from browser_use.browser import BrowserProfile, BrowserSession
+
+	llm = ChatOpenAI(model='gpt-4o-mini', api_key='test-key', base_url=completions_url)
+	extraction_llm = ChatOpenAI(model='gpt-4o', api_key='other-key', base_url=completions_url)
+	http_client = llm.get_client()._client
+	extraction_http_client = extraction_llm.get_client()._client
+
+	def make_agent() -> Agent:
+		browser_session = BrowserSession(browser_profile=BrowserProfile(keep_alive=True))
+		return Agent(task='test', llm=llm, page_extraction_llm=extraction_llm, browser_session=browser_session)
+
+	first, second = make_agent(), make_agent()
+	await first.close()
+	await first.close()
+	assert not http_client.is_closed and not extraction_http_client.is_closed
+
+	await second.close()
+	assert http_client.is_closed and extraction_http_client.is_closed
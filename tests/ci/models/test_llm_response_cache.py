@@ -0,0 +1,125 @@
+"""Test the opt-in LLM response cache: identical requests are replayed from disk, TTL and size eviction, TokenCost stats."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel
+
+from browser_use.llm.cache.chat import ChatCached
+from browser_use.llm.cache.store import ResponseCacheStore
+from browser_use.llm.messages import SystemMessage, UserMessage
+from browser_use.llm.views import ChatInvokeCompletion, ChatInvokeUsage
+from browser_use.tokens.service import TokenCost
+
+
+class Answer(BaseModel):
+	city: str
+	population: int | None = None
+
+
+@dataclass
+class CountingChatModel:
+	"""Stands in for any provider and counts the requests that reach it."""
+
+	model: str = 'fake-model'
+	calls: int = 0
+	_verified_api_keys: bool = field(default=False)
+
+	@property
+	def provider(self) -> str:
+		return 'fake'
+
+	@property
+	def name(self) -> str:
+		return self.model
+
+	async def ainvoke(self, messages: list[Any], output_format: Any = None) -> ChatInvokeCompletion[Any]:
+		self.calls += 1
+		usage = ChatInvokeUsage(
+			prompt_tokens=100,
+			prompt_cached_tokens=None,
+			prompt_cache_creation_tokens=None,
+			prompt_image_tokens=None,
+			completion_tokens=20,
+			total_tokens=120,
+		)
+		completion = output_format(city='Paris') if output_format else f'answer {self.calls}'
+		return ChatInvokeCompletion(completion=completion, usage=usage, stop_reason='end_turn')
+
+
+def _messages(question: str) -> list[Any]:
+	return [SystemMessage(content='You answer questions.'), UserMessage(content=question)]
+
+
+async def test_identical_requests_are_served_from_the_cache(tmp_path):
+	inner = CountingChatModel()
+	llm = ChatCached(llm=inner, path=tmp_path / 'cache.sqlite')  # type: ignore[arg-type]
+
+	first = await llm.ainvoke(_messages('Capital of France?'))
+	again = await llm.ainvoke(_messages('Capital of France?'))
+	other = await llm.ainvoke(_messages('Capital of Italy?'))
+
+	assert inner.calls == 2
+	assert again.completion == first.completion == 'answer 1'
+	assert other.completion == 'answer 2'
+	# no tokens were spent on the replayed call
+	assert first.usage is not None and again.usage is None
+	assert again.stop_reason == 'end_turn'
+	assert (llm.hits, llm.misses) == (1, 2)
+
+	# a new process (new wrapper) reuses the file
+	reopened = ChatCached(llm=inner, path=tmp_path / 'cache.sqlite')  # type: ignore[arg-type]
+	assert (await reopened.ainvoke(_messages('Capital of France?'))).completion == 'answer 1'
+	assert inner.calls == 2
+
+
+async def test_structured_output_is_keyed_by_schema_and_validated_on_hit(tmp_path):
+	inner = CountingChatModel()
+	llm = ChatCached(llm=inner, path=tmp_path / 'cache.sqlite')  # type: ignore[arg-type]
+
+	await llm.ainvoke(_messages('Capital of France?'), output_format=Answer)
+	cached = await llm.ainvoke(_messages('Capital of France?'), output_format=Answer)
+	plain = await llm.ainvoke(_messages('Capital of France?'))
+
+	assert isinstance(cached.completion, Answer) and cached.completion.city == 'Paris'
+	assert isinstance(plain.completion, str)
+	assert inner.calls == 2
+
+
+async def test_hits_and_saved_tokens_are_recorded_in_token_cost(tmp_path):
+	token_cost = TokenCost()
+	llm = token_cost.register_llm(ChatCached(llm=CountingChatModel(), path=tmp_path / 'cache.sqlite'))  # type: ignore[arg-type]
+
+	for _ in range(3):
+		await llm.ainvoke(_messages('Capital of France?'))
+
+	stats = token_cost.cache_stats['fake-model']
+	assert (stats.hits, stats.misses) == (2, 1)
+	assert (stats.saved_prompt_tokens, stats.saved_completion_tokens) == (200, 40)
+	# only the call that reached the provider counts as usage
+	assert token_cost.get_usage_tokens_for_model('fake-model').total_tokens == 120
+
+
+def test_expired_entries_are_misses(tmp_path):
+	store = ResponseCacheStore(tmp_path / 'cache.sqlite', ttl=0.05)
+	store.set('key', 'value')
+	assert store.get('key') == 'value'
+
+	time.sleep(0.1)
+	assert store.get('key') is None
+
+
+def test_least_recently_read_entries_are_evicted_above_the_size_limit(tmp_path):
+	store = ResponseCacheStore(tmp_path / 'cache.sqlite', max_size_bytes=250)
+	store.set('a', 'x' * 100)
+	time.sleep(0.01)
+	store.set('b', 'x' * 100)
+	time.sleep(0.01)
+	store.get('a')
+
+	store.set('c', 'x' * 100)
+
+	assert store.get('a') is not None
+	assert store.get('b') is None
+	assert store.get('c') is not None
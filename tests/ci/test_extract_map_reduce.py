@@ -0,0 +1,55 @@
+"""Test map-reduce extraction of long pages: paragraph-boundary chunking and bounded concurrent map calls."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+from browser_use.dom.markdown_extractor import split_markdown_chunks
+from browser_use.llm.views import ChatInvokeCompletion
+from browser_use.tools.service import _map_reduce_extract
+
+
+def test_chunks_end_at_line_breaks_and_cover_the_content():
+	lines = [f'## Product {i}' if i % 10 == 0 else f'- item {i} costs {i * 3} dollars' for i in range(400)]
+	content = '\n'.join(lines)
+
+	chunks = split_markdown_chunks(content, 1000)
+
+	assert ''.join(chunks) == content
+	assert all(len(chunk) <= 1000 for chunk in chunks)
+	assert all(chunk.endswith('\n') for chunk in chunks[:-1])
+	# sections are kept together when a heading is close to the end of the window
+	assert sum(chunk.startswith('## ') for chunk in chunks[1:]) >= len(chunks) // 2
+
+
+def test_a_single_overlong_line_is_cut_hard():
+	assert split_markdown_chunks('x' * 250, 100) == ['x' * 100, 'x' * 100, 'x' * 50]
+
+
+async def test_chunks_are_extracted_concurrently_and_merged():
+	running = 0
+	peak = 0
+	prompts: list[str] = []
+
+	async def ainvoke(messages: list[Any], *args: Any, **kwargs: Any) -> ChatInvokeCompletion:
+		nonlocal running, peak
+		prompt = messages[-1].content
+		prompts.append(prompt)
+		if '<partial_results>' in prompt:
+			return ChatInvokeCompletion(completion='merged', usage=None)
+		running += 1
+		peak = max(peak, running)
+		await asyncio.sleep(0.01)
+		running -= 1
+		return ChatInvokeCompletion(completion=f'items of {prompt.split("This is part ")[1].split(" ")[0]}', usage=None)
+
+	llm = AsyncMock()
+	llm.ainvoke = ainvoke
+	chunks = [f'chunk {i}\n' for i in range(6)]
+
+	result = await _map_reduce_extract(llm, 'list all items', 'stats', chunks, 'system', max_concurrency=2)
+
+	assert result == 'merged'
+	assert peak == 2
+	reduce_prompt = prompts[-1]
+	assert reduce_prompt.index('items of 1') < reduce_prompt.index('items of 6')